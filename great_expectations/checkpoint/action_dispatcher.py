@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import atexit
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, List, Optional, Sequence, Set, Tuple
+
+from great_expectations.checkpoint.actions import ActionContext
+
+if TYPE_CHECKING:
+    from great_expectations.checkpoint.actions import ValidationAction
+    from great_expectations.checkpoint.checkpoint import CheckpointResult
+
+logger = logging.getLogger(__name__)
+
+
+class ActionDispatcher:
+    """Runs actions of Checkpoint, taken on its CheckpointResult, either in place or in background.
+
+    Actions are run one after another, unless concurrency is requested: then actions, which declare that they run
+    independently (i.e., do not consume results of prior actions), are run concurrently on thread pool, while every
+    other action is run only after all preceding actions have finished, with their results in ActionContext (e.g.,
+    "SlackNotificationAction" links data docs pages, built by "UpdateDataDocsAction").
+
+    Args:
+        max_workers: Maximum number of actions, which are run concurrently (and of dispatches, run in background).
+        max_queue_size: Maximum number of dispatches, which are pending in background; once reached, "dispatch()"
+            blocks, until earlier dispatches have finished.
+    """  # noqa: E501
+
+    def __init__(self, max_workers: int = 4, max_queue_size: int = 64) -> None:
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be positive; {max_workers} was given.")  # noqa: TRY003
+
+        if max_queue_size < 1:
+            raise ValueError(f"max_queue_size must be positive; {max_queue_size} was given.")  # noqa: TRY003
+
+        self._max_workers = max_workers
+        self._max_queue_size = max_queue_size
+        # Dispatches and individual actions are run by separate pools, so that pending dispatches never wait for threads occupied by themselves.  # noqa: E501
+        self._action_executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=f"{self.__class__.__name__}_actions"
+        )
+        self._dispatch_executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=f"{self.__class__.__name__}_dispatches"
+        )
+        self._queue_slots = threading.BoundedSemaphore(value=max_queue_size)
+        self._pending_dispatches: Set[Future] = set()
+        self._dispatch_errors: List[Exception] = []
+        self._lock = threading.Lock()
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    @property
+    def max_queue_size(self) -> int:
+        return self._max_queue_size
+
+    @property
+    def num_pending_dispatches(self) -> int:
+        with self._lock:
+            return len(self._pending_dispatches)
+
+    def run_actions(
+        self,
+        actions: Sequence[ValidationAction],
+        checkpoint_result: CheckpointResult,
+        concurrently: bool = False,
+    ) -> ActionContext:
+        """Runs actions in their order and returns their ActionContext.
+
+        If "concurrently" is True (default is False), then independent actions overlap; error of the earliest failed
+        action is raised (once all concurrently running actions have finished).
+        """  # noqa: E501
+        action_context = ActionContext()
+        running_actions: List[Tuple[ValidationAction, Future]] = []
+
+        action: ValidationAction
+        for action in actions:
+            if concurrently and action.runs_independently:
+                running_actions.append(
+                    (
+                        action,
+                        self._action_executor.submit(
+                            action.run,
+                            checkpoint_result=checkpoint_result,
+                            action_context=action_context,
+                        ),
+                    )
+                )
+            else:
+                self._collect_action_results(
+                    running_actions=running_actions, action_context=action_context
+                )
+                action_result = action.run(
+                    checkpoint_result=checkpoint_result,
+                    action_context=action_context,
+                )
+                action_context.update(action=action, action_result=action_result)
+
+        self._collect_action_results(running_actions=running_actions, action_context=action_context)
+        return action_context
+
+    def dispatch(
+        self,
+        actions: Sequence[ValidationAction],
+        checkpoint_result: CheckpointResult,
+        concurrently: bool = False,
+    ) -> Future:
+        """Runs actions in background (see "run_actions()"); returns Future of their ActionContext.
+
+        Errors of actions are logged and set on returned Future, rather than raised; "flush()" raises them as well.
+        """  # noqa: E501
+        self._queue_slots.acquire()
+        try:
+            future: Future = self._dispatch_executor.submit(
+                self._run_dispatched_actions,
+                actions=actions,
+                checkpoint_result=checkpoint_result,
+                concurrently=concurrently,
+            )
+        except BaseException:
+            self._queue_slots.release()
+            raise
+
+        with self._lock:
+            self._pending_dispatches.add(future)
+
+        future.add_done_callback(self._finish_dispatch)
+        return future
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Waits until all actions, dispatched so far, have finished.
+
+        Raises:
+            TimeoutError: Some dispatched actions did not finish within "timeout" seconds.
+            Exception: Error of the earliest failed dispatch (of those failed since previous "flush()").
+        """  # noqa: E501
+        with self._lock:
+            pending_dispatches: List[Future] = list(self._pending_dispatches)
+
+        _, not_done = wait(pending_dispatches, timeout=timeout)
+        if not_done:
+            raise TimeoutError(  # noqa: TRY003
+                f"{len(not_done)} dispatch(es) of checkpoint actions did not finish within {timeout} seconds."  # noqa: E501
+            )
+
+        with self._lock:
+            dispatch_errors: List[Exception] = self._dispatch_errors
+            self._dispatch_errors = []
+
+        if dispatch_errors:
+            raise dispatch_errors[0]
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._dispatch_executor.shutdown(wait=wait)
+        self._action_executor.shutdown(wait=wait)
+
+    @staticmethod
+    def _collect_action_results(
+        running_actions: List[Tuple[ValidationAction, Future]], action_context: ActionContext
+    ) -> None:
+        """Waits for concurrently running actions and adds their results to ActionContext in order of actions."""  # noqa: E501
+        try:
+            wait([future for _, future in running_actions])
+            action: ValidationAction
+            future: Future
+            for action, future in running_actions:
+                action_context.update(action=action, action_result=future.result())
+        finally:
+            running_actions.clear()
+
+    def _run_dispatched_actions(
+        self,
+        actions: Sequence[ValidationAction],
+        checkpoint_result: CheckpointResult,
+        concurrently: bool,
+    ) -> ActionContext:
+        try:
+            return self.run_actions(
+                actions=actions, checkpoint_result=checkpoint_result, concurrently=concurrently
+            )
+        except Exception as e:
+            logger.exception(
+                f'Checkpoint actions, dispatched for "{checkpoint_result.name}", did not complete.'
+            )
+            # Recorded before Future is done, so that "flush()", which waits for it, always sees error.  # noqa: E501
+            with self._lock:
+                self._dispatch_errors.append(e)
+
+            raise
+
+    def _finish_dispatch(self, future: Future) -> None:
+        with self._lock:
+            self._pending_dispatches.discard(future)
+
+        self._queue_slots.release()
+
+
+_action_dispatcher: Optional[ActionDispatcher] = None
+_action_dispatcher_lock = threading.Lock()
+
+
+def get_action_dispatcher() -> ActionDispatcher:
+    """Returns ActionDispatcher, shared by all Checkpoints (created with default settings on first use).
+
+    Shared ActionDispatcher is shut down at interpreter exit, once its pending dispatches have finished.
+    """  # noqa: E501
+    global _action_dispatcher  # noqa: PLW0603
+    with _action_dispatcher_lock:
+        if _action_dispatcher is None:
+            _action_dispatcher = ActionDispatcher()
+
+        return _action_dispatcher
+
+
+def set_action_dispatcher(action_dispatcher: ActionDispatcher) -> None:
+    """Replaces ActionDispatcher, shared by all Checkpoints (e.g., to change its "max_workers").
+
+    Replaced ActionDispatcher is shut down, once its pending dispatches have finished.
+    """
+    global _action_dispatcher  # noqa: PLW0603
+    with _action_dispatcher_lock:
+        previous_action_dispatcher: Optional[ActionDispatcher] = _action_dispatcher
+        _action_dispatcher = action_dispatcher
+
+    if (
+        previous_action_dispatcher is not None
+        and previous_action_dispatcher is not action_dispatcher
+    ):
+        previous_action_dispatcher.shutdown(wait=False)
+
+
+@atexit.register
+def _shutdown_action_dispatcher() -> None:
+    with _action_dispatcher_lock:
+        action_dispatcher: Optional[ActionDispatcher] = _action_dispatcher
+
+    if action_dispatcher is not None:
+        action_dispatcher.shutdown(wait=True)
@@ -15,6 +15,7 @@ from email.mime.text import MIMEText
 from typing import (
     TYPE_CHECKING,
     Any,
+    ClassVar,
     List,
     Literal,
     Optional,
@@ -121,6 +122,9 @@ class ValidationAction(BaseModel):
     type: str
     name: str
 
+    # Actions, which do not consume results of prior actions (via ActionContext), can be run concurrently with others.  # noqa: E501
+    runs_independently: ClassVar[bool] = False
+
     @property
     def _using_cloud_context(self) -> bool:
         return project_manager.is_using_cloud()
@@ -394,6 +398,7 @@ class PagerdutyAlertAction(ValidationAction):
     """  # noqa: E501
 
     type: Literal["pagerduty"] = "pagerduty"
+    runs_independently: ClassVar[bool] = True
 
     api_key: str
     routing_key: str
@@ -531,6 +536,7 @@ class OpsgenieAlertAction(ValidationAction):
     """  # noqa: E501
 
     type: Literal["opsgenie"] = "opsgenie"
+    runs_independently: ClassVar[bool] = True
 
     api_key: str
     region: Optional[str] = None
@@ -660,6 +666,7 @@ class EmailAction(ValidationAction):
     """  # noqa: E501
 
     type: Literal["email"] = "email"
+    runs_independently: ClassVar[bool] = True
 
     smtp_address: Union[ConfigStr, str]
     smtp_port: Union[ConfigStr, str]
@@ -814,6 +821,7 @@ class UpdateDataDocsAction(DataDocsAction):
     """  # noqa: E501
 
     type: Literal["update_data_docs"] = "update_data_docs"
+    runs_independently: ClassVar[bool] = True
 
     site_names: List[str] = []
 
@@ -913,6 +921,7 @@ class SNSNotificationAction(ValidationAction):
     """  # noqa: E501
 
     type: Literal["sns"] = "sns"
+    runs_independently: ClassVar[bool] = True
 
     sns_topic_arn: str
     sns_message_subject: Optional[str]
@@ -969,6 +978,7 @@ class SNSNotificationAction(ValidationAction):
 
 class APINotificationAction(ValidationAction):
     type: Literal["api"] = "api"
+    runs_independently: ClassVar[bool] = True
 
     url: str
 
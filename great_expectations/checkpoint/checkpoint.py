@@ -1,7 +1,12 @@
 from __future__ import annotations
 
 import datetime as dt
+import functools
 import json
+import logging
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
     TYPE_CHECKING,
     AbstractSet,
@@ -17,9 +22,11 @@ from typing import (
 )
 
 import great_expectations.exceptions as gx_exceptions
+from great_expectations import __version__ as ge_version
 from great_expectations._docs_decorators import public_api
 from great_expectations.analytics import submit as submit_analytics_event
 from great_expectations.analytics.events import CheckpointRanEvent
+from great_expectations.checkpoint.action_dispatcher import get_action_dispatcher
 from great_expectations.checkpoint.actions import (
     ActionContext,
     CheckpointAction,
@@ -35,6 +42,7 @@ from great_expectations.compatibility.pydantic import (
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.expectation_validation_result import (
     ExpectationSuiteValidationResult,
+    ExpectationValidationResult,
 )
 from great_expectations.core.freshness_diagnostics import CheckpointFreshnessDiagnostics
 from great_expectations.core.result_format import DEFAULT_RESULT_FORMAT, ResultFormatUnion
@@ -46,6 +54,7 @@ from great_expectations.data_context.types.resource_identifiers import (
     ExpectationSuiteIdentifier,
     ValidationResultIdentifier,
 )
+from great_expectations.datasource.fluent.interfaces import dedicated_execution_engines
 from great_expectations.exceptions import (
     CheckpointNotAddedError,
     CheckpointNotFreshError,
@@ -58,12 +67,17 @@ from great_expectations.exceptions.exceptions import (
 )
 from great_expectations.exceptions.resource_freshness import ResourceFreshnessAggregateError
 from great_expectations.render.renderer.renderer import Renderer
+from great_expectations.validator.exception_info import ExceptionInfo
+from great_expectations.validator.validator import calc_validation_statistics
 
 if TYPE_CHECKING:
     from great_expectations.core.suite_parameters import SuiteParameterDict
     from great_expectations.data_context.store.validation_definition_store import (
         ValidationDefinitionStore,
     )
+    from great_expectations.execution_engine import ExecutionEngine
+
+logger = logging.getLogger(__name__)
 
 
 @public_api
@@ -271,12 +285,41 @@ class Checkpoint(BaseModel):
         return validation_definitions
 
     @public_api
-    def run(
+    def run(  # noqa: PLR0913
         self,
         batch_parameters: Dict[str, Any] | None = None,
         expectation_parameters: SuiteParameterDict | None = None,
         run_id: RunIdentifier | None = None,
+        max_workers: int = 1,
+        run_actions_in_background: bool = False,
+        run_actions_concurrently: bool = False,
+        project_columns: bool = False,
     ) -> CheckpointResult:
+        """Runs validation definitions of this Checkpoint and then its actions.
+
+        Args:
+            batch_parameters: Parameters, selecting Batch of every validation definition.
+            expectation_parameters: Values of parameterized Expectations of every validation definition.
+            run_id: An identifier for this run (generated, if omitted).
+            max_workers: If greater than 1 (default is 1), then validation definitions are run concurrently on thread
+                pool of this size; every worker uses ExecutionEngines of its own (ExecutionEngine of Datasource, with
+                its active Batch and metric cache, is not safe for concurrent use), and validation definition, which
+                fails, yields unsuccessful result holding its error (rather than raising it).  Either way,
+                "run_results" follow order of validation definitions.
+            run_actions_in_background: If True (default is False), then actions are dispatched to bounded background
+                queue (see "get_action_dispatcher()") and CheckpointResult is returned without waiting for them; errors
+                of such actions are logged and raised by "get_action_dispatcher().flush()".
+            run_actions_concurrently: If True (default is False), then actions, which do not consume results of prior
+                actions (e.g., "UpdateDataDocsAction" and "EmailAction"), are run concurrently with one another.
+            project_columns: If True (default is False), then every validation definition only loads the columns
+                referenced by its suite, where its Data Asset supports it (see "ValidationDefinition.run()").
+
+        Returns:
+            CheckpointResult of this run.
+        """  # noqa: E501
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be positive; {max_workers} was given.")  # noqa: TRY003
+
         if not self.validation_definitions:
             raise CheckpointRunWithoutValidationDefinitionError()
 
@@ -294,10 +337,16 @@ class Checkpoint(BaseModel):
             expectation_parameters=expectation_parameters,
             result_format=self.result_format,
             run_id=run_id,
+            max_workers=max_workers,
+            project_columns=project_columns,
         )
 
         checkpoint_result = self._construct_result(run_id=run_id, run_results=run_results)
-        self._run_actions(checkpoint_result=checkpoint_result)
+        self._run_actions(
+            checkpoint_result=checkpoint_result,
+            run_actions_in_background=run_actions_in_background,
+            run_actions_concurrently=run_actions_concurrently,
+        )
 
         self._submit_analytics_event()
 
@@ -310,31 +359,171 @@ class Checkpoint(BaseModel):
         )
         submit_analytics_event(event=event)
 
-    def _run_validation_definitions(
+    def _run_validation_definitions(  # noqa: PLR0913
         self,
         batch_parameters: Dict[str, Any] | None,
         expectation_parameters: SuiteParameterDict | None,
         result_format: ResultFormatUnion,
         run_id: RunIdentifier,
+        max_workers: int = 1,
+        project_columns: bool = False,
     ) -> Dict[ValidationResultIdentifier, ExpectationSuiteValidationResult]:
-        run_results: Dict[ValidationResultIdentifier, ExpectationSuiteValidationResult] = {}
-        for validation_definition in self.validation_definitions:
-            validation_result = validation_definition.run(
-                checkpoint_id=self.id,
-                batch_parameters=batch_parameters,
-                expectation_parameters=expectation_parameters,
-                result_format=result_format,
+        run_validation_definition: Callable[
+            [ValidationDefinition], ExpectationSuiteValidationResult
+        ] = functools.partial(
+            self._run_validation_definition,
+            batch_parameters=batch_parameters,
+            expectation_parameters=expectation_parameters,
+            result_format=result_format,
+            run_id=run_id,
+            project_columns=project_columns,
+        )
+
+        validation_results: List[ExpectationSuiteValidationResult]
+        if max_workers > 1 and len(self.validation_definitions) > 1:
+            validation_results = self._run_validation_definitions_concurrently(
+                run_validation_definition=run_validation_definition,
+                max_workers=max_workers,
                 run_id=run_id,
             )
+        else:
+            validation_results = [
+                run_validation_definition(validation_definition)
+                for validation_definition in self.validation_definitions
+            ]
+
+        run_results: Dict[ValidationResultIdentifier, ExpectationSuiteValidationResult] = {}
+        for validation_definition, validation_result in zip(
+            self.validation_definitions, validation_results
+        ):
             key = self._build_result_key(
                 validation_definition=validation_definition,
                 run_id=run_id,
-                batch_identifier=validation_result.batch_id,
+                # Results of failed validation definitions have no Batch; keys must not collide.
+                batch_identifier=validation_result.batch_id or validation_definition.name,
             )
             run_results[key] = validation_result
 
         return run_results
 
+    def _run_validation_definition(  # noqa: PLR0913
+        self,
+        validation_definition: ValidationDefinition,
+        batch_parameters: Dict[str, Any] | None,
+        expectation_parameters: SuiteParameterDict | None,
+        result_format: ResultFormatUnion,
+        run_id: RunIdentifier,
+        project_columns: bool = False,
+    ) -> ExpectationSuiteValidationResult:
+        return validation_definition.run(
+            checkpoint_id=self.id,
+            batch_parameters=batch_parameters,
+            expectation_parameters=expectation_parameters,
+            result_format=result_format,
+            run_id=run_id,
+            project_columns=project_columns,
+        )
+
+    def _run_validation_definitions_concurrently(
+        self,
+        run_validation_definition: Callable[
+            [ValidationDefinition], ExpectationSuiteValidationResult
+        ],
+        max_workers: int,
+        run_id: RunIdentifier,
+    ) -> List[ExpectationSuiteValidationResult]:
+        """
+        Runs every validation definition as separate task on thread pool.
+
+        ExecutionEngine (with its loaded Batches, active Batch, and metric cache) is shared by all assets of Datasource and
+        is not safe for concurrent use (e.g., "ValidationDefinition.run()" unloads its Batch from ExecutionEngine, once
+        finished); hence, every worker validates using ExecutionEngines of its own (see "dedicated_execution_engines()"),
+        which are closed once all validation definitions are finished.
+
+        Failure of one validation definition does not prevent others from running (and storing their results); its result
+        is unsuccessful and holds the error (see "_build_failed_validation_result()").
+
+        Returns:
+            Validation results in order of validation definitions.
+        """  # noqa: E501
+        execution_engines_by_thread: Dict[int, Dict[str, ExecutionEngine]] = {}
+
+        def _run_validation_definition(
+            validation_definition: ValidationDefinition,
+        ) -> ExpectationSuiteValidationResult:
+            execution_engines: Dict[str, ExecutionEngine] = execution_engines_by_thread.setdefault(
+                threading.get_ident(), {}
+            )
+            try:
+                with dedicated_execution_engines(execution_engines):
+                    return run_validation_definition(validation_definition)
+            except Exception as e:
+                logger.exception(f"Validation definition {validation_definition.name} failed.")
+                return self._build_failed_validation_result(
+                    validation_definition=validation_definition,
+                    run_id=run_id,
+                    exception=e,
+                    exception_traceback=traceback.format_exc(),
+                )
+
+        try:
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(self.validation_definitions)),
+                thread_name_prefix=f"{self.__class__.__name__}_validations",
+            ) as executor:
+                return list(executor.map(_run_validation_definition, self.validation_definitions))
+        finally:
+            for execution_engines in execution_engines_by_thread.values():
+                for execution_engine in execution_engines.values():
+                    try:
+                        execution_engine.close()
+                    except Exception as e:
+                        logger.warning(f"Unable to close execution engine: {e!r}")
+
+    def _build_failed_validation_result(
+        self,
+        validation_definition: ValidationDefinition,
+        run_id: RunIdentifier,
+        exception: Exception,
+        exception_traceback: str,
+    ) -> ExpectationSuiteValidationResult:
+        """Unsuccessful result of validation definition, which raised exception, with exception info of every Expectation."""  # noqa: E501
+        exception_info = ExceptionInfo(
+            exception_traceback=exception_traceback,
+            exception_message=f"{type(exception).__name__}: {exception!s}",
+        )
+        results: List[ExpectationValidationResult] = [
+            ExpectationValidationResult(
+                success=False,
+                exception_info=exception_info,
+                expectation_config=expectation.configuration,
+            )
+            for expectation in validation_definition.suite.expectations
+        ]
+        statistics = calc_validation_statistics(results)
+
+        validation_result = ExpectationSuiteValidationResult(
+            success=False,
+            results=results,
+            suite_name=validation_definition.suite.name,
+            statistics={
+                "evaluated_expectations": statistics.evaluated_expectations,
+                "successful_expectations": statistics.successful_expectations,
+                "unsuccessful_expectations": statistics.unsuccessful_expectations,
+                "success_percent": statistics.success_percent,
+            },
+            meta={
+                "great_expectations_version": ge_version,
+                "validation_id": validation_definition.id,
+                "checkpoint_id": self.id,
+                "exception_info": exception_info.to_json_dict(),
+            },
+        )
+        # Same as in "ValidationDefinition.run()".
+        validation_result.meta["run_id"] = run_id
+        validation_result.meta["validation_time"] = run_id.run_time
+        return validation_result
+
     def _build_result_key(
         self,
         validation_definition: ValidationDefinition,
@@ -366,15 +555,31 @@ class Checkpoint(BaseModel):
     def _run_actions(
         self,
         checkpoint_result: CheckpointResult,
+        run_actions_in_background: bool = False,
+        run_actions_concurrently: bool = False,
     ) -> None:
-        action_context = ActionContext()
         sorted_actions = self._sort_actions()
-        for action in sorted_actions:
-            action_result = action.run(
+        if not sorted_actions:
+            return
+
+        if run_actions_in_background:
+            get_action_dispatcher().dispatch(
+                actions=sorted_actions,
                 checkpoint_result=checkpoint_result,
-                action_context=action_context,
+                concurrently=run_actions_concurrently,
             )
-            action_context.update(action=action, action_result=action_result)
+        elif run_actions_concurrently:
+            get_action_dispatcher().run_actions(
+                actions=sorted_actions, checkpoint_result=checkpoint_result, concurrently=True
+            )
+        else:
+            action_context = ActionContext()
+            for action in sorted_actions:
+                action_result = action.run(
+                    checkpoint_result=checkpoint_result,
+                    action_context=action_context,
+                )
+                action_context.update(action=action, action_result=action_result)
 
     def _sort_actions(self) -> List[CheckpointAction]:
         """
@@ -8,3 +8,13 @@ try:
     import pyarrow
 except ImportError:
     pyarrow = PYARROW_NOT_IMPORTED
+
+try:
+    from pyarrow import parquet
+except (ImportError, AttributeError):
+    parquet = PYARROW_NOT_IMPORTED
+
+try:
+    from pyarrow import ipc
+except (ImportError, AttributeError):
+    ipc = PYARROW_NOT_IMPORTED
@@ -167,3 +167,16 @@ class BatchManager:
         """
         self._batch_data_cache[batch_id] = batch_data
         self._active_batch_data_id = batch_id
+
+    def remove_batch_data(self, batch_id: str) -> None:
+        """
+        Removes the data (and the Batch object, if any) for the specified Batch from the cache
+        """
+        self._batch_data_cache.pop(batch_id, None)
+        self._batch_cache.pop(batch_id, None)
+
+        if self._active_batch_data_id == batch_id:
+            self._active_batch_data_id = None
+
+        if self._active_batch_id == batch_id:
+            self._active_batch_id = None
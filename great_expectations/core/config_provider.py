@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import copy
 import errno
 import os
 from abc import ABC, abstractmethod
 from collections import OrderedDict
-from typing import Any, Dict, Optional, Type, cast
+from typing import Any, Dict, Optional, Tuple, Type, cast
 
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.config_substitutor import _ConfigurationSubstitutor
@@ -25,6 +26,13 @@ class _AbstractConfigurationProvider(ABC):
         """
         pass
 
+    def invalidate_cache(self) -> None:  # noqa: B027 # empty-method-without-abstract-decorator
+        """
+        Discard any values cached by the provider, so that the next call of `get_values()`
+        retrieves them from their source.
+        """
+        pass
+
     def substitute_config(self, config: Any, config_values: Optional[Dict[str, str]] = None) -> Any:
         """
         Utilizes the underlying ConfigurationSubstitutor instance to substitute any
@@ -101,6 +109,15 @@ class _ConfigurationProvider(_AbstractConfigurationProvider):
             values.update(provider.get_values())
         return values
 
+    @override
+    def invalidate_cache(self) -> None:
+        """
+        Discards the values cached by all registered providers (e.g., after a config variables
+        file was written).
+        """
+        for provider in self._providers.values():
+            provider.invalidate_cache()
+
 
 class _RuntimeEnvironmentConfigurationProvider(_AbstractConfigurationProvider):
     """
@@ -134,6 +151,9 @@ class _ConfigurationVariablesConfigurationProvider(_AbstractConfigurationProvide
     Responsible for the management of user-defined configuration variables.
 
     These can be found in the user's /uncommitted/config_variables.yml file.
+
+    Substituted values are cached until the file (i.e., its path, modification time or size)
+    or the environment variables change, or until `invalidate_cache()` is called.
     """
 
     def __init__(
@@ -141,8 +161,15 @@ class _ConfigurationVariablesConfigurationProvider(_AbstractConfigurationProvide
     ) -> None:
         self._config_variables_file_path = config_variables_file_path
         self._root_directory = root_directory
+        self._cache_key: Optional[Tuple[Any, ...]] = None
+        self._cached_values: Dict[str, str] = {}
         super().__init__()
 
+    @override
+    def invalidate_cache(self) -> None:
+        self._cache_key = None
+        self._cached_values = {}
+
     @override
     def get_values(self) -> Dict[str, str]:
         env_vars = dict(os.environ)  # noqa: TID251 # os.environ allowed in config files
@@ -157,14 +184,26 @@ class _ConfigurationVariablesConfigurationProvider(_AbstractConfigurationProvide
                 root_directory = ""
 
             var_path = os.path.join(root_directory, defined_path)  # noqa: PTH118
-            with open(var_path) as config_variables_file:
-                contents = config_variables_file.read()
-
-            variables = dict(yaml.load(contents)) or {}
-            return cast(
-                Dict[str, str],
-                self._substitutor.substitute_all_config_variables(variables, env_vars),
+            stat_result = os.stat(var_path)  # noqa: PTH116
+            cache_key = (
+                var_path,
+                stat_result.st_mtime_ns,
+                stat_result.st_size,
+                hash(frozenset(env_vars.items())),
             )
+            if cache_key != self._cache_key:
+                with open(var_path) as config_variables_file:
+                    contents = config_variables_file.read()
+
+                variables = dict(yaml.load(contents)) or {}
+                self._cached_values = cast(
+                    Dict[str, str],
+                    self._substitutor.substitute_all_config_variables(variables, env_vars),
+                )
+                self._cache_key = cache_key
+
+            # Callers may update the returned values (e.g., `save_config_variable`).
+            return copy.deepcopy(self._cached_values)
 
         except OSError as e:
             if e.errno != errno.ENOENT:
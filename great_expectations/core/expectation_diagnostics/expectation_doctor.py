@@ -37,6 +37,7 @@ from great_expectations.expectations.expectation_configuration import (
 from great_expectations.expectations.registry import (
     _registered_metrics,
     _registered_renderers,
+    register_core_metrics,
 )
 from great_expectations.render import (
     CollapseContent,
@@ -128,6 +129,9 @@ class ExpectationDoctor:
             _debug = lambda x: x  # noqa: E731
             _error = lambda x: x  # noqa: E731
 
+        # Execution engine diagnostics inspect the providers of every (core) Metric.
+        register_core_metrics()
+
         library_metadata: AugmentedLibraryMetadata = self._get_augmented_library_metadata()
         examples: List[ExpectationTestDataCases] = self._get_examples(
             return_only_gallery_examples=False
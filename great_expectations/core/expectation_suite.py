@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import builtins
 import json
 import logging
 import uuid
+from contextlib import contextmanager
 from copy import deepcopy
 from typing import (
     TYPE_CHECKING,
+    Any,
+    ClassVar,
     Dict,
+    Hashable,
+    Iterator,
     List,
     Optional,
     Sequence,
@@ -74,6 +80,11 @@ class ExpectationSuite(SerializableDictDot):
         id: Great Expectations Cloud id for this Expectation Suite.
     """
 
+    # Built lazily (and rebuilt whenever "expectations" has been replaced or resized by others).
+    _expectation_index: Optional[_ExpectationIndex] = None
+    _batch_edit_depth: int = 0
+    _EQUALISH_EXCLUDED_FIELDS: ClassVar[set] = {"id", "rendered_content", "notes", "meta"}
+
     def __init__(  # noqa: PLR0913
         self,
         name: Optional[str] = None,
@@ -143,16 +154,13 @@ class ExpectationSuite(SerializableDictDot):
                 "it first (the core expectations and some others support copy(expectation)) "
                 "and set `Expectation.id = None`."
             )
-        should_save_expectation = self._has_been_saved()
-
-        already_added = any(
-            self._expectations_are_equalish(expectation, exp) for exp in self.expectations
-        )
+        expectation_index = self._get_expectation_index()
+        already_added = bool(expectation_index.find_equalish(expectation))
         if not already_added:
             # suite is a set-like collection, so don't add if it not unique
-            if should_save_expectation:
+            if not self._batch_edit_depth and self._has_been_saved():
                 expectation = self._store.add_expectation(suite=self, expectation=expectation)
-            self.expectations.append(expectation)
+            expectation_index.append(expectation)
 
         expectation.register_save_callback(save_callback=self._save_expectation)
 
@@ -160,19 +168,87 @@ class ExpectationSuite(SerializableDictDot):
 
         return expectation
 
-    @staticmethod
-    def _expectations_are_equalish(expectation_a: Expectation, expectation_b: Expectation) -> bool:
+    @public_api
+    def add_expectations(self, expectations: Sequence[_TExpectation]) -> List[_TExpectation]:
+        """Add Expectations to the collection; the suite (if saved before) is persisted once, for all of them.
+
+        Example:
+            >>> suite.add_expectations([gxe.ExpectColumnToExist(column=column) for column in columns])
+        """  # noqa: E501
+        with self.batch_edit():
+            return [self.add_expectation(expectation=expectation) for expectation in expectations]
+
+    @public_api
+    @contextmanager
+    def batch_edit(self) -> Iterator[ExpectationSuite]:
+        """Context manager, which defers persisting of changes to this ExpectationSuite until it exits.
+
+        Expectations added, deleted, or saved within the block are persisted once, by saving the whole suite, when
+        the block exits without error (and only if the suite had been saved before the block was entered).
+
+        Example:
+            >>> with suite.batch_edit():
+            ...     for column in columns:
+            ...         suite.add_expectation(gxe.ExpectColumnToExist(column=column))
+        """  # noqa: E501
+        if self._batch_edit_depth:
+            # Changes of nested block are persisted by outermost one.
+            self._batch_edit_depth += 1
+            try:
+                yield self
+            finally:
+                self._batch_edit_depth -= 1
+            return
+
+        should_save_suite = self._has_been_saved()
+        self._batch_edit_depth = 1
+        try:
+            yield self
+        finally:
+            self._batch_edit_depth = 0
+
+        if should_save_suite:
+            self._save_batch_edit()
+
+    def _save_batch_edit(self) -> None:
+        unsaved_expectations = [exp for exp in self.expectations if not exp.id]
+        self.save()
+        # Expectations may have been replaced by their persisted copies (e.g., by GX Cloud), which
+        # carry ids of newly added Expectations.
+        expectation_index = self._get_expectation_index()
+        for expectation in unsaved_expectations:
+            if expectation.id:
+                continue
+
+            for persisted_expectation in expectation_index.find_equalish(expectation):
+                if persisted_expectation.id:
+                    expectation.id = persisted_expectation.id
+                    break
+
+    @classmethod
+    def _expectations_are_equalish(
+        cls, expectation_a: Expectation, expectation_b: Expectation
+    ) -> bool:
         """
         Helper method to determine if two expectations are equal enough to be considered the same.
 
         Note that this check is less stringent than Expectation.__eq__ and excludes a few fields
         that are not relevant for uniqueness in the suite.
         """
-        exclude_params = {"id", "rendered_content", "notes", "meta"}
-        return expectation_a.dict(exclude=exclude_params) == expectation_b.dict(
-            exclude=exclude_params
+        return (
+            expectation_a.expectation_type == expectation_b.expectation_type
+            and expectation_a.dict(exclude=cls._EQUALISH_EXCLUDED_FIELDS)
+            == expectation_b.dict(exclude=cls._EQUALISH_EXCLUDED_FIELDS)
         )
 
+    def _get_expectation_index(self) -> _ExpectationIndex:
+        if self._expectation_index is None or not self._expectation_index.is_index_of(
+            self.expectations
+        ):
+            self._expectation_index = _ExpectationIndex(expectations=self.expectations)
+
+        return self._expectation_index
+
     def _submit_expectation_created_event(self, expectation: Expectation) -> None:
         if expectation.__module__.startswith("great_expectations."):
             custom_exp_type = False
@@ -233,24 +309,21 @@ class ExpectationSuite(SerializableDictDot):
         Raises:
             KeyError: Expectation not found in suite.
         """
-        remaining_expectations = [
-            exp
-            for exp in self.expectations
-            if not self._expectations_are_equalish(exp, expectation)
-        ]
-        if len(remaining_expectations) != len(self.expectations) - 1:
+        expectation_index = self._get_expectation_index()
+        matching_expectations = expectation_index.find_equalish(expectation)
+        if len(matching_expectations) != 1:
             raise KeyError("No matching expectation was found.")  # noqa: TRY003
 
-        self.expectations = remaining_expectations
+        expectation_index.remove(matching_expectations[0])
 
-        if self._has_been_saved():
+        if not self._batch_edit_depth and self._has_been_saved():
             # only persist on delete if the suite has already been saved
             try:
                 self._store.delete_expectation(suite=self, expectation=expectation)
             except Exception as exc:
                 # rollback this change
                 # expectation suite is set-like so order of expectations doesn't matter
-                self.expectations.append(expectation)
+                expectation_index.append(expectation)
                 raise exc  # noqa: TRY201
 
         submit_event(
@@ -270,6 +343,8 @@ class ExpectationSuite(SerializableDictDot):
             self.render()
         key = self._store.get_key(name=self.name, id=self.id)
         self._store.update(key=key, value=self)
+        # Store assigns ids of (and may replace) Expectations.
+        self._expectation_index = None
 
     def is_fresh(self) -> ExpectationSuiteFreshnessDiagnostics:
         diagnostics = self._is_added()
@@ -318,6 +393,9 @@ class ExpectationSuite(SerializableDictDot):
         return self._store.has_key(key=key)
 
     def _save_expectation(self, expectation) -> Expectation:
+        if self._batch_edit_depth:
+            return expectation
+
         expectation = self._store.update_expectation(suite=self, expectation=expectation)
         submit_event(
             event=ExpectationSuiteExpectationUpdatedEvent(
@@ -493,17 +571,28 @@ class ExpectationSuite(SerializableDictDot):
                 "Ensure that expectation configuration is valid."
             )
 
+        expectation_index = self._get_expectation_index()
+        if id is not None:
+            candidates = expectation_index.find_by_id(id=str(id))
+        else:
+            # Only Expectations of same type can match (their configurations are built only then).
+            candidates = expectation_index.find_by_type(
+                expectation_type=expectation_configuration.type  # type: ignore[union-attr]
+            )
+        if not candidates:
+            return []
+
+        candidate_object_ids = {builtins.id(candidate) for candidate in candidates}
         match_indexes = []
         for idx, expectation in enumerate(self.expectations):
-            if id is not None:
-                if expectation.id == id:
-                    match_indexes.append(idx)
-            else:  # noqa: PLR5501
-                if expectation.configuration.isEquivalentTo(
-                    other=expectation_configuration,  # type: ignore[arg-type]
-                    match_type=match_type,
-                ):
-                    match_indexes.append(idx)
+            if builtins.id(expectation) not in candidate_object_ids:
+                continue
+
+            if id is not None or expectation.configuration.isEquivalentTo(
+                other=expectation_configuration,  # type: ignore[arg-type]
+                match_type=match_type,
+            ):
+                match_indexes.append(idx)
 
         return match_indexes
 
@@ -552,8 +641,11 @@ class ExpectationSuite(SerializableDictDot):
                 if existing_expectation_id is not None:
                     expectation_configuration.id = existing_expectation_id
 
-                self.expectations[found_expectation_indexes[0]] = self._build_expectation(
-                    expectation_configuration=expectation_configuration
+                self._get_expectation_index().replace(
+                    position=found_expectation_indexes[0],
+                    expectation=self._build_expectation(
+                        expectation_configuration=expectation_configuration
+                    ),
                 )
             else:
                 raise gx_exceptions.DataContextError(  # noqa: TRY003
@@ -561,7 +653,7 @@ class ExpectationSuite(SerializableDictDot):
                     "ExpectationConfiguration, set overwrite_existing=True"
                 )
         else:
-            self.expectations.append(
+            self._get_expectation_index().append(
                 self._build_expectation(expectation_configuration=expectation_configuration)
             )
 
@@ -666,6 +758,148 @@ class ExpectationSuite(SerializableDictDot):
 _TExpectationSuite = TypeVar("_TExpectationSuite", ExpectationSuite, dict)
 
 
+class _ExpectationIndex:
+    """Hash index of list of Expectations: by identity (as compared by "ExpectationSuite._expectations_are_equalish()"), by type, and by id.
+
+    Index is kept up to date by ExpectationSuite methods, which modify the list through it.  Ids may be assigned to
+    Expectations after they have been indexed (e.g., by store), so that lookups by id, which do not find any, rebuild
+    the index of ids.  Likewise, Expectations may be edited in place (which changes their identity); lookups by
+    identity, which do not find any, rebuild the index only if some Expectation has been edited (or saved) since it
+    was built (see "Expectation._last_configuration_edit"), so that adding many new Expectations stays linear.
+    """  # noqa: E501
+
+    def __init__(self, expectations: List[Expectation]) -> None:
+        self._expectations = expectations
+        self.rebuild()
+
+    def is_index_of(self, expectations: List[Expectation]) -> bool:
+        # Elements of list may have been replaced (e.g., by "suite.expectations[0] = ...").
+        return (
+            expectations is self._expectations
+            and len(expectations) == self._size
+            and all(map(self._identity_keys.__contains__, map(id, expectations)))
+        )
+
+    def rebuild(self) -> _ExpectationIndex:
+        from great_expectations.expectations.expectation import Expectation
+
+        self._last_configuration_edit = Expectation._last_configuration_edit
+        self._size = 0
+        self._identity_keys: Dict[int, Hashable] = {}
+        self._by_identity: Dict[Hashable, List[Expectation]] = {}
+        self._by_type: Dict[str, List[Expectation]] = {}
+        for expectation in self._expectations:
+            self._add(expectation)
+
+        self._build_id_index()
+        return self
+
+    def append(self, expectation: Expectation) -> None:
+        self._expectations.append(expectation)
+        self._add(expectation)
+        if expectation.id:
+            self._by_id.setdefault(str(expectation.id), []).append(expectation)
+
+    def replace(self, position: int, expectation: Expectation) -> None:
+        self._discard(self._expectations[position])
+        self._expectations[position] = expectation
+        self._add(expectation)
+        self._build_id_index()
+
+    def remove(self, expectation: Expectation) -> None:
+        for position, indexed_expectation in enumerate(self._expectations):
+            if indexed_expectation is expectation:
+                del self._expectations[position]
+                break
+
+        self._discard(expectation)
+        self._build_id_index()
+
+    def find_equalish(self, expectation: Expectation) -> List[Expectation]:
+        from great_expectations.expectations.expectation import Expectation
+
+        identity_key = self._identity_key(expectation)
+        expectations = self._find_equalish(expectation=expectation, identity_key=identity_key)
+        if not expectations and (
+            self._last_configuration_edit != Expectation._last_configuration_edit
+        ):
+            # Expectations may have been edited in place, since they were indexed.
+            expectations = self.rebuild()._find_equalish(
+                expectation=expectation, identity_key=identity_key
+            )
+
+        return expectations
+
+    def find_by_type(self, expectation_type: str) -> List[Expectation]:
+        return self._by_type.get(expectation_type, [])
+
+    def find_by_id(self, id: str) -> List[Expectation]:
+        expectations = [
+            expectation for expectation in self._by_id.get(id, []) if str(expectation.id) == id
+        ]
+        if not expectations:
+            self._build_id_index()
+            expectations = self._by_id.get(id, [])
+
+        return expectations
+
+    def _find_equalish(self, expectation: Expectation, identity_key: Hashable) -> List[Expectation]:
+        return [
+            indexed_expectation
+            for indexed_expectation in self._by_identity.get(identity_key, [])
+            if ExpectationSuite._expectations_are_equalish(indexed_expectation, expectation)
+        ]
+
+    def _add(self, expectation: Expectation) -> None:
+        identity_key = self._identity_key(expectation)
+        self._identity_keys[id(expectation)] = identity_key
+        self._by_identity.setdefault(identity_key, []).append(expectation)
+        self._by_type.setdefault(expectation.expectation_type, []).append(expectation)
+        self._size += 1
+
+    def _discard(self, expectation: Expectation) -> None:
+        identity_key = self._identity_keys.pop(id(expectation))
+        self._by_identity[identity_key] = [
+            indexed_expectation
+            for indexed_expectation in self._by_identity[identity_key]
+            if indexed_expectation is not expectation
+        ]
+        self._by_type[expectation.expectation_type] = [
+            indexed_expectation
+            for indexed_expectation in self._by_type[expectation.expectation_type]
+            if indexed_expectation is not expectation
+        ]
+        self._size -= 1
+
+    def _build_id_index(self) -> None:
+        self._by_id: Dict[str, List[Expectation]] = {}
+        for expectation in self._expectations:
+            if expectation.id:
+                self._by_id.setdefault(str(expectation.id), []).append(expectation)
+
+    @staticmethod
+    def _identity_key(expectation: Expectation) -> Hashable:
+        return (
+            expectation.expectation_type,
+            _to_hashable(expectation.dict(exclude=ExpectationSuite._EQUALISH_EXCLUDED_FIELDS)),
+        )
+
+
+def _to_hashable(value: Any) -> Hashable:
+    """Converts value to hashable one, so that equal values (e.g., 1 and 1.0) are converted to equal ones."""  # noqa: E501
+    if isinstance(value, dict):
+        return frozenset((key, _to_hashable(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_to_hashable(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_to_hashable(item) for item in value)
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
 class ExpectationSuiteSchema(Schema):
     name = fields.Str()
     id = fields.UUID(required=False, allow_none=True)
@@ -2,31 +2,101 @@ from __future__ import annotations
 
 import hashlib
 import json
-from typing import Any, Set, TypeVar, Union
+from typing import Any, Optional, Set, Tuple, TypeVar, Union
 
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.util import convert_to_json_serializable  # noqa: TID251
 
 T = TypeVar("T")
 
+# Single-value identifiers longer than this (e.g., of large value sets) are replaced by digests.
+MAX_INLINE_ID_LENGTH: int = 1_000
+
 
 class IDDict(dict):
+    """Dictionary, whose contents are summarized by a deterministic identifier (see "to_id()").
+
+    The identifier computed with default arguments is memoized and is reset whenever the dictionary itself is mutated.
+    Mutating nested values in place (e.g., appending to a list value) is not detected; such values must be reassigned.
+    """  # noqa: E501
+
     _id_ignore_keys: Set[str] = set()
 
+    # Memoized result of "to_id()" with default arguments (None, if not computed or invalidated).
+    _cached_id: Optional[Union[str, Tuple]] = None
+
     def to_id(self, id_keys=None, id_ignore_keys=None):
+        use_cache: bool = id_keys is None and id_ignore_keys is None
+        if use_cache and self._cached_id is not None:
+            return self._cached_id
+
         if id_keys is None:
             id_keys = self.keys()
         if id_ignore_keys is None:
             id_ignore_keys = self._id_ignore_keys
         id_keys = set(id_keys) - set(id_ignore_keys)
         if len(id_keys) == 0:
-            return tuple()
+            _id = tuple()
         elif len(id_keys) == 1:
             key = list(id_keys)[0]
-            return f"{key}={self[key]!s}"
+            value_str: str = str(self[key])
+            if len(value_str) > MAX_INLINE_ID_LENGTH:
+                value_str = f"md5:{hashlib.md5(value_str.encode('utf-8')).hexdigest()}"
+
+            _id = f"{key}={value_str}"
+        else:
+            _id_dict = convert_to_json_serializable(data={k: self[k] for k in id_keys})
+            _id = hashlib.md5(json.dumps(_id_dict, sort_keys=True).encode("utf-8")).hexdigest()
+
+        if use_cache:
+            # Bypass "__setattr__", which "DotDict" subclasses map onto dictionary items.
+            object.__setattr__(self, "_cached_id", _id)
+
+        return _id
+
+    def _invalidate_id(self) -> None:
+        if self._cached_id is not None:
+            object.__setattr__(self, "_cached_id", None)
+
+    @override
+    def __setitem__(self, key, value) -> None:
+        self._invalidate_id()
+        super().__setitem__(key, value)
+
+    @override
+    def __delitem__(self, key) -> None:
+        self._invalidate_id()
+        super().__delitem__(key)
+
+    @override
+    def __ior__(self, other):  # type: ignore[override,misc]
+        self._invalidate_id()
+        return super().__ior__(other)
+
+    @override
+    def update(self, *args, **kwargs) -> None:
+        self._invalidate_id()
+        super().update(*args, **kwargs)
+
+    @override
+    def setdefault(self, key, default=None):
+        self._invalidate_id()
+        return super().setdefault(key, default)
+
+    @override
+    def pop(self, key, *args):
+        self._invalidate_id()
+        return super().pop(key, *args)
 
-        _id_dict = convert_to_json_serializable(data={k: self[k] for k in id_keys})
-        return hashlib.md5(json.dumps(_id_dict, sort_keys=True).encode("utf-8")).hexdigest()
+    @override
+    def popitem(self):
+        self._invalidate_id()
+        return super().popitem()
+
+    @override
+    def clear(self) -> None:
+        self._invalidate_id()
+        super().clear()
 
     @override
     def __hash__(self) -> int:  # type: ignore[override]
@@ -241,7 +241,7 @@ class ValidationDefinition(BaseModel):
         return batch_definition
 
     @public_api
-    def run(
+    def run(  # noqa: PLR0913
         self,
         *,
         checkpoint_id: Optional[str] = None,
@@ -249,6 +249,7 @@ class ValidationDefinition(BaseModel):
         expectation_parameters: Optional[SuiteParameterDict] = None,
         result_format: ResultFormatUnion = DEFAULT_RESULT_FORMAT,
         run_id: RunIdentifier | None = None,
+        project_columns: bool = False,
     ) -> ExpectationSuiteValidationResult:
         """
         Runs a validation using the configured data and suite.
@@ -272,6 +273,10 @@ class ValidationDefinition(BaseModel):
               definition. Otherwise, it should be None.
             run_id: An identifier for this run. Typically, this should be set to None and it will
               be generated by this call.
+            project_columns: If True (default is False), then only the columns referenced by the
+              suite are loaded, where the data asset supports it (e.g., CSV, Parquet and Feather
+              files read with pandas, or files read with Spark). Table metrics, such as the
+              columns of the table, still report all columns of the data.
         """
         diagnostics = self.is_fresh()
         if not diagnostics.success:
@@ -285,8 +290,21 @@ class ValidationDefinition(BaseModel):
             batch_definition=self.batch_definition,
             batch_parameters=batch_parameters,
             result_format=result_format,
+            project_columns=project_columns,
         )
-        results = validator.validate_expectation_suite(self.suite, expectation_parameters)
+        try:
+            results = validator.validate_expectation_suite(self.suite, expectation_parameters)
+            (
+                expectation_suite_identifier,
+                validation_result_id,
+            ) = self._get_expectation_suite_and_validation_result_ids(
+                validator=validator, run_id=run_id
+            )
+        finally:
+            # The execution engine is shared by the datasource; the batch data and the metrics
+            # cached for it are not needed once the suite is validated.
+            validator.unload_batch()
+
         results.meta["validation_id"] = self.id
         results.meta["checkpoint_id"] = checkpoint_id
 
@@ -303,13 +321,6 @@ class ValidationDefinition(BaseModel):
         else:
             results.meta["batch_parameters"] = None
 
-        (
-            expectation_suite_identifier,
-            validation_result_id,
-        ) = self._get_expectation_suite_and_validation_result_ids(
-            validator=validator, run_id=run_id
-        )
-
         ref = self._validation_results_store.store_validation_results(
             suite_validation_result=results,
             suite_validation_result_identifier=validation_result_id,
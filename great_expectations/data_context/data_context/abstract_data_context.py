@@ -2414,6 +2414,8 @@ class AbstractDataContext(ConfigPeer, ABC):
 
         with open(config_variables_filepath, "w") as config_variables_file:
             yaml.dump(config_variables, config_variables_file)
+        # The file may be rewritten within the resolution of its modification time.
+        self.config_provider.invalidate_cache()
 
     def _load_fluent_config(self, config_provider: _ConfigurationProvider) -> GxConfig:
         """Called at beginning of DataContext __init__ after config_providers init."""
@@ -4,7 +4,7 @@ import logging
 import urllib
 import uuid
 from abc import ABCMeta, abstractmethod
-from typing import Any, List, Optional, Union
+from typing import Any, Iterable, Iterator, List, Optional, Tuple, Union
 
 import pyparsing as pp
 
@@ -124,6 +124,21 @@ class StoreBackend(metaclass=ABCMeta):
     def get_all(self):
         return self._get_all()
 
+    def get_many(
+        self, keys: Iterable[tuple], skip_missing_keys: bool = False
+    ) -> Iterator[Tuple[tuple, Any]]:
+        """Yields "(key, value)" pairs of "keys" (in their order).
+
+        Values are yielded as soon as they are retrieved, so that callers can process them while remaining values are
+        still being fetched (backends may fetch several values concurrently).  If "skip_missing_keys" is True, keys
+        without values are logged and skipped; otherwise, "InvalidKeyError" is raised.
+        """  # noqa: E501
+        keys = list(keys)
+        for key in keys:
+            self._validate_key(key)
+
+        return self._get_many(keys=keys, skip_missing_keys=skip_missing_keys)
+
     def set(self, key, value, **kwargs):
         self._validate_key(key)
         self._validate_value(value)
@@ -219,6 +234,19 @@ class StoreBackend(metaclass=ABCMeta):
     def _get_all(self) -> list[Any]:
         raise NotImplementedError
 
+    def _get_many(self, keys: List[tuple], skip_missing_keys: bool) -> Iterator[Tuple[tuple, Any]]:
+        for key in keys:
+            try:
+                value = self._get(key)
+            except InvalidKeyError:
+                if not skip_missing_keys:
+                    raise
+
+                logger.warning(f"Object with Key: {key!s} could not be retrieved. Skipping...")
+                continue
+
+            yield key, value
+
     @abstractmethod
     def _set(self, key, value, **kwargs) -> None:
         raise NotImplementedError
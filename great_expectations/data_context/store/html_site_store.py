@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 import os
 import pathlib
 import re
 import tempfile
 from mimetypes import guess_type
-from typing import Optional
+from typing import Any, Dict, Optional
 from zipfile import ZipFile, is_zipfile
 
+from great_expectations import __version__ as ge_version
 from great_expectations.core.data_context_key import DataContextKey
 from great_expectations.data_context.store.gx_cloud_store_backend import (
     GXCloudStoreBackend,
@@ -32,6 +35,8 @@ from great_expectations.util import (
 
 logger = logging.getLogger(__name__)
 
+BUILD_MANIFEST_KEY = ("build_manifest.json",)
+
 
 class HtmlSiteStore:
     """
@@ -242,6 +247,9 @@ class HtmlSiteStore:
         # can't necessarily set and list_keys like most other Stores.
         self.keys = set()  # type: ignore[var-annotated]
 
+        # Loaded lazily (on first access) from "static_assets" store backend.
+        self._build_manifest: Optional[SiteBuildManifest] = None
+
         # Gather the call arguments of the present function (include the "module_name" and add the "class_name"), filter  # noqa: E501
         # out the Falsy values, and set the instance "_config" variable equal to the resulting dictionary.  # noqa: E501
         self._config = {
@@ -357,12 +365,45 @@ class HtmlSiteStore:
             content_type="text/html; " "charset=utf-8",
         )
 
+    @property
+    def build_manifest(self) -> SiteBuildManifest:
+        """Manifest of pages, which have been rendered by previous builds of site."""
+        if self._build_manifest is None:
+            self._build_manifest = self._load_build_manifest()
+
+        return self._build_manifest
+
+    def _load_build_manifest(self) -> SiteBuildManifest:
+        try:
+            manifest_json = self.store_backends["static_assets"].get(BUILD_MANIFEST_KEY)
+            return SiteBuildManifest.from_json_dict(json.loads(manifest_json))
+        except Exception as e:
+            logger.debug(
+                f"Data Docs build manifest could not be loaded; rebuilding all pages: {e!s}"
+            )
+            return SiteBuildManifest()
+
+    def write_build_manifest(self) -> None:
+        if self._build_manifest is None or isinstance(
+            self.store_backends["static_assets"], GXCloudStoreBackend
+        ):
+            return
+
+        self.store_backends["static_assets"].set(
+            BUILD_MANIFEST_KEY,
+            json.dumps(self._build_manifest.to_json_dict()),
+            content_encoding="utf-8",
+            content_type="application/json; charset=utf-8",
+        )
+
     def clean_site(self) -> None:
         for _, target_store_backend in self.store_backends.items():
             keys = target_store_backend.list_keys()
             for key in keys:
                 target_store_backend.remove_key(key)
 
+        self._build_manifest = SiteBuildManifest()
+
     def copy_static_assets(  # noqa: C901 - 11
         self, static_assets_source_dir: str | None = None
     ):
@@ -468,3 +509,63 @@ class HtmlSiteStore:
     @property
     def config(self) -> dict:
         return self._config
+
+
+class SiteBuildManifest:
+    """Records, per site section and resource, content hash of source of rendered page and summary fields of index page.
+
+    Incremental builds of Data Docs render only those resources, whose content hashes differ from those, recorded in
+    manifest, and build index page from recorded summaries (e.g., "success" of Validation Results), without loading
+    resources themselves.  Manifest, written by another version of Great Expectations, is discarded.
+    """  # noqa: E501
+
+    def __init__(self, sections: Optional[Dict[str, Dict[str, dict]]] = None) -> None:
+        self._sections: Dict[str, Dict[str, dict]] = sections or {}
+
+    @staticmethod
+    def compute_content_hash(serialized_value: Any, render_signature: str = "") -> str:
+        """Returns hash of serialized resource (and of "render_signature", identifying renderer and view of page)."""  # noqa: E501
+        if isinstance(serialized_value, str):
+            content = serialized_value.encode("utf-8")
+        elif isinstance(serialized_value, bytes):
+            content = serialized_value
+        else:
+            content = json.dumps(serialized_value, sort_keys=True, default=str).encode("utf-8")
+
+        content_hash = hashlib.sha256(content)
+        content_hash.update(render_signature.encode("utf-8"))
+        return content_hash.hexdigest()
+
+    def get_entry(self, section_name: str, resource_key: DataContextKey) -> Optional[dict]:
+        return self._sections.get(section_name, {}).get(self._resource_key_to_str(resource_key))
+
+    def has_unchanged_entry(
+        self, section_name: str, resource_key: DataContextKey, content_hash: str
+    ) -> bool:
+        entry: Optional[dict] = self.get_entry(section_name=section_name, resource_key=resource_key)
+        return entry is not None and entry.get("content_hash") == content_hash
+
+    def set_entry(
+        self, section_name: str, resource_key: DataContextKey, content_hash: str, **summary
+    ) -> None:
+        self._sections.setdefault(section_name, {})[self._resource_key_to_str(resource_key)] = {
+            "content_hash": content_hash,
+            **summary,
+        }
+
+    def remove_entry(self, section_name: str, resource_key: DataContextKey) -> None:
+        self._sections.get(section_name, {}).pop(self._resource_key_to_str(resource_key), None)
+
+    def to_json_dict(self) -> dict:
+        return {"great_expectations_version": ge_version, "sections": self._sections}
+
+    @classmethod
+    def from_json_dict(cls, manifest_dict: dict) -> SiteBuildManifest:
+        if manifest_dict.get("great_expectations_version") != ge_version:
+            return cls()
+
+        return cls(sections=manifest_dict.get("sections"))
+
+    @staticmethod
+    def _resource_key_to_str(resource_key: DataContextKey) -> str:
+        return "/".join(resource_key.to_tuple())
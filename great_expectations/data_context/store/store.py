@@ -7,6 +7,8 @@ from typing import (
     Any,
     ClassVar,
     Dict,
+    Iterable,
+    Iterator,
     List,
     Optional,
     Tuple,
@@ -247,6 +249,43 @@ class Store:
 
         return None
 
+    def get_many(
+        self, keys: Iterable[DataContextKey], skip_failed_keys: bool = False
+    ) -> Iterator[Tuple[DataContextKey, Optional[Any]]]:
+        """Yields "(key, value)" pairs of "keys" (in their order).
+
+        Values are retrieved by "StoreBackend.get_many" (concurrently, if backend supports it) and every value is
+        deserialized as soon as it arrives.  If "skip_failed_keys" is True, keys, whose values are missing or cannot be
+        deserialized, are logged and skipped; otherwise, the error is raised.
+        """  # noqa: E501
+        keys_by_tuple: Dict[Tuple[str, ...], DataContextKey] = {}
+        for key in keys:
+            self._validate_key(key)
+            keys_by_tuple[self.key_to_tuple(key)] = key
+
+        for key_tuple, serialized_value in self._store_backend.get_many(
+            keys=keys_by_tuple.keys(), skip_missing_keys=skip_failed_keys
+        ):
+            key = keys_by_tuple[key_tuple]
+            value = serialized_value
+            if self.cloud_mode and value:
+                value = self.gx_cloud_response_json_to_object_dict(response_json=value)
+
+            if not value:
+                yield key, None
+                continue
+
+            try:
+                deserialized_value = self.deserialize(value)
+            except (MarshmallowValidationError, PydanticValidationError, StoreBackendError):
+                if not skip_failed_keys:
+                    raise
+
+                logger.warning(f"Object with Key: {key!s} could not be deserialized. Skipping...")
+                continue
+
+            yield key, deserialized_value
+
     def get_all(self) -> list[Any]:
         objs = self._store_backend.get_all()
         if self.cloud_mode:
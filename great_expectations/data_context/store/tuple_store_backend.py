@@ -2,14 +2,18 @@
 from __future__ import annotations
 
 import functools
+import itertools
 import logging
 import os
 import pathlib
 import random
 import re
 import shutil
+import threading
 from abc import ABCMeta
-from typing import Any, List, Tuple
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, ClassVar, Deque, Iterator, List, Optional, Tuple
 
 from great_expectations.compatibility import aws
 from great_expectations.compatibility.typing_extensions import override
@@ -27,8 +31,13 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
 
     For example, in the following template path: expectations/{0}/{1}/{2}/prefix-{2}.json, keys must have
     three components.
+
+    Values, requested together (by "get_many"), are fetched by up to "get_many_max_workers" threads (defaults to
+    "DEFAULT_GET_MANY_MAX_WORKERS" of backend).
     """  # noqa: E501
 
+    DEFAULT_GET_MANY_MAX_WORKERS: ClassVar[int] = 1
+
     def __init__(  # noqa: PLR0913
         self,
         filepath_template=None,
@@ -41,6 +50,7 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
         manually_initialize_store_backend_id: str = "",
         base_public_path=None,
         store_name=None,
+        get_many_max_workers: Optional[int] = None,
     ) -> None:
         super().__init__(
             fixed_length_key=fixed_length_key,
@@ -48,6 +58,11 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
             manually_initialize_store_backend_id=manually_initialize_store_backend_id,
             store_name=store_name,
         )
+        if get_many_max_workers is not None and get_many_max_workers < 1:
+            raise ValueError(  # noqa: TRY003
+                f"get_many_max_workers must be positive; {get_many_max_workers} was given."
+            )
+        self._get_many_max_workers: int = get_many_max_workers or self.DEFAULT_GET_MANY_MAX_WORKERS
         if forbidden_substrings is None:
             forbidden_substrings = ["/", "\\"]
         self.forbidden_substrings = forbidden_substrings
@@ -208,6 +223,66 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
                 "Have you included all elements in the key tuple?"
             )
 
+    @property
+    def get_many_max_workers(self) -> int:
+        return self._get_many_max_workers
+
+    @override
+    def _get_all(self) -> list[Any]:
+        keys = [key for key in self.list_keys() if key != StoreBackend.STORE_BACKEND_ID_KEY]
+        return [value for _, value in self._get_many(keys=keys, skip_missing_keys=False)]
+
+    @override
+    def _get_many(self, keys: List[tuple], skip_missing_keys: bool) -> Iterator[Tuple[tuple, Any]]:
+        get_value: Callable[[tuple], Any] = self._build_get_many_value_getter()
+        max_workers: int = min(self._get_many_max_workers, len(keys))
+        value_retrievers: Iterator[Tuple[tuple, Callable[[], Any]]]
+        if max_workers > 1:
+            value_retrievers = self._fetch_values_concurrently(
+                get_value=get_value, keys=keys, max_workers=max_workers
+            )
+        else:
+            value_retrievers = ((key, functools.partial(get_value, key)) for key in keys)
+
+        for key, retrieve_value in value_retrievers:
+            try:
+                value = retrieve_value()
+            except InvalidKeyError:
+                if not skip_missing_keys:
+                    raise
+
+                logger.warning(f"Object with Key: {key!s} could not be retrieved. Skipping...")
+                continue
+
+            yield key, value
+
+    def _build_get_many_value_getter(self) -> Callable[[tuple], Any]:
+        """Returns callable, which retrieves value of key; it is shared by all threads of "get_many" call."""  # noqa: E501
+        return self._get
+
+    def _fetch_values_concurrently(
+        self, get_value: Callable[[tuple], Any], keys: List[tuple], max_workers: int
+    ) -> Iterator[Tuple[tuple, Callable[[], Any]]]:
+        # At most "2 * max_workers" values are fetched ahead of consumer, so that memory use does not grow with number of keys.  # noqa: E501
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix=f"{self.__class__.__name__}_get_many",
+        )
+        pending: Deque[Tuple[tuple, Future]] = deque()
+        remaining_keys: Iterator[tuple] = iter(keys)
+        try:
+            for key in itertools.islice(remaining_keys, 2 * max_workers):
+                pending.append((key, executor.submit(get_value, key)))
+
+            while pending:
+                key, future = pending.popleft()
+                for next_key in itertools.islice(remaining_keys, 1):
+                    pending.append((next_key, executor.submit(get_value, next_key)))
+
+                yield key, future.result
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
     @property
     @override
     def config(self) -> dict:
@@ -236,6 +311,7 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
         manually_initialize_store_backend_id: str = "",
         base_public_path=None,
         store_name=None,
+        get_many_max_workers: Optional[int] = None,
     ) -> None:
         super().__init__(
             filepath_template=filepath_template,
@@ -248,6 +324,7 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
             manually_initialize_store_backend_id=manually_initialize_store_backend_id,
             base_public_path=base_public_path,
             store_name=store_name,
+            get_many_max_workers=get_many_max_workers,
         )
         if os.path.isabs(base_directory):  # noqa: PTH117
             self.full_base_directory = base_directory
@@ -288,6 +365,7 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
             "manually_initialize_store_backend_id": manually_initialize_store_backend_id,
             "base_public_path": base_public_path,
             "store_name": store_name,
+            "get_many_max_workers": get_many_max_workers,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -307,11 +385,6 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
 
         return contents
 
-    @override
-    def _get_all(self) -> list[Any]:
-        keys = [key for key in self.list_keys() if key != StoreBackend.STORE_BACKEND_ID_KEY]
-        return [self._get(key) for key in keys]
-
     def _set(self, key, value, **kwargs):  # type: ignore[explicit-override] # FIXME
         if not isinstance(key, tuple):
             key = key.to_tuple()
@@ -451,6 +524,8 @@ class TupleS3StoreBackend(TupleStoreBackend):
     The filepath_template is a string template used to convert the key to a filepath.
     """  # noqa: E501
 
+    DEFAULT_GET_MANY_MAX_WORKERS: ClassVar[int] = 16
+
     def __init__(  # noqa: PLR0913
         self,
         bucket,
@@ -468,6 +543,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
         base_public_path=None,
         endpoint_url=None,
         store_name=None,
+        get_many_max_workers: Optional[int] = None,
     ) -> None:
         super().__init__(
             filepath_template=filepath_template,
@@ -480,6 +556,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
             manually_initialize_store_backend_id=manually_initialize_store_backend_id,
             base_public_path=base_public_path,
             store_name=store_name,
+            get_many_max_workers=get_many_max_workers,
         )
         self.bucket = bucket
         if prefix:
@@ -519,6 +596,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
             "base_public_path = None": base_public_path,
             "endpoint_url": endpoint_url,
             "store_name": store_name,
+            "get_many_max_workers": get_many_max_workers,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -545,17 +623,10 @@ class TupleS3StoreBackend(TupleStoreBackend):
         return self._get_by_s3_object_key(client, s3_object_key)
 
     @override
-    def _get_all(self) -> list[Any]:
-        """Get all objects from the store.
-        NOTE: This is non-performant because we download each object separately.
-        See https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3/bucket/objects.html#objects
-        for the docs.
-        """
+    def _build_get_many_value_getter(self) -> Callable[[tuple], Any]:
+        # S3 clients are thread-safe; hence, one client serves all threads.
         client = self._create_client()
-        keys = self.list_keys()
-        keys = [k for k in keys if k != StoreBackend.STORE_BACKEND_ID_KEY]
-        s3_object_keys = [self._build_s3_object_key(key) for key in keys]
-        return [self._get_by_s3_object_key(client, key) for key in s3_object_keys]
+        return lambda key: self._get_by_s3_object_key(client, self._build_s3_object_key(key))
 
     def _get_by_s3_object_key(self, s3_client, s3_object_key):
         try:
@@ -753,6 +824,8 @@ class TupleGCSStoreBackend(TupleStoreBackend):
     The filepath_template is a string template used to convert the key to a filepath.
     """  # noqa: E501
 
+    DEFAULT_GET_MANY_MAX_WORKERS: ClassVar[int] = 16
+
     def __init__(  # noqa: PLR0913
         self,
         bucket,
@@ -769,6 +842,7 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         public_urls=True,
         base_public_path=None,
         store_name=None,
+        get_many_max_workers: Optional[int] = None,
     ) -> None:
         super().__init__(
             filepath_template=filepath_template,
@@ -781,6 +855,7 @@ class TupleGCSStoreBackend(TupleStoreBackend):
             manually_initialize_store_backend_id=manually_initialize_store_backend_id,
             base_public_path=base_public_path,
             store_name=store_name,
+            get_many_max_workers=get_many_max_workers,
         )
         self.bucket = bucket
         self.prefix = prefix
@@ -807,6 +882,7 @@ class TupleGCSStoreBackend(TupleStoreBackend):
             "public_urls": public_urls,
             "base_public_path": base_public_path,
             "store_name": store_name,
+            "get_many_max_workers": get_many_max_workers,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -835,16 +911,21 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         return self._get_by_gcs_object_key(bucket, key)
 
     @override
-    def _get_all(self) -> list[Any]:
+    def _build_get_many_value_getter(self) -> Callable[[tuple], Any]:
         from great_expectations.compatibility import google
 
-        gcs = google.storage.Client(project=self.project)
-        bucket = gcs.bucket(self.bucket)
+        # GCS clients are not guaranteed to be thread-safe; hence, every thread creates its own one.
+        thread_local = threading.local()
+
+        def get_value(key: tuple) -> Any:
+            if not hasattr(thread_local, "bucket"):
+                thread_local.bucket = google.storage.Client(project=self.project).bucket(
+                    self.bucket
+                )
 
-        keys = self.list_keys()
-        keys = [k for k in keys if k != StoreBackend.STORE_BACKEND_ID_KEY]
+            return self._get_by_gcs_object_key(thread_local.bucket, key)
 
-        return [self._get_by_gcs_object_key(bucket, key) for key in keys]
+        return get_value
 
     def _get_by_gcs_object_key(self, bucket, key):
         gcs_object_key = self._build_gcs_object_key(key)
@@ -988,6 +1069,8 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
     https://docs.microsoft.com/en-us/azure/storage/blobs/storage-quickstart-blobs-python
     """  # noqa: E501
 
+    DEFAULT_GET_MANY_MAX_WORKERS: ClassVar[int] = 16
+
     # We will use blobclient here
     def __init__(  # noqa: PLR0913
         self,
@@ -1005,6 +1088,7 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
         suppress_store_backend_id=False,
         manually_initialize_store_backend_id: str = "",
         store_name=None,
+        get_many_max_workers: Optional[int] = None,
     ) -> None:
         super().__init__(
             filepath_template=filepath_template,
@@ -1016,6 +1100,7 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
             suppress_store_backend_id=suppress_store_backend_id,
             manually_initialize_store_backend_id=manually_initialize_store_backend_id,
             store_name=store_name,
+            get_many_max_workers=get_many_max_workers,
         )
         self.connection_string = connection_string or os.environ.get(  # noqa: TID251
             "AZURE_STORAGE_CONNECTION_STRING"
@@ -1072,11 +1157,6 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
         )
         return self._container_client.download_blob(az_blob_key).readall().decode("utf-8")
 
-    @override
-    def _get_all(self) -> list[Any]:
-        keys = self.list_keys()
-        return [self._get(key) for key in keys]
-
     def _set(self, key, value, content_encoding="utf-8", **kwargs):  # type: ignore[explicit-override] # FIXME
         from great_expectations.compatibility.azure import ContentSettings
 
@@ -7,6 +7,7 @@ from typing import (
     Callable,
     Dict,
     Generic,
+    List,
     Mapping,
     Optional,
     Union,
@@ -59,6 +60,8 @@ class BatchRequest(pydantic.GenericModel, Generic[PartitionerT]):
             calling DataAsset.get_batch_parameters_keys(...).
         batch_slice: A python slice that can be used to filter the sorted batches by index.
             e.g. `batch_slice = "[-5:]"` will request only the last 5 batches after the options filter is applied.
+        columns: If set, only these columns (e.g., the ones referenced by an Expectation Suite) are loaded
+            by Data Assets reading files with pandas or Spark; other Data Assets load all columns.
 
     Returns:
         BatchRequest
@@ -86,6 +89,9 @@ class BatchRequest(pydantic.GenericModel, Generic[PartitionerT]):
     _batch_slice_input: Optional[BatchSlice] = pydantic.PrivateAttr(
         default=None,
     )
+    _columns: Optional[List[str]] = pydantic.PrivateAttr(
+        default=None,
+    )
 
     def __init__(self, **kwargs) -> None:
         _batch_slice_input: Optional[BatchSlice] = None
@@ -114,9 +120,30 @@ class BatchRequest(pydantic.GenericModel, Generic[PartitionerT]):
             raise ValueError(f"Failed to parse BatchSlice to slice: {e}")  # noqa: TRY003
         self._batch_slice_input = value
 
+    @property
+    def columns(self) -> Optional[List[str]]:
+        """The columns to load, or None to load all columns."""
+        return self._columns
+
+    def update_columns(self, value: Optional[List[str]] = None) -> None:
+        """Updates the columns to load on this BatchRequest.
+
+        Args:
+            value: The names of the columns to load, or None to load all columns.
+
+        Returns:
+            None
+        """
+        if value is not None and not all(isinstance(column, str) for column in value):
+            raise TypeError("BatchRequest columns must all be strings.")  # noqa: TRY003
+        self._columns = list(value) if value is not None else None
+
     class Config:
         extra = pydantic.Extra.forbid
-        property_set_methods = {"batch_slice": "update_batch_slice"}
+        property_set_methods = {
+            "batch_slice": "update_batch_slice",
+            "columns": "update_columns",
+        }
         validate_assignment = True
 
     @override
@@ -153,6 +153,8 @@ class PathDataAsset(DataAsset, Generic[DatasourceT, PartitionerT], ABC):
         batch_spec = self._data_connector.build_batch_spec(batch_definition=batch_definition)
         batch_spec_options = self._batch_spec_options_from_batch_request(batch_request)
         batch_spec.update(batch_spec_options)
+        if batch_request.columns is not None:
+            batch_spec["columns"] = batch_request.columns
 
         data, markers = execution_engine.get_batch_data_and_markers(batch_spec=batch_spec)
 
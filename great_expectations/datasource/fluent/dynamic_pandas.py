@@ -13,6 +13,7 @@ from typing import (
     Callable,
     Dict,
     Final,
+    ForwardRef,
     Hashable,
     Iterable,
     Iterator,
@@ -243,6 +244,16 @@ _TYPE_REF_LOCALS: Final[Dict[str, Type | Any]] = {
     "DtypeBackend": DtypeBackend,
 }
 
+# Names of annotations, which are resolved in the global namespace (see `_resolve_annotation`).
+_TYPE_REF_GLOBALS: Final[Dict[str, Type | Any]] = {
+    "Any": Any,
+    "Dict": Dict,
+    "List": List,
+    "Optional": Optional,
+    "Tuple": Tuple,
+    "Union": Union,
+}
+
 # TODO: make these functions a generator pipeline
 
 
@@ -331,6 +342,26 @@ def _get_annotation_type(param: inspect.Parameter) -> Union[Type, str, object]:
     return str_to_eval
 
 
+def _resolve_annotation(type_: Union[Type, str, object]) -> Union[Type, str, object]:
+    """
+    Evaluate a stringized annotation before the model is created.
+
+    Otherwise pydantic stores it as a forward reference, and analyzes the field twice: when
+    creating the model, and again on `update_forward_refs()`.
+    Annotations, which cannot be evaluated, are returned unchanged (and so are left to
+    `update_forward_refs()`).
+    """
+    if not isinstance(type_, str):
+        return type_
+    try:
+        return pydantic.typing.evaluate_forwardref(
+            ForwardRef(type_), _TYPE_REF_GLOBALS, _TYPE_REF_LOCALS
+        )
+    except (NameError, SyntaxError, TypeError) as e:
+        logger.debug(f"unable to resolve annotation {type_!r} - {type(e).__name__}:{e}")
+        return type_
+
+
 def _to_pydantic_fields(
     sig_tuple: _SignatureTuple, skip_first_param: bool
 ) -> Dict[str, _FieldSpec]:
@@ -364,7 +395,8 @@ def _to_pydantic_fields(
                     continue
 
             fields_dict[param_name] = _FieldSpec(
-                type=_replace_builtins(type_), default_value=_get_default_value(param)
+                type=_resolve_annotation(_replace_builtins(type_)),
+                default_value=_get_default_value(param),
             )
 
     return fields_dict
@@ -427,7 +459,7 @@ def _generate_pandas_data_asset_models(
             asset_model = _create_pandas_asset_model(
                 model_name=model_name,
                 model_base=base_model_class,
-                type_field=(f"Literal['{type_name}']", type_name),
+                type_field=(Literal[type_name], type_name),  # type: ignore[valid-type]
                 fields_dict=fields,
                 extra=pydantic.Extra.forbid,
                 model_docstring=signature_tuple.docstring.partition("\n\nParameters")[0]
@@ -4,9 +4,11 @@ import copy
 import dataclasses
 import functools
 import logging
+import threading
 import uuid
 import warnings
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from pprint import pformat as pf
 from typing import (
     TYPE_CHECKING,
@@ -17,6 +19,7 @@ from typing import (
     Dict,
     Final,
     Generic,
+    Iterator,
     List,
     Mapping,
     MutableMapping,
@@ -25,6 +28,7 @@ from typing import (
     Protocol,
     Sequence,
     Set,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -612,6 +616,31 @@ def _sort_batch_identifiers_with_none_metadata_values(
 # If a Datasource can have more than 1 _DataAssetT, this will need to change.
 _DataAssetT = TypeVar("_DataAssetT", bound=DataAsset)
 
+# Execution engines, which Datasources serve to current thread (see "dedicated_execution_engines")
+_dedicated_execution_engines_state = threading.local()
+
+
+@contextmanager
+def dedicated_execution_engines(execution_engines: Dict[str, Any]) -> Iterator[None]:
+    """Within block, every Datasource serves execution engine of its own to current thread.
+
+    ExecutionEngine (with its loaded Batches, active Batch, and metric cache) is shared by all assets of Datasource and
+    is not safe for concurrent use; threads validating Batches of same Datasource concurrently (e.g., workers of
+    "Checkpoint.run()") enter this block, so that none of them sees Batches of another.
+
+    Args:
+        execution_engines: Execution engines of current thread, keyed by Datasource name; Datasources, which have none
+            yet, add new execution engine (built as their own would be), which caller is responsible for closing.
+    """  # noqa: E501
+    previous_execution_engines: Optional[Dict[str, Any]] = getattr(
+        _dedicated_execution_engines_state, "execution_engines", None
+    )
+    _dedicated_execution_engines_state.execution_engines = execution_engines
+    try:
+        yield
+    finally:
+        _dedicated_execution_engines_state.execution_engines = previous_execution_engines
+
 
 @public_api
 class Datasource(
@@ -649,6 +678,7 @@ class Datasource(
     # private attrs
     _data_context: Union[GXDataContext, None] = pydantic.PrivateAttr(None)
     _cached_execution_engine_kwargs: Dict[str, Any] = pydantic.PrivateAttr({})
+    _cached_execution_engine_fingerprint: Optional[Tuple[Any, ...]] = pydantic.PrivateAttr(None)
     _execution_engine: Union[_ExecutionEngineT, None] = pydantic.PrivateAttr(None)
 
     @property
@@ -747,6 +777,14 @@ class Datasource(
         assert isinstance(updated_datasource, Datasource)
 
     def get_execution_engine(self) -> _ExecutionEngineT:
+        dedicated_execution_engine = self._get_dedicated_execution_engine()
+        if dedicated_execution_engine is not None:
+            return dedicated_execution_engine
+
+        fingerprint = self._get_execution_engine_fingerprint()
+        if self._is_cached_execution_engine_current(fingerprint):
+            return self._execution_engine  # type: ignore[return-value] # checked to be set
+
         current_execution_engine_kwargs = self.dict(
             exclude=self._get_exec_engine_excludes(),
             config_provider=self._config_provider,
@@ -759,8 +797,61 @@ class Datasource(
                 **current_execution_engine_kwargs
             )
             self._cached_execution_engine_kwargs = current_execution_engine_kwargs
+        self._cached_execution_engine_fingerprint = fingerprint
         return self._execution_engine
 
+    def _get_dedicated_execution_engine(self) -> Optional[_ExecutionEngineT]:
+        """Execution engine of this Datasource, which is dedicated to current thread (None, unless it is within "dedicated_execution_engines()" block)."""  # noqa: E501
+        execution_engines: Optional[Dict[str, Any]] = getattr(
+            _dedicated_execution_engines_state, "execution_engines", None
+        )
+        if execution_engines is None:
+            return None
+
+        if self.name not in execution_engines:
+            # Copy without cached execution engine builds new one (and does not replace ours).
+            datasource = self.copy()
+            datasource._execution_engine = None
+            _dedicated_execution_engines_state.execution_engines = None
+            try:
+                execution_engines[self.name] = datasource.get_execution_engine()
+            finally:
+                _dedicated_execution_engines_state.execution_engines = execution_engines
+
+        return execution_engines[self.name]
+
+    def _get_execution_engine_fingerprint(self) -> Optional[Tuple[Any, ...]]:
+        """Snapshot of the fields and config values, from which the execution engine kwargs derive.
+
+        Comparing snapshots is much cheaper than serializing the datasource (and substituting its
+        config values) on every call of `get_execution_engine()`.
+
+        Returns:
+            The snapshot, or None if the fields cannot be copied (then kwargs are always compared).
+        """
+        excludes = self._get_exec_engine_excludes()
+        try:
+            fields = copy.deepcopy(
+                {name: getattr(self, name) for name in self.__fields__ if name not in excludes}
+            )
+        except Exception as e:
+            logger.debug(f"{self.name} - unable to snapshot execution engine fields: {e!r}")
+            return None
+
+        config_provider = self._config_provider
+        config_values = config_provider.get_values() if config_provider else None
+        return fields, frozenset(self.__fields_set__), config_values
+
+    def _is_cached_execution_engine_current(self, fingerprint: Optional[Tuple[Any, ...]]) -> bool:
+        if not self._execution_engine or fingerprint is None:
+            return False
+
+        try:
+            return bool(fingerprint == self._cached_execution_engine_fingerprint)
+        except Exception:
+            # e.g., fields holding arrays, whose comparison is ambiguous
+            return False
+
     def get_batch(self, batch_request: BatchRequest) -> Batch:
         """A Batch that corresponds to the BatchRequest.
 
@@ -10,6 +10,7 @@ from typing import (
     Any,
     Callable,
     ClassVar,
+    Dict,
     Generic,
     List,
     Literal,
@@ -138,6 +139,8 @@ work-around, until "type" naming convention and method for obtaining 'reader_met
                 config_provider=self._datasource._config_provider,
             ),
         )
+        if batch_request.columns is not None:
+            batch_spec["columns"] = batch_request.columns
         execution_engine: PandasExecutionEngine = self.datasource.get_execution_engine()
         data, markers = execution_engine.get_batch_data_and_markers(batch_spec=batch_spec)
 
@@ -489,6 +492,12 @@ class _PandasDatasource(Datasource, Generic[_DataAssetT]):
 
     # instance attributes
     assets: MutableSequence[_DataAssetT] = []
+    metric_cache_max_entries: Optional[int] = None
+    metric_cache_max_bytes: Optional[int] = None
+    metric_computation_max_workers: int = 1
+    metric_computation_timeout: Optional[float] = None
+    persistent_metric_cache: Optional[Dict[str, Any]] = None
+    value_set_semi_join_threshold: Optional[int] = None
 
     # Abstract Methods
     @property
@@ -7,6 +7,7 @@ from typing import (
     Any,
     Callable,
     ClassVar,
+    Dict,
     Hashable,
     Iterable,
     List,
@@ -140,6 +141,12 @@ _PandasDataAssetT = TypeVar("_PandasDataAssetT", bound=_PandasDataAsset)
 class _PandasDatasource(Datasource):
     asset_types: ClassVar[Sequence[Type[DataAsset]]]
     assets: MutableSequence[_PandasDataAssetT]  # type: ignore[valid-type]
+    metric_cache_max_entries: Optional[int]
+    metric_cache_max_bytes: Optional[int]
+    metric_computation_max_workers: int
+    metric_computation_timeout: Optional[float]
+    persistent_metric_cache: Optional[Dict[str, Any]]
+    value_set_semi_join_threshold: Optional[int]
     @property
     @override
     def execution_engine_type(self) -> Type[PandasExecutionEngine]: ...
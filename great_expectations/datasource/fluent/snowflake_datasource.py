@@ -722,6 +722,10 @@ class SnowflakeDatasource(SQLDatasource):
 
         For Snowflake specifically we may represent the connection_string as a dict, which is not supported by SQLAlchemy.
         """  # noqa: E501
+        dedicated_execution_engine = self._get_dedicated_execution_engine()
+        if dedicated_execution_engine is not None:
+            return dedicated_execution_engine
+
         gx_execution_engine_type: Type[SqlAlchemyExecutionEngine] = self.execution_engine_type
 
         connection_string: str | None = (
@@ -734,6 +738,14 @@ class SnowflakeDatasource(SQLDatasource):
             engine=self.get_engine(),
             create_temp_table=self.create_temp_table,
             data_context=self._data_context,
+            metric_cache_max_entries=self.metric_cache_max_entries,
+            metric_cache_max_bytes=self.metric_cache_max_bytes,
+            metric_computation_max_workers=self.metric_computation_max_workers,
+            metric_computation_timeout=self.metric_computation_timeout,
+            persistent_metric_cache=self.persistent_metric_cache,
+            value_set_semi_join_threshold=self.value_set_semi_join_threshold,
+            fuse_unexpected_rows_queries=self.fuse_unexpected_rows_queries,
+            schema_metadata_cache=self.schema_metadata_cache,
         )
         self._execution_engine = gx_exec_engine
         return gx_exec_engine
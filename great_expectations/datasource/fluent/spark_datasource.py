@@ -75,6 +75,12 @@ class _SparkDatasource(Datasource):
     spark_config: Union[SparkConfig, None] = None
     force_reuse_spark_context: bool = True
     persist: bool = True
+    metric_cache_max_entries: Optional[int] = None
+    metric_cache_max_bytes: Optional[int] = None
+    metric_computation_max_workers: int = 1
+    metric_computation_timeout: Optional[float] = None
+    persistent_metric_cache: Optional[Dict[str, Any]] = None
+    value_set_semi_join_threshold: Optional[int] = None
 
     # private attrs
     _spark: Union[SparkSession, None] = pydantic.PrivateAttr(None)
@@ -131,6 +137,14 @@ class _SparkDatasource(Datasource):
     def get_execution_engine(self) -> SparkDFExecutionEngine:
         # Method override is required because PrivateAttr _spark won't be passed into Execution Engine  # noqa: E501
         # unless it is passed explicitly.
+        dedicated_execution_engine = self._get_dedicated_execution_engine()
+        if dedicated_execution_engine is not None:
+            return dedicated_execution_engine
+
+        fingerprint = self._get_execution_engine_fingerprint()
+        if self._is_cached_execution_engine_current(fingerprint):
+            return self._execution_engine  # type: ignore[return-value] # checked to be set
+
         current_execution_engine_kwargs = self.dict(
             exclude=self._get_exec_engine_excludes(),
             config_provider=self._config_provider,
@@ -149,6 +163,7 @@ class _SparkDatasource(Datasource):
                 )
 
             self._cached_execution_engine_kwargs = current_execution_engine_kwargs
+        self._cached_execution_engine_fingerprint = fingerprint
         return self._execution_engine
 
     @override
@@ -17,6 +17,7 @@ from typing import (
     Optional,
     Protocol,
     Sequence,
+    Set,
     Tuple,
     Type,
     Union,
@@ -80,6 +81,10 @@ from great_expectations.execution_engine.partition_and_sample.data_partitioner i
 from great_expectations.execution_engine.partition_and_sample.sqlalchemy_data_partitioner import (
     SqlAlchemyDataPartitioner,
 )
+from great_expectations.execution_engine.sqlalchemy_schema_metadata_cache import (
+    DEFAULT_SCHEMA_METADATA_CACHE_TTL_SECONDS,
+    SqlAlchemySchemaMetadataCache,
+)
 
 if TYPE_CHECKING:
     from sqlalchemy.sql import quoted_name  # noqa: TID251 # type-checking only
@@ -1115,12 +1120,37 @@ class SQLDatasource(Datasource):
         create_temp_table: Whether to leverage temporary tables during metric computation.
         kwargs: Extra SQLAlchemy keyword arguments to pass to `create_engine()`. Note, only python
             primitive types will be serializable to config.
+        metric_cache_max_entries: Optional maximum number of computed metrics kept in memory.
+        metric_cache_max_bytes: Optional maximum estimated size (in bytes) of computed metrics kept
+            in memory (default is 512 MiB).
+        metric_computation_max_workers: If greater than 1 (default is 1), independent metrics are
+            computed concurrently, on this many threads.
+        metric_computation_timeout: Optional number of seconds to wait for concurrently computed
+            metrics of single resolution pass.
+        persistent_metric_cache: Optional settings of on-disk cache of computed metrics, which is
+            shared across runs (e.g., {"path": "gx_metrics.db", "ttl_seconds": 86400}).
+        value_set_semi_join_threshold: Optional number of values (default is 10,000), above which
+            value sets of membership metrics (e.g., "column_values.in_set") are loaded into value
+            set table and matched by "EXISTS" subquery, instead of being inlined into every query.
+        fuse_unexpected_rows_queries: If True, unexpected rows samples of map metrics sharing same
+            Domain are fetched by single query.
+        schema_metadata_cache_enabled: If True, column metadata of tables is cached, and shared by
+            all execution engines of this datasource, instead of being reflected for every batch.
+            Changes of tables (e.g., by "ALTER TABLE") are only picked up once cached metadata
+            expires, or is discarded by "refresh_schema_metadata()".
+        schema_metadata_cache_ttl_seconds: Number of seconds, after which cached column metadata
+            expires (default is 300; None, if it never expires).
         assets: An optional dictionary whose keys are SQL DataAsset names and whose values
             are SQL DataAsset objects.
     """
 
     # class var definitions
     asset_types: ClassVar[List[Type[DataAsset]]] = [TableAsset, QueryAsset]
+    # Schema metadata cache is owned by datasource (see "schema_metadata_cache"), not by engine.
+    _EXTRA_EXCLUDED_EXEC_ENG_ARGS: ClassVar[Set[str]] = {
+        "schema_metadata_cache_enabled",
+        "schema_metadata_cache_ttl_seconds",
+    }
 
     # right side of the operator determines the type name
     # left side enforces the names on instance creation
@@ -1132,6 +1162,15 @@ class SQLDatasource(Datasource):
         description="Optional dictionary of `kwargs` will be passed to the SQLAlchemy Engine"
         " as part of `create_engine(connection_string, **kwargs)`",
     )
+    metric_cache_max_entries: Optional[int] = None
+    metric_cache_max_bytes: Optional[int] = None
+    metric_computation_max_workers: int = 1
+    metric_computation_timeout: Optional[float] = None
+    persistent_metric_cache: Optional[Dict[str, Any]] = None
+    value_set_semi_join_threshold: Optional[int] = None
+    fuse_unexpected_rows_queries: bool = False
+    schema_metadata_cache_enabled: bool = False
+    schema_metadata_cache_ttl_seconds: Optional[float] = DEFAULT_SCHEMA_METADATA_CACHE_TTL_SECONDS
     # We need to explicitly add each asset type to the Union due to how
     # deserialization is implemented in our pydantic base model.
     assets: List[AssetTypes] = []
@@ -1139,6 +1178,8 @@ class SQLDatasource(Datasource):
     # private attrs
     _cached_connection_string: Union[str, ConfigStr] = pydantic.PrivateAttr("")
     _engine: Union[sqlalchemy.Engine, None] = pydantic.PrivateAttr(None)
+    # Shared by all execution engines of this Datasource (see "schema_metadata_cache").
+    _schema_metadata_cache: Optional[SqlAlchemySchemaMetadataCache] = pydantic.PrivateAttr(None)
 
     # These are instance var because ClassVars can't contain Type variables. See
     # https://peps.python.org/pep-0526/#class-and-instance-variable-annotations
@@ -1182,6 +1223,14 @@ class SQLDatasource(Datasource):
         # Overrides get_execution_engine in Datasource
         # because we need to pass the kwargs as keyvalue args to the execution engine
         # when then passes them to the engine.
+        dedicated_execution_engine = self._get_dedicated_execution_engine()
+        if dedicated_execution_engine is not None:
+            return dedicated_execution_engine
+
+        fingerprint = self._get_execution_engine_fingerprint()
+        if self._is_cached_execution_engine_current(fingerprint):
+            return self._execution_engine  # type: ignore[return-value] # checked to be set
+
         current_execution_engine_kwargs = self.dict(
             exclude=self._get_exec_engine_excludes(),
             config_provider=self._config_provider,
@@ -1189,18 +1238,51 @@ class SQLDatasource(Datasource):
             # but we want to include them here
             exclude_unset=False,
         )
+        schema_metadata_cache = self.schema_metadata_cache
         if (
             current_execution_engine_kwargs != self._cached_execution_engine_kwargs
             or not self._execution_engine
+            or self._execution_engine.schema_metadata_cache is not schema_metadata_cache
         ):
             self._cached_execution_engine_kwargs = current_execution_engine_kwargs
             engine_kwargs = current_execution_engine_kwargs.pop("kwargs", {})
             self._execution_engine = self._execution_engine_type()(
                 **current_execution_engine_kwargs,
+                schema_metadata_cache=schema_metadata_cache,
                 **engine_kwargs,
             )
+        self._cached_execution_engine_fingerprint = fingerprint
         return self._execution_engine
 
+    @property
+    def schema_metadata_cache(self) -> Optional[SqlAlchemySchemaMetadataCache]:
+        """Cache of column metadata of tables, shared by all execution engines of Datasource (None, if disabled)."""  # noqa: E501
+        if not self.schema_metadata_cache_enabled:
+            self._schema_metadata_cache = None
+        elif (
+            self._schema_metadata_cache is None
+            or self._schema_metadata_cache.ttl_seconds != self.schema_metadata_cache_ttl_seconds
+        ):
+            self._schema_metadata_cache = SqlAlchemySchemaMetadataCache(
+                ttl_seconds=self.schema_metadata_cache_ttl_seconds
+            )
+
+        return self._schema_metadata_cache
+
+    def refresh_schema_metadata(self, schema_name: Optional[str] = None) -> int:
+        """Discards cached column metadata of tables, so that changes of tables are picked up before cache expires.
+
+        Args:
+            schema_name: Optional name of schema, whose tables are to be reloaded (all tables, if omitted).
+
+        Returns:
+            Number of tables, whose metadata was discarded (0, if schema metadata cache is disabled).
+        """  # noqa: E501
+        if self._schema_metadata_cache is None:
+            return 0
+
+        return self._schema_metadata_cache.refresh(schema_name=schema_name)
+
     @override
     def test_connection(self, test_assets: bool = True) -> None:
         """Test the connection for the SQLDatasource.
@@ -0,0 +1,199 @@
+"""Column projection: load only the columns of a batch, which its Expectations reference.
+
+A batch spec may carry the referenced columns under its "columns" key (see "BatchRequest.columns").
+Readers of delimited and columnar files then load only these columns (along with any columns, by
+which the batch is partitioned or sampled), while the batch data keeps the column names of the
+source, read from the file header or metadata, so that table metrics (e.g., "table.columns") still
+report the real schema.
+"""
+
+from __future__ import annotations
+
+import logging
+from functools import partial
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from great_expectations.core.batch_spec import BatchSpec
+    from great_expectations.execution_engine.pandas_execution_engine import (
+        DataFrameFactoryFn,
+    )
+
+logger = logging.getLogger(__name__)
+
+# Keyword argument of each pandas reader method, which selects the columns to load.
+PANDAS_READER_COLUMNS_OPTIONS: Dict[str, str] = {
+    "read_csv": "usecols",
+    "read_table": "usecols",
+    "read_parquet": "columns",
+    "read_feather": "columns",
+}
+
+# Reader options, which cannot be combined with reading the header of a delimited file only
+# (the source is passed positionally, even if the reader options name it).
+_DELIMITED_HEADER_EXCLUDED_OPTIONS: Tuple[str, ...] = (
+    "filepath_or_buffer",
+    "path",
+    "chunksize",
+    "iterator",
+    "nrows",
+    "skipfooter",
+)
+
+
+def get_projected_columns(batch_spec: BatchSpec) -> Optional[List[str]]:
+    """Return the columns to load for the given batch spec, or None to load all columns.
+
+    Besides the referenced columns, the projection includes the columns, by which the batch is
+    partitioned or sampled.
+    """
+    columns: Optional[List[str]] = batch_spec.get("columns")
+    if columns is None:
+        return None
+
+    projected_columns: List[str] = list(columns)
+    projected_columns.extend(batch_spec.get("partitions") or [])
+    for kwargs_key in ("partitioner_kwargs", "sampling_kwargs"):
+        kwargs: dict = batch_spec.get(kwargs_key) or {}
+        if kwargs.get("column_name"):
+            projected_columns.append(kwargs["column_name"])
+        projected_columns.extend(kwargs.get("column_names") or [])
+
+    return list(dict.fromkeys(projected_columns))
+
+
+def get_pandas_reader_method_name(reader_fn: DataFrameFactoryFn) -> str:
+    """Return the name of the pandas reader method (e.g., "read_csv") behind the given reader."""
+    while isinstance(reader_fn, partial):
+        reader_fn = reader_fn.func  # type: ignore[assignment]
+
+    return getattr(reader_fn, "__name__", "")
+
+
+def read_pandas_source_columns(
+    reader_fn: DataFrameFactoryFn, source: Any, reader_options: dict
+) -> Optional[List[str]]:
+    """Read the column names of a file from its header or metadata, without loading its rows.
+
+    Args:
+        reader_fn: The pandas reader used to load the file.
+        source: The path or buffer, from which the file is loaded.
+        reader_options: The options passed to the reader.
+
+    Returns:
+        The column names in file order, or None if they cannot be determined up front.
+    """
+    reader_method = get_pandas_reader_method_name(reader_fn)
+    try:
+        if reader_method in ("read_csv", "read_table"):
+            header_options = {
+                key: value
+                for key, value in reader_options.items()
+                if key not in _DELIMITED_HEADER_EXCLUDED_OPTIONS
+            }
+            source_columns = list(reader_fn(source, nrows=0, **header_options).columns)
+        elif reader_method == "read_parquet":
+            source_columns = _read_parquet_source_columns(source)
+        elif reader_method == "read_feather":
+            source_columns = _read_feather_source_columns(source)
+        else:
+            source_columns = None
+    except Exception as e:
+        logger.debug(f"Unable to read the columns of {source!r}; loading all columns: {e}")
+        source_columns = None
+    finally:
+        if hasattr(source, "seek"):
+            source.seek(0)
+
+    return source_columns
+
+
+def _read_parquet_source_columns(source: Any) -> Optional[List[str]]:
+    from great_expectations.compatibility.pyarrow import parquet
+
+    if not parquet:
+        return None
+
+    schema = parquet.read_schema(source)
+    # Indexes of DataFrames written by pandas are stored as columns, which "read_parquet" restores.
+    pandas_metadata: dict = schema.pandas_metadata or {}
+    index_columns = {
+        index_column
+        for index_column in pandas_metadata.get("index_columns", [])
+        if isinstance(index_column, str)
+    }
+    return [name for name in schema.names if name not in index_columns]
+
+
+def _read_feather_source_columns(source: Any) -> Optional[List[str]]:
+    from great_expectations.compatibility.pyarrow import ipc
+
+    if not ipc:
+        return None
+
+    return list(ipc.open_file(source).schema.names)
+
+
+def project_pandas_reader_options(
+    reader_fn: DataFrameFactoryFn,
+    source: Any,
+    reader_options: dict,
+    columns: Optional[List[str]],
+) -> Tuple[dict, Optional[List[str]]]:
+    """Restrict the given reader options to load only the given columns.
+
+    The projection is skipped (i.e., the reader options are returned unchanged) if no columns are
+    given, if the reader cannot select columns, if the reader options already select columns, or
+    if the column names of the source cannot be read up front.
+
+    Args:
+        reader_fn: The pandas reader used to load the file.
+        source: The path or buffer, from which the file is loaded.
+        reader_options: The options passed to the reader.
+        columns: The columns to load (see "get_projected_columns").
+
+    Returns:
+        The reader options to use, and the column names of the source if the projection applies.
+    """
+    if columns is None:
+        return reader_options, None
+
+    option_name = PANDAS_READER_COLUMNS_OPTIONS.get(get_pandas_reader_method_name(reader_fn))
+    if option_name is None or reader_options.get(option_name) is not None:
+        return reader_options, None
+
+    source_columns = read_pandas_source_columns(
+        reader_fn=reader_fn, source=source, reader_options=reader_options
+    )
+    if not source_columns:
+        return reader_options, None
+
+    requested_columns = set(columns)
+    # At least one column is loaded, so that the number of rows is preserved.
+    projected_columns = [
+        column for column in source_columns if column in requested_columns
+    ] or source_columns[:1]
+    return {**reader_options, option_name: projected_columns}, source_columns
+
+
+def project_spark_dataframe(
+    df: Any, columns: Optional[List[str]]
+) -> Tuple[Any, Optional[List[str]]]:
+    """Select only the given columns of a Spark DataFrame (its schema is known up front).
+
+    Returns:
+        The projected DataFrame, and the column names of the source if the projection applies.
+    """
+    if columns is None:
+        return df, None
+
+    source_columns: List[str] = list(df.columns)
+    requested_columns = set(columns)
+    projected_columns = [
+        column for column in source_columns if column in requested_columns
+    ] or source_columns[:1]
+    if len(projected_columns) == len(source_columns):
+        return df, None
+
+    quoted_columns = ["`{}`".format(column.replace("`", "``")) for column in projected_columns]
+    return df.select(*quoted_columns), source_columns
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import copy
+import functools
 import logging
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from dataclasses import asdict, dataclass
 from typing import (
     TYPE_CHECKING,
@@ -20,7 +23,21 @@ from typing import (
 import great_expectations.exceptions as gx_exceptions
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.batch_manager import BatchManager
+from great_expectations.core.id_dict import IDDict
 from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.core.metric_function_types import MetricFunctionTypes
+from great_expectations.execution_engine.metric_cache import (
+    DEFAULT_METRIC_CACHE_MAX_BYTES,
+    MISSING,
+    LRUMetricCache,
+    MetricCache,
+    MetricCacheStatistics,
+    NoOpMetricCache,
+)
+from great_expectations.execution_engine.persistent_metric_cache import (
+    PersistentMetricCache,
+    SqlitePersistentMetricCache,
+)
 from great_expectations.expectations.registry import get_metric_provider
 from great_expectations.expectations.row_conditions import (
     RowCondition,
@@ -51,17 +68,8 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-
-class NoOpDict:
-    def __getitem__(self, item):
-        return None
-
-    def __setitem__(self, key, value):
-        return None
-
-    # noinspection PyMethodMayBeStatic,PyUnusedLocal
-    def update(self, value):
-        return None
+# Value sets (e.g., of "column_values.in_set" metric) larger than this are matched by semi-join, rather than literal list.  # noqa: E501
+DEFAULT_VALUE_SET_SEMI_JOIN_THRESHOLD: int = 10_000
 
 
 @dataclass(frozen=True)
@@ -134,29 +142,89 @@ class ExecutionEngine(ABC):
         batch_spec_defaults: dictionary of BatchSpec overrides (useful for amending configuration at runtime).
         batch_data_dict: dictionary of Batch objects with corresponding IDs as keys supplied at initialization time
         validator: Validator object (optional) -- not utilized in V3 and later versions
+        metric_computation_max_workers: (int) if greater than 1 (default is 1), then independent direct metrics and
+            per-Domain metric bundles of every resolution pass are computed concurrently on thread pool of this size.
+        metric_computation_timeout: (float) optional number of seconds to wait for concurrent metric computations of
+            single resolution pass, after which pending metrics are cancelled and, once computations already underway
+            have finished, unfinished metrics are reported as failed.
+        metric_cache_max_entries: (int) optional maximum number of resolved metrics kept in metric cache; least recently
+            used metrics are evicted first.
+        metric_cache_max_bytes: (int) optional maximum estimated size (in bytes) of resolved metrics kept in metric cache
+            (default is 512 MiB); metrics are also dropped, once validation of Batch they describe is finished.
+        metric_cache: (MetricCache) optional custom MetricCache implementation (overrides two preceding arguments).
+        persistent_metric_cache: (PersistentMetricCache or dict) optional on-disk cache of resolved metrics, keyed by
+            fingerprint of Batch data, which is consulted before metrics are computed; dictionary is treated as keyword
+            arguments of "SqlitePersistentMetricCache" (e.g., {"path": "gx_metrics.db", "ttl_seconds": 86400}).
+        value_set_semi_join_threshold: (int) value sets of membership metrics (e.g., "column_values.in_set"), which have
+            more values than this (default is 10,000), are matched against pre-hashed index (Pandas) or value set table
+            (SQL), instead of being inlined into every query as literal list (Spark hashes large "isin()" lists itself).
     """  # noqa: E501
 
     recognized_batch_spec_defaults: Set[str] = set()
 
-    def __init__(
+    def __init__(  # noqa: C901, PLR0913
         self,
         name: Optional[str] = None,
         caching: bool = True,
         batch_spec_defaults: Optional[dict] = None,
         batch_data_dict: Optional[dict] = None,
         validator: Optional[Validator] = None,
+        metric_computation_max_workers: int = 1,
+        metric_computation_timeout: Optional[float] = None,
+        metric_cache_max_entries: Optional[int] = None,
+        metric_cache_max_bytes: Optional[int] = None,
+        metric_cache: Optional[MetricCache] = None,
+        persistent_metric_cache: Optional[Union[PersistentMetricCache, dict]] = None,
+        value_set_semi_join_threshold: Optional[int] = None,
     ) -> None:
         self.name = name
         self._validator = validator
 
+        if metric_computation_max_workers < 1:
+            raise ValueError(  # noqa: TRY003
+                f"metric_computation_max_workers must be positive; {metric_computation_max_workers} was given."  # noqa: E501
+            )
+
+        self._metric_computation_max_workers = metric_computation_max_workers
+        self._metric_computation_timeout = metric_computation_timeout
+        # Thread pool is created on first concurrent resolution pass and reused by all later ones.
+        self._metric_computation_executor: Optional[ThreadPoolExecutor] = None
+        self._metric_computation_executor_lock = threading.Lock()
+        # Marks pool threads, so that metric functions resolving metrics themselves do not wait on the same pool.  # noqa: E501
+        self._metric_computation_thread_state = threading.local()
+
+        if value_set_semi_join_threshold is not None and value_set_semi_join_threshold < 0:
+            raise ValueError(  # noqa: TRY003
+                f"value_set_semi_join_threshold must not be negative; {value_set_semi_join_threshold} was given."  # noqa: E501
+            )
+
+        self._value_set_semi_join_threshold = value_set_semi_join_threshold
+
         # NOTE: using caching makes the strong assumption that the user will not modify the core data store  # noqa: E501
         # (e.g. self.spark_df) over the lifetime of the dataset instance
         self._caching = caching
-        # NOTE: 20200918 - this is a naive cache; update.
-        if self._caching:
-            self._metric_cache: Union[Dict, NoOpDict] = {}
+        self._metric_cache_max_entries = metric_cache_max_entries
+        self._metric_cache_max_bytes = metric_cache_max_bytes
+        # Resolved metrics are scoped to Batch they were computed for and are invalidated when that Batch is reloaded or unloaded.  # noqa: E501
+        self._metric_cache: MetricCache
+        if not self._caching:
+            self._metric_cache = NoOpMetricCache()
+        elif metric_cache is not None:
+            self._metric_cache = metric_cache
         else:
-            self._metric_cache = NoOpDict()
+            self._metric_cache = LRUMetricCache(
+                max_entries=metric_cache_max_entries,
+                max_bytes=DEFAULT_METRIC_CACHE_MAX_BYTES
+                if metric_cache_max_bytes is None
+                else metric_cache_max_bytes,
+            )
+
+        if isinstance(persistent_metric_cache, dict):
+            persistent_metric_cache = SqlitePersistentMetricCache(**persistent_metric_cache)
+
+        self._persistent_metric_cache: Optional[PersistentMetricCache] = persistent_metric_cache
+        # Fingerprints of loaded Batch data by "batch_id" (computing them may require data scan).
+        self._batch_fingerprints: Dict[str, Optional[str]] = {}
 
         if batch_spec_defaults is None:
             batch_spec_defaults = {}
@@ -190,17 +258,61 @@ class ExecutionEngine(ABC):
             "batch_spec_defaults": batch_spec_defaults,
             "batch_data_dict": batch_data_dict,
             "validator": validator,
+            **self._metric_computation_config,
+            **self._metric_cache_config,
+            "value_set_semi_join_threshold": value_set_semi_join_threshold,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
         filter_properties_dict(properties=self._config, clean_falsy=True, inplace=True)
 
+    @property
+    def _metric_computation_config(self) -> dict:
+        """Concurrent metric computation settings for "config" (omitted, if left at defaults)."""
+        return {
+            "metric_computation_max_workers": self._metric_computation_max_workers
+            if self._metric_computation_max_workers > 1
+            else None,
+            "metric_computation_timeout": self._metric_computation_timeout,
+        }
+
+    @property
+    def _metric_cache_config(self) -> dict:
+        """Metric cache settings for "config" (omitted, if left at defaults and not persisted)."""
+        return {
+            "metric_cache_max_entries": self._metric_cache_max_entries,
+            "metric_cache_max_bytes": self._metric_cache_max_bytes,
+            "persistent_metric_cache": self._persistent_metric_cache.config
+            if self._persistent_metric_cache is not None
+            else None,
+        }
+
+    @property
+    def _supports_concurrent_metric_computation(self) -> bool:
+        """Whether or not metric functions of this ExecutionEngine may be invoked from multiple threads at once."""  # noqa: E501
+        return True
+
     def configure_validator(  # noqa: B027 # empty-method-without-abstract-decorator
         self, validator
     ) -> None:
         """Optionally configure the validator as appropriate for the execution engine."""
         pass
 
+    def release_validation_resources(  # noqa: B027 # empty-method-without-abstract-decorator
+        self,
+    ) -> None:
+        """Optionally release temporary resources (e.g., scratch tables) created by validation."""
+        pass
+
+    def close(self) -> None:
+        """Release resources held by this ExecutionEngine (e.g., its metric computation thread pool), once it is no longer used."""  # noqa: E501
+        with self._metric_computation_executor_lock:
+            executor: Optional[ThreadPoolExecutor] = self._metric_computation_executor
+            self._metric_computation_executor = None
+
+        if executor is not None:
+            executor.shutdown(wait=True)
+
     @property
     def config(self) -> dict:
         return self._config
@@ -214,6 +326,29 @@ class ExecutionEngine(ABC):
         """Getter for batch_manager"""
         return self._batch_manager
 
+    @property
+    def metric_cache(self) -> MetricCache:
+        """Getter for metric_cache"""
+        return self._metric_cache
+
+    @property
+    def metric_cache_statistics(self) -> MetricCacheStatistics:
+        """Hit, miss, eviction, and invalidation counts (and current size) of metric cache."""
+        return self._metric_cache.statistics
+
+    @property
+    def value_set_semi_join_threshold(self) -> int:
+        """Number of values, above which value sets of membership metrics are semi-joined."""
+        if self._value_set_semi_join_threshold is None:
+            return DEFAULT_VALUE_SET_SEMI_JOIN_THRESHOLD
+
+        return self._value_set_semi_join_threshold
+
+    @property
+    def persistent_metric_cache(self) -> Optional[PersistentMetricCache]:
+        """Getter for persistent_metric_cache"""
+        return self._persistent_metric_cache
+
     def _load_batch_data_from_dict(self, batch_data_dict: Dict[str, BatchDataType]) -> None:
         """
         Loads all data in batch_data_dict using cache_batch_data
@@ -224,8 +359,58 @@ class ExecutionEngine(ABC):
             self.load_batch_data(batch_id=batch_id, batch_data=batch_data)  # type: ignore[arg-type]
 
     def load_batch_data(self, batch_id: str, batch_data: BatchDataUnion) -> None:
+        if self._batch_manager.batch_data_cache.get(batch_id, batch_data) is not batch_data:
+            # Metrics, computed for data previously loaded under this "batch_id", are stale.
+            self._metric_cache.invalidate_batch(batch_id=batch_id)
+            self._batch_fingerprints.pop(batch_id, None)
+
         self._batch_manager.save_batch_data(batch_id=batch_id, batch_data=batch_data)
 
+    def unload_batch_data(self, batch_id: str) -> None:
+        """Releases Batch data, loaded under specified "batch_id", and all metrics cached for it."""
+        self._batch_manager.remove_batch_data(batch_id=batch_id)
+        self._metric_cache.invalidate_batch(batch_id=batch_id)
+        self._batch_fingerprints.pop(batch_id, None)
+
+    def invalidate_persisted_metrics(self, batch_id: Optional[str] = None) -> int:
+        """Removes metrics of specified loaded Batch (or all metrics, if omitted) from persistent metric cache.
+
+        Args:
+            batch_id: Optional identifier of loaded Batch, whose persisted metrics are to be removed.
+
+        Returns:
+            Number of removed metric values.
+        """  # noqa: E501
+        if self._persistent_metric_cache is None:
+            return 0
+
+        if batch_id is None:
+            return self._persistent_metric_cache.invalidate()
+
+        fingerprint: Optional[str] = self._get_batch_fingerprint(batch_id=batch_id)
+        if fingerprint is None:
+            return 0
+
+        return self._persistent_metric_cache.invalidate(fingerprint=fingerprint)
+
+    def _get_batch_fingerprint(self, batch_id: Optional[str]) -> Optional[str]:
+        """Returns (memoized) fingerprint of Batch data loaded under "batch_id" (None, if data cannot be identified)."""  # noqa: E501
+        if batch_id is None:
+            return None
+
+        if batch_id not in self._batch_fingerprints:
+            self._batch_fingerprints[batch_id] = self._compute_batch_fingerprint(batch_id=batch_id)
+
+        return self._batch_fingerprints[batch_id]
+
+    def _compute_batch_fingerprint(self, batch_id: str) -> Optional[str]:
+        """Identifies Batch data by "pandas_data_fingerprint" of its "BatchMarkers" (subclasses can do better)."""  # noqa: E501
+        batch: Optional[Any] = self._batch_manager.batch_cache.get(batch_id)
+        if batch is None or not batch.batch_markers:
+            return None
+
+        return batch.batch_markers.get("pandas_data_fingerprint")
+
     def get_batch_data(
         self,
         batch_spec: BatchSpec,
@@ -266,6 +451,22 @@ class ExecutionEngine(ABC):
         if not metrics_to_resolve:
             return metrics or {}
 
+        persisted_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+        fingerprints_by_metric_id: Dict[Tuple[str, str, str], str] = {}
+        if self._persistent_metric_cache is not None:
+            metrics_to_resolve = list(metrics_to_resolve)
+            fingerprints_by_metric_id = self._get_persistable_metric_fingerprints(
+                metrics_to_resolve=metrics_to_resolve
+            )
+            persisted_metrics = self._get_persisted_metrics(
+                fingerprints_by_metric_id=fingerprints_by_metric_id
+            )
+            metrics_to_resolve = [
+                metric_configuration
+                for metric_configuration in metrics_to_resolve
+                if metric_configuration.id not in persisted_metrics
+            ]
+
         metric_fn_direct_configurations: List[MetricComputationConfiguration]
         metric_fn_bundle_configurations: List[MetricComputationConfiguration]
         (
@@ -276,11 +477,96 @@ class ExecutionEngine(ABC):
             metrics=metrics,
             runtime_configuration=runtime_configuration,
         )
-        return self._process_direct_and_bundled_metric_computation_configurations(
-            metric_fn_direct_configurations=metric_fn_direct_configurations,
-            metric_fn_bundle_configurations=metric_fn_bundle_configurations,
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = (
+            self._process_direct_and_bundled_metric_computation_configurations(
+                metric_fn_direct_configurations=metric_fn_direct_configurations,
+                metric_fn_bundle_configurations=metric_fn_bundle_configurations,
+            )
         )
 
+        if self._persistent_metric_cache is not None:
+            self._persist_metrics(
+                resolved_metrics=resolved_metrics,
+                fingerprints_by_metric_id=fingerprints_by_metric_id,
+            )
+            resolved_metrics.update(persisted_metrics)
+
+        return resolved_metrics
+
+    def _get_persistable_metric_fingerprints(
+        self, metrics_to_resolve: List[MetricConfiguration]
+    ) -> Dict[Tuple[str, str, str], str]:
+        """Returns Batch fingerprints of those metrics, whose values describe identifiable Batch data.
+
+        Only final metric values qualify; partial metric functions (conditions, aggregate functions, etc.) are
+        backend-specific deferred computations, which are not meaningful outside of current ExecutionEngine.
+        """  # noqa: E501
+        active_batch_data_id: Optional[str] = self._batch_manager.active_batch_data_id
+
+        fingerprints_by_metric_id: Dict[Tuple[str, str, str], str] = {}
+        fingerprint: Optional[str]
+        metric_fn: Union[Callable, None]
+        metric_configuration: MetricConfiguration
+        for metric_configuration in metrics_to_resolve:
+            _, metric_fn = get_metric_provider(
+                metric_name=metric_configuration.metric_name, execution_engine=self
+            )
+            if metric_fn is not None and not isinstance(
+                getattr(metric_fn, "metric_fn_type", MetricFunctionTypes.VALUE),
+                MetricFunctionTypes,
+            ):
+                continue
+
+            fingerprint = self._get_batch_fingerprint(
+                batch_id=metric_configuration.metric_domain_kwargs.get("batch_id")
+                or active_batch_data_id
+            )
+            if fingerprint is not None:
+                fingerprints_by_metric_id[metric_configuration.id] = fingerprint
+
+        return fingerprints_by_metric_id
+
+    def _get_persisted_metrics(
+        self, fingerprints_by_metric_id: Dict[Tuple[str, str, str], str]
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        metric_ids_by_fingerprint: Dict[str, List[Tuple[str, str, str]]] = {}
+        metric_id: Tuple[str, str, str]
+        fingerprint: str
+        for metric_id, fingerprint in fingerprints_by_metric_id.items():
+            metric_ids_by_fingerprint.setdefault(fingerprint, []).append(metric_id)
+
+        persisted_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+        metric_ids: List[Tuple[str, str, str]]
+        for fingerprint, metric_ids in metric_ids_by_fingerprint.items():
+            persisted_metrics.update(
+                self._persistent_metric_cache.get_many(  # type: ignore[union-attr] # checked by caller
+                    fingerprint=fingerprint, metric_ids=metric_ids
+                )
+            )
+
+        return persisted_metrics
+
+    def _persist_metrics(
+        self,
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue],
+        fingerprints_by_metric_id: Dict[Tuple[str, str, str], str],
+    ) -> None:
+        metrics_by_fingerprint: Dict[str, Dict[Tuple[str, str, str], MetricValue]] = {}
+        metric_id: Tuple[str, str, str]
+        value: MetricValue
+        for metric_id, value in resolved_metrics.items():
+            if metric_id in fingerprints_by_metric_id:
+                metrics_by_fingerprint.setdefault(fingerprints_by_metric_id[metric_id], {})[
+                    metric_id
+                ] = value
+
+        fingerprint: str
+        metrics: Dict[Tuple[str, str, str], MetricValue]
+        for fingerprint, metrics in metrics_by_fingerprint.items():
+            self._persistent_metric_cache.put_many(  # type: ignore[union-attr] # checked by caller
+                fingerprint=fingerprint, metrics=metrics
+            )
+
     def resolve_metric_bundle(self, metric_fn_bundle) -> Dict[Tuple[str, str, str], MetricValue]:
         """Resolve a bundle of metrics with the same compute Domain as part of a single trip to the compute engine."""  # noqa: E501
         raise NotImplementedError
@@ -496,10 +782,10 @@ class ExecutionEngine(ABC):
         ) in metric_to_resolve.metric_dependencies.items():
             if metric_configuration.id in metrics:
                 metric_dependencies_by_metric_name[metric_name] = metrics[metric_configuration.id]
-            elif self._caching and metric_configuration.id in self._metric_cache:  # type: ignore[operator] # TODO: update NoOpDict
-                metric_dependencies_by_metric_name[metric_name] = self._metric_cache[
-                    metric_configuration.id
-                ]
+            elif (
+                cached_metric_value := self._metric_cache.get(key=metric_configuration.id)
+            ) is not MISSING:
+                metric_dependencies_by_metric_name[metric_name] = cached_metric_value
             else:
                 raise gx_exceptions.MetricError(
                     message=f'Missing metric dependency: "{metric_name}" for metric "{metric_to_resolve.metric_name}".'  # noqa: E501
@@ -522,29 +808,183 @@ class ExecutionEngine(ABC):
         Returns:
             resolved_metrics (Dict): a dictionary with the values for the metrics that have just been resolved.
         """  # noqa: E501
-        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue]
+        if (
+            self._metric_computation_max_workers > 1
+            and self._supports_concurrent_metric_computation
+            and not getattr(self._metric_computation_thread_state, "is_worker", False)
+        ):
+            resolved_metrics = self._process_metric_computation_configurations_concurrently(
+                metric_fn_direct_configurations=metric_fn_direct_configurations,
+                metric_fn_bundle_configurations=metric_fn_bundle_configurations,
+            )
+        else:
+            resolved_metrics = {}
+
+            metric_computation_configuration: MetricComputationConfiguration
+            for metric_computation_configuration in metric_fn_direct_configurations:
+                resolved_metrics.update(
+                    self._resolve_direct_metric_computation_configuration(
+                        metric_computation_configuration=metric_computation_configuration
+                    )
+                )
+
+            resolved_metrics.update(
+                self._resolve_bundled_metric_computation_configurations(
+                    metric_fn_bundle_configurations=metric_fn_bundle_configurations
+                )
+            )
+
+        self._cache_resolved_metrics(
+            resolved_metrics=resolved_metrics,
+            metric_computation_configurations=metric_fn_direct_configurations
+            + metric_fn_bundle_configurations,
+        )
+
+        return resolved_metrics
+
+    def _cache_resolved_metrics(
+        self,
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue],
+        metric_computation_configurations: List[MetricComputationConfiguration],
+    ) -> None:
+        """Adds resolved metrics to metric cache, each scoped to Batch named by its Domain (or to active Batch)."""  # noqa: E501
+        if not self._caching:
+            return
+
+        active_batch_data_id: Optional[str] = self._batch_manager.active_batch_data_id
 
         metric_computation_configuration: MetricComputationConfiguration
+        metric_configuration: MetricConfiguration
+        for metric_computation_configuration in metric_computation_configurations:
+            metric_configuration = metric_computation_configuration.metric_configuration
+            if metric_configuration.id in resolved_metrics:
+                self._metric_cache.put(
+                    key=metric_configuration.id,
+                    value=resolved_metrics[metric_configuration.id],
+                    batch_id=metric_configuration.metric_domain_kwargs.get("batch_id")
+                    or active_batch_data_id,
+                )
 
-        for metric_computation_configuration in metric_fn_direct_configurations:
-            try:
-                resolved_metrics[metric_computation_configuration.metric_configuration.id] = (
-                    metric_computation_configuration.metric_fn(  # type: ignore[misc] # F not callable
-                        **metric_computation_configuration.metric_provider_kwargs
-                    )
+    def _process_metric_computation_configurations_concurrently(
+        self,
+        metric_fn_direct_configurations: List[MetricComputationConfiguration],
+        metric_fn_bundle_configurations: List[MetricComputationConfiguration],
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """
+        Computes every directly-computable metric and every per-Domain metric bundle as separate task on thread pool,
+        which is shared by all resolution passes of this ExecutionEngine.
+
+        Each task raises "MetricResolutionError" attributed only to metrics it computes.  If several tasks fail, the
+        error of the earliest submitted task is raised (direct metrics precede bundles, as in sequential processing).
+
+        Args:
+            metric_fn_direct_configurations: directly-computable "MetricComputationConfiguration" objects
+            metric_fn_bundle_configurations: bundled "MetricComputationConfiguration" objects (column aggregates)
+
+        Returns:
+            resolved_metrics (Dict): a dictionary with the values for the metrics that have just been resolved.
+        """  # noqa: E501
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+        tasks: List[
+            Tuple[Callable[[], Dict[Tuple[str, str, str], MetricValue]], List[MetricConfiguration]]
+        ] = [
+            (
+                functools.partial(
+                    self._resolve_direct_metric_computation_configuration,
+                    metric_computation_configuration=metric_computation_configuration,
+                ),
+                [metric_computation_configuration.metric_configuration],
+            )
+            for metric_computation_configuration in metric_fn_direct_configurations
+        ]
+        tasks.extend(
+            (
+                functools.partial(
+                    self._resolve_bundled_metric_computation_configurations,
+                    metric_fn_bundle_configurations=domain_bundle,
+                ),
+                [
+                    metric_computation_configuration.metric_configuration
+                    for metric_computation_configuration in domain_bundle
+                ],
+            )
+            for domain_bundle in self._partition_metric_fn_bundle_by_compute_domain(
+                metric_fn_bundle_configurations=metric_fn_bundle_configurations
+            )
+        )
+
+        if not tasks:
+            return resolved_metrics
+
+        executor: ThreadPoolExecutor = self._get_metric_computation_executor()
+        futures: List[Future] = [
+            executor.submit(self._run_metric_computation_task, task) for task, _ in tasks
+        ]
+        _, not_done = wait(futures, timeout=self._metric_computation_timeout)
+        if not_done:
+            future: Future
+            for future in not_done:
+                future.cancel()
+
+            # Computations already underway use this ExecutionEngine; they must finish before control is returned.  # noqa: E501
+            wait(not_done)
+            raise gx_exceptions.MetricResolutionError(
+                message=f"Metric computation did not complete within {self._metric_computation_timeout} seconds.",  # noqa: E501
+                failed_metrics=[
+                    metric_configuration
+                    for future, (_, metric_configurations) in zip(futures, tasks)
+                    if future in not_done
+                    for metric_configuration in metric_configurations
+                ],
+            )
+
+        # Results are collected in submission order, so that the earliest failure is the one re-raised.  # noqa: E501
+        for future in futures:
+            resolved_metrics.update(future.result())
+
+        return resolved_metrics
+
+    def _get_metric_computation_executor(self) -> ThreadPoolExecutor:
+        """Returns thread pool of this ExecutionEngine for concurrent metric computation (creating it, if needed)."""  # noqa: E501
+        with self._metric_computation_executor_lock:
+            if self._metric_computation_executor is None:
+                self._metric_computation_executor = ThreadPoolExecutor(
+                    max_workers=self._metric_computation_max_workers,
+                    thread_name_prefix=f"{self.__class__.__name__}_metrics",
                 )
-            except Exception as e:
-                raise gx_exceptions.MetricResolutionError(
-                    message=str(e),
-                    failed_metrics=(metric_computation_configuration.metric_configuration,),
-                ) from e
 
+            return self._metric_computation_executor
+
+    def _run_metric_computation_task(
+        self, task: Callable[[], Dict[Tuple[str, str, str], MetricValue]]
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        self._metric_computation_thread_state.is_worker = True
+        return task()
+
+    def _resolve_direct_metric_computation_configuration(
+        self,
+        metric_computation_configuration: MetricComputationConfiguration,
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        try:
+            metric_value: MetricValue = metric_computation_configuration.metric_fn(  # type: ignore[misc] # F not callable
+                **metric_computation_configuration.metric_provider_kwargs
+            )
+            return {metric_computation_configuration.metric_configuration.id: metric_value}
+        except Exception as e:
+            raise gx_exceptions.MetricResolutionError(
+                message=str(e),
+                failed_metrics=(metric_computation_configuration.metric_configuration,),
+            ) from e
+
+    def _resolve_bundled_metric_computation_configurations(
+        self,
+        metric_fn_bundle_configurations: List[MetricComputationConfiguration],
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
         try:
             # an engine-specific way of computing metrics together
-            resolved_metric_bundle: Dict[Tuple[str, str, str], MetricValue] = (
-                self.resolve_metric_bundle(metric_fn_bundle=metric_fn_bundle_configurations)
-            )
-            resolved_metrics.update(resolved_metric_bundle)
+            return self.resolve_metric_bundle(metric_fn_bundle=metric_fn_bundle_configurations)
         except Exception as e:
             raise gx_exceptions.MetricResolutionError(
                 message=str(e),
@@ -554,10 +994,25 @@ class ExecutionEngine(ABC):
                 ],
             ) from e
 
-        if self._caching:
-            self._metric_cache.update(resolved_metrics)
+    @staticmethod
+    def _partition_metric_fn_bundle_by_compute_domain(
+        metric_fn_bundle_configurations: List[MetricComputationConfiguration],
+    ) -> List[List[MetricComputationConfiguration]]:
+        """Groups bundled "MetricComputationConfiguration" objects by their compute Domain (one query per group)."""  # noqa: E501
+        domain_bundles: Dict[Union[str, tuple], List[MetricComputationConfiguration]] = {}
 
-        return resolved_metrics
+        metric_computation_configuration: MetricComputationConfiguration
+        compute_domain_kwargs: dict
+        for metric_computation_configuration in metric_fn_bundle_configurations:
+            compute_domain_kwargs = metric_computation_configuration.compute_domain_kwargs or {}
+            if not isinstance(compute_domain_kwargs, IDDict):
+                compute_domain_kwargs = IDDict(compute_domain_kwargs)
+
+            domain_bundles.setdefault(compute_domain_kwargs.to_id(), []).append(
+                metric_computation_configuration
+            )
+
+        return list(domain_bundles.values())
 
     def _partition_domain_kwargs(
         self,
@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+import logging
+import sys
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+from great_expectations.compatibility.typing_extensions import override
+
+if TYPE_CHECKING:
+    from great_expectations.validator.computed_metric import MetricValue
+
+logger = logging.getLogger(__name__)
+
+_MetricCacheKey = Tuple[str, Hashable, Hashable]
+
+# Returned by "MetricCache.get()" for absent keys (metric values may legitimately be None).
+MISSING: Any = object()
+
+# Default budget of estimated size of metric values, which ExecutionEngine keeps in memory.
+DEFAULT_METRIC_CACHE_MAX_BYTES: int = 512 * 1024 * 1024
+
+
+@dataclass
+class MetricCacheStatistics:
+    """Counters, describing effectiveness of "MetricCache" since it was created (or since "reset_statistics()")."""  # noqa: E501
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    entries: int = 0
+    size_in_bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups: int = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class MetricCache(ABC):
+    """Cache of resolved metric values, keyed by "MetricConfiguration.id" and scoped to "batch_id" of Batch they describe.
+
+    ExecutionEngine consults its MetricCache for already-computed metric dependencies and writes every resolved metric
+    into it.  Custom implementations can be supplied to ExecutionEngine via its "metric_cache" constructor argument.
+    """  # noqa: E501
+
+    @abstractmethod
+    def get(self, key: _MetricCacheKey) -> MetricValue:
+        """Returns cached value for "key" (or "MISSING" sentinel), recording hit or miss."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def put(self, key: _MetricCacheKey, value: MetricValue, batch_id: Optional[str] = None) -> None:
+        """Stores resolved metric value, associating it with Batch that it was computed for."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def invalidate_batch(self, batch_id: str) -> int:
+        """Removes all values computed for specified Batch; returns number of removed values."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def statistics(self) -> MetricCacheStatistics:
+        raise NotImplementedError
+
+    @abstractmethod
+    def reset_statistics(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def __contains__(self, key: _MetricCacheKey) -> bool:
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        return self.statistics.entries
+
+    def update(
+        self, resolved_metrics: Dict[_MetricCacheKey, MetricValue], batch_id: Optional[str] = None
+    ) -> None:
+        key: _MetricCacheKey
+        value: MetricValue
+        for key, value in resolved_metrics.items():
+            self.put(key=key, value=value, batch_id=batch_id)
+
+
+class NoOpMetricCache(MetricCache):
+    """MetricCache that stores nothing (used when ExecutionEngine "caching" is disabled)."""
+
+    def __init__(self) -> None:
+        self._statistics = MetricCacheStatistics()
+
+    @override
+    def get(self, key: _MetricCacheKey) -> MetricValue:
+        self._statistics.misses += 1
+        return MISSING
+
+    @override
+    def put(self, key: _MetricCacheKey, value: MetricValue, batch_id: Optional[str] = None) -> None:
+        pass
+
+    @override
+    def invalidate_batch(self, batch_id: str) -> int:
+        return 0
+
+    @override
+    def clear(self) -> None:
+        pass
+
+    @property
+    @override
+    def statistics(self) -> MetricCacheStatistics:
+        return MetricCacheStatistics(**self._statistics.to_dict())
+
+    @override
+    def reset_statistics(self) -> None:
+        self._statistics = MetricCacheStatistics()
+
+    @override
+    def __contains__(self, key: _MetricCacheKey) -> bool:
+        return False
+
+
+class LRUMetricCache(MetricCache):
+    """In-memory MetricCache with least-recently-used eviction under optional entry count and byte budgets.
+
+    Sizes of values are estimated (see "estimate_size_in_bytes()"), so that few large values (e.g., "unexpected_rows"
+    DataFrames) are evicted before many small ones.  Single value, which is larger than "max_bytes", is not cached.
+    If neither limit is specified, cache is unbounded (but still scoped to loaded Batches via "invalidate_batch()").
+
+    Args:
+        max_entries: Optional maximum number of cached metric values.
+        max_bytes: Optional maximum estimated total size of cached metric values.
+    """  # noqa: E501
+
+    def __init__(self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None) -> None:
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+
+        # Values are stored with their estimated size and "batch_id"; order of keys reflects recency of use.  # noqa: E501
+        self._entries: OrderedDict[_MetricCacheKey, Tuple[MetricValue, int, Optional[str]]] = (
+            OrderedDict()
+        )
+        self._keys_by_batch_id: Dict[Optional[str], Set[_MetricCacheKey]] = {}
+        self._size_in_bytes: int = 0
+        self._statistics = MetricCacheStatistics()
+
+        # ExecutionEngine may resolve metrics from multiple threads.
+        self._lock = threading.RLock()
+
+    @property
+    def max_entries(self) -> Optional[int]:
+        return self._max_entries
+
+    @property
+    def max_bytes(self) -> Optional[int]:
+        return self._max_bytes
+
+    @override
+    def get(self, key: _MetricCacheKey) -> MetricValue:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._statistics.misses += 1
+                return MISSING
+
+            self._entries.move_to_end(key)
+            self._statistics.hits += 1
+            return entry[0]
+
+    @override
+    def put(self, key: _MetricCacheKey, value: MetricValue, batch_id: Optional[str] = None) -> None:
+        size_in_bytes: int = estimate_size_in_bytes(value) if self._max_bytes is not None else 0
+        with self._lock:
+            self._remove(key=key)
+
+            if self._max_bytes is not None and size_in_bytes > self._max_bytes:
+                logger.debug(
+                    f"Metric {key} ({size_in_bytes} bytes) exceeds metric cache budget of {self._max_bytes} bytes; not cached."  # noqa: E501
+                )
+                return
+
+            self._entries[key] = (value, size_in_bytes, batch_id)
+            self._keys_by_batch_id.setdefault(batch_id, set()).add(key)
+            self._size_in_bytes += size_in_bytes
+            self._evict()
+
+    @override
+    def invalidate_batch(self, batch_id: str) -> int:
+        with self._lock:
+            keys: Set[_MetricCacheKey] = self._keys_by_batch_id.pop(batch_id, set())
+            key: _MetricCacheKey
+            for key in list(keys):
+                self._remove(key=key)
+
+            self._statistics.invalidations += len(keys)
+            return len(keys)
+
+    @override
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_batch_id.clear()
+            self._size_in_bytes = 0
+
+    @property
+    @override
+    def statistics(self) -> MetricCacheStatistics:
+        with self._lock:
+            return MetricCacheStatistics(
+                hits=self._statistics.hits,
+                misses=self._statistics.misses,
+                evictions=self._statistics.evictions,
+                invalidations=self._statistics.invalidations,
+                entries=len(self._entries),
+                size_in_bytes=self._size_in_bytes,
+            )
+
+    @override
+    def reset_statistics(self) -> None:
+        with self._lock:
+            self._statistics = MetricCacheStatistics()
+
+    @override
+    def __contains__(self, key: _MetricCacheKey) -> bool:
+        return key in self._entries
+
+    def _remove(self, key: _MetricCacheKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+
+        _, size_in_bytes, batch_id = entry
+        self._size_in_bytes -= size_in_bytes
+        keys: Optional[Set[_MetricCacheKey]] = self._keys_by_batch_id.get(batch_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_batch_id[batch_id]
+
+    def _evict(self) -> None:
+        while self._entries and (
+            (self._max_entries is not None and len(self._entries) > self._max_entries)
+            or (self._max_bytes is not None and self._size_in_bytes > self._max_bytes)
+        ):
+            least_recently_used_key: _MetricCacheKey = next(iter(self._entries))
+            self._remove(key=least_recently_used_key)
+            self._statistics.evictions += 1
+
+
+def estimate_size_in_bytes(value: Any) -> int:
+    """Estimates memory footprint of metric value (deep for DataFrames, Series, and arrays; one level for containers)."""  # noqa: E501
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+
+    if isinstance(value, (pd.Series, pd.Index)):
+        return int(value.memory_usage(index=True, deep=True))
+
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            sys.getsizeof(key) + sys.getsizeof(element) for key, element in value.items()
+        )
+
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(sys.getsizeof(element) for element in value)
+
+    return sys.getsizeof(value)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, List, Optional
 
 from great_expectations.core.batch import BatchData
 
@@ -9,10 +9,21 @@ if TYPE_CHECKING:
 
 
 class PandasBatchData(BatchData):
-    def __init__(self, execution_engine, dataframe: pd.DataFrame) -> None:
+    def __init__(
+        self,
+        execution_engine,
+        dataframe: pd.DataFrame,
+        source_columns: Optional[List[str]] = None,
+    ) -> None:
         super().__init__(execution_engine=execution_engine)
         self._dataframe = dataframe
+        self._source_columns = source_columns
 
     @property
     def dataframe(self):
         return self._dataframe
+
+    @property
+    def source_columns(self) -> Optional[List[str]]:
+        """Columns of the source, if only some of them were loaded (see "column_projection")."""
+        return self._source_columns
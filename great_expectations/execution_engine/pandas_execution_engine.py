@@ -12,6 +12,7 @@ from typing import (
     Callable,
     Dict,
     Iterable,
+    List,
     Optional,
     Tuple,
     Union,
@@ -44,6 +45,11 @@ from great_expectations.core.metric_domain_types import (
 )
 from great_expectations.core.util import AzureUrl, GCSUrl, S3Url, sniff_s3_compression
 from great_expectations.execution_engine import ExecutionEngine
+from great_expectations.execution_engine.column_projection import (
+    get_pandas_reader_method_name,
+    get_projected_columns,
+    project_pandas_reader_options,
+)
 from great_expectations.execution_engine.execution_engine import (
     PartitionDomainKwargs,  # noqa: TCH001
 )
@@ -59,6 +65,10 @@ from great_expectations.expectations.model_field_types import CONDITION_PARSER_P
 if TYPE_CHECKING:
     from typing_extensions import TypeAlias
 
+    from great_expectations.execution_engine.partition_and_sample.data_partitioner import (
+        PartitionFilter,
+    )
+
 logger = logging.getLogger(__name__)
 
 
@@ -135,6 +145,9 @@ class PandasExecutionEngine(ExecutionEngine):
         self._data_partitioner = PandasDataPartitioner()
         self._data_sampler = PandasDataSampler()
 
+        # Large value sets of membership metrics, hashed once per validation (keyed by values).
+        self._value_set_indexes: Dict[tuple, pd.Index] = {}
+
     def _instantiate_azure_client(self) -> None:
         self._azure = None
         if azure.BlobServiceClient:  # type: ignore[truthy-function] # False if NotImported
@@ -201,6 +214,22 @@ class PandasExecutionEngine(ExecutionEngine):
 
         super().load_batch_data(batch_id=batch_id, batch_data=batch_data)
 
+    @override
+    def _compute_batch_fingerprint(self, batch_id: str) -> Optional[str]:
+        fingerprint: Optional[str] = super()._compute_batch_fingerprint(batch_id=batch_id)
+        if fingerprint is not None:
+            return fingerprint
+
+        batch_data = self.batch_manager.batch_data_cache.get(batch_id)
+        if not isinstance(batch_data, PandasBatchData):
+            return None
+
+        df: pd.DataFrame = batch_data.dataframe
+        if df.memory_usage().sum() >= HASH_THRESHOLD:
+            return None
+
+        return hash_pandas_dataframe(df)
+
     @override
     def get_batch_data_and_markers(  # noqa: C901, PLR0912, PLR0915
         self, batch_spec: BatchSpec | PandasBatchSpecProtocol
@@ -214,6 +243,12 @@ class PandasExecutionEngine(ExecutionEngine):
             }
         )
 
+        # Columns to load (if the batch spec requests a projection) and columns of the source.
+        columns: Optional[List[str]] = (
+            get_projected_columns(batch_spec) if isinstance(batch_spec, BatchSpec) else None
+        )
+        source_columns: Optional[List[str]] = None
+
         batch_data: Any
         if isinstance(batch_spec, RuntimeDataBatchSpec):
             # batch_data != None is already checked when RuntimeDataBatchSpec is instantiated
@@ -261,7 +296,15 @@ class PandasExecutionEngine(ExecutionEngine):
             reader_fn: DataFrameFactoryFn = self._get_reader_fn(reader_method, s3_url.key)
             buf = BytesIO(s3_object["Body"].read())  # type: ignore[possibly-undefined] # FIXME
             buf.seek(0)
-            df = reader_fn(buf, **reader_options)
+            reader_options, source_columns = project_pandas_reader_options(
+                reader_fn=reader_fn, source=buf, reader_options=reader_options, columns=columns
+            )
+            df = self._read_batch_data(
+                batch_spec=batch_spec,
+                reader_fn=reader_fn,
+                source=buf,
+                reader_options=reader_options,
+            )
 
         elif isinstance(batch_spec, AzureBatchSpec):
             if self._azure is None:
@@ -287,7 +330,15 @@ class PandasExecutionEngine(ExecutionEngine):
             reader_fn = self._get_reader_fn(reader_method, azure_url.blob)
             buf = BytesIO(azure_object.readall())
             buf.seek(0)
-            df = reader_fn(buf, **reader_options)
+            reader_options, source_columns = project_pandas_reader_options(
+                reader_fn=reader_fn, source=buf, reader_options=reader_options, columns=columns
+            )
+            df = self._read_batch_data(
+                batch_spec=batch_spec,
+                reader_fn=reader_fn,
+                source=buf,
+                reader_options=reader_options,
+            )
 
         elif isinstance(batch_spec, GCSBatchSpec):
             if self._gcs is None:
@@ -314,7 +365,15 @@ Bucket: {error}"""  # noqa: E501
             reader_fn = self._get_reader_fn(reader_method, gcs_url.blob)
             buf = BytesIO(gcs_blob.download_as_bytes())
             buf.seek(0)
-            df = reader_fn(buf, **reader_options)
+            reader_options, source_columns = project_pandas_reader_options(
+                reader_fn=reader_fn, source=buf, reader_options=reader_options, columns=columns
+            )
+            df = self._read_batch_data(
+                batch_spec=batch_spec,
+                reader_fn=reader_fn,
+                source=buf,
+                reader_options=reader_options,
+            )
 
         # Experimental datasources will go down this code path
         elif isinstance(batch_spec, PathBatchSpec):
@@ -322,12 +381,26 @@ Bucket: {error}"""  # noqa: E501
             reader_options = batch_spec.reader_options
             path = batch_spec.path
             reader_fn = self._get_reader_fn(reader_method, path)
-            df = reader_fn(path, **reader_options)
+            reader_options, source_columns = project_pandas_reader_options(
+                reader_fn=reader_fn, source=path, reader_options=reader_options, columns=columns
+            )
+            df = self._read_batch_data(
+                batch_spec=batch_spec,
+                reader_fn=reader_fn,
+                source=path,
+                reader_options=reader_options,
+            )
 
         elif isinstance(batch_spec, PandasBatchSpec):
             reader_method = batch_spec.reader_method
             reader_options = batch_spec.reader_options
             reader_fn = self._get_reader_fn(reader_method)
+            reader_options, source_columns = project_pandas_reader_options(
+                reader_fn=reader_fn,
+                source=reader_options.get("filepath_or_buffer", reader_options.get("path")),
+                reader_options=reader_options,
+                columns=columns,
+            )
             reader_fn_result: pd.DataFrame | list[pd.DataFrame] = execute_pandas_reader_fn(
                 reader_fn, reader_options
             )
@@ -356,10 +429,54 @@ not {batch_spec.__class__.__name__}"""  # noqa: E501
         if df.memory_usage().sum() < HASH_THRESHOLD:
             batch_markers["pandas_data_fingerprint"] = hash_pandas_dataframe(df)
 
-        typed_batch_data = PandasBatchData(execution_engine=self, dataframe=df)
+        typed_batch_data = PandasBatchData(
+            execution_engine=self, dataframe=df, source_columns=source_columns
+        )
 
         return typed_batch_data, batch_markers
 
+    def _read_batch_data(
+        self,
+        batch_spec: BatchSpec,
+        reader_fn: DataFrameFactoryFn,
+        source: Any,
+        reader_options: dict,
+    ) -> pd.DataFrame:
+        """Read the file of a batch, pushing its partition down to the Parquet reader as filters.
+
+        If the reader rejects the filters (e.g., since a filter value does not match the type of its
+        column), then the file is read without them; either way, the partitioner is applied to the
+        data read (see "_apply_partitioning_and_sampling_methods").
+        """
+        filters: Optional[List[PartitionFilter]] = self._get_reader_filters(
+            batch_spec=batch_spec, reader_fn=reader_fn, reader_options=reader_options
+        )
+        if filters is not None:
+            try:
+                return reader_fn(source, **reader_options, filters=filters)
+            except (NotImplementedError, TypeError, ValueError) as e:
+                logger.debug(f"Unable to push partition filters {filters} down to reader: {e}")
+                if hasattr(source, "seek"):
+                    source.seek(0)
+
+        return reader_fn(source, **reader_options)
+
+    def _get_reader_filters(
+        self, batch_spec: BatchSpec, reader_fn: DataFrameFactoryFn, reader_options: dict
+    ) -> Optional[List[PartitionFilter]]:
+        partitioner_method_name: Optional[str] = batch_spec.get("partitioner_method")
+        if (
+            not partitioner_method_name
+            or reader_options.get("filters") is not None
+            or get_pandas_reader_method_name(reader_fn) != "read_parquet"
+        ):
+            return None
+
+        return self._data_partitioner.get_partition_filters(
+            partitioner_method_name=partitioner_method_name,
+            partitioner_kwargs=batch_spec.get("partitioner_kwargs") or {},
+        )
+
     def _apply_partitioning_and_sampling_methods(
         self,
         batch_spec: BatchSpec | PandasBatchSpecProtocol,
@@ -478,6 +595,33 @@ not {batch_spec.__class__.__name__}"""  # noqa: E501
                 f'Unable to find reader_method "{reader_method}" in pandas.'
             )
 
+    def get_value_set_index(self, value_set: Iterable) -> pd.Index:
+        """Returns Index of unique values of value set, whose hash table is shared by all membership metrics matching
+        same values during validation (see "release_validation_resources()").
+
+        Args:
+            value_set: Values of membership metric (e.g., "column_values.in_set").
+
+        Returns:
+            Pandas "Index" of unique values.
+        """  # noqa: E501
+        key: tuple = tuple(value_set)
+        try:
+            index: Optional[pd.Index] = self._value_set_indexes.get(key)
+        except TypeError:
+            # Unhashable values (e.g., lists) cannot be keyed.
+            return pd.Index(key).unique()
+
+        if index is None:
+            index = pd.Index(key).unique()
+            self._value_set_indexes[key] = index
+
+        return index
+
+    @override
+    def release_validation_resources(self) -> None:
+        self._value_set_indexes.clear()
+
     @override
     def resolve_metric_bundle(self, metric_fn_bundle) -> Dict[Tuple[str, str, str], Any]:
         """Resolve a bundle of metrics with the same compute Domain as part of a single trip to the compute engine."""  # noqa: E501
@@ -3,7 +3,7 @@ from __future__ import annotations
 import abc
 import datetime
 import enum
-from typing import Callable, ClassVar, List, Type
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Tuple, Type
 
 import ruamel
 from dateutil.parser import parse
@@ -73,6 +73,25 @@ class PartitionerMethod(enum.Enum):
         return hash(self.value)
 
 
+# Filter, which a reader applies while reading data: (column name, comparison operator, value).
+# Lists of filters are conjunctions, as in the "filters" argument of "pyarrow.parquet.read_table".
+PartitionFilter = Tuple[str, str, Any]
+
+# Date parts, whose values (from coarsest to finest) identify a contiguous range of datetimes.
+_CONTIGUOUS_DATE_PARTS: Tuple[str, ...] = ("year", "month", "day", "hour", "minute", "second")
+
+# Formats of "partition_on_converted_datetime", whose values identify a range of datetimes.
+_CONVERTED_DATETIME_FORMAT_DATE_PARTS: Dict[str, str] = {
+    "%Y": "year",
+    "%Y-%m": "month",
+    "%Y-%m-%d": "day",
+    "%Y%m%d": "day",
+    "%Y-%m-%d %H": "hour",
+    "%Y-%m-%d %H:%M": "minute",
+    "%Y-%m-%d %H:%M:%S": "second",
+}
+
+
 class DataPartitioner(abc.ABC):  # noqa: B024
     """Abstract base class containing methods for partitioning data accessible via Execution Engines.
 
@@ -95,6 +114,160 @@ class DataPartitioner(abc.ABC):  # noqa: B024
 
         return getattr(self, partitioner_method_name)
 
+    def get_partition_filters(
+        self, partitioner_method_name: str, partitioner_kwargs: dict
+    ) -> Optional[List[PartitionFilter]]:
+        """Translate a partitioner and its batch identifiers into filters, which readers can apply.
+
+        Readers (e.g., of Parquet files) can use these filters to skip data outside of the
+        partition (e.g., by row group statistics).  Rows matching the filters are a superset of the
+        rows of the partition, so the partitioner is still applied to the data read.
+
+        Args:
+            partitioner_method_name: name of the partitioner.
+            partitioner_kwargs: keyword arguments of the partitioner, including batch_identifiers.
+
+        Returns:
+            Filters of the partition, or None if the partitioner cannot be translated (in which case
+                the partition is only filtered in memory).
+        """
+        kwargs: dict = dict(partitioner_kwargs)
+        batch_identifiers: dict = kwargs.pop("batch_identifiers", None) or {}
+        try:
+            partitioner_method = PartitionerMethod(
+                self._get_partitioner_method_name(partitioner_method_name)
+            )
+            return self._get_partition_filters(
+                partitioner_method=partitioner_method,
+                batch_identifiers=batch_identifiers,
+                **kwargs,
+            )
+        except (KeyError, TypeError, ValueError, gx_exceptions.InvalidConfigError):
+            return None
+
+    def _get_partition_filters(  # noqa: PLR0911
+        self,
+        partitioner_method: PartitionerMethod,
+        batch_identifiers: dict,
+        column_name: Optional[str] = None,
+        **kwargs,
+    ) -> Optional[List[PartitionFilter]]:
+        date_parts: Optional[List[DatePart] | List[str]] = {
+            PartitionerMethod.PARTITION_ON_YEAR: [DatePart.YEAR],
+            PartitionerMethod.PARTITION_ON_YEAR_AND_MONTH: [DatePart.YEAR, DatePart.MONTH],
+            PartitionerMethod.PARTITION_ON_YEAR_AND_MONTH_AND_DAY: [
+                DatePart.YEAR,
+                DatePart.MONTH,
+                DatePart.DAY,
+            ],
+            PartitionerMethod.PARTITION_ON_DATE_PARTS: kwargs.get("date_parts"),
+        }.get(partitioner_method)
+        if date_parts is not None:
+            self._validate_date_parts(date_parts)
+            date_parts_dict = self._convert_datetime_batch_identifiers_to_date_parts_dict(
+                batch_identifiers[column_name], self._convert_date_parts(date_parts)
+            )
+            return self._get_date_range_filters(column_name, date_parts_dict)  # type: ignore[arg-type]
+
+        if partitioner_method == PartitionerMethod.PARTITION_ON_CONVERTED_DATETIME:
+            return self._get_converted_datetime_filters(
+                column_name,  # type: ignore[arg-type]
+                matching_string=batch_identifiers[column_name],
+                date_format_string=kwargs.get("date_format_string", "%Y-%m-%d"),
+            )
+
+        if partitioner_method == PartitionerMethod.PARTITION_ON_COLUMN_VALUE:
+            value = batch_identifiers[column_name]
+            return None if value is None else [(column_name, "==", value)]  # type: ignore[list-item]
+
+        if partitioner_method == PartitionerMethod.PARTITION_ON_MULTI_COLUMN_VALUES:
+            column_values = {name: batch_identifiers.get(name) for name in kwargs["column_names"]}
+            if not all(column_values.values()):
+                return None
+            return [(name, "==", value) for name, value in column_values.items()]
+
+        if partitioner_method == PartitionerMethod.PARTITION_ON_DIVIDED_INTEGER:
+            return self._get_divided_integer_filters(
+                column_name,  # type: ignore[arg-type]
+                divisor=kwargs["divisor"],
+                quotient=batch_identifiers[column_name],
+            )
+
+        return None
+
+    @staticmethod
+    def _get_date_range_filters(
+        column_name: str, date_parts_dict: dict
+    ) -> Optional[List[PartitionFilter]]:
+        """Filters of the range of datetimes, whose coarsest date parts have the given values."""
+        values: Dict[str, int] = {
+            str(date_part).lower(): int(value) for date_part, value in date_parts_dict.items()
+        }
+        num_date_parts = len(values)
+        if num_date_parts == 0 or set(values) != set(_CONTIGUOUS_DATE_PARTS[:num_date_parts]):
+            return None
+
+        start = datetime.datetime(  # noqa: DTZ001
+            year=values["year"],
+            month=values.get("month", 1),
+            day=values.get("day", 1),
+            hour=values.get("hour", 0),
+            minute=values.get("minute", 0),
+            second=values.get("second", 0),
+        )
+        finest_date_part = _CONTIGUOUS_DATE_PARTS[num_date_parts - 1]
+        end: datetime.datetime
+        if finest_date_part == "year":
+            end = start.replace(year=start.year + 1)
+        elif finest_date_part == "month":
+            end = start.replace(year=start.year + start.month // 12, month=start.month % 12 + 1)
+        else:
+            end = start + datetime.timedelta(**{f"{finest_date_part}s": 1})
+
+        return [(column_name, ">=", start), (column_name, "<", end)]
+
+    @classmethod
+    def _get_converted_datetime_filters(
+        cls, column_name: str, matching_string: str, date_format_string: str
+    ) -> Optional[List[PartitionFilter]]:
+        """Filters of the range of datetimes, which the given format converts to matching_string."""
+        finest_date_part = _CONVERTED_DATETIME_FORMAT_DATE_PARTS.get(date_format_string)
+        if finest_date_part is None:
+            return None
+
+        value = datetime.datetime.strptime(matching_string, date_format_string)  # noqa: DTZ007
+        # Strings, which are parsed but never produced by the format (e.g., "2020-1-5"), match none.
+        if value.strftime(date_format_string) != matching_string:
+            return None
+
+        date_parts_dict = {
+            date_part: getattr(value, date_part)
+            for date_part in _CONTIGUOUS_DATE_PARTS[
+                : _CONTIGUOUS_DATE_PARTS.index(finest_date_part) + 1
+            ]
+        }
+        return cls._get_date_range_filters(column_name, date_parts_dict)
+
+    @staticmethod
+    def _get_divided_integer_filters(
+        column_name: str, divisor: int, quotient: int
+    ) -> Optional[List[PartitionFilter]]:
+        """Filters of the values, whose quotient by divisor (truncated toward zero) is given."""
+        if not isinstance(divisor, int) or divisor <= 0 or not isinstance(quotient, int):
+            return None
+
+        if quotient > 0:
+            return [
+                (column_name, ">=", divisor * quotient),
+                (column_name, "<", divisor * (quotient + 1)),
+            ]
+        if quotient < 0:
+            return [
+                (column_name, ">", divisor * (quotient - 1)),
+                (column_name, "<=", divisor * quotient),
+            ]
+        return [(column_name, ">", -divisor), (column_name, "<", divisor)]
+
     @staticmethod
     def _get_partitioner_method_name(partitioner_method_name: str) -> str:
         """Accept partitioner methods with or without starting with `_`.
@@ -1,16 +1,19 @@
 from __future__ import annotations
 
 import hashlib
-from typing import TYPE_CHECKING, List, Union
+from typing import List, Union
+
+import numpy as np
+import pandas as pd
 
 import great_expectations.exceptions as gx_exceptions
 from great_expectations.execution_engine.partition_and_sample.data_partitioner import (
     DataPartitioner,
     DatePart,
 )
-
-if TYPE_CHECKING:
-    import pandas as pd
+from great_expectations.execution_engine.partition_and_sample.pandas_hashing import (
+    get_hash_suffix_matches,
+)
 
 
 class PandasDataPartitioner(DataPartitioner):
@@ -167,17 +170,37 @@ class PandasDataPartitioner(DataPartitioner):
         """  # noqa: E501
         return df[df[column_name] == batch_identifiers[column_name]]
 
-    @staticmethod
+    @classmethod
     def partition_on_converted_datetime(
+        cls,
         df,
         column_name: str,
         batch_identifiers: dict,
         date_format_string: str = "%Y-%m-%d",
     ) -> pd.DataFrame:
         """Convert the values in the named column to the given date_format, and partition on that"""
-        stringified_datetime_series = df[column_name].map(lambda x: x.strftime(date_format_string))
         matching_string = batch_identifiers[column_name]
-        return df[stringified_datetime_series == matching_string]
+        column = df[column_name]
+        if not pd.api.types.is_datetime64_any_dtype(column):
+            stringified_datetime_series = column.map(lambda x: x.strftime(date_format_string))
+            return df[stringified_datetime_series == matching_string]
+
+        if isinstance(column.dtype, pd.DatetimeTZDtype):
+            # Datetimes are converted to strings in their local (wall) time.
+            column = column.dt.tz_localize(None)
+
+        try:
+            filters = cls._get_converted_datetime_filters(
+                column_name, matching_string=matching_string, date_format_string=date_format_string
+            )
+        except ValueError:
+            filters = None
+
+        if filters is None:
+            return df[column.dt.strftime(date_format_string) == matching_string]
+
+        (_, _, start), (_, _, end) = filters
+        return df[(column >= start) & (column < end)]
 
     @staticmethod
     def partition_on_divided_integer(
@@ -186,7 +209,8 @@ class PandasDataPartitioner(DataPartitioner):
         """Divide the values in the named column by `divisor`, and partition on that"""
 
         matching_divisor = batch_identifiers[column_name]
-        matching_rows = df[column_name].map(lambda x: int(x / divisor) == matching_divisor)
+        # Quotients are truncated toward zero (as by "int"), not floored (as by "//").
+        matching_rows = np.trunc(df[column_name] / divisor) == matching_divisor
 
         return df[matching_rows]
 
@@ -197,7 +221,7 @@ class PandasDataPartitioner(DataPartitioner):
         """Divide the values in the named column by `divisor`, and partition on that"""
 
         matching_mod_value = batch_identifiers[column_name]
-        matching_rows = df[column_name].map(lambda x: x % mod == matching_mod_value)
+        matching_rows = df[column_name] % mod == matching_mod_value
 
         return df[matching_rows]
 
@@ -207,7 +231,7 @@ class PandasDataPartitioner(DataPartitioner):
     ) -> pd.DataFrame:
         """Partition on the joint values in the named columns"""
 
-        subset_df = df.copy()
+        matching_rows = np.ones(len(df), dtype=bool)
         for column_name in column_names:
             value = batch_identifiers.get(column_name)
             if not value:
@@ -216,8 +240,8 @@ class PandasDataPartitioner(DataPartitioner):
                     f"all values in column_names must also exist in batch_identifiers. "
                     f"{column_name} was not found in batch_identifiers."
                 )
-            subset_df = subset_df[subset_df[column_name] == value]
-        return subset_df
+            matching_rows &= (df[column_name] == value).to_numpy(dtype=bool, na_value=False)
+        return df[matching_rows]
 
     @staticmethod
     def partition_on_hashed_column(
@@ -237,8 +261,10 @@ class PandasDataPartitioner(DataPartitioner):
                         Reference to {hash_function_name} cannot be found."""  # noqa: E501
                 )
             )
-        matching_rows = df[column_name].map(
-            lambda x: hash_method(str(x).encode()).hexdigest()[-1 * hash_digits :]
-            == batch_identifiers["hash_value"]
+        matching_rows = get_hash_suffix_matches(
+            df[column_name],
+            hash_func=hash_method,
+            hash_digits=hash_digits,
+            hash_value=batch_identifiers["hash_value"],
         )
         return df[matching_rows]
@@ -8,6 +8,9 @@ import great_expectations.exceptions as gx_exceptions
 from great_expectations.execution_engine.partition_and_sample.data_sampler import (
     DataSampler,
 )
+from great_expectations.execution_engine.partition_and_sample.pandas_hashing import (
+    get_hash_suffix_matches,
+)
 
 if TYPE_CHECKING:
     import pandas as pd
@@ -86,7 +89,7 @@ class PandasDataSampler(DataSampler):
         mod: int = self.get_sampling_kwargs_value_or_default(batch_spec, "mod")
         value: int = self.get_sampling_kwargs_value_or_default(batch_spec, "value")
 
-        return df[df[column_name].map(lambda x: x % mod == value)]
+        return df[df[column_name] % mod == value]
 
     def sample_using_a_list(
         self,
@@ -159,7 +162,7 @@ class PandasDataSampler(DataSampler):
                 )
             )
 
-        matches: pd.Series = df[column_name].map(
-            lambda x: hash_func(str(x).encode()).hexdigest()[-1 * hash_digits :] == hash_value
+        matches = get_hash_suffix_matches(
+            df[column_name], hash_func=hash_func, hash_digits=hash_digits, hash_value=hash_value
         )
         return df[matches]
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import infer_dtype
+
+
+def get_hash_suffix_matches(
+    series: pd.Series,
+    hash_func: Callable,
+    hash_digits: int,
+    hash_value: str,
+) -> np.ndarray:
+    """Mask of values, whose hex digest ends with hash_value (hashing the "str()" of every value).
+
+    Equivalent to:
+        series.map(lambda x: hash_func(str(x).encode()).hexdigest()[-hash_digits:] == hash_value)
+
+    but every distinct value is hashed once, and the results are broadcast to all rows by NumPy
+    indexing.  (Hashes of "pd.util.hash_array" would select different rows than earlier versions.)
+
+    Args:
+        series: values to hash.
+        hash_func: hashlib constructor, e.g. "hashlib.md5".
+        hash_digits: number of trailing hex digits of the digest to compare.
+        hash_value: trailing hex digits to match.
+
+    Returns:
+        Boolean array, aligned with series.
+    """
+
+    def _matches(value) -> bool:
+        return hash_func(str(value).encode()).hexdigest()[-1 * hash_digits :] == hash_value
+
+    values: pd.Series = series
+    if series.dtype == object and infer_dtype(series, skipna=False) != "string":
+        # Distinct objects may be equal (e.g., 1, 1.0 and True), but have different strings.
+        values = pd.Series([str(value) for value in series], index=series.index, dtype=object)
+
+    codes, uniques = pd.factorize(values)
+    unique_matches = np.fromiter(
+        (_matches(value) for value in uniques), dtype=bool, count=len(uniques)
+    )
+    # Missing values (of code -1) are of one kind (e.g., NaN or NaT) per non-object dtype.
+    missing = codes == -1
+    missing_match = bool(missing.any()) and _matches(values[missing].iloc[0])
+    return np.append(unique_matches, missing_match)[codes]
@@ -0,0 +1,445 @@
+from __future__ import annotations
+
+import contextlib
+import datetime
+import decimal
+import hashlib
+import json
+import logging
+import pathlib
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Iterable, Iterator, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from great_expectations.compatibility.typing_extensions import override
+from great_expectations.util import convert_to_json_serializable  # noqa: TID251
+
+if TYPE_CHECKING:
+    from great_expectations.alias_types import PathStr
+    from great_expectations.core.batch_spec import BatchSpec
+    from great_expectations.validator.computed_metric import MetricValue
+
+logger = logging.getLogger(__name__)
+
+_MetricCacheKey = Tuple[str, Hashable, Hashable]
+
+
+class PersistentMetricCache(ABC):
+    """Cache of resolved metric values, which outlives ExecutionEngine (and process) that computed them.
+
+    Values are keyed by fingerprint of Batch data (e.g., "pandas_data_fingerprint" of "BatchMarkers", or hash of
+    "BatchSpec" for SQL and Spark Batches) and by "MetricConfiguration.id"; hence, re-validating unchanged data reuses
+    previously computed metrics.  Custom implementations can be supplied to ExecutionEngine via its
+    "persistent_metric_cache" constructor argument.
+    """  # noqa: E501
+
+    @abstractmethod
+    def get_many(
+        self, fingerprint: str, metric_ids: Iterable[_MetricCacheKey]
+    ) -> Dict[_MetricCacheKey, MetricValue]:
+        """Returns those of requested metrics, which are cached (and not expired) for Batch with given fingerprint."""  # noqa: E501
+        raise NotImplementedError
+
+    @abstractmethod
+    def put_many(self, fingerprint: str, metrics: Dict[_MetricCacheKey, MetricValue]) -> None:
+        """Stores resolved metrics of Batch with given fingerprint (values that cannot be serialized are skipped)."""  # noqa: E501
+        raise NotImplementedError
+
+    @abstractmethod
+    def invalidate(self, fingerprint: Optional[str] = None) -> int:
+        """Removes metrics of Batch with given fingerprint (or all metrics, if omitted); returns number removed."""  # noqa: E501
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def config(self) -> dict:
+        raise NotImplementedError
+
+
+class SqlitePersistentMetricCache(PersistentMetricCache):
+    """PersistentMetricCache, backed by local SQLite database file (safe for concurrent use by threads and processes).
+
+    Metric values are stored as JSON (see "encode_metric_value"), so that reading shared cache file never executes code;
+    values of types that cannot be represented are not persisted.
+
+    Args:
+        path: Location of SQLite database file (created, along with its parent directories, if it does not exist).
+        ttl_seconds: Optional number of seconds, after which cached metric values are considered stale.
+        max_entries: Optional maximum number of cached metric values; least recently used values are evicted first.
+        max_bytes: Optional maximum total size of serialized metric values; least recently used values are evicted first.
+    """  # noqa: E501
+
+    _TABLE_NAME = "gx_metric_cache"
+
+    def __init__(
+        self,
+        path: PathStr,
+        ttl_seconds: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+    ) -> None:
+        self._path = pathlib.Path(path)
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as connection:
+            connection.execute(
+                f"""CREATE TABLE IF NOT EXISTS {self._TABLE_NAME} (
+                    fingerprint TEXT NOT NULL,
+                    metric_id TEXT NOT NULL,
+                    value BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    PRIMARY KEY (fingerprint, metric_id)
+                )"""
+            )
+            connection.execute(
+                f"CREATE INDEX IF NOT EXISTS {self._TABLE_NAME}_accessed_at ON {self._TABLE_NAME} (accessed_at)"  # noqa: E501
+            )
+
+    @property
+    def path(self) -> pathlib.Path:
+        return self._path
+
+    @property
+    @override
+    def config(self) -> dict:
+        return {
+            "path": str(self._path),
+            "ttl_seconds": self._ttl_seconds,
+            "max_entries": self._max_entries,
+            "max_bytes": self._max_bytes,
+        }
+
+    @override
+    def get_many(
+        self, fingerprint: str, metric_ids: Iterable[_MetricCacheKey]
+    ) -> Dict[_MetricCacheKey, MetricValue]:
+        keys_by_serialized_id: Dict[str, _MetricCacheKey] = {
+            _serialize_metric_id(metric_id): metric_id for metric_id in metric_ids
+        }
+        if not keys_by_serialized_id:
+            return {}
+
+        now: float = time.time()
+        rows: list = []
+        with self._lock, self._connect() as connection:
+            self._purge_expired(connection=connection, now=now)
+
+            serialized_ids: list = list(keys_by_serialized_id.keys())
+            # Stay well under SQLite limit on number of host parameters per statement.
+            for offset in range(0, len(serialized_ids), 500):
+                chunk = serialized_ids[offset : offset + 500]
+                placeholders: str = ", ".join("?" for _ in chunk)
+                rows.extend(
+                    connection.execute(
+                        f"SELECT metric_id, value FROM {self._TABLE_NAME} WHERE fingerprint = ? AND metric_id IN ({placeholders})",  # noqa: E501
+                        [fingerprint, *chunk],
+                    ).fetchall()
+                )
+
+            if rows:
+                connection.executemany(
+                    f"UPDATE {self._TABLE_NAME} SET accessed_at = ? WHERE fingerprint = ? AND metric_id = ?",  # noqa: E501
+                    [(now, fingerprint, row[0]) for row in rows],
+                )
+
+        metrics: Dict[_MetricCacheKey, MetricValue] = {}
+        serialized_id: str
+        value: bytes
+        for serialized_id, value in rows:
+            try:
+                metrics[keys_by_serialized_id[serialized_id]] = decode_metric_value(
+                    json.loads(value)
+                )
+            except (TypeError, ValueError, KeyError) as e:
+                logger.debug(f"Unable to load cached value of metric {serialized_id}: {e!r}")
+
+        return metrics
+
+    @override
+    def put_many(self, fingerprint: str, metrics: Dict[_MetricCacheKey, MetricValue]) -> None:
+        now: float = time.time()
+        rows: list = []
+        metric_id: _MetricCacheKey
+        value: MetricValue
+        for metric_id, value in metrics.items():
+            try:
+                serialized_value: bytes = json.dumps(encode_metric_value(value)).encode("utf-8")
+            except (TypeError, ValueError) as e:
+                logger.debug(f"Metric {metric_id} cannot be persisted: {e!r}")
+                continue
+
+            if self._max_bytes is not None and len(serialized_value) > self._max_bytes:
+                continue
+
+            rows.append(
+                (
+                    fingerprint,
+                    _serialize_metric_id(metric_id),
+                    serialized_value,
+                    len(serialized_value),
+                    now,
+                    now,
+                )
+            )
+
+        if not rows:
+            return
+
+        with self._lock, self._connect() as connection:
+            connection.executemany(
+                f"INSERT OR REPLACE INTO {self._TABLE_NAME} (fingerprint, metric_id, value, size, created_at, accessed_at) VALUES (?, ?, ?, ?, ?, ?)",  # noqa: E501
+                rows,
+            )
+            self._purge_expired(connection=connection, now=now)
+            self._evict(connection=connection)
+
+    @override
+    def invalidate(self, fingerprint: Optional[str] = None) -> int:
+        with self._lock, self._connect() as connection:
+            if fingerprint is None:
+                cursor = connection.execute(f"DELETE FROM {self._TABLE_NAME}")
+            else:
+                cursor = connection.execute(
+                    f"DELETE FROM {self._TABLE_NAME} WHERE fingerprint = ?", (fingerprint,)
+                )
+
+            return cursor.rowcount
+
+    def __len__(self) -> int:
+        with self._lock, self._connect() as connection:
+            return connection.execute(f"SELECT COUNT(*) FROM {self._TABLE_NAME}").fetchone()[0]
+
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        connection = sqlite3.connect(str(self._path), timeout=30.0)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def _purge_expired(self, connection: sqlite3.Connection, now: float) -> None:
+        if self._ttl_seconds is not None:
+            connection.execute(
+                f"DELETE FROM {self._TABLE_NAME} WHERE created_at < ?",
+                (now - self._ttl_seconds,),
+            )
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        if self._max_entries is not None:
+            connection.execute(
+                f"""DELETE FROM {self._TABLE_NAME} WHERE rowid IN (
+                    SELECT rowid FROM {self._TABLE_NAME} ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+                )""",
+                (self._max_entries,),
+            )
+
+        if self._max_bytes is not None:
+            # Keep most recently used values, whose running total size fits the budget.
+            connection.execute(
+                f"""DELETE FROM {self._TABLE_NAME} WHERE rowid IN (
+                    SELECT rowid FROM (
+                        SELECT rowid, SUM(size) OVER (ORDER BY accessed_at DESC, rowid DESC) AS running_size
+                        FROM {self._TABLE_NAME}
+                    ) WHERE running_size > ?
+                )""",  # noqa: E501
+                (self._max_bytes,),
+            )
+
+
+def fingerprint_batch_spec(batch_spec: BatchSpec, **context: Any) -> Optional[str]:
+    """Returns stable hash of "BatchSpec" (and of any additional identifying context, such as database URL).
+
+    Returns None for "BatchSpec" objects that carry in-memory data (their contents cannot be identified by reference).
+    """  # noqa: E501
+    if "batch_data" in batch_spec:
+        return None
+
+    try:
+        serialized: str = json.dumps(
+            convert_to_json_serializable({"batch_spec": dict(batch_spec), **context}),
+            sort_keys=True,
+        )
+    except (TypeError, ValueError) as e:
+        logger.debug(f"Unable to fingerprint BatchSpec: {e!r}")
+        return None
+
+    return hashlib.md5(serialized.encode("utf-8")).hexdigest()
+
+
+_TYPE_KEY = "__gx_metric_value_type__"
+# Boolean, integer, unsigned integer, floating point, and string dtypes (all JSON-serializable).
+_JSON_NUMPY_DTYPE_KINDS = "biufU"
+
+
+def encode_metric_value(value: Any) -> Any:  # noqa: C901, PLR0911, PLR0912
+    """Converts metric value to JSON-serializable form, from which "decode_metric_value" restores it.
+
+    Python containers, NumPy scalars and arrays, and Pandas objects are wrapped in typed envelopes, so that their types
+    (and dtypes) survive round trip.
+
+    Raises:
+        TypeError: if value (or any of its elements) is of type that cannot be represented.
+    """  # noqa: E501
+    value_type: type = type(value)
+    if value is None or value_type in (bool, int, float, str):
+        return value
+
+    if value_type is list:
+        return [encode_metric_value(element) for element in value]
+
+    if value_type in (tuple, set, frozenset):
+        return {
+            _TYPE_KEY: value_type.__name__,
+            "value": [encode_metric_value(element) for element in value],
+        }
+
+    if value_type is dict:
+        return {
+            _TYPE_KEY: "dict",
+            "value": [
+                [encode_metric_value(key), encode_metric_value(element)]
+                for key, element in value.items()
+            ],
+        }
+
+    if isinstance(value, (np.generic, np.ndarray)):
+        if value.dtype.kind not in _JSON_NUMPY_DTYPE_KINDS:
+            raise TypeError(f"NumPy values of dtype {value.dtype} cannot be persisted.")  # noqa: TRY003
+
+        return {
+            _TYPE_KEY: "numpy_scalar" if isinstance(value, np.generic) else "numpy_array",
+            "dtype": value.dtype.str,
+            "value": convert_to_json_serializable(value),
+        }
+
+    if value is pd.NaT:
+        return {_TYPE_KEY: "nat"}
+
+    if value_type in (pd.Timestamp, datetime.datetime, datetime.date):
+        return {_TYPE_KEY: value_type.__name__, "value": value.isoformat()}
+
+    if value_type is decimal.Decimal:
+        return {_TYPE_KEY: "decimal", "value": str(value)}
+
+    if value_type is pd.RangeIndex:
+        return {
+            _TYPE_KEY: "range_index",
+            "value": [value.start, value.stop, value.step],
+            "name": encode_metric_value(value.name),
+        }
+
+    if value_type is pd.Index:
+        return {
+            _TYPE_KEY: "index",
+            "dtype": str(value.dtype),
+            "name": encode_metric_value(value.name),
+            "value": [encode_metric_value(element) for element in value.tolist()],
+        }
+
+    if value_type is pd.Series:
+        return {
+            _TYPE_KEY: "series",
+            "dtype": str(value.dtype),
+            "name": encode_metric_value(value.name),
+            "index": encode_metric_value(value.index),
+            "value": [encode_metric_value(element) for element in value.tolist()],
+        }
+
+    if value_type is pd.DataFrame:
+        return {
+            _TYPE_KEY: "dataframe",
+            "columns": encode_metric_value(value.columns),
+            "index": encode_metric_value(value.index),
+            "value": [encode_metric_value(value.iloc[:, idx]) for idx in range(value.shape[1])],
+        }
+
+    raise TypeError(f"Metric values of type {value_type.__name__} cannot be persisted.")  # noqa: TRY003
+
+
+def decode_metric_value(value: Any) -> Any:  # noqa: C901, PLR0911, PLR0912
+    """Restores metric value from its "encode_metric_value" form (only types listed there are ever constructed)."""  # noqa: E501
+    if isinstance(value, list):
+        return [decode_metric_value(element) for element in value]
+
+    if not isinstance(value, dict):
+        return value
+
+    value_type: str = value[_TYPE_KEY]
+    if value_type in ("tuple", "set", "frozenset"):
+        container_type: type = {"tuple": tuple, "set": set, "frozenset": frozenset}[value_type]
+        return container_type(decode_metric_value(element) for element in value["value"])
+
+    if value_type == "dict":
+        return {
+            decode_metric_value(key): decode_metric_value(element)
+            for key, element in value["value"]
+        }
+
+    if value_type in ("numpy_scalar", "numpy_array"):
+        dtype = np.dtype(value["dtype"])
+        if dtype.kind not in _JSON_NUMPY_DTYPE_KINDS:
+            raise TypeError(f"NumPy values of dtype {dtype} cannot be loaded.")  # noqa: TRY003
+
+        if value_type == "numpy_scalar":
+            return dtype.type(value["value"])
+
+        return np.array(value["value"], dtype=dtype)
+
+    if value_type == "nat":
+        return pd.NaT
+
+    if value_type == "Timestamp":
+        return pd.Timestamp(value["value"])
+
+    if value_type == "datetime":
+        return datetime.datetime.fromisoformat(value["value"])
+
+    if value_type == "date":
+        return datetime.date.fromisoformat(value["value"])
+
+    if value_type == "decimal":
+        return decimal.Decimal(value["value"])
+
+    if value_type == "range_index":
+        start, stop, step = value["value"]
+        return pd.RangeIndex(start, stop, step, name=decode_metric_value(value["name"]))
+
+    if value_type == "index":
+        return pd.Index(
+            decode_metric_value(value["value"]),
+            dtype=value["dtype"],
+            name=decode_metric_value(value["name"]),
+        )
+
+    if value_type == "series":
+        return pd.Series(
+            decode_metric_value(value["value"]),
+            index=decode_metric_value(value["index"]),
+            dtype=value["dtype"],
+            name=decode_metric_value(value["name"]),
+        )
+
+    if value_type == "dataframe":
+        columns: list = [decode_metric_value(column) for column in value["value"]]
+        return pd.DataFrame(
+            dict(enumerate(columns)), index=decode_metric_value(value["index"])
+        ).set_axis(decode_metric_value(value["columns"]), axis="columns")
+
+    raise ValueError(f"Unknown type of persisted metric value: {value_type}.")  # noqa: TRY003
+
+
+def _serialize_metric_id(metric_id: _MetricCacheKey) -> str:
+    return json.dumps(metric_id, default=str)
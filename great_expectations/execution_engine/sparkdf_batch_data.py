@@ -1,13 +1,23 @@
 from __future__ import annotations
 
+from typing import List, Optional
+
 from great_expectations.core.batch import BatchData
 
 
 class SparkDFBatchData(BatchData):
-    def __init__(self, execution_engine, dataframe) -> None:
+    def __init__(
+        self, execution_engine, dataframe, source_columns: Optional[List[str]] = None
+    ) -> None:
         super().__init__(execution_engine=execution_engine)
         self._dataframe = dataframe
+        self._source_columns = source_columns
 
     @property
     def dataframe(self):
         return self._dataframe
+
+    @property
+    def source_columns(self) -> Optional[List[str]]:
+        """Columns of the source, if only some of them were loaded (see "column_projection")."""
+        return self._source_columns
@@ -3,6 +3,7 @@ from __future__ import annotations
 import copy
 import datetime
 import logging
+import operator
 import os
 import warnings
 from functools import reduce
@@ -49,6 +50,10 @@ from great_expectations.exceptions import (
 )
 from great_expectations.exceptions import exceptions as gx_exceptions
 from great_expectations.execution_engine import ExecutionEngine
+from great_expectations.execution_engine.column_projection import (
+    get_projected_columns,
+    project_spark_dataframe,
+)
 from great_expectations.execution_engine.execution_engine import (
     MetricComputationConfiguration,  # noqa: TCH001
     PartitionDomainKwargs,  # noqa: TCH001
@@ -59,6 +64,7 @@ from great_expectations.execution_engine.partition_and_sample.sparkdf_data_parti
 from great_expectations.execution_engine.partition_and_sample.sparkdf_data_sampler import (
     SparkDataSampler,
 )
+from great_expectations.execution_engine.persistent_metric_cache import fingerprint_batch_spec
 from great_expectations.execution_engine.sparkdf_batch_data import SparkDFBatchData
 from great_expectations.expectations.model_field_types import (
     CONDITION_PARSER_GREAT_EXPECTATIONS,
@@ -81,6 +87,15 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Spark column comparisons of the operators of partition filters (see "get_partition_filters").
+_SPARK_FILTER_OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    "==": operator.eq,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
 
 def apply_dateutil_parse(column):
     assert len(column.columns) == 1, "Expected DataFrame with 1 column"
@@ -415,6 +430,22 @@ class SparkDFExecutionEngine(ExecutionEngine):
 
         super().load_batch_data(batch_id=batch_id, batch_data=batch_data)
 
+    @override
+    def unload_batch_data(self, batch_id: str) -> None:
+        batch_data = self._batch_manager.batch_data_cache.get(batch_id)
+        if self._persist and isinstance(batch_data, SparkDFBatchData):
+            batch_data.dataframe.unpersist()
+
+        super().unload_batch_data(batch_id=batch_id)
+
+    @override
+    def _compute_batch_fingerprint(self, batch_id: str) -> Optional[str]:
+        batch = self.batch_manager.batch_cache.get(batch_id)
+        if batch is None:
+            return None
+
+        return fingerprint_batch_spec(batch_spec=batch.batch_spec, engine=self.__class__.__name__)
+
     @override
     def get_batch_data_and_markers(  # noqa: C901, PLR0912, PLR0915
         self, batch_spec: BatchSpec
@@ -535,7 +566,12 @@ illegal.  Please check your config."""  # noqa: E501
             )
 
         batch_data = self._apply_partitioning_and_sampling_methods(batch_spec, batch_data)
-        typed_batch_data = SparkDFBatchData(execution_engine=self, dataframe=batch_data)
+        batch_data, source_columns = project_spark_dataframe(
+            df=batch_data, columns=get_projected_columns(batch_spec)
+        )
+        typed_batch_data = SparkDFBatchData(
+            execution_engine=self, dataframe=batch_data, source_columns=source_columns
+        )
 
         return typed_batch_data, batch_markers
 
@@ -555,6 +591,12 @@ illegal.  Please check your config."""  # noqa: E501
                 partitioner_method_name
             )
             partitioner_kwargs: dict = batch_spec.get("partitioner_kwargs") or {}
+            batch_data = self._apply_partition_filters(
+                batch_spec=batch_spec,
+                df=batch_data,
+                partitioner_method_name=partitioner_method_name,
+                partitioner_kwargs=partitioner_kwargs,
+            )
             batch_data = partitioner_fn(batch_data, **partitioner_kwargs)
 
         sampler_method_name: Optional[str] = batch_spec.get("sampling_method")
@@ -564,6 +606,39 @@ illegal.  Please check your config."""  # noqa: E501
 
         return batch_data
 
+    def _apply_partition_filters(
+        self,
+        batch_spec: BatchSpec,
+        df: pyspark.DataFrame,
+        partitioner_method_name: str,
+        partitioner_kwargs: dict,
+    ) -> pyspark.DataFrame:
+        """Filter Parquet data by the partition of the batch, using plain column comparisons.
+
+        Unlike the date part functions of some partitioners, Spark pushes these comparisons down to
+        the Parquet reader (i.e., row groups outside of the partition are skipped).  The partitioner
+        is still applied to the filtered data.
+        """
+        reader_method: Optional[str] = batch_spec.get("reader_method")
+        is_parquet = reader_method == "parquet" or (
+            reader_method is None and str(batch_spec.get("path", "")).lower().endswith(".parquet")
+        )
+        if not is_parquet:
+            return df
+
+        filters = self._data_partitioner.get_partition_filters(
+            partitioner_method_name=partitioner_method_name,
+            partitioner_kwargs=partitioner_kwargs,
+        )
+        if not filters:
+            return df
+
+        conditions = [
+            _SPARK_FILTER_OPERATORS[operator_name](F.col(column_name), value)
+            for column_name, operator_name, value in filters
+        ]
+        return df.where(reduce(lambda left, right: left & right, conditions))
+
     # TODO: <Alex>Similar to Abe's note in PandasExecutionEngine: Any reason this shouldn't be a private method?</Alex>  # noqa: E501
     @staticmethod
     def guess_reader_method_from_path(path: str):
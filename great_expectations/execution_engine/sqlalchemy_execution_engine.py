@@ -9,6 +9,7 @@ import os
 import random
 import re
 import string
+import threading
 import traceback
 from collections.abc import Generator
 from contextlib import contextmanager
@@ -22,6 +23,7 @@ from typing import (
     List,
     MutableMapping,
     Optional,
+    Sequence,
     Tuple,
     Union,
     cast,
@@ -54,6 +56,13 @@ from great_expectations.execution_engine.partition_and_sample.sqlalchemy_data_pa
 from great_expectations.execution_engine.partition_and_sample.sqlalchemy_data_sampler import (
     SqlAlchemyDataSampler,
 )
+from great_expectations.execution_engine.persistent_metric_cache import fingerprint_batch_spec
+from great_expectations.execution_engine.sqlalchemy_schema_metadata_cache import (
+    SqlAlchemySchemaMetadataCache,  # noqa: TCH001
+)
+from great_expectations.execution_engine.sqlalchemy_scratch_table_manager import (
+    SqlAlchemyScratchTableManager,
+)
 from great_expectations.expectations.model_field_types import (
     CONDITION_PARSER_GREAT_EXPECTATIONS,
     CONDITION_PARSER_GREAT_EXPECTATIONS_DEPRECATED,
@@ -147,6 +156,10 @@ except ImportError:
 if TYPE_CHECKING:
     from sqlalchemy.engine import Engine as SaEngine  # noqa: TID251
 
+    from great_expectations.execution_engine.persistent_metric_cache import (
+        PersistentMetricCache,
+    )
+
 
 def _get_dialect_type_module(dialect):  # noqa: C901
     """Given a dialect, returns the dialect type, which is defines the engine/system that is used to communicates
@@ -211,6 +224,13 @@ _PERSISTED_CONNECTION_DIALECTS = (
     GXSqlDialect.BIGQUERY,
 )
 
+# Value set tables are temporary on dialects, whose every query runs on single persisted connection
+# (BigQuery is not among them, since its temporary tables are only usable within sessions).
+_TEMPORARY_VALUE_SET_TABLE_DIALECTS = (
+    GXSqlDialect.SQLITE,
+    GXSqlDialect.MSSQL,
+)
+
 
 def _dialect_requires_persisted_connection(
     connection_string: str | None = None,
@@ -278,6 +298,26 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         url (string): If neither the engines, the credentials, nor the connection_string have been provided, a \
             URL can be used to access the data. This will be overridden by all other configuration options if \
             any are provided.
+        metric_computation_max_workers (int): If greater than 1, independent metric queries are issued concurrently \
+            on thread pool of this size.  Dialects, which require single persisted connection (e.g., sqlite, mssql), \
+            always issue queries one at a time.
+        metric_computation_timeout (float): Optional number of seconds to wait for concurrent metric queries.
+        max_concurrent_connections (int): Optional upper bound on number of connections this ExecutionEngine holds \
+            open at the same time (useful when "metric_computation_max_workers" exceeds capacity of the pool).
+        metric_cache_max_entries (int): Optional maximum number of resolved metrics kept in metric cache.
+        metric_cache_max_bytes (int): Optional maximum estimated size (in bytes) of resolved metrics kept in metric cache \
+            (default is 512 MiB).
+        persistent_metric_cache (PersistentMetricCache or dict): Optional on-disk cache of resolved metrics, keyed by \
+            fingerprint of Batch (its BatchSpec and database URL); dictionary configures "SqlitePersistentMetricCache".
+        fuse_unexpected_rows_queries (bool): If True, bounded "unexpected_values" and "unexpected_index_list" samples \
+            of all column map metrics sharing compute Domain are fetched by single query (using window functions), \
+            instead of one query per metric.
+        value_set_semi_join_threshold (int): Value sets of membership metrics (e.g., "column_values.in_set"), which \
+            have more values than this (default is 10,000), are loaded into value set table and matched by "EXISTS" \
+            subquery, instead of being rendered into every query as literal "IN" list (see "get_value_set_table()").
+        schema_metadata_cache (SqlAlchemySchemaMetadataCache): Optional cache of column metadata of tables (shared by \
+            all execution engines of Datasource, which enables it), which serves "table.column_types" metric without \
+            reflection.
         kwargs (dict): These will be passed as optional parameters to the SQLAlchemy engine, **not** the ExecutionEngine
 
     For example:
@@ -297,12 +337,45 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         url: Optional[str] = None,
         batch_data_dict: Optional[dict] = None,
         create_temp_table: bool = True,
+        metric_computation_max_workers: int = 1,
+        metric_computation_timeout: Optional[float] = None,
+        max_concurrent_connections: Optional[int] = None,
+        metric_cache_max_entries: Optional[int] = None,
+        metric_cache_max_bytes: Optional[int] = None,
+        persistent_metric_cache: Optional[Union[PersistentMetricCache, dict]] = None,
+        fuse_unexpected_rows_queries: bool = False,
+        value_set_semi_join_threshold: Optional[int] = None,
+        schema_metadata_cache: Optional[SqlAlchemySchemaMetadataCache] = None,
         # kwargs will be passed as optional parameters to the SQLAlchemy engine, **not** the ExecutionEngine  # noqa: E501
         **kwargs,
     ) -> None:
-        super().__init__(name=name, batch_data_dict=batch_data_dict)
+        super().__init__(
+            name=name,
+            batch_data_dict=batch_data_dict,
+            metric_computation_max_workers=metric_computation_max_workers,
+            metric_computation_timeout=metric_computation_timeout,
+            metric_cache_max_entries=metric_cache_max_entries,
+            metric_cache_max_bytes=metric_cache_max_bytes,
+            persistent_metric_cache=persistent_metric_cache,
+            value_set_semi_join_threshold=value_set_semi_join_threshold,
+        )
         self._name = name
 
+        self._max_concurrent_connections = max_concurrent_connections
+        self._connection_semaphore: threading.BoundedSemaphore | None = (
+            threading.BoundedSemaphore(max_concurrent_connections)
+            if max_concurrent_connections
+            else None
+        )
+        # Guards creation of single persisted connection (may be requested by several threads).
+        self._connection_lock = threading.Lock()
+
+        self._fuse_unexpected_rows_queries = fuse_unexpected_rows_queries
+
+        self._scratch_table_manager = SqlAlchemyScratchTableManager()
+
+        self._schema_metadata_cache = schema_metadata_cache
+
         self._credentials = credentials
         self._connection_string = connection_string
         self._url = url
@@ -432,6 +505,11 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             "connection_string": connection_string,
             "url": url,
             "batch_data_dict": batch_data_dict,
+            **self._metric_computation_config,
+            **self._metric_cache_config,
+            "max_concurrent_connections": max_concurrent_connections,
+            "fuse_unexpected_rows_queries": fuse_unexpected_rows_queries,
+            "value_set_semi_join_threshold": value_set_semi_join_threshold,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -484,6 +562,72 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                 "Credentials or an engine are required for a SqlAlchemyExecutionEngine."
             )
 
+    @property
+    @override
+    def _supports_concurrent_metric_computation(self) -> bool:
+        # Single persisted connection (holding temp tables) cannot be shared by concurrent queries.
+        return self.dialect_name not in _PERSISTED_CONNECTION_DIALECTS
+
+    @override
+    def _compute_batch_fingerprint(self, batch_id: str) -> Optional[str]:
+        batch = self.batch_manager.batch_cache.get(batch_id)
+        if batch is None:
+            return None
+
+        # Same table in different databases is different data (URL representation masks password).
+        return fingerprint_batch_spec(batch_spec=batch.batch_spec, url=repr(self.engine.url))
+
+    @property
+    def scratch_table_manager(self) -> SqlAlchemyScratchTableManager:
+        return self._scratch_table_manager
+
+    @property
+    def schema_metadata_cache(self) -> Optional[SqlAlchemySchemaMetadataCache]:
+        return self._schema_metadata_cache
+
+    def get_value_set_table(
+        self,
+        rows: Sequence[Tuple[Any, ...]],
+        column_types: Sequence[sa.types.TypeEngine],
+    ) -> Optional[sa.Table]:
+        """Returns table of large value set of membership metrics, which is shared by all membership metrics matching
+        same values during validation (see "release_validation_resources()").
+
+        Value set table is temporary table on dialects, whose queries all run on single persisted connection
+        (see "get_connection()"); on other dialects, it is committed table (usable on pooled connections).
+
+        Args:
+            rows: Tuples of (hashable and non-NULL) values (one per column) of value set.
+            column_types: SQLAlchemy types of table columns.
+
+        Returns:
+            SQLAlchemy "Table" object of value set table (None, if it could not be loaded).
+        """  # noqa: E501
+        with self.get_connection() as connection:
+            return self._scratch_table_manager.get_value_set_table(
+                connection=connection,
+                rows=rows,
+                column_types=column_types,
+                temporary=self.dialect_name in _TEMPORARY_VALUE_SET_TABLE_DIALECTS,
+            )
+
+    @override
+    def release_validation_resources(self) -> None:
+        self._scratch_table_manager.drop_scratch_tables()
+        self._drop_value_set_tables()
+
+    def _drop_value_set_tables(self) -> None:
+        if self._scratch_table_manager.num_value_set_tables == 0:
+            return
+
+        with self.get_connection() as connection:
+            self._scratch_table_manager.drop_value_set_tables(connection=connection)
+
+    @override
+    def unload_batch_data(self, batch_id: str) -> None:
+        self._scratch_table_manager.drop_scratch_tables(batch_id=batch_id)
+        super().unload_batch_data(batch_id=batch_id)
+
     @property
     def credentials(self) -> Optional[dict]:
         return self._credentials
@@ -952,6 +1096,52 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
         return PartitionDomainKwargs(compute_domain_kwargs, accessor_domain_kwargs)
 
+    @override
+    def _process_direct_and_bundled_metric_computation_configurations(
+        self,
+        metric_fn_direct_configurations: List[MetricComputationConfiguration],
+        metric_fn_bundle_configurations: List[MetricComputationConfiguration],
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        if not self._fuse_unexpected_rows_queries:
+            return super()._process_direct_and_bundled_metric_computation_configurations(
+                metric_fn_direct_configurations=metric_fn_direct_configurations,
+                metric_fn_bundle_configurations=metric_fn_bundle_configurations,
+            )
+
+        from great_expectations.expectations.metrics.map_metric_provider.sqlalchemy_fused_map_condition_auxilliary_methods import (  # noqa: E501
+            _sqlalchemy_resolve_fused_unexpected_rows_samples,
+        )
+
+        fused_metrics: Dict[Tuple[str, str, str], MetricValue] = (
+            _sqlalchemy_resolve_fused_unexpected_rows_samples(
+                execution_engine=self,
+                metric_computation_configurations=metric_fn_direct_configurations,
+            )
+        )
+        fused_metric_fn_configurations: List[MetricComputationConfiguration] = []
+        unfused_metric_fn_configurations: List[MetricComputationConfiguration] = []
+
+        metric_computation_configuration: MetricComputationConfiguration
+        for metric_computation_configuration in metric_fn_direct_configurations:
+            if metric_computation_configuration.metric_configuration.id in fused_metrics:
+                fused_metric_fn_configurations.append(metric_computation_configuration)
+            else:
+                unfused_metric_fn_configurations.append(metric_computation_configuration)
+
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = (
+            super()._process_direct_and_bundled_metric_computation_configurations(
+                metric_fn_direct_configurations=unfused_metric_fn_configurations,
+                metric_fn_bundle_configurations=metric_fn_bundle_configurations,
+            )
+        )
+        self._cache_resolved_metrics(
+            resolved_metrics=fused_metrics,
+            metric_computation_configurations=fused_metric_fn_configurations,
+        )
+        resolved_metrics.update(fused_metrics)
+
+        return resolved_metrics
+
     @override
     def resolve_metric_bundle(  # noqa: C901 - too complex
         self,
@@ -1063,6 +1253,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
         return resolved_metrics
 
+    @override
     def close(self) -> None:
         """
         Note: Will 20210729
@@ -1081,6 +1272,9 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
         More background can be found here: https://github.com/great-expectations/great_expectations/pull/3104/
         """  # noqa: E501
+        super().close()
+        self._scratch_table_manager.drop_scratch_tables()
+        self._drop_value_set_tables()
         if self._engine_backup:
             if self._connection:
                 self._connection.close()
@@ -1304,12 +1498,17 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         if self.dialect_name in _PERSISTED_CONNECTION_DIALECTS:
             try:
                 if not self._connection:
-                    self._connection = self.engine.connect()
+                    with self._connection_lock:
+                        if not self._connection:
+                            self._connection = self.engine.connect()
                 yield self._connection
             finally:
                 # Temp tables only persist within a connection for some dialects,
                 # so we need to keep the connection alive.
                 pass
+        elif self._connection_semaphore is not None:
+            with self._connection_semaphore, self.engine.connect() as connection:
+                yield connection
         else:
             with self.engine.connect() as connection:
                 yield connection
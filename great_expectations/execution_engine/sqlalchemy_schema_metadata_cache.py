@@ -0,0 +1,339 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from great_expectations.compatibility import sqlalchemy
+from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
+from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
+
+if TYPE_CHECKING:
+    from great_expectations.execution_engine.sqlalchemy_execution_engine import (
+        SqlAlchemyExecutionEngine,
+    )
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SCHEMA_METADATA_CACHE_TTL_SECONDS: float = 300.0
+
+# Dialects, whose "information_schema.columns" lists columns of all tables of schema, with types
+# named as in "ischema_names" of SQLAlchemy dialect (other dialects require reflection of tables).
+INFORMATION_SCHEMA_COLUMNS_DIALECTS: Tuple[GXSqlDialect, ...] = (
+    GXSqlDialect.MSSQL,
+    GXSqlDialect.MYSQL,
+    GXSqlDialect.POSTGRESQL,
+    GXSqlDialect.REDSHIFT,
+    GXSqlDialect.SNOWFLAKE,
+)
+
+_INFORMATION_SCHEMA_COLUMNS_QUERY: str = """SELECT
+    table_name,
+    column_name,
+    data_type,
+    {full_data_type} AS full_data_type,
+    is_nullable,
+    column_default,
+    character_maximum_length,
+    numeric_precision,
+    numeric_scale
+FROM information_schema.columns
+WHERE table_schema = :schema_name
+ORDER BY table_name, ordinal_position"""
+
+# Columns of "information_schema.columns", which name types together with their attributes (e.g.,
+# MySQL "data_type" of "int unsigned" column is "int"); "data_type" does so on other dialects.
+_INFORMATION_SCHEMA_FULL_DATA_TYPE_COLUMNS: Mapping[GXSqlDialect, str] = {
+    GXSqlDialect.MYSQL: "column_type",
+}
+
+# Type attributes, which types of "ischema_names" do not carry (columns having them are reflected).
+_UNSUPPORTED_TYPE_ATTRIBUTES: Tuple[str, ...] = ("with time zone", "unsigned", "zerofill")
+
+ColumnMetadata = Dict[str, Any]
+
+
+@dataclass(frozen=True)
+class _CachedColumns:
+    # Keyed by table name (single entry for table of per-table reflection).
+    columns_by_table_name: Dict[str, List[ColumnMetadata]]
+    loaded_at: float
+
+
+class SqlAlchemySchemaMetadataCache:
+    """In-memory cache of column metadata of database tables (as returned by "Inspector.get_columns()"), which serves
+    "table.column_types" (and thus "table.columns") metrics of all Batches of Datasource without reflection round trips.
+
+    Columns of all tables of schema are loaded by single "information_schema.columns" query, where dialect supports it
+    (see "INFORMATION_SCHEMA_COLUMNS_DIALECTS"); tables, which are not found there (e.g., temporary tables, or tables of
+    types unknown to SQLAlchemy dialect), and tables of other dialects are reflected one by one, and are cached as well.
+    Changes of tables are not detected; cached metadata expires after "ttl_seconds" (and is evicted then), or is
+    discarded by "refresh()".  Columns of types, whose attributes (e.g., time zone, or "UNSIGNED") information schema
+    types do not carry, are reflected as well.
+
+    Args:
+        ttl_seconds: Number of seconds, after which cached metadata is reloaded (None, if it never expires).
+    """  # noqa: E501
+
+    def __init__(
+        self, ttl_seconds: Optional[float] = DEFAULT_SCHEMA_METADATA_CACHE_TTL_SECONDS
+    ) -> None:
+        if ttl_seconds is not None and ttl_seconds < 0:
+            raise ValueError(  # noqa: TRY003
+                f"ttl_seconds must not be negative; {ttl_seconds} was given."
+            )
+
+        self._ttl_seconds = ttl_seconds
+
+        # Keyed by URL of database and schema name (None for default schema).
+        self._schemas: Dict[Tuple[str, Optional[str]], _CachedColumns] = {}
+        # Keyed by URL of database, schema name, and table name.
+        self._tables: Dict[Tuple[str, Optional[str], str], _CachedColumns] = {}
+        # Held while loading schemas (so that concurrent requests do not load same schema
+        # repeatedly) and while accessing entries, but not while reflecting individual tables.
+        self._lock = threading.Lock()
+
+    @property
+    def ttl_seconds(self) -> Optional[float]:
+        return self._ttl_seconds
+
+    @property
+    def num_cached_tables(self) -> int:
+        return sum(
+            len(cached_columns.columns_by_table_name)
+            for cached_columns in [*self._schemas.values(), *self._tables.values()]
+        )
+
+    def get_columns(
+        self,
+        execution_engine: SqlAlchemyExecutionEngine,
+        table_name: str,
+        schema_name: Optional[str],
+        reflect: Callable[[], Optional[Sequence[Mapping[str, Any]]]],
+    ) -> Optional[List[ColumnMetadata]]:
+        """Returns column metadata of table, loading (or reflecting) it, if it is not cached (or has expired).
+
+        Args:
+            execution_engine: Execution engine, connected to database of table.
+            table_name: Name of table.
+            schema_name: Name of schema of table (None for default schema).
+            reflect: Callable, which reflects columns of this table (used, if bulk load does not cover table).
+
+        Returns:
+            List of column metadata dictionaries (copies of cached ones); None, if table could not be reflected.
+        """  # noqa: E501
+        url: str = repr(execution_engine.engine.url)
+        table_key: Tuple[str, Optional[str], str] = (url, schema_name, table_name)
+        with self._lock:
+            now: float = time.monotonic()
+            self._evict_expired_entries(now=now)
+
+            schema_columns: Optional[_CachedColumns] = self._schemas.get((url, schema_name))
+            if schema_columns is None:
+                # Schemas, which cannot be loaded in bulk, are not retried until entry expires.
+                schema_columns = self._load_schema_columns(
+                    execution_engine=execution_engine, schema_name=schema_name, now=now
+                ) or _CachedColumns(columns_by_table_name={}, loaded_at=now)
+                self._schemas[(url, schema_name)] = schema_columns
+
+            if table_name in schema_columns.columns_by_table_name:
+                return _copy_columns(schema_columns.columns_by_table_name[table_name])
+
+            table_columns: Optional[_CachedColumns] = self._tables.get(table_key)
+            if table_columns is not None:
+                return _copy_columns(table_columns.columns_by_table_name[table_name])
+
+        columns: Optional[Sequence[Mapping[str, Any]]] = reflect()
+        if columns is None:
+            return None
+
+        with self._lock:
+            self._tables[table_key] = _CachedColumns(
+                columns_by_table_name={table_name: _copy_columns(columns)}, loaded_at=now
+            )
+
+        return _copy_columns(columns)
+
+    def refresh(self, schema_name: Optional[str] = None) -> int:
+        """Discards cached metadata of tables of specified schema (or of all tables, if omitted).
+
+        Args:
+            schema_name: Optional name of schema, whose tables are to be reloaded on next request.
+
+        Returns:
+            Number of tables, whose metadata was discarded.
+        """
+        with self._lock:
+            num_tables: int = 0
+            cache: Dict[Any, _CachedColumns]
+            for cache in (self._schemas, self._tables):
+                keys: List[Any] = [
+                    key for key in cache if schema_name is None or key[1] == schema_name
+                ]
+                for key in keys:
+                    num_tables += len(cache.pop(key).columns_by_table_name)
+
+            return num_tables
+
+    def _evict_expired_entries(self, now: float) -> None:
+        if self._ttl_seconds is None:
+            return
+
+        cache: Dict[Any, _CachedColumns]
+        for cache in (self._schemas, self._tables):
+            expired_keys: List[Any] = [
+                key
+                for key, cached_columns in cache.items()
+                if now - cached_columns.loaded_at >= self._ttl_seconds
+            ]
+            for key in expired_keys:
+                del cache[key]
+
+    @staticmethod
+    def _load_schema_columns(
+        execution_engine: SqlAlchemyExecutionEngine, schema_name: Optional[str], now: float
+    ) -> Optional[_CachedColumns]:
+        if execution_engine.dialect_name not in INFORMATION_SCHEMA_COLUMNS_DIALECTS:
+            return None
+
+        dialect: sqlalchemy.Dialect = execution_engine.engine.dialect
+        query_schema_name: Optional[str] = (
+            schema_name or execution_engine.get_inspector().default_schema_name
+        )
+        if query_schema_name is None:
+            return None
+
+        if getattr(dialect, "requires_name_normalize", False):
+            # E.g., Snowflake stores unquoted (case-insensitive) names in upper case.
+            query_schema_name = dialect.denormalize_name(query_schema_name)
+
+        try:
+            with execution_engine.get_connection() as connection:
+                rows: Sequence[Any] = connection.execute(
+                    sa.text(
+                        _INFORMATION_SCHEMA_COLUMNS_QUERY.format(
+                            full_data_type=_INFORMATION_SCHEMA_FULL_DATA_TYPE_COLUMNS.get(
+                                execution_engine.dialect_name, "data_type"
+                            )
+                        )
+                    ),
+                    {"schema_name": query_schema_name},
+                ).fetchall()
+        except sqlalchemy.SQLAlchemyError as e:
+            logger.info(f"Unable to load columns of schema {query_schema_name}: {e!r}")
+            return None
+
+        columns_by_table_name: Dict[str, List[ColumnMetadata]] = {}
+        tables_of_unknown_types: set = set()
+        for (
+            table_name,
+            column_name,
+            data_type,
+            full_data_type,
+            is_nullable,
+            column_default,
+            character_maximum_length,
+            numeric_precision,
+            numeric_scale,
+        ) in rows:
+            table_name = _normalize_name(dialect=dialect, name=table_name)  # noqa: PLW2901
+            column_type: Optional[sa.types.TypeEngine] = _get_column_type(
+                dialect=dialect,
+                data_type=data_type,
+                full_data_type=full_data_type,
+                character_maximum_length=character_maximum_length,
+                numeric_precision=numeric_precision,
+                numeric_scale=numeric_scale,
+            )
+            if column_type is None:
+                tables_of_unknown_types.add(table_name)
+                continue
+
+            columns_by_table_name.setdefault(table_name, []).append(
+                {
+                    "name": _normalize_name(dialect=dialect, name=column_name),
+                    "type": column_type,
+                    "nullable": str(is_nullable).upper() == "YES",
+                    "default": column_default,
+                }
+            )
+
+        # Types (or type attributes) missing from "ischema_names" (e.g., arrays) require reflection.
+        for table_name in tables_of_unknown_types:
+            columns_by_table_name.pop(table_name, None)
+
+        return _CachedColumns(columns_by_table_name=columns_by_table_name, loaded_at=now)
+
+
+def _copy_columns(columns: Sequence[Mapping[str, Any]]) -> List[ColumnMetadata]:
+    return [dict(column) for column in columns]
+
+
+def _normalize_name(dialect: sqlalchemy.Dialect, name: str) -> str:
+    if getattr(dialect, "requires_name_normalize", False):
+        return dialect.normalize_name(name)
+
+    return name
+
+
+def _get_column_type(  # noqa: PLR0911, PLR0913
+    dialect: sqlalchemy.Dialect,
+    data_type: Optional[str],
+    full_data_type: Optional[str],
+    character_maximum_length: Optional[int],
+    numeric_precision: Optional[int],
+    numeric_scale: Optional[int],
+) -> Optional[sa.types.TypeEngine]:
+    if not data_type:
+        return None
+
+    if any(
+        type_attribute in str(full_data_type or data_type).lower()
+        for type_attribute in _UNSUPPORTED_TYPE_ATTRIBUTES
+    ):
+        return None
+
+    ischema_names: Mapping[str, Any] = getattr(dialect, "ischema_names", {})
+    type_class: Optional[Any] = (
+        ischema_names.get(data_type)
+        or ischema_names.get(data_type.lower())
+        or ischema_names.get(data_type.upper())
+    )
+    if type_class is None or issubclass(type_class, sa.Enum):
+        # Values of enumerations are not listed by "information_schema.columns".
+        return None
+
+    try:
+        if (
+            issubclass(type_class, sa.String)
+            and character_maximum_length is not None
+            # E.g., MSSQL reports "MAX" length as -1.
+            and int(character_maximum_length) > 0
+        ):
+            return type_class(length=int(character_maximum_length))
+
+        if (
+            issubclass(type_class, sa.Numeric)
+            and not issubclass(type_class, sa.Float)
+            and numeric_precision is not None
+        ):
+            return type_class(
+                precision=int(numeric_precision),
+                scale=None if numeric_scale is None else int(numeric_scale),
+            )
+
+        return type_class()
+    except TypeError:
+        return None
@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from great_expectations.compatibility import sqlalchemy
+from great_expectations.compatibility.not_imported import is_version_greater_or_equal
+from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
+from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
+from great_expectations.util import (
+    convert_to_json_serializable,  # noqa: TID251
+    generate_temporary_table_name,
+)
+
+if TYPE_CHECKING:
+    from great_expectations.compatibility.sqlalchemy import Connection
+
+logger = logging.getLogger(__name__)
+
+# MSSQL treats tables, whose names start with "#", as (connection-scoped) temporary tables.
+DEFAULT_SCRATCH_TABLE_NAME_PREFIX: str = "#ge_temp_"
+
+# Columns of value set tables are named "ge_value_0", "ge_value_1", etc. (unlikely to shadow names of Batch columns).  # noqa: E501
+VALUE_SET_TABLE_COLUMN_NAME_PREFIX: str = "ge_value_"
+
+# Number of rows of value set, which are inserted into value set table by single "executemany" call.
+VALUE_SET_TABLE_INSERT_CHUNK_SIZE: int = 10_000
+
+
+@dataclass
+class _ScratchTable:
+    table: sa.Table
+    connection: Connection
+    batch_id: Optional[str]
+
+
+class SqlAlchemyScratchTableManager:
+    """Creates, reuses, and drops single-column scratch tables of SqlAlchemyExecutionEngine.
+
+    Map metrics, whose queries cannot be expressed as single "SELECT" on some dialects, stage per-row conditions in
+    scratch table.  Rather than creating new table (after reflecting entire database schema) for every such metric, one
+    table is created (without reflection) per connection and Batch; it is emptied before every subsequent use, and all
+    tables are dropped once validation is finished (see "SqlAlchemyExecutionEngine.release_validation_resources()").
+
+    Large value sets of membership metrics (e.g., "column_values.in_set") are loaded into value set tables, which are
+    shared by all metrics matching same values (see "get_value_set_table()").  These are temporary tables, if requested
+    (i.e., if all queries run on single connection); otherwise, they are committed (so that they are usable on any
+    connection).  Either way, they are dropped once validation is finished as well, or as soon as loading them fails.
+
+    Args:
+        table_name_prefix: Prefix of generated scratch table names.
+    """  # noqa: E501
+
+    def __init__(self, table_name_prefix: str = DEFAULT_SCRATCH_TABLE_NAME_PREFIX) -> None:
+        self._table_name_prefix = table_name_prefix
+
+        # Only tables created by this manager are ever registered with this MetaData (it is never reflected).  # noqa: E501
+        self._metadata = sa.MetaData()
+
+        # Keyed by identity of connection (kept alive by "_ScratchTable" reference) and "batch_id".
+        self._scratch_tables: Dict[Tuple[int, Optional[str]], _ScratchTable] = {}
+        # Keyed by fingerprint of column types and rows (not specific to Batch, nor to connection).
+        self._value_set_tables: Dict[str, sa.Table] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def num_scratch_tables(self) -> int:
+        return len(self._scratch_tables)
+
+    @property
+    def num_value_set_tables(self) -> int:
+        return len(self._value_set_tables)
+
+    def get_scratch_table(self, connection: Connection, batch_id: Optional[str] = None) -> sa.Table:
+        """Returns empty scratch table (with single integer "condition" column) usable on "connection".
+
+        Args:
+            connection: Connection, on which scratch table is to be used (temporary tables are connection-scoped).
+            batch_id: Identifier of Batch, whose records will be staged in scratch table.
+
+        Returns:
+            SQLAlchemy "Table" object of existing (emptied) or newly created scratch table.
+        """  # noqa: E501
+        with self._lock:
+            self._forget_closed_connections()
+
+            key: Tuple[int, Optional[str]] = (id(connection), batch_id)
+            scratch_table: Optional[_ScratchTable] = self._scratch_tables.get(key)
+            if scratch_table is not None:
+                connection.execute(scratch_table.table.delete())
+                return scratch_table.table
+
+            table = sa.Table(
+                generate_temporary_table_name(default_table_name_prefix=self._table_name_prefix),
+                self._metadata,
+                sa.Column("condition", sa.Integer, primary_key=False, nullable=False),
+            )
+            # Generated name is unique, so neither existence check nor reflection is necessary.
+            table.create(bind=connection, checkfirst=False)
+            self._scratch_tables[key] = _ScratchTable(
+                table=table, connection=connection, batch_id=batch_id
+            )
+            return table
+
+    def get_value_set_table(
+        self,
+        connection: Connection,
+        rows: Sequence[Tuple[Any, ...]],
+        column_types: Sequence[sa.types.TypeEngine],
+        temporary: bool = False,
+    ) -> Optional[sa.Table]:
+        """Returns table of value set (with columns "ge_value_0", "ge_value_1", etc.), loading it on first request.
+
+        Args:
+            connection: Connection, on which value set table is to be used (temporary tables are connection-scoped).
+            rows: Tuples of (hashable and non-NULL) values (one per column) of value set; duplicates are discarded.
+            column_types: SQLAlchemy types of table columns (values are converted by database on insert).
+            temporary: If True, table is created as temporary table (only usable on "connection"); otherwise, it is
+                committed, so that it is usable on any connection to same database.
+
+        Returns:
+            SQLAlchemy "Table" object of value set table (None, if table could not be created or loaded, in which case
+            caller is expected to fall back to literal value list).
+        """  # noqa: E501
+        try:
+            rows = list(dict.fromkeys(rows))
+        except TypeError:
+            logger.warning("Unable to load value set of unhashable values into table.")
+            return None
+
+        fingerprint: str = hashlib.md5(
+            json.dumps(
+                convert_to_json_serializable(
+                    data={
+                        "column_types": [repr(column_type) for column_type in column_types],
+                        "rows": [list(row) for row in rows],
+                    }
+                )
+            ).encode("utf-8")
+        ).hexdigest()
+
+        with self._lock:
+            self._forget_closed_connections()
+
+            value_set_table: Optional[sa.Table] = self._value_set_tables.get(fingerprint)
+            if value_set_table is not None:
+                return value_set_table
+
+            table = sa.Table(
+                generate_temporary_table_name(
+                    default_table_name_prefix=f"{self._table_name_prefix}value_set_"
+                ),
+                self._metadata,
+                *[
+                    # Primary key indexes values, so that every lookup of semi-join is by index.
+                    sa.Column(
+                        f"{VALUE_SET_TABLE_COLUMN_NAME_PREFIX}{idx}", column_type, primary_key=True
+                    )
+                    for idx, column_type in enumerate(column_types)
+                ],
+                # MSSQL treats "#" names as temporary tables (and rejects "TEMPORARY" keyword).
+                prefixes=(
+                    ["TEMPORARY"]
+                    if temporary and connection.dialect.name != GXSqlDialect.MSSQL
+                    else []
+                ),
+            )
+            try:
+                _execute_in_transaction(
+                    connection=connection,
+                    statements=lambda: self._create_and_load_value_set_table(
+                        connection=connection, table=table, rows=rows
+                    ),
+                )
+            except sqlalchemy.SQLAlchemyError as e:
+                logger.warning(f"Unable to load value set into table {table.name}: {e!s}")
+                # DDL is not transactional on some dialects (e.g., MySQL), so table may outlive rollback.  # noqa: E501
+                self._drop_value_set_table(connection=connection, table=table, checkfirst=True)
+                return None
+
+            self._value_set_tables[fingerprint] = table
+            return table
+
+    def drop_scratch_tables(self, batch_id: Optional[str] = None) -> int:
+        """Drops scratch tables of specified Batch (or all scratch tables, if omitted).
+
+        Args:
+            batch_id: Optional identifier of Batch, whose scratch tables are to be dropped.
+
+        Returns:
+            Number of dropped scratch tables.
+        """
+        with self._lock:
+            keys: List[Tuple[int, Optional[str]]] = [
+                key
+                for key, scratch_table in self._scratch_tables.items()
+                if batch_id is None or scratch_table.batch_id == batch_id
+            ]
+
+            num_dropped: int = 0
+            key: Tuple[int, Optional[str]]
+            for key in keys:
+                scratch_table: _ScratchTable = self._scratch_tables.pop(key)
+                self._metadata.remove(scratch_table.table)
+                if scratch_table.connection.closed:
+                    # Temporary tables are discarded together with their connection.
+                    continue
+
+                try:
+                    scratch_table.table.drop(bind=scratch_table.connection, checkfirst=False)
+                    num_dropped += 1
+                except sqlalchemy.SQLAlchemyError as e:
+                    logger.warning(
+                        f"Unable to drop scratch table {scratch_table.table.name}: {e!s}"
+                    )
+
+            return num_dropped
+
+    def drop_value_set_tables(self, connection: Connection) -> int:
+        """Drops all value set tables.
+
+        Args:
+            connection: Connection, on which value set tables are to be dropped (committed value set tables can be
+                dropped on any connection to same database, but temporary ones only on connection they were created on).
+
+        Returns:
+            Number of dropped value set tables.
+        """  # noqa: E501
+        with self._lock:
+            num_dropped: int = sum(
+                self._drop_value_set_table(connection=connection, table=table, checkfirst=False)
+                for table in self._value_set_tables.values()
+            )
+            self._value_set_tables.clear()
+            return num_dropped
+
+    def _drop_value_set_table(
+        self, connection: Connection, table: sa.Table, checkfirst: bool
+    ) -> bool:
+        self._metadata.remove(table)
+        if connection.closed:
+            # Temporary tables are discarded together with their connection.
+            return False
+
+        try:
+            _execute_in_transaction(
+                connection=connection,
+                statements=lambda: table.drop(bind=connection, checkfirst=checkfirst),
+            )
+        except sqlalchemy.SQLAlchemyError as e:
+            logger.warning(f"Unable to drop value set table {table.name}: {e!s}")
+            return False
+
+        return True
+
+    @staticmethod
+    def _create_and_load_value_set_table(
+        connection: Connection, table: sa.Table, rows: Sequence[Tuple[Any, ...]]
+    ) -> None:
+        # Generated name is unique, so neither existence check nor reflection is necessary.
+        table.create(bind=connection, checkfirst=False)
+        start: int
+        for start in range(0, len(rows), VALUE_SET_TABLE_INSERT_CHUNK_SIZE):
+            connection.execute(
+                table.insert(),
+                [
+                    {column.name: value for column, value in zip(table.columns, row)}
+                    for row in rows[start : start + VALUE_SET_TABLE_INSERT_CHUNK_SIZE]
+                ],
+            )
+
+    def _forget_closed_connections(self) -> None:
+        key: Tuple[int, Optional[str]]
+        scratch_table: _ScratchTable
+        for key, scratch_table in list(self._scratch_tables.items()):
+            if scratch_table.connection.closed:
+                self._metadata.remove(scratch_table.table)
+                del self._scratch_tables[key]
+
+
+def _execute_in_transaction(connection: Connection, statements: Callable[[], None]) -> None:
+    # Value set tables are committed, so that they are visible to other (e.g., pooled) connections.
+    if is_version_greater_or_equal(sqlalchemy.sqlalchemy.__version__, "2.0.0"):
+        try:
+            statements()
+        except sqlalchemy.SQLAlchemyError:
+            connection.rollback()
+            raise
+        connection.commit()
+    else:
+        with connection.begin():
+            statements()
@@ -1,59 +1,71 @@
+from typing import TYPE_CHECKING
+
 from great_expectations.expectations.expectation import Expectation
+from great_expectations.expectations.registry import get_lazy_export, list_lazy_exports
+
+if TYPE_CHECKING:
+    from .core import (
+        ExpectColumnDistinctValuesToBeInSet,
+        ExpectColumnDistinctValuesToContainSet,
+        ExpectColumnDistinctValuesToEqualSet,
+        ExpectColumnKLDivergenceToBeLessThan,
+        ExpectColumnMaxToBeBetween,
+        ExpectColumnMeanToBeBetween,
+        ExpectColumnMedianToBeBetween,
+        ExpectColumnMinToBeBetween,
+        ExpectColumnMostCommonValueToBeInSet,
+        ExpectColumnPairValuesAToBeGreaterThanB,
+        ExpectColumnPairValuesToBeEqual,
+        ExpectColumnPairValuesToBeInSet,
+        ExpectColumnProportionOfUniqueValuesToBeBetween,
+        ExpectColumnQuantileValuesToBeBetween,
+        ExpectColumnStdevToBeBetween,
+        ExpectColumnSumToBeBetween,
+        ExpectColumnToExist,
+        ExpectColumnUniqueValueCountToBeBetween,
+        ExpectColumnValueLengthsToBeBetween,
+        ExpectColumnValueLengthsToEqual,
+        ExpectColumnValuesToBeBetween,
+        ExpectColumnValuesToBeDateutilParseable,
+        ExpectColumnValuesToBeDecreasing,
+        ExpectColumnValuesToBeIncreasing,
+        ExpectColumnValuesToBeInSet,
+        ExpectColumnValuesToBeInTypeList,
+        ExpectColumnValuesToBeJsonParseable,
+        ExpectColumnValuesToBeNull,
+        ExpectColumnValuesToBeOfType,
+        ExpectColumnValuesToBeUnique,
+        ExpectColumnValuesToMatchJsonSchema,
+        ExpectColumnValuesToMatchLikePattern,
+        ExpectColumnValuesToMatchLikePatternList,
+        ExpectColumnValuesToMatchRegex,
+        ExpectColumnValuesToMatchRegexList,
+        ExpectColumnValuesToMatchStrftimeFormat,
+        ExpectColumnValuesToNotBeInSet,
+        ExpectColumnValuesToNotBeNull,
+        ExpectColumnValuesToNotMatchLikePattern,
+        ExpectColumnValuesToNotMatchLikePatternList,
+        ExpectColumnValuesToNotMatchRegex,
+        ExpectColumnValuesToNotMatchRegexList,
+        ExpectColumnValueZScoresToBeLessThan,
+        ExpectCompoundColumnsToBeUnique,
+        ExpectMulticolumnSumToEqual,
+        ExpectMulticolumnValuesToBeUnique,
+        ExpectSelectColumnValuesToBeUniqueWithinRecord,
+        ExpectTableColumnCountToBeBetween,
+        ExpectTableColumnCountToEqual,
+        ExpectTableColumnsToMatchOrderedList,
+        ExpectTableColumnsToMatchSet,
+        ExpectTableRowCountToBeBetween,
+        ExpectTableRowCountToEqual,
+        ExpectTableRowCountToEqualOtherTable,
+        UnexpectedRowsExpectation,
+    )
+
+
+def __getattr__(name: str):
+    return get_lazy_export(package_name=__name__, name=name)
+
 
-from .core import (
-    ExpectColumnDistinctValuesToBeInSet,
-    ExpectColumnDistinctValuesToContainSet,
-    ExpectColumnDistinctValuesToEqualSet,
-    ExpectColumnKLDivergenceToBeLessThan,
-    ExpectColumnMaxToBeBetween,
-    ExpectColumnMeanToBeBetween,
-    ExpectColumnMedianToBeBetween,
-    ExpectColumnMinToBeBetween,
-    ExpectColumnMostCommonValueToBeInSet,
-    ExpectColumnPairValuesAToBeGreaterThanB,
-    ExpectColumnPairValuesToBeEqual,
-    ExpectColumnPairValuesToBeInSet,
-    ExpectColumnProportionOfUniqueValuesToBeBetween,
-    ExpectColumnQuantileValuesToBeBetween,
-    ExpectColumnStdevToBeBetween,
-    ExpectColumnSumToBeBetween,
-    ExpectColumnToExist,
-    ExpectColumnUniqueValueCountToBeBetween,
-    ExpectColumnValueLengthsToBeBetween,
-    ExpectColumnValueLengthsToEqual,
-    ExpectColumnValuesToBeBetween,
-    ExpectColumnValuesToBeDateutilParseable,
-    ExpectColumnValuesToBeDecreasing,
-    ExpectColumnValuesToBeIncreasing,
-    ExpectColumnValuesToBeInSet,
-    ExpectColumnValuesToBeInTypeList,
-    ExpectColumnValuesToBeJsonParseable,
-    ExpectColumnValuesToBeNull,
-    ExpectColumnValuesToBeOfType,
-    ExpectColumnValuesToBeUnique,
-    ExpectColumnValuesToMatchJsonSchema,
-    ExpectColumnValuesToMatchLikePattern,
-    ExpectColumnValuesToMatchLikePatternList,
-    ExpectColumnValuesToMatchRegex,
-    ExpectColumnValuesToMatchRegexList,
-    ExpectColumnValuesToMatchStrftimeFormat,
-    ExpectColumnValuesToNotBeInSet,
-    ExpectColumnValuesToNotBeNull,
-    ExpectColumnValuesToNotMatchLikePattern,
-    ExpectColumnValuesToNotMatchLikePatternList,
-    ExpectColumnValuesToNotMatchRegex,
-    ExpectColumnValuesToNotMatchRegexList,
-    ExpectColumnValueZScoresToBeLessThan,
-    ExpectCompoundColumnsToBeUnique,
-    ExpectMulticolumnSumToEqual,
-    ExpectMulticolumnValuesToBeUnique,
-    ExpectSelectColumnValuesToBeUniqueWithinRecord,
-    ExpectTableColumnCountToBeBetween,
-    ExpectTableColumnCountToEqual,
-    ExpectTableColumnsToMatchOrderedList,
-    ExpectTableColumnsToMatchSet,
-    ExpectTableRowCountToBeBetween,
-    ExpectTableRowCountToEqual,
-    ExpectTableRowCountToEqualOtherTable,
-    UnexpectedRowsExpectation,
-)
+def __dir__():
+    return sorted({*globals(), *list_lazy_exports(__name__)})
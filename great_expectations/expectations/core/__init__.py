@@ -1,101 +1,114 @@
-from .expect_column_distinct_values_to_be_in_set import (
-    ExpectColumnDistinctValuesToBeInSet,
-)
-from .expect_column_distinct_values_to_contain_set import (
-    ExpectColumnDistinctValuesToContainSet,
-)
-from .expect_column_distinct_values_to_equal_set import (
-    ExpectColumnDistinctValuesToEqualSet,
-)
-from .expect_column_kl_divergence_to_be_less_than import (
-    ExpectColumnKLDivergenceToBeLessThan,
-)
-from .expect_column_max_to_be_between import ExpectColumnMaxToBeBetween
-from .expect_column_mean_to_be_between import ExpectColumnMeanToBeBetween
-from .expect_column_median_to_be_between import ExpectColumnMedianToBeBetween
-from .expect_column_min_to_be_between import ExpectColumnMinToBeBetween
-from .expect_column_most_common_value_to_be_in_set import (
-    ExpectColumnMostCommonValueToBeInSet,
-)
-from .expect_column_pair_values_a_to_be_greater_than_b import (
-    ExpectColumnPairValuesAToBeGreaterThanB,
-)
-from .expect_column_pair_values_to_be_equal import ExpectColumnPairValuesToBeEqual
-from .expect_column_pair_values_to_be_in_set import ExpectColumnPairValuesToBeInSet
-from .expect_column_proportion_of_unique_values_to_be_between import (
-    ExpectColumnProportionOfUniqueValuesToBeBetween,
-)
-from .expect_column_quantile_values_to_be_between import (
-    ExpectColumnQuantileValuesToBeBetween,
-)
-from .expect_column_stdev_to_be_between import ExpectColumnStdevToBeBetween
-from .expect_column_sum_to_be_between import ExpectColumnSumToBeBetween
-from .expect_column_to_exist import ExpectColumnToExist
-from .expect_column_unique_value_count_to_be_between import (
-    ExpectColumnUniqueValueCountToBeBetween,
-)
-from .expect_column_value_lengths_to_be_between import (
-    ExpectColumnValueLengthsToBeBetween,
-)
-from .expect_column_value_lengths_to_equal import ExpectColumnValueLengthsToEqual
-from .expect_column_value_z_scores_to_be_less_than import (
-    ExpectColumnValueZScoresToBeLessThan,
-)
-from .expect_column_values_to_be_between import ExpectColumnValuesToBeBetween
-from .expect_column_values_to_be_dateutil_parseable import (
-    ExpectColumnValuesToBeDateutilParseable,
-)
-from .expect_column_values_to_be_decreasing import ExpectColumnValuesToBeDecreasing
-from .expect_column_values_to_be_in_set import ExpectColumnValuesToBeInSet
-from .expect_column_values_to_be_in_type_list import ExpectColumnValuesToBeInTypeList
-from .expect_column_values_to_be_increasing import ExpectColumnValuesToBeIncreasing
-from .expect_column_values_to_be_json_parseable import (
-    ExpectColumnValuesToBeJsonParseable,
-)
-from .expect_column_values_to_be_null import ExpectColumnValuesToBeNull
-from .expect_column_values_to_be_of_type import ExpectColumnValuesToBeOfType
-from .expect_column_values_to_be_unique import ExpectColumnValuesToBeUnique
-from .expect_column_values_to_match_json_schema import (
-    ExpectColumnValuesToMatchJsonSchema,
-)
-from .expect_column_values_to_match_like_pattern import (
-    ExpectColumnValuesToMatchLikePattern,
-)
-from .expect_column_values_to_match_like_pattern_list import (
-    ExpectColumnValuesToMatchLikePatternList,
-)
-from .expect_column_values_to_match_regex import ExpectColumnValuesToMatchRegex
-from .expect_column_values_to_match_regex_list import ExpectColumnValuesToMatchRegexList
-from .expect_column_values_to_match_strftime_format import (
-    ExpectColumnValuesToMatchStrftimeFormat,
-)
-from .expect_column_values_to_not_be_in_set import ExpectColumnValuesToNotBeInSet
-from .expect_column_values_to_not_be_null import ExpectColumnValuesToNotBeNull
-from .expect_column_values_to_not_match_like_pattern import (
-    ExpectColumnValuesToNotMatchLikePattern,
-)
-from .expect_column_values_to_not_match_like_pattern_list import (
-    ExpectColumnValuesToNotMatchLikePatternList,
-)
-from .expect_column_values_to_not_match_regex import ExpectColumnValuesToNotMatchRegex
-from .expect_column_values_to_not_match_regex_list import (
-    ExpectColumnValuesToNotMatchRegexList,
-)
-from .expect_compound_columns_to_be_unique import ExpectCompoundColumnsToBeUnique
-from .expect_multicolumn_sum_to_equal import ExpectMulticolumnSumToEqual
-from .expect_multicolumn_values_to_be_unique import ExpectMulticolumnValuesToBeUnique
-from .expect_select_column_values_to_be_unique_within_record import (
-    ExpectSelectColumnValuesToBeUniqueWithinRecord,
-)
-from .expect_table_column_count_to_be_between import ExpectTableColumnCountToBeBetween
-from .expect_table_column_count_to_equal import ExpectTableColumnCountToEqual
-from .expect_table_columns_to_match_ordered_list import (
-    ExpectTableColumnsToMatchOrderedList,
-)
-from .expect_table_columns_to_match_set import ExpectTableColumnsToMatchSet
-from .expect_table_row_count_to_be_between import ExpectTableRowCountToBeBetween
-from .expect_table_row_count_to_equal import ExpectTableRowCountToEqual
-from .expect_table_row_count_to_equal_other_table import (
-    ExpectTableRowCountToEqualOtherTable,
-)
-from .unexpected_rows_expectation import UnexpectedRowsExpectation
+from typing import TYPE_CHECKING
+
+from great_expectations.expectations.registry import get_lazy_export, list_lazy_exports
+
+if TYPE_CHECKING:
+    from .expect_column_distinct_values_to_be_in_set import (
+        ExpectColumnDistinctValuesToBeInSet,
+    )
+    from .expect_column_distinct_values_to_contain_set import (
+        ExpectColumnDistinctValuesToContainSet,
+    )
+    from .expect_column_distinct_values_to_equal_set import (
+        ExpectColumnDistinctValuesToEqualSet,
+    )
+    from .expect_column_kl_divergence_to_be_less_than import (
+        ExpectColumnKLDivergenceToBeLessThan,
+    )
+    from .expect_column_max_to_be_between import ExpectColumnMaxToBeBetween
+    from .expect_column_mean_to_be_between import ExpectColumnMeanToBeBetween
+    from .expect_column_median_to_be_between import ExpectColumnMedianToBeBetween
+    from .expect_column_min_to_be_between import ExpectColumnMinToBeBetween
+    from .expect_column_most_common_value_to_be_in_set import (
+        ExpectColumnMostCommonValueToBeInSet,
+    )
+    from .expect_column_pair_values_a_to_be_greater_than_b import (
+        ExpectColumnPairValuesAToBeGreaterThanB,
+    )
+    from .expect_column_pair_values_to_be_equal import ExpectColumnPairValuesToBeEqual
+    from .expect_column_pair_values_to_be_in_set import ExpectColumnPairValuesToBeInSet
+    from .expect_column_proportion_of_unique_values_to_be_between import (
+        ExpectColumnProportionOfUniqueValuesToBeBetween,
+    )
+    from .expect_column_quantile_values_to_be_between import (
+        ExpectColumnQuantileValuesToBeBetween,
+    )
+    from .expect_column_stdev_to_be_between import ExpectColumnStdevToBeBetween
+    from .expect_column_sum_to_be_between import ExpectColumnSumToBeBetween
+    from .expect_column_to_exist import ExpectColumnToExist
+    from .expect_column_unique_value_count_to_be_between import (
+        ExpectColumnUniqueValueCountToBeBetween,
+    )
+    from .expect_column_value_lengths_to_be_between import (
+        ExpectColumnValueLengthsToBeBetween,
+    )
+    from .expect_column_value_lengths_to_equal import ExpectColumnValueLengthsToEqual
+    from .expect_column_value_z_scores_to_be_less_than import (
+        ExpectColumnValueZScoresToBeLessThan,
+    )
+    from .expect_column_values_to_be_between import ExpectColumnValuesToBeBetween
+    from .expect_column_values_to_be_dateutil_parseable import (
+        ExpectColumnValuesToBeDateutilParseable,
+    )
+    from .expect_column_values_to_be_decreasing import ExpectColumnValuesToBeDecreasing
+    from .expect_column_values_to_be_in_set import ExpectColumnValuesToBeInSet
+    from .expect_column_values_to_be_in_type_list import ExpectColumnValuesToBeInTypeList
+    from .expect_column_values_to_be_increasing import ExpectColumnValuesToBeIncreasing
+    from .expect_column_values_to_be_json_parseable import (
+        ExpectColumnValuesToBeJsonParseable,
+    )
+    from .expect_column_values_to_be_null import ExpectColumnValuesToBeNull
+    from .expect_column_values_to_be_of_type import ExpectColumnValuesToBeOfType
+    from .expect_column_values_to_be_unique import ExpectColumnValuesToBeUnique
+    from .expect_column_values_to_match_json_schema import (
+        ExpectColumnValuesToMatchJsonSchema,
+    )
+    from .expect_column_values_to_match_like_pattern import (
+        ExpectColumnValuesToMatchLikePattern,
+    )
+    from .expect_column_values_to_match_like_pattern_list import (
+        ExpectColumnValuesToMatchLikePatternList,
+    )
+    from .expect_column_values_to_match_regex import ExpectColumnValuesToMatchRegex
+    from .expect_column_values_to_match_regex_list import ExpectColumnValuesToMatchRegexList
+    from .expect_column_values_to_match_strftime_format import (
+        ExpectColumnValuesToMatchStrftimeFormat,
+    )
+    from .expect_column_values_to_not_be_in_set import ExpectColumnValuesToNotBeInSet
+    from .expect_column_values_to_not_be_null import ExpectColumnValuesToNotBeNull
+    from .expect_column_values_to_not_match_like_pattern import (
+        ExpectColumnValuesToNotMatchLikePattern,
+    )
+    from .expect_column_values_to_not_match_like_pattern_list import (
+        ExpectColumnValuesToNotMatchLikePatternList,
+    )
+    from .expect_column_values_to_not_match_regex import ExpectColumnValuesToNotMatchRegex
+    from .expect_column_values_to_not_match_regex_list import (
+        ExpectColumnValuesToNotMatchRegexList,
+    )
+    from .expect_compound_columns_to_be_unique import ExpectCompoundColumnsToBeUnique
+    from .expect_multicolumn_sum_to_equal import ExpectMulticolumnSumToEqual
+    from .expect_multicolumn_values_to_be_unique import ExpectMulticolumnValuesToBeUnique
+    from .expect_select_column_values_to_be_unique_within_record import (
+        ExpectSelectColumnValuesToBeUniqueWithinRecord,
+    )
+    from .expect_table_column_count_to_be_between import ExpectTableColumnCountToBeBetween
+    from .expect_table_column_count_to_equal import ExpectTableColumnCountToEqual
+    from .expect_table_columns_to_match_ordered_list import (
+        ExpectTableColumnsToMatchOrderedList,
+    )
+    from .expect_table_columns_to_match_set import ExpectTableColumnsToMatchSet
+    from .expect_table_row_count_to_be_between import ExpectTableRowCountToBeBetween
+    from .expect_table_row_count_to_equal import ExpectTableRowCountToEqual
+    from .expect_table_row_count_to_equal_other_table import (
+        ExpectTableRowCountToEqualOtherTable,
+    )
+    from .unexpected_rows_expectation import UnexpectedRowsExpectation
+
+
+def __getattr__(name: str):
+    return get_lazy_export(package_name=__name__, name=name)
+
+
+def __dir__():
+    return sorted({*globals(), *list_lazy_exports(__name__)})
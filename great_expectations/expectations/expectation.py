@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import datetime
 import functools
+import itertools
 import logging
 import re
 import warnings
@@ -16,6 +17,7 @@ from typing import (
     Callable,
     ClassVar,
     Dict,
+    Iterator,
     List,
     Literal,
     Optional,
@@ -119,6 +121,9 @@ logger = logging.getLogger(__name__)
 P = ParamSpec("P")
 T = TypeVar("T", List[RenderedStringTemplateContent], RenderedAtomicContent)
 
+# Increasing ids of in-place edits of Expectations (see "Expectation._last_configuration_edit").
+_CONFIGURATION_EDIT_IDS: Iterator[int] = itertools.count(1)
+
 
 def render_suite_parameter_string(render_func: Callable[P, T]) -> Callable[P, T]:  # noqa: C901
     """Decorator for Expectation classes that renders suite parameters as strings.
@@ -347,6 +352,15 @@ class Expectation(pydantic.BaseModel, metaclass=MetaExpectation):
     _save_callback: Union[Callable[[Expectation], Expectation], None] = pydantic.PrivateAttr(
         default=None
     )
+    # Id of latest in-place edit (or save) of any Expectation; ExpectationSuite indexes its
+    # Expectations by configuration, and only looks for edited ones when this has changed.
+    _last_configuration_edit: ClassVar[int] = 0
+
+    @override
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in self.__fields__ and name not in ("id", "rendered_content"):
+            Expectation._last_configuration_edit = next(_CONFIGURATION_EDIT_IDS)
 
     def __lt__(self, other: object) -> bool:
         # Enables sorting of Expectations
@@ -407,6 +421,8 @@ class Expectation(pydantic.BaseModel, metaclass=MetaExpectation):
         if self._include_rendered_content:
             self.render()
 
+        # Nested values (e.g., of "meta") may have been edited in place, too.
+        Expectation._last_configuration_edit = next(_CONFIGURATION_EDIT_IDS)
         updated_self = self._save_callback(self)
         self.id = updated_self.id
 
@@ -1,3 +1,7 @@
+from typing import TYPE_CHECKING
+
+from great_expectations.expectations.registry import get_lazy_export, list_lazy_exports
+
 from .meta_metric_provider import (  # isort:skip
     MetaMetricProvider,
     DeprecatedMetaMetricProvider,
@@ -8,15 +12,25 @@ from .column_aggregate_metric_provider import (
     column_aggregate_partial,
     column_aggregate_value,
 )
-from .column_aggregate_metrics import *
-from .column_map_metrics import *
-from .column_pair_map_metrics import *
 from .map_metric_provider import (
     ColumnMapMetricProvider,
     MapMetricProvider,
     column_condition_partial,
     column_function_partial,
 )
-from .multicolumn_map_metrics import *
-from .query_metrics import *
-from .table_metrics import *
+
+if TYPE_CHECKING:
+    from .column_aggregate_metrics import *
+    from .column_map_metrics import *
+    from .column_pair_map_metrics import *
+    from .multicolumn_map_metrics import *
+    from .query_metrics import *
+    from .table_metrics import *
+
+
+def __getattr__(name: str):
+    return get_lazy_export(package_name=__name__, name=name)
+
+
+def __dir__():
+    return sorted({*globals(), *list_lazy_exports(__name__)})
@@ -1,23 +1,41 @@
-from .column_distinct_values import (
-    ColumnDistinctValues,
-    ColumnDistinctValuesCount,
-    ColumnDistinctValuesCountUnderThreshold,
-)
-from .column_histogram import ColumnHistogram
-from .column_max import ColumnMax
-from .column_mean import ColumnMean
-from .column_median import ColumnMedian
-from .column_min import ColumnMin
-from .column_most_common_value import ColumnMostCommonValue
-from .column_parameterized_distribution_ks_test_p_value import (
-    ColumnParameterizedDistributionKSTestPValue,
-)
-from .column_partition import ColumnPartition
-from .column_proportion_of_unique_values import ColumnUniqueProportion
-from .column_quantile_values import ColumnQuantileValues
-from .column_standard_deviation import ColumnStandardDeviation
-from .column_sum import ColumnSum
-from .column_value_counts import ColumnValueCounts
-from .column_values_between_count import ColumnValuesBetweenCount
-from .column_values_length_max import ColumnValuesLengthMax
-from .column_values_length_min import ColumnValuesLengthMin
+from typing import TYPE_CHECKING
+
+from great_expectations.expectations.registry import get_lazy_export, list_lazy_exports
+
+if TYPE_CHECKING:
+    from .column_distinct_values import (
+        ColumnApproxDistinctValuesCount,
+        ColumnDistinctValues,
+        ColumnDistinctValuesCount,
+        ColumnDistinctValuesCountUnderThreshold,
+    )
+    from .column_histogram import ColumnHistogram
+    from .column_max import ColumnMax
+    from .column_mean import ColumnMean
+    from .column_median import ColumnMedian
+    from .column_min import ColumnMin
+    from .column_most_common_value import ColumnMostCommonValue
+    from .column_parameterized_distribution_ks_test_p_value import (
+        ColumnParameterizedDistributionKSTestPValue,
+    )
+    from .column_partition import ColumnPartition
+    from .column_proportion_of_unique_values import (
+        ColumnApproxUniqueProportion,
+        ColumnUniqueProportion,
+    )
+    from .column_quantile_sketch import ColumnQuantileSketch
+    from .column_quantile_values import ColumnQuantileValues
+    from .column_standard_deviation import ColumnStandardDeviation
+    from .column_sum import ColumnSum
+    from .column_value_counts import ColumnTopValueCounts, ColumnValueCounts
+    from .column_values_between_count import ColumnValuesBetweenCount
+    from .column_values_length_max import ColumnValuesLengthMax
+    from .column_values_length_min import ColumnValuesLengthMin
+
+
+def __getattr__(name: str):
+    return get_lazy_export(package_name=__name__, name=name)
+
+
+def __dir__():
+    return sorted({*globals(), *list_lazy_exports(__name__)})
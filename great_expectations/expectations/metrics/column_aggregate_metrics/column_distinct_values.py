@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Set
 
 from great_expectations.compatibility.pyspark import (
     functions as F,
@@ -14,12 +14,19 @@ from great_expectations.execution_engine import (
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
+from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
+from great_expectations.execution_engine.util import get_approximate_percentile_disc_sql
 from great_expectations.expectations.metrics.column_aggregate_metric_provider import (
     ColumnAggregateMetricProvider,
     column_aggregate_partial,
     column_aggregate_value,
 )
 from great_expectations.expectations.metrics.metric_provider import metric_value
+from great_expectations.expectations.metrics.sketches import (
+    DEFAULT_DISTINCT_COUNT_SKETCH_RELATIVE_ERROR,
+    HyperLogLogSketch,
+    validate_relative_error,
+)
 from great_expectations.validator.metric_configuration import MetricConfiguration
 
 if TYPE_CHECKING:
@@ -136,6 +143,82 @@ class ColumnDistinctValuesCount(ColumnAggregateMetricProvider):
         return F.countDistinct(column)
 
 
+# Native approximate distinct count functions (Redshift uses "APPROXIMATE COUNT(DISTINCT ...)"
+# instead; other dialects count distinct values exactly).
+APPROX_DISTINCT_COUNT_FUNCTION_NAMES: Mapping[GXSqlDialect, str] = {
+    GXSqlDialect.AWSATHENA: "approx_distinct",
+    GXSqlDialect.BIGQUERY: "approx_count_distinct",
+    GXSqlDialect.CLICKHOUSE: "uniq",
+    GXSqlDialect.DATABRICKS: "approx_count_distinct",
+    GXSqlDialect.MSSQL: "approx_count_distinct",
+    GXSqlDialect.ORACLE: "approx_count_distinct",
+    GXSqlDialect.SNOWFLAKE: "approx_count_distinct",
+    GXSqlDialect.TRINO: "approx_distinct",
+    GXSqlDialect.VERTICA: "approximate_count_distinct",
+}
+
+
+class ColumnApproxDistinctValuesCount(ColumnAggregateMetricProvider):
+    """MetricProvider Class for approximate number of distinct (non-null) column values.
+
+    Distinct values are not materialized: Pandas values are summarized by "HyperLogLogSketch", while SQL and Spark
+    backends use their native approximate aggregates (e.g., "APPROX_COUNT_DISTINCT" and "approx_count_distinct").
+    """  # noqa: E501
+
+    metric_name = "column.distinct_values.count.approx"
+    value_keys = ("relative_error",)
+
+    @column_aggregate_value(engine=PandasExecutionEngine)  # type: ignore[misc] # untyped-decorator
+    def _pandas(cls, column: pd.Series, relative_error: Optional[float] = None, **kwargs) -> int:
+        sketch = HyperLogLogSketch.from_relative_error(
+            relative_error=relative_error or DEFAULT_DISTINCT_COUNT_SKETCH_RELATIVE_ERROR
+        )
+        sketch.update(column)
+        return sketch.estimate()
+
+    @column_aggregate_partial(engine=SqlAlchemyExecutionEngine)  # type: ignore[misc] # untyped-decorator
+    def _sqlalchemy(
+        cls,
+        column: sqlalchemy.ColumnClause,
+        _dialect: sqlalchemy.Dialect,
+        relative_error: Optional[float] = None,
+        **kwargs,
+    ) -> sqlalchemy.Selectable:
+        """Native approximate aggregates have fixed accuracy (relative_error is only validated)."""
+        if relative_error is not None:
+            validate_relative_error(relative_error=relative_error)
+
+        if _dialect.name.lower() == GXSqlDialect.REDSHIFT:
+            # Redshift approximates with "APPROXIMATE" keyword, rather than with separate function.
+            return sa.literal_column(
+                get_approximate_percentile_disc_sql(
+                    selects=[sa.func.count(sa.distinct(column))], sql_engine_dialect=_dialect
+                )
+            )
+
+        function_name: Optional[str] = APPROX_DISTINCT_COUNT_FUNCTION_NAMES.get(
+            _dialect.name.lower()  # type: ignore[call-overload] # GXSqlDialect compares equal to its name
+        )
+        if function_name is None:
+            return sa.func.count(sa.distinct(column))
+
+        return getattr(sa.func, function_name)(column)
+
+    @column_aggregate_partial(engine=SparkDFExecutionEngine)  # type: ignore[misc] # untyped-decorator
+    def _spark(
+        cls,
+        column: pyspark.Column,
+        relative_error: Optional[float] = None,
+        **kwargs,
+    ) -> pyspark.Column:
+        return F.approx_count_distinct(
+            column,
+            rsd=validate_relative_error(
+                relative_error=relative_error or DEFAULT_DISTINCT_COUNT_SKETCH_RELATIVE_ERROR
+            ),
+        )
+
+
 class ColumnDistinctValuesCountUnderThreshold(ColumnAggregateMetricProvider):
     metric_name = "column.distinct_values.count.under_threshold"
     condition_keys = ("threshold",)
@@ -17,7 +17,14 @@ from great_expectations.expectations.metrics.column_aggregate_metric_provider im
     ColumnAggregateMetricProvider,
     column_aggregate_value,
 )
+from great_expectations.expectations.metrics.column_aggregate_metrics.column_quantile_sketch import (  # noqa: E501
+    build_pandas_quantile_sketch,
+)
+from great_expectations.expectations.metrics.column_aggregate_metrics.column_quantile_values import (  # noqa: E501
+    _get_approximate_column_quantiles_sqlalchemy,
+)
 from great_expectations.expectations.metrics.metric_provider import metric_value
+from great_expectations.expectations.metrics.sketches import validate_relative_error
 from great_expectations.validator.metric_configuration import MetricConfiguration
 
 if TYPE_CHECKING:
@@ -32,10 +39,17 @@ class ColumnMedian(ColumnAggregateMetricProvider):
     """MetricProvider Class for Aggregate Mean MetricProvider"""
 
     metric_name = "column.median"
+    value_keys = ("approximate_relative_error",)
 
     @column_aggregate_value(engine=PandasExecutionEngine)
-    def _pandas(cls, column, **kwargs):
+    def _pandas(cls, column, approximate_relative_error=None, **kwargs):
         """Pandas Median Implementation"""
+        if approximate_relative_error:
+            return build_pandas_quantile_sketch(
+                column=column,
+                relative_error=validate_relative_error(relative_error=approximate_relative_error),
+            ).quantiles([0.5])[0]
+
         column_null_elements_cond: pd.Series = column.isnull()
         column_nonnull_elements: pd.Series = column[~column_null_elements_cond]
         return column_nonnull_elements.median()
@@ -61,6 +75,19 @@ class ColumnMedian(ColumnAggregateMetricProvider):
         if not nonnull_count:
             return None
 
+        approximate_relative_error = (metric_value_kwargs or {}).get("approximate_relative_error")
+        if approximate_relative_error:
+            # Native approximate percentile function of dialect (if any) instead of full sort.
+            approximate_quantiles = _get_approximate_column_quantiles_sqlalchemy(
+                column=column,
+                quantiles=[0.5],
+                relative_error=validate_relative_error(relative_error=approximate_relative_error),
+                selectable=selectable,
+                execution_engine=execution_engine,
+            )
+            if approximate_quantiles is not None:
+                return approximate_quantiles[0]
+
         element_values = execution_engine.execute_query(
             sa.select(column)
             .order_by(column)
@@ -117,6 +144,15 @@ class ColumnMedian(ColumnAggregateMetricProvider):
         # in the degenerate case when n_values = 0
 
         """Spark Median Implementation"""
+        approximate_relative_error = (metric_value_kwargs or {}).get("approximate_relative_error")
+        if approximate_relative_error:
+            result = df.approxQuantile(
+                column,
+                [0.5],
+                validate_relative_error(relative_error=approximate_relative_error),
+            )
+            return result[0] if result else None
+
         table_row_count = metrics["table.row_count"]
         result = df.approxQuantile(column, [0.5, 0.5 + (1 / (2 + (2 * table_row_count)))], 0)
         return np.mean(result)
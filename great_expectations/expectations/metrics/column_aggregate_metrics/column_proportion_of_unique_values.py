@@ -24,17 +24,18 @@ if TYPE_CHECKING:
     )
 
 
-def unique_proportion(_metrics):
+def unique_proportion(_metrics, distinct_values_count_metric_name="column.distinct_values.count"):
     """Computes the proportion of unique non-null values out of all non-null values"""
     total_values = _metrics.get("table.row_count")
-    unique_values = _metrics.get("column.distinct_values.count")
+    unique_values = _metrics.get(distinct_values_count_metric_name)
     null_count = _metrics.get(
         f"column_values.nonnull.{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}"
     )
 
     # Ensuring that we do not divide by 0, returning 0 if all values are nulls (we only consider non-nulls unique values)  # noqa: E501
     if total_values > 0 and total_values != null_count:
-        return unique_values / (total_values - null_count)
+        # Approximate count of distinct values may slightly exceed count of non-null values.
+        return min(unique_values / (total_values - null_count), 1.0)
     else:
         return 0
 
@@ -83,3 +84,51 @@ class ColumnUniqueProportion(ColumnAggregateMetricProvider):
         )
 
         return dependencies
+
+
+class ColumnApproxUniqueProportion(ColumnAggregateMetricProvider):
+    """MetricProvider Class for proportion of unique values, based on approximate distinct count."""
+
+    metric_name = "column.unique_proportion.approx"
+
+    @metric_value(engine=PandasExecutionEngine)
+    def _pandas(*args, metrics, **kwargs):
+        return unique_proportion(metrics, "column.distinct_values.count.approx")
+
+    @metric_value(engine=SqlAlchemyExecutionEngine)
+    def _sqlalchemy(*args, metrics, **kwargs):
+        return unique_proportion(metrics, "column.distinct_values.count.approx")
+
+    @metric_value(engine=SparkDFExecutionEngine)
+    def _spark(*args, metrics, **kwargs):
+        return unique_proportion(metrics, "column.distinct_values.count.approx")
+
+    @classmethod
+    @override
+    def _get_evaluation_dependencies(
+        cls,
+        metric: MetricConfiguration,
+        configuration: Optional[ExpectationConfiguration] = None,
+        execution_engine: Optional[ExecutionEngine] = None,
+        runtime_configuration: Optional[dict] = None,
+    ):
+        dependencies: dict = super()._get_evaluation_dependencies(
+            metric=metric,
+            configuration=configuration,
+            execution_engine=execution_engine,
+            runtime_configuration=runtime_configuration,
+        )
+
+        dependencies["column.distinct_values.count.approx"] = MetricConfiguration(
+            metric_name="column.distinct_values.count.approx",
+            metric_domain_kwargs=metric.metric_domain_kwargs,
+        )
+
+        dependencies[
+            f"column_values.nonnull.{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}"
+        ] = MetricConfiguration(
+            metric_name=f"column_values.nonnull.{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}",
+            metric_domain_kwargs=metric.metric_domain_kwargs,
+        )
+
+        return dependencies
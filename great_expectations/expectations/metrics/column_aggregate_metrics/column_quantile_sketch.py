@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
+
+from great_expectations.compatibility.pyspark import functions as F
+from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
+from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.execution_engine import (
+    PandasExecutionEngine,
+    SparkDFExecutionEngine,
+    SqlAlchemyExecutionEngine,
+)
+from great_expectations.expectations.metrics.column_aggregate_metric_provider import (
+    ColumnAggregateMetricProvider,
+    column_aggregate_value,
+)
+from great_expectations.expectations.metrics.metric_provider import metric_value
+from great_expectations.expectations.metrics.sketches import (
+    DEFAULT_QUANTILE_SKETCH_RELATIVE_ERROR,
+    QUANTILE_SKETCH_CHUNK_SIZE,
+    KllQuantileSketch,
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from great_expectations.compatibility import pyspark
+
+
+class ColumnQuantileSketch(ColumnAggregateMetricProvider):
+    """MetricProvider Class for mergeable quantile sketch (JSON representation of "KllQuantileSketch") of column values.
+
+    Sketches of several Batches can be combined with "KllQuantileSketch.merge_all()" (after "from_json_dict()"), so that
+    quantiles of multi-Batch data are estimated without rescanning any Batch.
+    """  # noqa: E501
+
+    metric_name = "column.quantile_sketch"
+    value_keys = ("relative_error",)
+
+    @column_aggregate_value(engine=PandasExecutionEngine)
+    def _pandas(cls, column, relative_error=None, **kwargs):
+        return build_pandas_quantile_sketch(
+            column=column, relative_error=relative_error
+        ).to_json_dict()
+
+    @metric_value(engine=SqlAlchemyExecutionEngine)
+    def _sqlalchemy(
+        cls,
+        execution_engine: SqlAlchemyExecutionEngine,
+        metric_domain_kwargs: dict,
+        metric_value_kwargs: dict,
+        metrics: Dict[str, Any],
+        runtime_configuration: dict,
+    ):
+        (
+            selectable,
+            _compute_domain_kwargs,
+            accessor_domain_kwargs,
+        ) = execution_engine.get_compute_domain(metric_domain_kwargs, MetricDomainTypes.COLUMN)
+        return build_sqlalchemy_quantile_sketch(
+            execution_engine=execution_engine,
+            selectable=selectable,
+            column=sa.column(accessor_domain_kwargs["column"]),
+            relative_error=metric_value_kwargs.get("relative_error"),
+        ).to_json_dict()
+
+    @metric_value(engine=SparkDFExecutionEngine)
+    def _spark(
+        cls,
+        execution_engine: SparkDFExecutionEngine,
+        metric_domain_kwargs: dict,
+        metric_value_kwargs: dict,
+        metrics: Dict[str, Any],
+        runtime_configuration: dict,
+    ):
+        (
+            df,
+            _compute_domain_kwargs,
+            accessor_domain_kwargs,
+        ) = execution_engine.get_compute_domain(metric_domain_kwargs, MetricDomainTypes.COLUMN)
+        return build_spark_quantile_sketch(
+            df=df,
+            column_name=accessor_domain_kwargs["column"],
+            relative_error=metric_value_kwargs.get("relative_error"),
+        ).to_json_dict()
+
+
+def build_pandas_quantile_sketch(
+    column: pd.Series, relative_error: Optional[float] = None
+) -> KllQuantileSketch:
+    """Summarizes Pandas column in single pass over chunks of at most "QUANTILE_SKETCH_CHUNK_SIZE" values."""  # noqa: E501
+    sketch = KllQuantileSketch.from_relative_error(
+        relative_error=relative_error or DEFAULT_QUANTILE_SKETCH_RELATIVE_ERROR
+    )
+    column = column.dropna()
+    start: int
+    for start in range(0, len(column), QUANTILE_SKETCH_CHUNK_SIZE):
+        sketch.update(column.iloc[start : start + QUANTILE_SKETCH_CHUNK_SIZE].to_numpy())
+
+    return sketch
+
+
+def build_sqlalchemy_quantile_sketch(
+    execution_engine: SqlAlchemyExecutionEngine,
+    selectable: Any,
+    column: Any,
+    relative_error: Optional[float] = None,
+) -> KllQuantileSketch:
+    """Summarizes SQL column in single (unsorted) pass, fetching at most "QUANTILE_SKETCH_CHUNK_SIZE" rows at once.
+
+    Every non-null value of column is transferred to client; approximate quantile metrics therefore use native
+    approximate percentile functions (or exact quantiles, computed by server) instead, and only "column.quantile_sketch"
+    metric, whose mergeable sketch requires values themselves, streams column this way.
+    """  # noqa: E501
+    sketch = KllQuantileSketch.from_relative_error(
+        relative_error=relative_error or DEFAULT_QUANTILE_SKETCH_RELATIVE_ERROR
+    )
+    result = execution_engine.execute_query(
+        sa.select(column)
+        .where(column != None)  # noqa: E711
+        .select_from(selectable)
+    )
+
+    rows: List[Any]
+    while rows := result.fetchmany(QUANTILE_SKETCH_CHUNK_SIZE):
+        sketch.update(row[0] for row in rows)
+
+    return sketch
+
+
+def build_spark_quantile_sketch(
+    df: pyspark.DataFrame, column_name: str, relative_error: Optional[float] = None
+) -> KllQuantileSketch:
+    """Summarizes every partition of Spark column independently and merges partition sketches."""
+    relative_error = relative_error or DEFAULT_QUANTILE_SKETCH_RELATIVE_ERROR
+
+    def _sketch_partition(rows: Iterable[Any]) -> Iterable[KllQuantileSketch]:
+        sketch = KllQuantileSketch.from_relative_error(relative_error=relative_error)
+        sketch.update(row[0] for row in rows)
+        yield sketch
+
+    def _merge(left: KllQuantileSketch, right: KllQuantileSketch) -> KllQuantileSketch:
+        left.merge(right)
+        return left
+
+    sketches = (
+        df.select(column_name)
+        .where(F.col(column_name).isNotNull())
+        .rdd.mapPartitions(_sketch_partition)
+    )
+    if sketches.isEmpty():
+        return KllQuantileSketch.from_relative_error(relative_error=relative_error)
+
+    return sketches.treeReduce(_merge)
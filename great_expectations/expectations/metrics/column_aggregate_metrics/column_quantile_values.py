@@ -3,6 +3,7 @@ from __future__ import annotations
 import ast
 import itertools
 import logging
+import math
 import traceback
 from collections.abc import Iterable
 from typing import Any
@@ -25,7 +26,11 @@ from great_expectations.expectations.metrics.column_aggregate_metric_provider im
     ColumnAggregateMetricProvider,
     column_aggregate_value,
 )
+from great_expectations.expectations.metrics.column_aggregate_metrics.column_quantile_sketch import (  # noqa: E501
+    build_pandas_quantile_sketch,
+)
 from great_expectations.expectations.metrics.metric_provider import metric_value
+from great_expectations.expectations.metrics.sketches import validate_relative_error
 from great_expectations.expectations.metrics.util import attempt_allowing_relative_error
 
 logger = logging.getLogger(__name__)
@@ -33,11 +38,19 @@ logger = logging.getLogger(__name__)
 
 class ColumnQuantileValues(ColumnAggregateMetricProvider):
     metric_name = "column.quantile_values"
-    value_keys = ("quantiles", "allow_relative_error")
+    value_keys = ("quantiles", "allow_relative_error", "approximate_relative_error")
 
     @column_aggregate_value(engine=PandasExecutionEngine)
-    def _pandas(cls, column, quantiles, allow_relative_error, **kwargs):
+    def _pandas(
+        cls, column, quantiles, allow_relative_error, approximate_relative_error=None, **kwargs
+    ):
         """Quantile Function"""
+        if approximate_relative_error:
+            return build_pandas_quantile_sketch(
+                column=column,
+                relative_error=validate_relative_error(relative_error=approximate_relative_error),
+            ).quantiles(quantiles)
+
         interpolation_options = ("linear", "lower", "higher", "midpoint", "nearest")
 
         if not allow_relative_error:
@@ -73,6 +86,18 @@ class ColumnQuantileValues(ColumnAggregateMetricProvider):
         quantiles = metric_value_kwargs["quantiles"]
         allow_relative_error = metric_value_kwargs.get("allow_relative_error", False)
         table_row_count = metrics.get("table.row_count")
+        approximate_relative_error = metric_value_kwargs.get("approximate_relative_error")
+        if approximate_relative_error:
+            approximate_quantiles = _get_approximate_column_quantiles_sqlalchemy(
+                column=column,
+                quantiles=quantiles,
+                relative_error=validate_relative_error(relative_error=approximate_relative_error),
+                selectable=selectable,
+                execution_engine=execution_engine,
+            )
+            if approximate_quantiles is not None:
+                return approximate_quantiles
+
         if dialect_name == GXSqlDialect.MSSQL:
             return _get_column_quantiles_mssql(
                 column=column,
@@ -168,7 +193,11 @@ class ColumnQuantileValues(ColumnAggregateMetricProvider):
         column = accessor_domain_kwargs["column"]
 
         allow_relative_error = metric_value_kwargs.get("allow_relative_error", False)
-        if not allow_relative_error:
+        if metric_value_kwargs.get("approximate_relative_error"):
+            allow_relative_error = validate_relative_error(
+                relative_error=metric_value_kwargs["approximate_relative_error"]
+            )
+        elif not allow_relative_error:
             allow_relative_error = 0.0
 
         if (
@@ -183,6 +212,70 @@ class ColumnQuantileValues(ColumnAggregateMetricProvider):
         return df.approxQuantile(column, list(quantiles), allow_relative_error)  # type: ignore[attr-defined]
 
 
+def _get_approximate_column_quantiles_sqlalchemy(  # noqa: C901
+    column,
+    quantiles: Iterable,
+    relative_error: float,
+    selectable,
+    execution_engine: SqlAlchemyExecutionEngine,
+) -> list | None:
+    """Uses approximate percentile function of dialect, if available.
+
+    Returns None (so that exact quantiles are computed by server instead), if dialect has no approximate percentile
+    function or if it cannot be applied to column (e.g., to column of date/time values).
+    """  # noqa: E501
+    quantiles = list(quantiles)
+    dialect_name: str = execution_engine.dialect_name.lower()
+
+    selects: list[sqlalchemy.ColumnElement] | None = None
+    if dialect_name == GXSqlDialect.SNOWFLAKE:
+        # Please see "_get_column_quantiles_generic_sqlalchemy()" regarding Snowflake precision limitation.  # noqa: E501
+        selects = [sa.func.approx_percentile(column, round(x, 10)) for x in quantiles]
+    elif dialect_name in (GXSqlDialect.TRINO, GXSqlDialect.AWSATHENA):
+        selects = [sa.func.approx_percentile(column, quantile) for quantile in quantiles]
+    elif dialect_name == GXSqlDialect.DATABRICKS:
+        accuracy: int = math.ceil(1.0 / relative_error)
+        selects = [sa.func.percentile_approx(column, quantile, accuracy) for quantile in quantiles]
+    elif dialect_name == GXSqlDialect.BIGQUERY:
+        # APPROX_QUANTILES() returns array of "num_quantiles + 1" approximate boundaries.
+        num_quantiles: int = max(math.ceil(1.0 / relative_error), 2)
+        selects = [sa.func.approx_quantiles(column, num_quantiles)]
+    elif dialect_name == GXSqlDialect.MSSQL:
+        # APPROX_PERCENTILE_DISC() is available as of SQL Server 2022 (and in Azure SQL).
+        selects = [
+            sa.func.approx_percentile_disc(quantile).within_group(column.asc())
+            for quantile in quantiles
+        ]
+    elif dialect_name == GXSqlDialect.REDSHIFT:
+        selects = [
+            sa.text(
+                get_approximate_percentile_disc_sql(
+                    selects=[sa.func.percentile_disc(quantile).within_group(column.asc())],
+                    sql_engine_dialect=execution_engine.dialect,
+                )
+            )
+            for quantile in quantiles
+        ]
+
+    if selects is None:
+        return None
+
+    quantiles_query: sqlalchemy.Select = sa.select(*selects).select_from(selectable)
+    try:
+        quantiles_results = list(execution_engine.execute_query(quantiles_query).fetchone())  # type: ignore[arg-type]
+    except sqlalchemy.SQLAlchemyError as e:
+        logger.info(
+            f'Approximate quantiles are not available for column "{column}" of "{dialect_name}" dialect ({type(e).__name__}: "{e!s}"); computing exact quantiles instead.'  # noqa: E501
+        )
+        return None
+
+    if dialect_name == GXSqlDialect.BIGQUERY:
+        boundaries: list = quantiles_results[0]
+        return [boundaries[round(quantile * num_quantiles)] for quantile in quantiles]
+
+    return quantiles_results
+
+
 def _get_column_quantiles_mssql(
     column, quantiles: Iterable, selectable, execution_engine: SqlAlchemyExecutionEngine
 ) -> list:
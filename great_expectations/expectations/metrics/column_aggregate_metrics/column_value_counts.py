@@ -1,13 +1,15 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Union
 
 import pandas as pd
 
 from great_expectations.compatibility.pyspark import functions as F
 from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
+from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.metric_domain_types import MetricDomainTypes
 from great_expectations.execution_engine import (
+    ExecutionEngine,
     PandasExecutionEngine,
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
@@ -16,16 +18,33 @@ from great_expectations.expectations.metrics.column_aggregate_metric_provider im
     ColumnAggregateMetricProvider,
 )
 from great_expectations.expectations.metrics.metric_provider import metric_value
+from great_expectations.validator.metric_configuration import MetricConfiguration
 
 if TYPE_CHECKING:
     from great_expectations.compatibility import pyspark, sqlalchemy
+    from great_expectations.expectations.expectation_configuration import (
+        ExpectationConfiguration,
+    )
+
+
+def _validate_limit(limit: Optional[int]) -> Optional[int]:
+    if limit is not None and (isinstance(limit, bool) or not isinstance(limit, int) or limit < 1):
+        raise ValueError(f'limit must be a positive integer; got "{limit}".')  # noqa: TRY003
+
+    return limit
 
 
 class ColumnValueCounts(ColumnAggregateMetricProvider):
+    """MetricProvider Class for counts of distinct (non-null) column values.
+
+    If "limit" is specified, only "limit" most frequent values are counted (and then ordered according to "sort");
+    SQL and Spark backends select them, so that no more than "limit" values are transferred to client.
+    """  # noqa: E501
+
     metric_name = "column.value_counts"
-    value_keys = ("sort", "collate")
+    value_keys = ("sort", "collate", "limit")
 
-    default_kwarg_values = {"sort": "value", "collate": None}
+    default_kwarg_values = {"sort": "value", "collate": None, "limit": None}
 
     @metric_value(engine=PandasExecutionEngine)
     def _pandas(
@@ -44,6 +63,7 @@ class ColumnValueCounts(ColumnAggregateMetricProvider):
             raise ValueError("sort must be either 'value', 'count', or 'none'")  # noqa: TRY003
         if collate is not None:
             raise ValueError("collate parameter is not supported in PandasDataset")  # noqa: TRY003
+        limit: Optional[int] = _validate_limit(metric_value_kwargs.get("limit"))  # type: ignore[arg-type]
 
         df: pd.DataFrame
         accessor_domain_kwargs: Dict[str, str]
@@ -53,6 +73,9 @@ class ColumnValueCounts(ColumnAggregateMetricProvider):
         column: str = accessor_domain_kwargs["column"]
 
         counts: pd.Series = df[column].value_counts()
+        if limit is not None:
+            # Counts are in descending order.
+            counts = counts.iloc[:limit]
         if sort == "value":
             try:
                 counts.sort_index(inplace=True)
@@ -86,6 +109,7 @@ class ColumnValueCounts(ColumnAggregateMetricProvider):
             raise ValueError("sort must be either 'value', 'count', or 'none'")  # noqa: TRY003
         if collate is not None:
             raise ValueError("collate parameter is not supported in PandasDataset")  # noqa: TRY003
+        limit: Optional[int] = _validate_limit(metric_value_kwargs.get("limit"))  # type: ignore[arg-type]
 
         selectable: sqlalchemy.Selectable
         accessor_domain_kwargs: Dict[str, str]
@@ -113,19 +137,29 @@ class ColumnValueCounts(ColumnAggregateMetricProvider):
                 .where(sa.column(column).isnot(None))
                 .group_by(sa.column(column))
             )
+        query = query.select_from(selectable)  # type: ignore[arg-type]
+
+        value_column: Union[sqlalchemy.ColumnClause, sqlalchemy.ColumnElement] = sa.column(column)
+        if limit is not None:
+            # Database selects most frequent values, so that at most "limit" rows are fetched.
+            top_values: sqlalchemy.Subquery = (
+                query.order_by(sa.column("count").desc(), sa.column(column)).limit(limit).subquery()
+            )
+            value_column = top_values.c["value"]
+            query = sa.select(value_column, top_values.c["count"])
         if sort == "value":
             # NOTE: depending on the way the underlying database collates columns,
             # ordering can vary. postgresql collate "C" matches default sort
             # for python and most other systems, but is not universally supported,
             # so we use the default sort for the system, unless specifically overridden
             if collate is not None:
-                query = query.order_by(sa.column(column).collate(collate))
+                query = query.order_by(value_column.collate(collate))
             else:
-                query = query.order_by(sa.column(column))
+                query = query.order_by(value_column)
         elif sort == "count":
             query = query.order_by(sa.column("count").desc())
         results: List[sqlalchemy.Row] = execution_engine.execute_query(  # type: ignore[assignment]
-            query.select_from(selectable)  # type: ignore[arg-type]
+            query
         ).fetchall()
         # Numpy does not always infer the correct DataTypes for SqlAlchemy Row, so we cannot use vectorized approach.  # noqa: E501
         series = pd.Series(
@@ -152,6 +186,7 @@ class ColumnValueCounts(ColumnAggregateMetricProvider):
             raise ValueError("sort must be either 'value', 'count', or 'none'")  # noqa: TRY003
         if collate is not None:
             raise ValueError("collate parameter is not supported in SparkDFDataset")  # noqa: TRY003
+        limit: Optional[int] = _validate_limit(metric_value_kwargs.get("limit"))  # type: ignore[arg-type]
 
         df: pyspark.DataFrame
         accessor_domain_kwargs: Dict[str, str]
@@ -163,6 +198,8 @@ class ColumnValueCounts(ColumnAggregateMetricProvider):
         value_counts_df: pyspark.DataFrame = (
             df.select(column).where(F.col(column).isNotNull()).groupBy(column).count()
         )
+        if limit is not None:
+            value_counts_df = value_counts_df.orderBy(F.desc("count"), column).limit(limit)
 
         if sort == "value":
             value_counts_df = value_counts_df.orderBy(column)
@@ -186,3 +223,66 @@ class ColumnValueCounts(ColumnAggregateMetricProvider):
             name="count",
         )
         return series
+
+
+class ColumnTopValueCounts(ColumnAggregateMetricProvider):
+    """MetricProvider Class for counts of "limit" most frequent (non-null) column values.
+
+    Value is dictionary with "value_counts" (Series of counts in descending order, as "column.value_counts") and
+    "truncated" (whether column has more distinct values), computed from "limit" + 1 most frequent values.
+    """  # noqa: E501
+
+    metric_name = "column.top_value_counts"
+    value_keys = ("limit",)
+
+    default_kwarg_values = {"limit": 20}
+
+    @metric_value(engine=PandasExecutionEngine)
+    def _pandas(cls, metric_value_kwargs: Dict[str, int], metrics: Dict[str, Any], **kwargs):
+        return _get_top_value_counts(metric_value_kwargs=metric_value_kwargs, metrics=metrics)
+
+    @metric_value(engine=SqlAlchemyExecutionEngine)
+    def _sqlalchemy(cls, metric_value_kwargs: Dict[str, int], metrics: Dict[str, Any], **kwargs):
+        return _get_top_value_counts(metric_value_kwargs=metric_value_kwargs, metrics=metrics)
+
+    @metric_value(engine=SparkDFExecutionEngine)
+    def _spark(cls, metric_value_kwargs: Dict[str, int], metrics: Dict[str, Any], **kwargs):
+        return _get_top_value_counts(metric_value_kwargs=metric_value_kwargs, metrics=metrics)
+
+    @classmethod
+    @override
+    def _get_evaluation_dependencies(
+        cls,
+        metric: MetricConfiguration,
+        configuration: Optional[ExpectationConfiguration] = None,
+        execution_engine: Optional[ExecutionEngine] = None,
+        runtime_configuration: Optional[dict] = None,
+    ):
+        dependencies: dict = super()._get_evaluation_dependencies(
+            metric=metric,
+            configuration=configuration,
+            execution_engine=execution_engine,
+            runtime_configuration=runtime_configuration,
+        )
+
+        limit: int = _validate_limit(  # type: ignore[assignment] # limit has default value
+            metric.metric_value_kwargs.get("limit", cls.default_kwarg_values["limit"])
+        )
+        dependencies["column.value_counts"] = MetricConfiguration(
+            metric_name="column.value_counts",
+            metric_domain_kwargs=metric.metric_domain_kwargs,
+            metric_value_kwargs={"sort": "count", "collate": None, "limit": limit + 1},
+        )
+
+        return dependencies
+
+
+def _get_top_value_counts(
+    metric_value_kwargs: Dict[str, int], metrics: Dict[str, Any]
+) -> Dict[str, Union[pd.Series, bool]]:
+    limit: int = metric_value_kwargs["limit"]
+    value_counts: pd.Series = metrics["column.value_counts"]
+    return {
+        "value_counts": value_counts.iloc[:limit],
+        "truncated": len(value_counts) > limit,
+    }
@@ -1,26 +1,39 @@
-from .column_value_lengths import ColumnValuesValueLength, ColumnValuesValueLengthEquals
-from .column_values_between import ColumnValuesBetween
-from .column_values_dateutil_parseable import ColumnValuesDateutilParseable
-from .column_values_decreasing import ColumnValuesDecreasing
-from .column_values_in_set import ColumnValuesInSet
-from .column_values_in_type_list import ColumnValuesInTypeList
-from .column_values_increasing import ColumnValuesIncreasing
-from .column_values_json_parseable import ColumnValuesJsonParseable
-from .column_values_match_json_schema import ColumnValuesMatchJsonSchema
-from .column_values_match_like_pattern import ColumnValuesMatchLikePattern
-from .column_values_match_like_pattern_list import ColumnValuesMatchLikePatternList
-from .column_values_match_regex import ColumnValuesMatchRegex
-from .column_values_match_regex_list import ColumnValuesMatchRegexList
-from .column_values_match_strftime_format import ColumnValuesMatchStrftimeFormat
-from .column_values_non_null import ColumnValuesNonNull
-from .column_values_not_in_set import ColumnValuesNotInSet
-from .column_values_not_match_like_pattern import ColumnValuesNotMatchLikePattern
-from .column_values_not_match_like_pattern_list import (
-    ColumnValuesNotMatchLikePatternList,
-)
-from .column_values_not_match_regex import ColumnValuesNotMatchRegex
-from .column_values_not_match_regex_list import ColumnValuesNotMatchRegexList
-from .column_values_null import ColumnValuesNull
-from .column_values_of_type import ColumnValuesOfType
-from .column_values_unique import ColumnValuesUnique
-from .column_values_z_score import ColumnValuesZScore
+from typing import TYPE_CHECKING
+
+from great_expectations.expectations.registry import get_lazy_export, list_lazy_exports
+
+if TYPE_CHECKING:
+    from .column_value_lengths import ColumnValuesValueLength, ColumnValuesValueLengthEquals
+    from .column_values_between import ColumnValuesBetween
+    from .column_values_dateutil_parseable import ColumnValuesDateutilParseable
+    from .column_values_decreasing import ColumnValuesDecreasing
+    from .column_values_in_set import ColumnValuesInSet
+    from .column_values_in_type_list import ColumnValuesInTypeList
+    from .column_values_increasing import ColumnValuesIncreasing
+    from .column_values_json_parseable import ColumnValuesJsonParseable
+    from .column_values_match_json_schema import ColumnValuesMatchJsonSchema
+    from .column_values_match_like_pattern import ColumnValuesMatchLikePattern
+    from .column_values_match_like_pattern_list import ColumnValuesMatchLikePatternList
+    from .column_values_match_regex import ColumnValuesMatchRegex
+    from .column_values_match_regex_list import ColumnValuesMatchRegexList
+    from .column_values_match_strftime_format import ColumnValuesMatchStrftimeFormat
+    from .column_values_non_null import ColumnValuesNonNull
+    from .column_values_not_in_set import ColumnValuesNotInSet
+    from .column_values_not_match_like_pattern import ColumnValuesNotMatchLikePattern
+    from .column_values_not_match_like_pattern_list import (
+        ColumnValuesNotMatchLikePatternList,
+    )
+    from .column_values_not_match_regex import ColumnValuesNotMatchRegex
+    from .column_values_not_match_regex_list import ColumnValuesNotMatchRegexList
+    from .column_values_null import ColumnValuesNull
+    from .column_values_of_type import ColumnValuesOfType
+    from .column_values_unique import ColumnValuesUnique
+    from .column_values_z_score import ColumnValuesZScore
+
+
+def __getattr__(name: str):
+    return get_lazy_export(package_name=__name__, name=name)
+
+
+def __dir__():
+    return sorted({*globals(), *list_lazy_exports(__name__)})
@@ -14,6 +14,10 @@ from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
+from great_expectations.expectations.metrics.value_set_membership import (
+    pandas_values_in_set,
+    sqlalchemy_values_in_set_condition,
+)
 
 try:
     import sqlalchemy as sa  # noqa: TID251
@@ -36,7 +40,7 @@ class ColumnValuesInSet(ColumnMapMetricProvider):
             # Vacuously true
             return np.ones(len(column), dtype=np.bool_)
 
-        return column.isin(value_set)
+        return pandas_values_in_set(column, value_set, kwargs.get("_execution_engine"))
 
     @column_condition_partial(engine=SqlAlchemyExecutionEngine)
     def _sqlalchemy(cls, column, value_set, **kwargs):
@@ -51,6 +55,13 @@ class ColumnValuesInSet(ColumnMapMetricProvider):
         if len(value_set) == 0:
             return False
 
+        # Large value sets are semi-joined (rather than rendered as literal "IN" list).
+        semi_join_condition = sqlalchemy_values_in_set_condition(
+            [column], value_set, kwargs.get("_execution_engine"), kwargs.get("_metrics")
+        )
+        if semi_join_condition is not None:
+            return semi_join_condition
+
         # This "if" block is a workaround for:
         # https://github.com/googleapis/python-bigquery-sqlalchemy/issues/489#issuecomment-1253731826
         # `in_` doesn't work for boolean columns in bigquery so we unroll expressions like
@@ -3,6 +3,7 @@ from __future__ import annotations
 import numpy as np
 import pandas as pd
 
+from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
@@ -13,6 +14,10 @@ from great_expectations.expectations.metrics.map_metric_provider import (
     column_condition_partial,
 )
 from great_expectations.expectations.metrics.util import parse_value_set
+from great_expectations.expectations.metrics.value_set_membership import (
+    pandas_values_in_set,
+    sqlalchemy_values_in_set_condition,
+)
 
 
 class ColumnValuesNotInSet(ColumnMapMetricProvider):
@@ -34,7 +39,7 @@ class ColumnValuesNotInSet(ColumnMapMetricProvider):
         else:
             parsed_value_set = value_set
 
-        return ~column.isin(parsed_value_set)
+        return ~pandas_values_in_set(column, parsed_value_set, kwargs.get("_execution_engine"))
 
     @column_condition_partial(engine=SqlAlchemyExecutionEngine)
     def _sqlalchemy(
@@ -46,6 +51,13 @@ class ColumnValuesNotInSet(ColumnMapMetricProvider):
         if value_set is None or len(value_set) == 0:
             return True
 
+        # Large value sets are semi-joined (rather than rendered as literal "NOT IN" list).
+        semi_join_condition = sqlalchemy_values_in_set_condition(
+            [column], value_set, kwargs.get("_execution_engine"), kwargs.get("_metrics")
+        )
+        if semi_join_condition is not None:
+            return sa.not_(semi_join_condition)
+
         return column.notin_(tuple(value_set))
 
     @column_condition_partial(engine=SparkDFExecutionEngine)
@@ -1,3 +1,16 @@
-from .column_pair_values_equal import ColumnPairValuesEqual
-from .column_pair_values_greater import ColumnPairValuesAGreaterThanB
-from .column_pair_values_in_set import ColumnPairValuesInSet
+from typing import TYPE_CHECKING
+
+from great_expectations.expectations.registry import get_lazy_export, list_lazy_exports
+
+if TYPE_CHECKING:
+    from .column_pair_values_equal import ColumnPairValuesEqual
+    from .column_pair_values_greater import ColumnPairValuesAGreaterThanB
+    from .column_pair_values_in_set import ColumnPairValuesInSet
+
+
+def __getattr__(name: str):
+    return get_lazy_export(package_name=__name__, name=name)
+
+
+def __dir__():
+    return sorted({*globals(), *list_lazy_exports(__name__)})
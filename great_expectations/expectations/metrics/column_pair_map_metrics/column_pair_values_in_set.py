@@ -16,6 +16,9 @@ from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnPairMapMetricProvider,
     column_pair_condition_partial,
 )
+from great_expectations.expectations.metrics.value_set_membership import (
+    sqlalchemy_values_in_set_condition,
+)
 
 
 class ColumnPairValuesInSet(ColumnPairMapMetricProvider):
@@ -38,24 +41,16 @@ class ColumnPairValuesInSet(ColumnPairMapMetricProvider):
             # vacuously true
             return np.ones(len(column_A), dtype=np.bool_)
 
-        temp_df = pd.DataFrame({"A": column_A, "B": column_B})
         value_pairs_set = {(x, y) for x, y in value_pairs_set}
 
-        results = []
-        for i, t in temp_df.iterrows():
-            if pd.isnull(t["A"]):
-                a = None
-            else:
-                a = t["A"]
-
-            if pd.isnull(t["B"]):
-                b = None
-            else:
-                b = t["B"]
-
-            results.append((a, b) in value_pairs_set)
+        # Missing values (e.g., NaN) are matched as None.
+        results = [
+            (None if pd.isnull(a) else a, None if pd.isnull(b) else b) in value_pairs_set
+            for a, b in zip(column_A, column_B)
+        ]
 
-        return pd.Series(results)
+        # Aligned with rows remaining after "ignore_row_if" filtering.
+        return pd.Series(results, index=column_A.index)
 
     @column_pair_condition_partial(engine=SqlAlchemyExecutionEngine)
     def _sqlalchemy(cls, column_A, column_B, **kwargs):
@@ -67,6 +62,16 @@ class ColumnPairValuesInSet(ColumnPairMapMetricProvider):
 
         value_pairs_set = [(x, y) for x, y in value_pairs_set]
 
+        # Large value sets are semi-joined (rather than rendered as disjunction of every pair).
+        semi_join_condition = sqlalchemy_values_in_set_condition(
+            [column_A, column_B],
+            value_pairs_set,
+            kwargs.get("_execution_engine"),
+            kwargs.get("_metrics"),
+        )
+        if semi_join_condition is not None:
+            return semi_join_condition
+
         # or_ implementation was required due to mssql issues with in_
         conditions = [sa.or_(sa.and_(column_A == x, column_B == y)) for x, y in value_pairs_set]
         row_wise_cond = sa.or_(*conditions)
@@ -114,6 +114,7 @@ def column_condition_partial(  # noqa: C901, PLR0915
                     cls,
                     df[column_name],
                     **metric_value_kwargs,
+                    _execution_engine=execution_engine,
                     _metrics=metrics,
                 )
                 return (
@@ -111,6 +111,7 @@ def column_pair_condition_partial(  # noqa: C901 - 16
                     df[column_A_name],
                     df[column_B_name],
                     **metric_value_kwargs,
+                    _execution_engine=execution_engine,
                     _metrics=metrics,
                 )
                 return (
@@ -182,6 +183,7 @@ def column_pair_condition_partial(  # noqa: C901 - 16
                     sa.column(column_A_name),
                     sa.column(column_B_name),
                     **metric_value_kwargs,
+                    _execution_engine=execution_engine,
                     _dialect=dialect,
                     _table=selectable,
                     _sqlalchemy_engine=sqlalchemy_engine,
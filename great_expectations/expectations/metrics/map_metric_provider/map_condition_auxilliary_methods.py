@@ -36,7 +36,6 @@ from great_expectations.expectations.metrics.util import (
 )
 from great_expectations.util import (
     convert_to_json_serializable,  # noqa: TID251
-    generate_temporary_table_name,
     get_sqlalchemy_selectable,
 )
 
@@ -315,6 +314,7 @@ def _sqlalchemy_map_condition_unexpected_count_value(
                 if not connection.closed:
                     temp_table_obj = _generate_temp_table(
                         connection=connection,
+                        execution_engine=execution_engine,
                         metric_domain_kwargs=metric_domain_kwargs,
                         metric_value_kwargs=metric_value_kwargs,
                         metrics=metrics,
@@ -323,6 +323,7 @@ def _sqlalchemy_map_condition_unexpected_count_value(
                     with connection.begin():
                         temp_table_obj = _generate_temp_table(
                             connection=connection,
+                            execution_engine=execution_engine,
                             metric_domain_kwargs=metric_domain_kwargs,
                             metric_value_kwargs=metric_value_kwargs,
                             metrics=metrics,
@@ -791,21 +792,19 @@ def _spark_map_condition_query(
 
 def _generate_temp_table(
     connection: sa.engine.base.Connection,
+    execution_engine: SqlAlchemyExecutionEngine,
     metric_domain_kwargs: Dict,
     metric_value_kwargs: Dict,
     metrics: Dict[str, Any],
     **kwargs,
 ) -> sa.Table:
-    temp_table_name: str = generate_temporary_table_name(default_table_name_prefix="#ge_temp_")
-    metadata: sa.MetaData = sa.MetaData()
-    metadata.reflect(bind=connection)
-    temp_table_obj: sa.Table = sa.Table(
-        temp_table_name,
-        metadata,
-        sa.Column("condition", sa.Integer, primary_key=False, nullable=False),
+    """Returns empty scratch table, reused per connection and Batch (see "SqlAlchemyScratchTableManager")."""  # noqa: E501
+    batch_id: Optional[str] = (
+        metric_domain_kwargs.get("batch_id") or execution_engine.batch_manager.active_batch_id
+    )
+    return execution_engine.scratch_table_manager.get_scratch_table(
+        connection=connection, batch_id=batch_id
     )
-    temp_table_obj.create(bind=connection, checkfirst=True)
-    return temp_table_obj
 
 
 def _get_sqlalchemy_customized_unexpected_index_list(
@@ -0,0 +1,331 @@
+"""Single-scan computation of bounded "unexpected" samples for many SQL map metrics sharing compute Domain.
+
+Every ColumnMapExpectation with "SUMMARY" or "COMPLETE" result format requests its own "unexpected_values" (and, if
+"unexpected_index_column_names" are configured, "unexpected_index_list") metric; resolved one by one, each of those
+is separate query over whole table.  Here, conditions of all such metrics sharing compute Domain are evaluated in one
+query: every row, failing at least one condition, is numbered within each condition (using running "SUM()" window,
+ordered by "unexpected_index_column_names", if any, and by sampled columns), and only first "partial_unexpected_count"
+rows of each condition are returned; these are then fanned out to metrics.
+"""  # noqa: E501
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import great_expectations.exceptions as gx_exceptions
+from great_expectations.compatibility import sqlalchemy
+from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
+from great_expectations.core.id_dict import IDDict
+from great_expectations.expectations.metrics.map_metric_provider.column_map_condition_auxilliary_methods import (  # noqa: E501
+    _sqlalchemy_column_map_condition_values,
+)
+from great_expectations.expectations.metrics.map_metric_provider.is_sqlalchemy_metric_selectable import (  # noqa: E501
+    _is_sqlalchemy_metric_selectable,
+)
+from great_expectations.expectations.metrics.map_metric_provider.map_condition_auxilliary_methods import (  # noqa: E501
+    _get_sqlalchemy_customized_unexpected_index_list,
+    _sqlalchemy_map_condition_index,
+)
+from great_expectations.expectations.metrics.util import (
+    MAX_RESULT_RECORDS,
+    get_dbms_compatible_metric_domain_kwargs,
+)
+from great_expectations.util import get_sqlalchemy_selectable
+
+if TYPE_CHECKING:
+    from great_expectations.execution_engine import SqlAlchemyExecutionEngine
+    from great_expectations.execution_engine.execution_engine import (
+        MetricComputationConfiguration,
+    )
+    from great_expectations.validator.computed_metric import MetricValue
+    from great_expectations.validator.metric_configuration import MetricConfiguration
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class _UnexpectedRowsSample:
+    """Bounded sample of rows failing "unexpected_condition", which single map metric needs (and how to finish it).
+
+    Attributes:
+        unexpected_condition: SQLAlchemy expression of unexpected (failing) rows
+        compute_domain_kwargs: compute Domain, whose records are sampled
+        column_names: columns to select for every sampled row (in order expected by "build_metric_value")
+        index_column_names: columns identifying sampled rows (sampled rows are ordered by them first)
+        limit: maximum number of sampled rows
+        build_metric_value: converts sampled rows (tuples of "column_names" values) into metric value
+    """  # noqa: E501
+
+    unexpected_condition: Any
+    compute_domain_kwargs: dict
+    column_names: List[Union[str, sqlalchemy.quoted_name]]
+    index_column_names: List[Union[str, sqlalchemy.quoted_name]]
+    limit: int
+    build_metric_value: Callable[[List[Tuple]], Any]
+
+
+def _sqlalchemy_column_map_condition_values_sample(
+    cls,
+    execution_engine: SqlAlchemyExecutionEngine,
+    metric_domain_kwargs: dict,
+    metric_value_kwargs: dict,
+    metrics: Dict[str, Any],
+    **kwargs,
+) -> Optional[_UnexpectedRowsSample]:
+    """Mirrors "_sqlalchemy_column_map_condition_values()" (only bounded, i.e., non-"COMPLETE", result formats)."""  # noqa: E501
+    unexpected_condition, compute_domain_kwargs, accessor_domain_kwargs = metrics[
+        "unexpected_condition"
+    ]
+
+    result_format: dict = metric_value_kwargs["result_format"]
+    if "column" not in accessor_domain_kwargs or result_format["result_format"] == "COMPLETE":
+        return None
+
+    accessor_domain_kwargs = get_dbms_compatible_metric_domain_kwargs(
+        metric_domain_kwargs=accessor_domain_kwargs,
+        batch_columns_list=metrics["table.columns"],
+    )
+
+    return _UnexpectedRowsSample(
+        unexpected_condition=unexpected_condition,
+        compute_domain_kwargs=compute_domain_kwargs,
+        column_names=[accessor_domain_kwargs["column"]],
+        index_column_names=[],
+        limit=min(result_format["partial_unexpected_count"], MAX_RESULT_RECORDS),
+        build_metric_value=lambda rows: [row[0] for row in rows],
+    )
+
+
+def _sqlalchemy_map_condition_index_sample(
+    cls,
+    execution_engine: SqlAlchemyExecutionEngine,
+    metric_domain_kwargs: dict,
+    metric_value_kwargs: dict,
+    metrics: Dict[str, Any],
+    **kwargs,
+) -> Optional[_UnexpectedRowsSample]:
+    """Mirrors "_sqlalchemy_map_condition_index()" (only column map metrics; others are resolved individually)."""  # noqa: E501
+    unexpected_condition, compute_domain_kwargs, accessor_domain_kwargs = metrics[
+        "unexpected_condition"
+    ]
+
+    result_format: dict = metric_value_kwargs["result_format"]
+    if "unexpected_index_column_names" not in result_format or set(accessor_domain_kwargs) != {
+        "column"
+    }:
+        return None
+
+    unexpected_index_column_names: List[str] = result_format["unexpected_index_column_names"]
+    all_table_columns: List[str] = metrics.get("table.columns", [])
+    if any(column_name not in all_table_columns for column_name in unexpected_index_column_names):
+        # Leave reporting of misconfigured index columns to "_sqlalchemy_map_condition_index()".
+        return None
+
+    domain_column_name_list: List[Union[str, sqlalchemy.quoted_name]] = [
+        accessor_domain_kwargs["column"]
+    ]
+    exclude_unexpected_values: bool = result_format.get("exclude_unexpected_values", False)
+
+    return _UnexpectedRowsSample(
+        unexpected_condition=unexpected_condition,
+        compute_domain_kwargs=compute_domain_kwargs,
+        column_names=[*unexpected_index_column_names, *domain_column_name_list],
+        index_column_names=list(unexpected_index_column_names),
+        limit=result_format["partial_unexpected_count"],
+        build_metric_value=lambda rows: _get_sqlalchemy_customized_unexpected_index_list(
+            exclude_unexpected_values=exclude_unexpected_values,
+            unexpected_index_column_names=unexpected_index_column_names,
+            query_result=rows,  # type: ignore[arg-type] # tuples are indexed same as Row objects
+            domain_column_name_list=domain_column_name_list,
+        ),
+    )
+
+
+# Metric functions, whose queries can be fused, and builders of their samples.
+_SAMPLE_BUILDERS_BY_METRIC_FN: Dict[Callable, Callable[..., Optional[_UnexpectedRowsSample]]] = {
+    _sqlalchemy_column_map_condition_values: _sqlalchemy_column_map_condition_values_sample,
+    _sqlalchemy_map_condition_index: _sqlalchemy_map_condition_index_sample,
+}
+
+
+def _sqlalchemy_resolve_fused_unexpected_rows_samples(  # noqa: C901
+    execution_engine: SqlAlchemyExecutionEngine,
+    metric_computation_configurations: Sequence[MetricComputationConfiguration],
+) -> Dict[Tuple[str, str, str], MetricValue]:
+    """Resolves every fusable metric, whose compute Domain is shared by at least one other fusable metric.
+
+    Metrics, which are not fusable (or whose fused query is rejected by database, e.g., because dialect does not support
+    window functions), are absent from return value; their individual metric functions are expected to be invoked
+    instead (and to report errors, if any, in usual manner).  Other errors are raised as "MetricResolutionError" of
+    fused metrics.
+
+    Args:
+        execution_engine: SqlAlchemyExecutionEngine, on which to execute fused queries
+        metric_computation_configurations: directly-computable "MetricComputationConfiguration" objects
+
+    Returns:
+        Dictionary of resolved metric values, keyed by "MetricConfiguration" ID.
+    """  # noqa: E501
+    samples_by_domain_id: Dict[
+        Tuple[str, str, str], List[Tuple[Tuple[str, str, str], _UnexpectedRowsSample]]
+    ] = {}
+    metric_configurations_by_id: Dict[Tuple[str, str, str], MetricConfiguration] = {}
+
+    metric_computation_configuration: MetricComputationConfiguration
+    for metric_computation_configuration in metric_computation_configurations:
+        sample_builder: Optional[Callable[..., Optional[_UnexpectedRowsSample]]] = (
+            _SAMPLE_BUILDERS_BY_METRIC_FN.get(metric_computation_configuration.metric_fn)  # type: ignore[arg-type]
+        )
+        metric_provider_kwargs: dict = metric_computation_configuration.metric_provider_kwargs
+        if sample_builder is None or _is_sqlalchemy_metric_selectable(
+            map_metric_provider=metric_provider_kwargs["cls"]
+        ):
+            continue
+
+        try:
+            sample: Optional[_UnexpectedRowsSample] = sample_builder(**metric_provider_kwargs)
+            if sample is None:
+                continue
+
+            # Missing "batch_id" denotes active Batch; otherwise, same Domain would not be shared.
+            domain_kwargs: dict = dict(sample.compute_domain_kwargs)
+            if domain_kwargs.get("batch_id") is None:
+                domain_kwargs["batch_id"] = execution_engine.batch_manager.active_batch_id
+
+            domain_id: Tuple[str, str, str] = IDDict(domain_kwargs).to_id()
+        except Exception as e:
+            logger.debug(
+                f"Metric {metric_computation_configuration.metric_configuration.id} is not fused: {e!r}"  # noqa: E501
+            )
+            continue
+
+        metric_configuration: MetricConfiguration = (
+            metric_computation_configuration.metric_configuration
+        )
+        metric_configurations_by_id[metric_configuration.id] = metric_configuration
+        samples_by_domain_id.setdefault(domain_id, []).append((metric_configuration.id, sample))
+
+    resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    samples: List[Tuple[Tuple[str, str, str], _UnexpectedRowsSample]]
+    for samples in samples_by_domain_id.values():
+        if len(samples) < 2:  # noqa: PLR2004
+            continue
+
+        try:
+            resolved_metrics.update(
+                _sqlalchemy_fetch_unexpected_rows_samples(
+                    execution_engine=execution_engine, samples=samples
+                )
+            )
+        except sqlalchemy.SQLAlchemyError as e:
+            logger.info(
+                f'Fused unexpected rows query is not available ({type(e).__name__}: "{e!s}"); computing {len(samples)} metrics individually instead.'  # noqa: E501
+            )
+        except Exception as e:
+            raise gx_exceptions.MetricResolutionError(
+                message=str(e),
+                failed_metrics=[metric_configurations_by_id[metric_id] for metric_id, _ in samples],
+            ) from e
+
+    return resolved_metrics
+
+
+def _sqlalchemy_fetch_unexpected_rows_samples(
+    execution_engine: SqlAlchemyExecutionEngine,
+    samples: List[Tuple[Tuple[str, str, str], _UnexpectedRowsSample]],
+) -> Dict[Tuple[str, str, str], MetricValue]:
+    """Fetches all samples of single compute Domain in one scan and fans rows out to metrics."""
+    selectable = get_sqlalchemy_selectable(
+        execution_engine.get_domain_records(domain_kwargs=samples[0][1].compute_domain_kwargs)
+    )
+
+    column_names: List[Union[str, sqlalchemy.quoted_name]] = []
+    sample: _UnexpectedRowsSample
+    for _, sample in samples:
+        column_names.extend(
+            column_name for column_name in sample.column_names if column_name not in column_names
+        )
+
+    # Without ordering, running counts (and thus sampled rows) would be nondeterministic; moreover,
+    # some dialects (e.g., MSSQL) reject "ROWS" window frames without "ORDER BY".
+    order_by_column_names: List[Union[str, sqlalchemy.quoted_name]] = []
+    for _, sample in samples:
+        order_by_column_names.extend(
+            column_name
+            for column_name in sample.index_column_names
+            if column_name not in order_by_column_names
+        )
+
+    order_by_column_names.extend(
+        column_name for column_name in column_names if column_name not in order_by_column_names
+    )
+
+    flags: List[Any] = [sa.case((sample.unexpected_condition, 1), else_=0) for _, sample in samples]
+    ranked_rows = (
+        sa.select(
+            *[sa.column(column_name) for column_name in column_names],  # type: ignore[arg-type]
+            *[flag.label(f"gx_unexpected_{idx}") for idx, flag in enumerate(flags)],
+            *[
+                sa.func.sum(flag)
+                .over(
+                    order_by=[
+                        sa.column(column_name)  # type: ignore[arg-type]
+                        for column_name in order_by_column_names
+                    ],
+                    rows=(None, 0),
+                )
+                .label(f"gx_unexpected_rank_{idx}")
+                for idx, flag in enumerate(flags)
+            ],
+        )
+        .select_from(selectable)  # type: ignore[arg-type]
+        .where(sa.or_(*[sample.unexpected_condition for _, sample in samples]))
+        .subquery()
+    )
+    query = (
+        sa.select(ranked_rows)
+        .where(
+            sa.or_(
+                *[
+                    sa.and_(
+                        ranked_rows.c[f"gx_unexpected_{idx}"] == 1,
+                        ranked_rows.c[f"gx_unexpected_rank_{idx}"] <= sample.limit,
+                    )
+                    for idx, (_, sample) in enumerate(samples)
+                ]
+            )
+        )
+        .order_by(*[ranked_rows.c[column_name] for column_name in order_by_column_names])
+    )
+
+    rows: List[Tuple] = [tuple(row) for row in execution_engine.execute_query(query).fetchall()]
+
+    num_columns: int = len(column_names)
+    resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    metric_id: Tuple[str, str, str]
+    for idx, (metric_id, sample) in enumerate(samples):
+        positions: List[int] = [
+            column_names.index(column_name) for column_name in sample.column_names
+        ]
+        sampled_rows: List[Tuple] = [
+            tuple(row[position] for position in positions)
+            for row in rows
+            if row[num_columns + idx] == 1 and row[num_columns + len(samples) + idx] <= sample.limit
+        ]
+        resolved_metrics[metric_id] = sample.build_metric_value(sampled_rows)
+
+    return resolved_metrics
@@ -1,5 +1,18 @@
-from .compound_columns_unique import CompoundColumnsUnique
-from .multicolumn_sum_equal import MulticolumnSumEqual
-from .select_column_values_unique_within_record import (
-    SelectColumnValuesUniqueWithinRecord,
-)
+from typing import TYPE_CHECKING
+
+from great_expectations.expectations.registry import get_lazy_export, list_lazy_exports
+
+if TYPE_CHECKING:
+    from .compound_columns_unique import CompoundColumnsUnique
+    from .multicolumn_sum_equal import MulticolumnSumEqual
+    from .select_column_values_unique_within_record import (
+        SelectColumnValuesUniqueWithinRecord,
+    )
+
+
+def __getattr__(name: str):
+    return get_lazy_export(package_name=__name__, name=name)
+
+
+def __dir__():
+    return sorted({*globals(), *list_lazy_exports(__name__)})
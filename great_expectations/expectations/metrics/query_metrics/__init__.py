@@ -1,8 +1,21 @@
-from .query_column import QueryColumn
-from .query_column_pair import QueryColumnPair
-from .query_multiple_columns import QueryMultipleColumns
-from .query_row_count import QueryRowCount
-from .query_table import QueryTable
-from .query_template_values import QueryTemplateValues
-from .unexpected_rows_query_row_count import UnexpectedRowsQueryRowCount
-from .unexpected_rows_query_table import UnexpectedRowsQueryTable
+from typing import TYPE_CHECKING
+
+from great_expectations.expectations.registry import get_lazy_export, list_lazy_exports
+
+if TYPE_CHECKING:
+    from .query_column import QueryColumn
+    from .query_column_pair import QueryColumnPair
+    from .query_multiple_columns import QueryMultipleColumns
+    from .query_row_count import QueryRowCount
+    from .query_table import QueryTable
+    from .query_template_values import QueryTemplateValues
+    from .unexpected_rows_query_row_count import UnexpectedRowsQueryRowCount
+    from .unexpected_rows_query_table import UnexpectedRowsQueryTable
+
+
+def __getattr__(name: str):
+    return get_lazy_export(package_name=__name__, name=name)
+
+
+def __dir__():
+    return sorted({*globals(), *list_lazy_exports(__name__)})
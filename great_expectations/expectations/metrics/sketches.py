@@ -0,0 +1,408 @@
+"""Mergeable, serializable sketches, which summarize column values in single streaming pass.
+
+Sketches are computed per Batch (possibly per chunk or per partition of Batch) and merged afterwards; their JSON
+representations can be persisted (e.g., by multi-Batch profiling runs) and merged later, without rescanning data.
+"""  # noqa: E501
+
+from __future__ import annotations
+
+import datetime
+import math
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Empirical constants, relating KLL parameter "k" to normalized rank error (as published by Apache DataSketches).  # noqa: E501
+_KLL_RANK_ERROR_NUMERATOR: float = 2.296
+_KLL_RANK_ERROR_EXPONENT: float = 0.9723
+
+_KLL_CAPACITY_DECAY: float = 2.0 / 3.0
+_KLL_MIN_CAPACITY: int = 2
+_KLL_MIN_K: int = 8
+
+DEFAULT_QUANTILE_SKETCH_RELATIVE_ERROR: float = 1.0e-2
+
+_NUMERIC_VALUE_TYPE: str = "numeric"
+_DATETIME_VALUE_TYPE: str = "datetime"
+
+# Number of values, which are added to sketch at once, when streaming large columns.
+QUANTILE_SKETCH_CHUNK_SIZE: int = 1_000_000
+
+# Standard error of HyperLogLog estimate is approximately "1.04 / sqrt(m)" for "m" registers.
+_HLL_STANDARD_ERROR_NUMERATOR: float = 1.04
+_HLL_HASH_BITS: int = 64
+_HLL_MIN_PRECISION: int = 4
+_HLL_MAX_PRECISION: int = 18
+
+DEFAULT_DISTINCT_COUNT_SKETCH_RELATIVE_ERROR: float = 1.0e-2
+
+
+def validate_relative_error(relative_error: float) -> float:
+    if not isinstance(relative_error, (int, float)) or not 0.0 < relative_error < 1.0:
+        raise ValueError(  # noqa: TRY003
+            f'Relative error of approximate metrics must be between 0 and 1 (exclusive); got "{relative_error}".'  # noqa: E501
+        )
+
+    return float(relative_error)
+
+
+def _to_sketch_values(values: Iterable[Any]) -> Tuple[np.ndarray, str, Optional[str]]:
+    """Converts values to floats (date/time values to microseconds since epoch), dropping missing values.
+
+    Returns converted values, their type ("numeric" or "datetime"), and time zone of date/time values (if any).
+    """  # noqa: E501
+    array: np.ndarray = np.asarray(
+        values if isinstance(values, np.ndarray) else list(values)
+    ).ravel()
+    if array.dtype.kind != "M" and not (
+        array.dtype == object
+        and any(isinstance(value, (datetime.date, np.datetime64)) for value in array)
+    ):
+        array = array.astype(float)
+        return array[~np.isnan(array)], _NUMERIC_VALUE_TYPE, None
+
+    datetimes: pd.Series = pd.to_datetime(pd.Series(array)).dropna()
+    tz: Optional[str] = None
+    if datetimes.dt.tz is not None:
+        tz = str(datetimes.dt.tz)
+        datetimes = datetimes.dt.tz_convert(None)
+
+    return (
+        datetimes.to_numpy(dtype="datetime64[us]").astype(np.int64).astype(float),
+        _DATETIME_VALUE_TYPE,
+        tz,
+    )
+
+
+class KllQuantileSketch:
+    """KLL quantile sketch of numeric (or date/time) values.
+
+    Sketch retains O(k) values (weighted by powers of two) and answers quantile queries with normalized rank error of
+    approximately "2.296 / k ** 0.9723" (e.g., 1% for "k" of 250).  Sketches of disjoint data can be merged, yielding
+    sketch of their union with same error guarantee.  Date/time values are summarized as microseconds since epoch (in
+    UTC) and quantiles of them are returned as "pd.Timestamp" objects (in time zone of summarized values, if any).
+
+    Args:
+        k: Accuracy parameter (larger values yield smaller error at expense of memory).
+        seed: Seed of random choices made during compaction (fixed by default, so that results are reproducible).
+    """  # noqa: E501
+
+    def __init__(self, k: int = 200, seed: Optional[int] = 0) -> None:
+        if k < _KLL_MIN_K:
+            raise ValueError(f'Parameter "k" of KllQuantileSketch must be at least {_KLL_MIN_K}.')  # noqa: TRY003
+
+        self._k = k
+        self._rng = np.random.default_rng(seed)
+        self._compactors: List[np.ndarray] = [np.empty(0)]
+        self._count: int = 0
+        self._min: Optional[float] = None
+        self._max: Optional[float] = None
+        self._value_type: Optional[str] = None
+        self._tz: Optional[str] = None
+
+    @classmethod
+    def from_relative_error(
+        cls, relative_error: float = DEFAULT_QUANTILE_SKETCH_RELATIVE_ERROR, seed: Optional[int] = 0
+    ) -> KllQuantileSketch:
+        """Creates sketch, whose normalized rank error does not exceed "relative_error" (between 0 and 1)."""  # noqa: E501
+        validate_relative_error(relative_error=relative_error)
+        k: int = math.ceil(
+            (_KLL_RANK_ERROR_NUMERATOR / relative_error) ** (1.0 / _KLL_RANK_ERROR_EXPONENT)
+        )
+        return cls(k=max(k, _KLL_MIN_K), seed=seed)
+
+    @property
+    def k(self) -> int:
+        return self._k
+
+    @property
+    def count(self) -> int:
+        """Number of (non-null) values, summarized by sketch."""
+        return self._count
+
+    @property
+    def relative_error(self) -> float:
+        """Approximate normalized rank error of quantiles, estimated by sketch."""
+        return _KLL_RANK_ERROR_NUMERATOR / self._k**_KLL_RANK_ERROR_EXPONENT
+
+    @property
+    def num_retained(self) -> int:
+        return sum(compactor.size for compactor in self._compactors)
+
+    def update(self, values: Iterable[Any]) -> None:
+        """Adds numeric or date/time values (None, NaN, and NaT values are ignored) to sketch."""
+        array: np.ndarray
+        value_type: str
+        tz: Optional[str]
+        array, value_type, tz = _to_sketch_values(values=values)
+        if array.size == 0:
+            return
+
+        self._set_value_type(value_type=value_type, tz=tz)
+        self._count += int(array.size)
+        self._update_min_max(minimum=float(array.min()), maximum=float(array.max()))
+
+        self._compactors[0] = np.concatenate((self._compactors[0], array))
+        self._compress()
+
+    def merge(self, other: KllQuantileSketch) -> None:
+        """Merges "other" sketch into this one (result is as accurate as less accurate sketch)."""
+        if other.count == 0:
+            return
+
+        self._set_value_type(value_type=other._value_type, tz=other._tz)  # type: ignore[arg-type]
+        self._k = min(self._k, other.k)
+        self._count += other.count
+        self._update_min_max(minimum=other._min, maximum=other._max)  # type: ignore[arg-type]
+
+        while len(self._compactors) < len(other._compactors):
+            self._compactors.append(np.empty(0))
+
+        level: int
+        compactor: np.ndarray
+        for level, compactor in enumerate(other._compactors):
+            self._compactors[level] = np.concatenate((self._compactors[level], compactor))
+
+        self._compress()
+
+    def quantiles(self, quantiles: Sequence[float]) -> List[Optional[Any]]:
+        """Returns estimated values at specified quantiles (None for every quantile, if sketch is empty)."""  # noqa: E501
+        if self._count == 0:
+            return [None for _ in quantiles]
+
+        values: np.ndarray = np.concatenate(self._compactors)
+        weights: np.ndarray = np.concatenate(
+            [
+                np.full(compactor.size, 2**level, dtype=np.int64)
+                for level, compactor in enumerate(self._compactors)
+            ]
+        )
+        order: np.ndarray = np.argsort(values, kind="stable")
+        values = values[order]
+        cumulative_weights: np.ndarray = np.cumsum(weights[order])
+        total_weight: int = int(cumulative_weights[-1])
+
+        result: List[Optional[Any]] = []
+        quantile: float
+        for quantile in quantiles:
+            if quantile <= 0.0:
+                result.append(self._from_sketch_value(self._min))  # type: ignore[arg-type]
+            elif quantile >= 1.0:
+                result.append(self._from_sketch_value(self._max))  # type: ignore[arg-type]
+            else:
+                idx: int = int(
+                    np.searchsorted(cumulative_weights, quantile * total_weight, side="left")
+                )
+                result.append(self._from_sketch_value(float(values[min(idx, values.size - 1)])))
+
+        return result
+
+    def to_json_dict(self) -> Dict[str, Any]:
+        return {
+            "k": self._k,
+            "count": self._count,
+            "min": self._min,
+            "max": self._max,
+            "compactors": [compactor.tolist() for compactor in self._compactors],
+            "value_type": self._value_type,
+            "tz": self._tz,
+        }
+
+    @classmethod
+    def from_json_dict(
+        cls, sketch_dict: Dict[str, Any], seed: Optional[int] = 0
+    ) -> KllQuantileSketch:
+        sketch = cls(k=sketch_dict["k"], seed=seed)
+        sketch._count = sketch_dict["count"]
+        sketch._min = sketch_dict["min"]
+        sketch._max = sketch_dict["max"]
+        sketch._value_type = sketch_dict.get("value_type")
+        sketch._tz = sketch_dict.get("tz")
+        sketch._compactors = [
+            np.asarray(compactor, dtype=float) for compactor in sketch_dict["compactors"]
+        ] or [np.empty(0)]
+        return sketch
+
+    @classmethod
+    def merge_all(cls, sketches: Iterable[KllQuantileSketch]) -> KllQuantileSketch:
+        """Returns new sketch, summarizing values of all "sketches" (e.g., of all Batches)."""
+        sketches = list(sketches)
+        if not sketches:
+            return cls()
+
+        merged: KllQuantileSketch = cls(k=min(sketch.k for sketch in sketches))
+        sketch: KllQuantileSketch
+        for sketch in sketches:
+            merged.merge(sketch)
+
+        return merged
+
+    def _set_value_type(self, value_type: str, tz: Optional[str]) -> None:
+        if self._value_type is None:
+            self._value_type = value_type
+            self._tz = tz
+        elif self._value_type != value_type:
+            raise ValueError(  # noqa: TRY003
+                f"KllQuantileSketch of {self._value_type} values cannot summarize {value_type} values."  # noqa: E501
+            )
+
+    def _from_sketch_value(self, value: float) -> Any:
+        if self._value_type != _DATETIME_VALUE_TYPE:
+            return value
+
+        timestamp = pd.Timestamp(int(value), unit="us")
+        return timestamp if self._tz is None else timestamp.tz_localize("UTC").tz_convert(self._tz)
+
+    def _update_min_max(self, minimum: float, maximum: float) -> None:
+        self._min = minimum if self._min is None else min(self._min, minimum)
+        self._max = maximum if self._max is None else max(self._max, maximum)
+
+    def _capacity(self, level: int) -> int:
+        height: int = len(self._compactors)
+        return max(
+            _KLL_MIN_CAPACITY, math.ceil(self._k * _KLL_CAPACITY_DECAY ** (height - level - 1))
+        )
+
+    def _compress(self) -> None:
+        # Compacting level promotes (randomly) either odd or even half of its sorted values to next level, doubling their weight.  # noqa: E501
+        level: int = 0
+        while level < len(self._compactors):
+            compactor: np.ndarray = self._compactors[level]
+            if compactor.size > self._capacity(level):
+                if level + 1 == len(self._compactors):
+                    self._compactors.append(np.empty(0))
+
+                compactor = np.sort(compactor, kind="stable")
+                retained: np.ndarray = compactor[compactor.size - compactor.size % 2 :]
+                compactor = compactor[: compactor.size - compactor.size % 2]
+                offset: int = int(self._rng.integers(2))
+                self._compactors[level + 1] = np.concatenate(
+                    (self._compactors[level + 1], compactor[offset::2])
+                )
+                self._compactors[level] = retained
+
+            level += 1
+
+
+class HyperLogLogSketch:
+    """HyperLogLog sketch, estimating number of distinct (non-null) values.
+
+    Sketch retains "2 ** precision" registers (one byte each, e.g., 16 KiB for precision of 14) and estimates number of
+    distinct values with relative standard error of approximately "1.04 / sqrt(2 ** precision)".  Values are hashed by
+    "pd.util.hash_pandas_object()", which is deterministic across processes, so that sketches of Batches with values of
+    same dtype can be merged.
+
+    Args:
+        precision: Number of hash bits, which select register (between 4 and 18).
+    """  # noqa: E501
+
+    def __init__(self, precision: int = 14) -> None:
+        if not _HLL_MIN_PRECISION <= precision <= _HLL_MAX_PRECISION:
+            raise ValueError(  # noqa: TRY003
+                f'Parameter "precision" of HyperLogLogSketch must be between {_HLL_MIN_PRECISION} and {_HLL_MAX_PRECISION}.'  # noqa: E501
+            )
+
+        self._precision = precision
+        self._registers: np.ndarray = np.zeros(2**precision, dtype=np.uint8)
+
+    @classmethod
+    def from_relative_error(
+        cls, relative_error: float = DEFAULT_DISTINCT_COUNT_SKETCH_RELATIVE_ERROR
+    ) -> HyperLogLogSketch:
+        """Creates sketch, whose relative standard error does not exceed "relative_error" (between 0 and 1)."""  # noqa: E501
+        validate_relative_error(relative_error=relative_error)
+        precision: int = math.ceil(math.log2((_HLL_STANDARD_ERROR_NUMERATOR / relative_error) ** 2))
+        return cls(precision=min(max(precision, _HLL_MIN_PRECISION), _HLL_MAX_PRECISION))
+
+    @property
+    def precision(self) -> int:
+        return self._precision
+
+    @property
+    def relative_error(self) -> float:
+        """Relative standard error of estimated number of distinct values."""
+        return _HLL_STANDARD_ERROR_NUMERATOR / math.sqrt(self._registers.size)
+
+    def update(self, values: Iterable[Any]) -> None:
+        """Adds values (None and NaN values are ignored) to sketch."""
+        series: pd.Series = values if isinstance(values, pd.Series) else pd.Series(list(values))
+        series = series.dropna()
+        if series.empty:
+            return
+
+        hashes: np.ndarray = pd.util.hash_pandas_object(series, index=False).to_numpy(
+            dtype=np.uint64
+        )
+        # Leading "precision" bits select register; register keeps maximal rank (position of leftmost 1-bit) of remaining bits.  # noqa: E501
+        indexes: np.ndarray = (hashes >> np.uint64(_HLL_HASH_BITS - self._precision)).astype(
+            np.intp
+        )
+        remaining_bits: np.ndarray = hashes << np.uint64(self._precision)
+        ranks: np.ndarray = np.minimum(
+            _HLL_HASH_BITS - _bit_length(remaining_bits) + 1,
+            _HLL_HASH_BITS - self._precision + 1,
+        ).astype(np.uint8)
+        np.maximum.at(self._registers, indexes, ranks)
+
+    def merge(self, other: HyperLogLogSketch) -> None:
+        """Merges "other" sketch (of same precision) into this one."""
+        if other.precision != self._precision:
+            raise ValueError(  # noqa: TRY003
+                f"Cannot merge HyperLogLogSketch of precision {other.precision} into sketch of precision {self._precision}."  # noqa: E501
+            )
+
+        np.maximum(self._registers, other._registers, out=self._registers)
+
+    def estimate(self) -> int:
+        """Returns estimated number of distinct values (exact, if sketch is empty)."""
+        num_registers: int = self._registers.size
+        num_empty_registers: int = int(np.count_nonzero(self._registers == 0))
+        if num_empty_registers == num_registers:
+            return 0
+
+        alpha: float = 0.7213 / (1.0 + 1.079 / num_registers)
+        raw_estimate: float = (
+            alpha * num_registers**2 / float(np.sum(np.exp2(-self._registers.astype(float))))
+        )
+        if raw_estimate <= 2.5 * num_registers and num_empty_registers > 0:
+            # Linear counting is more accurate for small cardinalities.
+            return round(num_registers * math.log(num_registers / num_empty_registers))
+
+        return round(raw_estimate)
+
+    def to_json_dict(self) -> Dict[str, Any]:
+        return {
+            "precision": self._precision,
+            "registers": self._registers.tolist(),
+        }
+
+    @classmethod
+    def from_json_dict(cls, sketch_dict: Dict[str, Any]) -> HyperLogLogSketch:
+        sketch = cls(precision=sketch_dict["precision"])
+        sketch._registers = np.asarray(sketch_dict["registers"], dtype=np.uint8)
+        return sketch
+
+    @classmethod
+    def merge_all(cls, sketches: Iterable[HyperLogLogSketch]) -> HyperLogLogSketch:
+        """Returns new sketch, summarizing values of all "sketches" (e.g., of all Batches)."""
+        sketches = list(sketches)
+        if not sketches:
+            return cls()
+
+        merged: HyperLogLogSketch = cls(precision=sketches[0].precision)
+        sketch: HyperLogLogSketch
+        for sketch in sketches:
+            merged.merge(sketch)
+
+        return merged
+
+
+def _bit_length(values: np.ndarray) -> np.ndarray:
+    """Returns number of significant bits of every unsigned 64-bit integer."""
+    exponents: np.ndarray = np.minimum(np.frexp(values.astype(np.float64))[1], _HLL_HASH_BITS)
+    # Conversion to float rounds values above 2 ** 53, possibly up to next power of two.
+    is_overestimated: np.ndarray = (exponents > 0) & (
+        values < np.left_shift(np.uint64(1), np.maximum(exponents - 1, 0).astype(np.uint64))
+    )
+    return exponents - is_overestimated
@@ -1,5 +1,18 @@
-from .table_column_count import TableColumnCount
-from .table_column_types import ColumnTypes
-from .table_columns import TableColumns
-from .table_head import TableHead
-from .table_row_count import TableRowCount
+from typing import TYPE_CHECKING
+
+from great_expectations.expectations.registry import get_lazy_export, list_lazy_exports
+
+if TYPE_CHECKING:
+    from .table_column_count import TableColumnCount
+    from .table_column_types import ColumnTypes
+    from .table_columns import TableColumns
+    from .table_head import TableHead
+    from .table_row_count import TableRowCount
+
+
+def __getattr__(name: str):
+    return get_lazy_export(package_name=__name__, name=name)
+
+
+def __dir__():
+    return sorted({*globals(), *list_lazy_exports(__name__)})
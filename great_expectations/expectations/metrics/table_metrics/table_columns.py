@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.execution_engine import (
@@ -33,6 +33,10 @@ class TableColumns(TableMetricProvider):
         metrics: Dict[str, Any],
         runtime_configuration: dict,
     ):
+        source_columns = _get_source_columns(execution_engine, metric_domain_kwargs)
+        if source_columns is not None:
+            return source_columns
+
         column_metadata = metrics["table.column_types"]
         return [col["name"] for col in column_metadata]
 
@@ -57,6 +61,10 @@ class TableColumns(TableMetricProvider):
         metrics: Dict[str, Any],
         runtime_configuration: dict,
     ):
+        source_columns = _get_source_columns(execution_engine, metric_domain_kwargs)
+        if source_columns is not None:
+            return source_columns
+
         column_metadata = metrics["table.column_types"]
         return [col["name"] for col in column_metadata]
 
@@ -87,3 +95,15 @@ class TableColumns(TableMetricProvider):
             metric_value_kwargs=metric.metric_value_kwargs or metric_value_kwargs,
         )
         return dependencies
+
+
+def _get_source_columns(
+    execution_engine: PandasExecutionEngine | SparkDFExecutionEngine, metric_domain_kwargs: dict
+) -> Optional[List[str]]:
+    """Columns of the source of a batch, of which only some columns were loaded (see projection)."""
+    batch_id: Optional[str] = (
+        metric_domain_kwargs.get("batch_id") or execution_engine.batch_manager.active_batch_data_id
+    )
+    batch_data = execution_engine.batch_manager.batch_data_cache.get(batch_id)  # type: ignore[arg-type]
+    source_columns: Optional[List[str]] = getattr(batch_data, "source_columns", None)
+    return list(source_columns) if source_columns is not None else None
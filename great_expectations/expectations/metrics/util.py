@@ -412,52 +412,31 @@ def get_sqlalchemy_column_metadata(
     schema_name: Optional[str] = None,
 ) -> Sequence[Mapping[str, Any]] | None:
     try:
-        columns: Sequence[Dict[str, Any]]
+        columns: Sequence[Mapping[str, Any]] | None
 
-        engine = execution_engine.engine
-        inspector = execution_engine.get_inspector()
-        try:
-            # if a custom query was passed
-            if sqlalchemy.TextClause and isinstance(table_selectable, sqlalchemy.TextClause):  # type: ignore[truthy-function]
-                if hasattr(table_selectable, "selected_columns"):
-                    # New in version 1.4.
-                    columns = table_selectable.selected_columns.columns
-                else:
-                    # Implicit subquery for columns().column was deprecated in SQLAlchemy 1.4
-                    # We must explicitly create a subquery
-                    columns = table_selectable.columns().subquery().columns
-            else:
-                # TODO: remove cast to a string once [this](https://github.com/snowflakedb/snowflake-sqlalchemy/issues/157) issue is resovled  # noqa: E501
-                table_name = str(table_selectable)
-                if execution_engine.dialect_name == GXSqlDialect.SNOWFLAKE:
-                    table_name = table_name.lower()
-                columns = inspector.get_columns(  # type: ignore[assignment]
-                    table_name=table_name,
-                    schema=schema_name,
-                )
-        except (
-            KeyError,
-            AttributeError,
-            sa.exc.NoSuchTableError,
-            sa.exc.ProgrammingError,
-        ) as exc:
-            logger.debug(f"{type(exc).__name__} while introspecting columns", exc_info=exc)
-            logger.info(f"While introspecting columns {exc!r}; attempting reflection fallback")
-            # we will get a KeyError for temporary tables, since
-            # reflection will not find the temporary schema
-            columns = column_reflection_fallback(
-                selectable=table_selectable,
-                dialect=engine.dialect,
-                sqlalchemy_engine=engine,
+        schema_metadata_cache = execution_engine.schema_metadata_cache
+        # Columns of custom queries are known without reflection, so only tables are cached.
+        if schema_metadata_cache is None or (
+            sqlalchemy.TextClause and isinstance(table_selectable, sqlalchemy.TextClause)  # type: ignore[truthy-function]
+        ):
+            columns = _reflect_sqlalchemy_column_metadata(
+                execution_engine=execution_engine,
+                table_selectable=table_selectable,
+                schema_name=schema_name,
             )
-
-        # Use fallback because for mssql and trino reflection mechanisms do not throw an error but return an empty list  # noqa: E501
-        if len(columns) == 0:
-            columns = column_reflection_fallback(
-                selectable=table_selectable,
-                dialect=engine.dialect,
-                sqlalchemy_engine=engine,
+        else:
+            columns = schema_metadata_cache.get_columns(
+                execution_engine=execution_engine,
+                table_name=_get_reflected_table_name(execution_engine, table_selectable),
+                schema_name=schema_name,
+                reflect=lambda: _reflect_sqlalchemy_column_metadata(
+                    execution_engine=execution_engine,
+                    table_selectable=table_selectable,
+                    schema_name=schema_name,
+                ),
             )
+            if columns is None:
+                return None
 
         dialect_name = execution_engine.dialect.name
         if dialect_name == GXSqlDialect.SNOWFLAKE:
@@ -473,6 +452,68 @@ def get_sqlalchemy_column_metadata(
         return None
 
 
+def _get_reflected_table_name(
+    execution_engine: SqlAlchemyExecutionEngine, table_selectable: sqlalchemy.Select
+) -> str:
+    # TODO: remove cast to a string once [this](https://github.com/snowflakedb/snowflake-sqlalchemy/issues/157) issue is resovled  # noqa: E501
+    table_name = str(table_selectable)
+    if execution_engine.dialect_name == GXSqlDialect.SNOWFLAKE:
+        table_name = table_name.lower()
+
+    return table_name
+
+
+def _reflect_sqlalchemy_column_metadata(
+    execution_engine: SqlAlchemyExecutionEngine,
+    table_selectable: sqlalchemy.Select,
+    schema_name: Optional[str] = None,
+) -> Sequence[Mapping[str, Any]]:
+    columns: Sequence[Dict[str, Any]]
+
+    engine = execution_engine.engine
+    inspector = execution_engine.get_inspector()
+    try:
+        # if a custom query was passed
+        if sqlalchemy.TextClause and isinstance(table_selectable, sqlalchemy.TextClause):  # type: ignore[truthy-function]
+            if hasattr(table_selectable, "selected_columns"):
+                # New in version 1.4.
+                columns = table_selectable.selected_columns.columns
+            else:
+                # Implicit subquery for columns().column was deprecated in SQLAlchemy 1.4
+                # We must explicitly create a subquery
+                columns = table_selectable.columns().subquery().columns
+        else:
+            columns = inspector.get_columns(  # type: ignore[assignment]
+                table_name=_get_reflected_table_name(execution_engine, table_selectable),
+                schema=schema_name,
+            )
+    except (
+        KeyError,
+        AttributeError,
+        sa.exc.NoSuchTableError,
+        sa.exc.ProgrammingError,
+    ) as exc:
+        logger.debug(f"{type(exc).__name__} while introspecting columns", exc_info=exc)
+        logger.info(f"While introspecting columns {exc!r}; attempting reflection fallback")
+        # we will get a KeyError for temporary tables, since
+        # reflection will not find the temporary schema
+        columns = column_reflection_fallback(
+            selectable=table_selectable,
+            dialect=engine.dialect,
+            sqlalchemy_engine=engine,
+        )
+
+    # Use fallback because for mssql and trino reflection mechanisms do not throw an error but return an empty list  # noqa: E501
+    if len(columns) == 0:
+        columns = column_reflection_fallback(
+            selectable=table_selectable,
+            dialect=engine.dialect,
+            sqlalchemy_engine=engine,
+        )
+
+    return columns
+
+
 def column_reflection_fallback(  # noqa: C901, PLR0912, PLR0915
     selectable: sqlalchemy.Select,
     dialect: sqlalchemy.Dialect,
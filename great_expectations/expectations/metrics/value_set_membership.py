@@ -0,0 +1,162 @@
+"""Membership of column values in large value sets (e.g., of "column_values.in_set" metric).
+
+Value sets having more values than "ExecutionEngine.value_set_semi_join_threshold" are not inlined into every query as
+literal list; instead, they are semi-joined:
+
+- Pandas: values are looked up in pre-hashed "pd.Index", which is shared by all metrics matching same values.
+- SQL: values are loaded into value set table once (see "SqlAlchemyExecutionEngine.get_value_set_table()"), and are
+  matched by correlated "EXISTS" subquery.
+
+Spark is not affected: its optimizer already converts large "isin()" lists into hash set lookups ("InSet"), which are
+evaluated in JVM, whereas Python UDF (or join, which condition of map metric cannot express) would only be slower.
+
+Every helper returns None, whenever semi-join would not be equivalent to literal list (e.g., value set contains NULL, or
+types of values do not match column type); callers then fall back to literal list.
+"""  # noqa: E501
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Collection, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
+from great_expectations.execution_engine.sqlalchemy_scratch_table_manager import (
+    VALUE_SET_TABLE_COLUMN_NAME_PREFIX,
+)
+
+if TYPE_CHECKING:
+    from great_expectations.execution_engine import (
+        ExecutionEngine,
+        PandasExecutionEngine,
+        SqlAlchemyExecutionEngine,
+    )
+
+
+def is_large_value_set(
+    value_set: Optional[Collection], execution_engine: Optional[ExecutionEngine]
+) -> bool:
+    """Whether value set is to be semi-joined (rather than inlined as literal list)."""
+    return (
+        value_set is not None
+        and execution_engine is not None
+        and len(value_set) > execution_engine.value_set_semi_join_threshold
+    )
+
+
+def pandas_values_in_set(
+    column: pd.Series,
+    value_set: Collection,
+    execution_engine: Optional[PandasExecutionEngine],
+) -> pd.Series:
+    """Boolean mask of column values in value set (equivalent to "column.isin(value_set)").
+
+    Args:
+        column: Column values.
+        value_set: Values to match.
+        execution_engine: Execution engine, which holds pre-hashed value sets.
+
+    Returns:
+        Boolean Series, aligned with column.
+    """
+    if execution_engine is None or not is_large_value_set(value_set, execution_engine):
+        return column.isin(value_set)
+
+    index: pd.Index = execution_engine.get_value_set_index(value_set)
+    # Lookup by "get_indexer()" is only equivalent to "isin()" for same dtype (and without NaN).
+    if isinstance(index, pd.MultiIndex) or index.hasnans or index.dtype != column.dtype:
+        return column.isin(value_set)
+
+    return pd.Series(index.get_indexer(column) != -1, index=column.index)
+
+
+def sqlalchemy_values_in_set_condition(
+    columns: Sequence[sa.ColumnClause],
+    value_set: Collection,
+    execution_engine: Optional[SqlAlchemyExecutionEngine],
+    metrics: Optional[Dict[str, Any]] = None,
+) -> Optional[sa.ColumnElement]:
+    """ "EXISTS" condition, matching columns against rows of value set table (equivalent to "IN" list of value set).
+
+    Args:
+        columns: Columns to match (one per element of value set tuples, if more than one).
+        value_set: Values (or tuples of values, if more than one column) to match.
+        execution_engine: Execution engine, whose value set tables are used.
+        metrics: Resolved metric dependencies (of which "table.column_types" is used as types of value set table).
+
+    Returns:
+        Condition expression (None, if value set is not large, or literal list is to be used instead).
+    """  # noqa: E501
+    if execution_engine is None or not is_large_value_set(value_set, execution_engine):
+        return None
+
+    rows: List[Tuple[Any, ...]] = [
+        tuple(value) if len(columns) > 1 else (value,) for value in value_set
+    ]
+    if len(columns) == 1 and any(row[0] is None for row in rows):
+        # Comparisons with NULL of literal list are NULL (rather than false), unlike "EXISTS".
+        return None
+
+    # Rows containing NULL (which is not equal to anything) never match.
+    rows = [row for row in rows if all(value is not None for value in row)]
+    if len(rows) == 0:
+        return None
+
+    column_types: List[sa.types.TypeEngine] = []
+    for idx, column in enumerate(columns):
+        column_type: Optional[sa.types.TypeEngine] = _get_value_set_column_type(
+            column_name=column.name, values=[row[idx] for row in rows], metrics=metrics
+        )
+        if column_type is None:
+            return None
+
+        column_types.append(column_type)
+
+    table: Optional[sa.Table] = execution_engine.get_value_set_table(
+        rows=rows, column_types=column_types
+    )
+    if table is None:
+        return None
+
+    return sa.exists().where(
+        sa.and_(
+            *[
+                table.c[f"{VALUE_SET_TABLE_COLUMN_NAME_PREFIX}{idx}"] == column
+                for idx, column in enumerate(columns)
+            ]
+        )
+    )
+
+
+def _get_value_set_column_type(
+    column_name: str, values: Sequence[Any], metrics: Optional[Dict[str, Any]]
+) -> Optional[sa.types.TypeEngine]:
+    column_type: Optional[sa.types.TypeEngine] = None
+    column_info: Dict[str, Any]
+    for column_info in (metrics or {}).get("table.column_types") or []:
+        if column_info.get("name") == column_name:
+            column_type = column_info.get("type")
+            break
+
+    if column_type is None or isinstance(column_type, sa.types.NullType):
+        # Types of columns of (e.g., query) assets may be unknown; values determine them then.
+        column_type = sa.literal(values[0]).type
+        if isinstance(column_type, sa.types.NullType):
+            return None
+
+    try:
+        # Dialect-specific types (e.g., of enumerations) may require additional DDL.
+        column_type = column_type.as_generic()
+    except NotImplementedError:
+        return None
+
+    if isinstance(column_type, sa.String):
+        # Some dialects (e.g., MySQL) require length of "VARCHAR".
+        length: int = max(len(str(value)) for value in values)
+        return (
+            sa.Unicode(length=length)
+            if isinstance(column_type, sa.Unicode)
+            else sa.String(length=length)
+        )
+
+    return column_type
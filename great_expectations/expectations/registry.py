@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import importlib
 import logging
+import sys
 from typing import (
     TYPE_CHECKING,
+    Any,
     Callable,
     Dict,
     List,
@@ -15,6 +18,12 @@ from typing import (
 
 import great_expectations.exceptions as gx_exceptions
 from great_expectations.core.id_dict import IDDict
+from great_expectations.expectations.registry_manifest import (
+    EXPECTATION_MODULES,
+    METRIC_MODULES,
+    PACKAGE_EXPORTS,
+    RENDERER_MODULES,
+)
 
 if TYPE_CHECKING:
     from great_expectations.core.metric_function_types import (
@@ -66,6 +75,10 @@ def register_renderer(
 ):
     # noinspection PyUnresolvedReferences
     renderer_name = renderer_fn._renderer_type  # type: ignore[attr-defined]
+    if not _is_core_module(parent_class.__module__):
+        # Renderers of core object are registered first, so that they do not overwrite this one, when loaded later.  # noqa: E501
+        _load_core_renderers(object_name=object_name)
+
     if object_name not in _registered_renderers:
         logger.debug(f"Registering {renderer_name} for expectation_type {object_name}.")
         _registered_renderers[object_name] = {renderer_name: (parent_class, renderer_fn)}
@@ -106,6 +119,7 @@ def get_renderer_names(expectation_or_metric_type: str) -> List[str]:
     Returns:
         A list of renderer names for the Expectation or Metric.
     """  # noqa: E501
+    _load_core_renderers(object_name=expectation_or_metric_type)
     return list(_registered_renderers.get(expectation_or_metric_type, {}).keys())
 
 
@@ -132,10 +146,12 @@ def get_renderer_names_with_renderer_types(
 
 
 def get_renderer_impls(object_name: str) -> List[str]:
+    _load_core_renderers(object_name=object_name)
     return list(_registered_renderers.get(object_name, {}).values())
 
 
 def get_renderer_impl(object_name: str, renderer_type: str) -> Optional[RendererImpl]:
+    _load_core_renderers(object_name=object_name)
     renderer_tuple: Optional[tuple] = _registered_renderers.get(object_name, {}).get(renderer_type)
     renderer_impl: Optional[RendererImpl] = None
     if renderer_tuple:
@@ -145,6 +161,10 @@ def get_renderer_impl(object_name: str, renderer_type: str) -> Optional[Renderer
 
 def register_expectation(expectation: Type[Expectation]) -> None:
     expectation_type = expectation.expectation_type
+    if not _is_core_module(expectation.__module__):
+        # Core Expectation of same type is registered first, so that it does not overwrite this one, when loaded later.  # noqa: E501
+        _load_core_expectation(expectation_type=expectation_type)
+
     # TODO: add version to key
     if expectation_type in _registered_expectations:
         if _registered_expectations[expectation_type] == expectation:
@@ -162,17 +182,16 @@ def register_core_metrics() -> None:
     simply importing a given class will ensure that it is added to the Metric
     registry.
 
-    We use this to grab metrics by name within our workflows.
-
-    Without this function, we need to hope that core Metrics are imported somewhere
-    in our import graph - if not, our registry will be empty and we'll see
-    MetricResolutionErrors.
+    Core Metrics are otherwise registered when first looked up by name (see
+    "METRIC_MODULES"); we use this wherever the complete registry is needed,
+    e.g. when listing all registered renderers.
     """
     before_count = len(_registered_metrics)
 
-    # Implicitly calls MetaMetricProvider.__new__ as Metrics are loaded from metrics.__init__.py
-    # As __new__ calls upon register_metric this import builds our core registry
-    from great_expectations.expectations import metrics  # noqa: F401
+    # Implicitly calls MetaMetricProvider.__new__ as Metrics are loaded from their modules
+    # As __new__ calls upon register_metric these imports build our core registry
+    for module_name in sorted(set(METRIC_MODULES.values())):
+        importlib.import_module(module_name)
 
     after_count = len(_registered_metrics)
 
@@ -187,18 +206,16 @@ def register_core_expectations() -> None:
     simply importing a given class will ensure that it is added to the Expectation
     registry.
 
-    We use this JIT in the Validator to ensure that core Expectations are available
-    for usage when called upon.
-
-    Without this function, we need to hope that core Expectations are imported somewhere
-    in our import graph - if not, our registry will be empty and Validator workflows
-    will fail.
+    Core Expectations are otherwise registered when first looked up by type (see
+    "EXPECTATION_MODULES"); we use this wherever the complete registry is needed,
+    e.g. when listing all registered Expectation implementations.
     """
     before_count = len(_registered_expectations)
 
-    # Implicitly calls MetaExpectation.__new__ as Expectations are loaded from core.__init__.py
-    # As __new__ calls upon register_expectation, this import builds our core registry
-    from great_expectations.expectations import core  # noqa: F401
+    # Implicitly calls MetaExpectation.__new__ as Expectations are loaded from their modules
+    # As __new__ calls upon register_expectation, these imports build our core registry
+    for module_name in sorted(set(EXPECTATION_MODULES.values())):
+        importlib.import_module(module_name)
 
     after_count = len(_registered_expectations)
 
@@ -208,6 +225,74 @@ def register_core_expectations() -> None:
         logger.debug(f"Registered {after_count-before_count} core expectations")
 
 
+def _is_core_module(module_name: str) -> bool:
+    return module_name.split(".")[0] == "great_expectations"
+
+
+def _is_imported(module_name: str) -> bool:
+    """Whether the given module is imported completely.
+
+    A module, which another thread is still importing, is already in "sys.modules", but the
+    classes it registers may not be registered yet (importing it again waits for that thread).
+    """
+    module = sys.modules.get(module_name)
+    return module is not None and not getattr(
+        getattr(module, "__spec__", None), "_initializing", False
+    )
+
+
+def _load_core_expectation(expectation_type: str) -> None:
+    """Registers the given core Expectation by importing its module (see "EXPECTATION_MODULES")."""
+    module_name: Optional[str] = EXPECTATION_MODULES.get(expectation_type)
+    if module_name and not _is_imported(module_name):
+        importlib.import_module(module_name)
+
+
+def _load_core_metric(metric_name: str) -> None:
+    """Registers the given core Metric by importing the module of its provider (see "METRIC_MODULES")."""  # noqa: E501
+    module_name: Optional[str] = METRIC_MODULES.get(metric_name)
+    if module_name and not _is_imported(module_name):
+        importlib.import_module(module_name)
+
+
+def _load_core_renderers(object_name: str) -> None:
+    """Registers the renderers of the given core Expectation or Metric by importing their module (see "RENDERER_MODULES")."""  # noqa: E501
+    module_name: Optional[str] = RENDERER_MODULES.get(object_name)
+    if module_name and not _is_imported(module_name):
+        importlib.import_module(module_name)
+
+
+def get_lazy_export(package_name: str, name: str) -> Any:
+    """Imports a name exported by a lazily loaded package (i.e., its module "__getattr__").
+
+    Args:
+        package_name: The name of the lazily loaded package (see "PACKAGE_EXPORTS").
+        name: The name of the exported attribute or subpackage.
+
+    Returns:
+        The exported attribute or subpackage, which is also set on the package for later access.
+
+    Raises:
+        AttributeError: If the package does not export the given name.
+    """
+    module_name: Optional[str] = PACKAGE_EXPORTS.get(package_name, {}).get(name)
+    value: Any
+    if module_name:
+        value = getattr(importlib.import_module(module_name), name)
+    elif f"{package_name}.{name}" in PACKAGE_EXPORTS:
+        value = importlib.import_module(f"{package_name}.{name}")
+    else:
+        raise AttributeError(f"module {package_name!r} has no attribute {name!r}")  # noqa: TRY003
+
+    setattr(sys.modules[package_name], name, value)
+    return value
+
+
+def list_lazy_exports(package_name: str) -> List[str]:
+    """Lists the names exported by a lazily loaded package (i.e., its module "__all__")."""
+    return list(PACKAGE_EXPORTS.get(package_name, {}))
+
+
 def _add_response_key(res, key, value):
     if key in res:
         res[key].append(value)
@@ -242,6 +327,10 @@ def register_metric(  # noqa: PLR0913
     """  # noqa: E501
     res: dict = {}
     execution_engine_name = execution_engine.__name__
+    if not _is_core_module(metric_class.__module__):
+        # Core Metric of same name is registered first, so that it does not overwrite this one, when loaded later.  # noqa: E501
+        _load_core_metric(metric_name=metric_name)
+
     logger.debug(f"Registering metric: {metric_name}")
     if metric_provider is not None and metric_fn_type is not None:
         metric_provider.metric_fn_type = metric_fn_type  # type: ignore[attr-defined]
@@ -310,6 +399,7 @@ def register_metric(  # noqa: PLR0913
 def get_metric_provider(
     metric_name: str, execution_engine: ExecutionEngine
 ) -> Tuple[MetricProvider, Callable]:
+    _load_core_metric(metric_name=metric_name)
     try:
         metric_definition = _registered_metrics[metric_name]
         return metric_definition["providers"][type(execution_engine).__name__]
@@ -322,6 +412,7 @@ def get_metric_provider(
 def get_metric_function_type(
     metric_name: str, execution_engine: ExecutionEngine
 ) -> Optional[Union[MetricPartialFunctionTypes, MetricFunctionTypes]]:
+    _load_core_metric(metric_name=metric_name)
     try:
         metric_definition = _registered_metrics[metric_name]
         provider_fn, _provider_class = metric_definition["providers"][
@@ -339,6 +430,7 @@ def get_metric_kwargs(
     configuration: Optional[ExpectationConfiguration] = None,
     runtime_configuration: Optional[dict] = None,
 ) -> dict:
+    _load_core_metric(metric_name=metric_name)
     try:
         metric_definition = _registered_metrics.get(metric_name)
         if metric_definition is None:
@@ -391,6 +483,7 @@ def get_domain_metrics_dict_by_name(
 
 
 def get_expectation_impl(expectation_name: str) -> Type[Expectation]:
+    _load_core_expectation(expectation_type=expectation_name)
     expectation: Type[Expectation] | None = _registered_expectations.get(expectation_name)
     if not expectation:
         raise gx_exceptions.ExpectationNotFoundError(f"{expectation_name} not found")  # noqa: TRY003
@@ -401,6 +494,7 @@ def get_expectation_impl(expectation_name: str) -> Type[Expectation]:
 def list_registered_expectation_implementations(
     expectation_root: Optional[Type[Expectation]] = None,
 ) -> List[str]:
+    register_core_expectations()
     registered_expectation_implementations = []
     for (
         expectation_name,
@@ -0,0 +1,689 @@
+"""Modules of core Expectations and Metrics, imported on first use by "great_expectations.expectations.registry".
+
+Generated by "invoke registry-manifest --sync"; do not edit by hand.
+"""
+
+from __future__ import annotations
+
+from typing import Dict
+
+# Module defining each core Expectation, by expectation type.
+EXPECTATION_MODULES: Dict[str, str] = {
+    "expect_column_distinct_values_to_be_in_set": "great_expectations.expectations.core.expect_column_distinct_values_to_be_in_set",
+    "expect_column_distinct_values_to_contain_set": "great_expectations.expectations.core.expect_column_distinct_values_to_contain_set",
+    "expect_column_distinct_values_to_equal_set": "great_expectations.expectations.core.expect_column_distinct_values_to_equal_set",
+    "expect_column_kl_divergence_to_be_less_than": "great_expectations.expectations.core.expect_column_kl_divergence_to_be_less_than",
+    "expect_column_max_to_be_between": "great_expectations.expectations.core.expect_column_max_to_be_between",
+    "expect_column_mean_to_be_between": "great_expectations.expectations.core.expect_column_mean_to_be_between",
+    "expect_column_median_to_be_between": "great_expectations.expectations.core.expect_column_median_to_be_between",
+    "expect_column_min_to_be_between": "great_expectations.expectations.core.expect_column_min_to_be_between",
+    "expect_column_most_common_value_to_be_in_set": "great_expectations.expectations.core.expect_column_most_common_value_to_be_in_set",
+    "expect_column_pair_values_a_to_be_greater_than_b": "great_expectations.expectations.core.expect_column_pair_values_a_to_be_greater_than_b",
+    "expect_column_pair_values_to_be_equal": "great_expectations.expectations.core.expect_column_pair_values_to_be_equal",
+    "expect_column_pair_values_to_be_in_set": "great_expectations.expectations.core.expect_column_pair_values_to_be_in_set",
+    "expect_column_proportion_of_unique_values_to_be_between": "great_expectations.expectations.core.expect_column_proportion_of_unique_values_to_be_between",
+    "expect_column_quantile_values_to_be_between": "great_expectations.expectations.core.expect_column_quantile_values_to_be_between",
+    "expect_column_stdev_to_be_between": "great_expectations.expectations.core.expect_column_stdev_to_be_between",
+    "expect_column_sum_to_be_between": "great_expectations.expectations.core.expect_column_sum_to_be_between",
+    "expect_column_to_exist": "great_expectations.expectations.core.expect_column_to_exist",
+    "expect_column_unique_value_count_to_be_between": "great_expectations.expectations.core.expect_column_unique_value_count_to_be_between",
+    "expect_column_value_lengths_to_be_between": "great_expectations.expectations.core.expect_column_value_lengths_to_be_between",
+    "expect_column_value_lengths_to_equal": "great_expectations.expectations.core.expect_column_value_lengths_to_equal",
+    "expect_column_value_z_scores_to_be_less_than": "great_expectations.expectations.core.expect_column_value_z_scores_to_be_less_than",
+    "expect_column_values_to_be_between": "great_expectations.expectations.core.expect_column_values_to_be_between",
+    "expect_column_values_to_be_dateutil_parseable": "great_expectations.expectations.core.expect_column_values_to_be_dateutil_parseable",
+    "expect_column_values_to_be_decreasing": "great_expectations.expectations.core.expect_column_values_to_be_decreasing",
+    "expect_column_values_to_be_in_set": "great_expectations.expectations.core.expect_column_values_to_be_in_set",
+    "expect_column_values_to_be_in_type_list": "great_expectations.expectations.core.expect_column_values_to_be_in_type_list",
+    "expect_column_values_to_be_increasing": "great_expectations.expectations.core.expect_column_values_to_be_increasing",
+    "expect_column_values_to_be_json_parseable": "great_expectations.expectations.core.expect_column_values_to_be_json_parseable",
+    "expect_column_values_to_be_null": "great_expectations.expectations.core.expect_column_values_to_be_null",
+    "expect_column_values_to_be_of_type": "great_expectations.expectations.core.expect_column_values_to_be_of_type",
+    "expect_column_values_to_be_unique": "great_expectations.expectations.core.expect_column_values_to_be_unique",
+    "expect_column_values_to_match_json_schema": "great_expectations.expectations.core.expect_column_values_to_match_json_schema",
+    "expect_column_values_to_match_like_pattern": "great_expectations.expectations.core.expect_column_values_to_match_like_pattern",
+    "expect_column_values_to_match_like_pattern_list": "great_expectations.expectations.core.expect_column_values_to_match_like_pattern_list",
+    "expect_column_values_to_match_regex": "great_expectations.expectations.core.expect_column_values_to_match_regex",
+    "expect_column_values_to_match_regex_list": "great_expectations.expectations.core.expect_column_values_to_match_regex_list",
+    "expect_column_values_to_match_strftime_format": "great_expectations.expectations.core.expect_column_values_to_match_strftime_format",
+    "expect_column_values_to_not_be_in_set": "great_expectations.expectations.core.expect_column_values_to_not_be_in_set",
+    "expect_column_values_to_not_be_null": "great_expectations.expectations.core.expect_column_values_to_not_be_null",
+    "expect_column_values_to_not_match_like_pattern": "great_expectations.expectations.core.expect_column_values_to_not_match_like_pattern",
+    "expect_column_values_to_not_match_like_pattern_list": "great_expectations.expectations.core.expect_column_values_to_not_match_like_pattern_list",
+    "expect_column_values_to_not_match_regex": "great_expectations.expectations.core.expect_column_values_to_not_match_regex",
+    "expect_column_values_to_not_match_regex_list": "great_expectations.expectations.core.expect_column_values_to_not_match_regex_list",
+    "expect_compound_columns_to_be_unique": "great_expectations.expectations.core.expect_compound_columns_to_be_unique",
+    "expect_multicolumn_sum_to_equal": "great_expectations.expectations.core.expect_multicolumn_sum_to_equal",
+    "expect_select_column_values_to_be_unique_within_record": "great_expectations.expectations.core.expect_select_column_values_to_be_unique_within_record",
+    "expect_table_column_count_to_be_between": "great_expectations.expectations.core.expect_table_column_count_to_be_between",
+    "expect_table_column_count_to_equal": "great_expectations.expectations.core.expect_table_column_count_to_equal",
+    "expect_table_columns_to_match_ordered_list": "great_expectations.expectations.core.expect_table_columns_to_match_ordered_list",
+    "expect_table_columns_to_match_set": "great_expectations.expectations.core.expect_table_columns_to_match_set",
+    "expect_table_row_count_to_be_between": "great_expectations.expectations.core.expect_table_row_count_to_be_between",
+    "expect_table_row_count_to_equal": "great_expectations.expectations.core.expect_table_row_count_to_equal",
+    "expect_table_row_count_to_equal_other_table": "great_expectations.expectations.core.expect_table_row_count_to_equal_other_table",
+    "unexpected_rows_expectation": "great_expectations.expectations.core.unexpected_rows_expectation",
+}
+
+# Module defining the provider of each core Metric, by metric name.
+METRIC_MODULES: Dict[str, str] = {
+    "column.distinct_values": "great_expectations.expectations.metrics.column_aggregate_metrics.column_distinct_values",
+    "column.distinct_values.count": "great_expectations.expectations.metrics.column_aggregate_metrics.column_distinct_values",
+    "column.distinct_values.count.aggregate_fn": "great_expectations.expectations.metrics.column_aggregate_metrics.column_distinct_values",
+    "column.distinct_values.count.approx": "great_expectations.expectations.metrics.column_aggregate_metrics.column_distinct_values",
+    "column.distinct_values.count.approx.aggregate_fn": "great_expectations.expectations.metrics.column_aggregate_metrics.column_distinct_values",
+    "column.distinct_values.count.under_threshold": "great_expectations.expectations.metrics.column_aggregate_metrics.column_distinct_values",
+    "column.histogram": "great_expectations.expectations.metrics.column_aggregate_metrics.column_histogram",
+    "column.max": "great_expectations.expectations.metrics.column_aggregate_metrics.column_max",
+    "column.max.aggregate_fn": "great_expectations.expectations.metrics.column_aggregate_metrics.column_max",
+    "column.mean": "great_expectations.expectations.metrics.column_aggregate_metrics.column_mean",
+    "column.mean.aggregate_fn": "great_expectations.expectations.metrics.column_aggregate_metrics.column_mean",
+    "column.median": "great_expectations.expectations.metrics.column_aggregate_metrics.column_median",
+    "column.min": "great_expectations.expectations.metrics.column_aggregate_metrics.column_min",
+    "column.min.aggregate_fn": "great_expectations.expectations.metrics.column_aggregate_metrics.column_min",
+    "column.most_common_value": "great_expectations.expectations.metrics.column_aggregate_metrics.column_most_common_value",
+    "column.parameterized_distribution_ks_test_p_value": "great_expectations.expectations.metrics.column_aggregate_metrics.column_parameterized_distribution_ks_test_p_value",
+    "column.partition": "great_expectations.expectations.metrics.column_aggregate_metrics.column_partition",
+    "column.quantile_sketch": "great_expectations.expectations.metrics.column_aggregate_metrics.column_quantile_sketch",
+    "column.quantile_values": "great_expectations.expectations.metrics.column_aggregate_metrics.column_quantile_values",
+    "column.standard_deviation": "great_expectations.expectations.metrics.column_aggregate_metrics.column_standard_deviation",
+    "column.standard_deviation.aggregate_fn": "great_expectations.expectations.metrics.column_aggregate_metrics.column_standard_deviation",
+    "column.sum": "great_expectations.expectations.metrics.column_aggregate_metrics.column_sum",
+    "column.sum.aggregate_fn": "great_expectations.expectations.metrics.column_aggregate_metrics.column_sum",
+    "column.top_value_counts": "great_expectations.expectations.metrics.column_aggregate_metrics.column_value_counts",
+    "column.unique_proportion": "great_expectations.expectations.metrics.column_aggregate_metrics.column_proportion_of_unique_values",
+    "column.unique_proportion.approx": "great_expectations.expectations.metrics.column_aggregate_metrics.column_proportion_of_unique_values",
+    "column.value_counts": "great_expectations.expectations.metrics.column_aggregate_metrics.column_value_counts",
+    "column_pair_values.a_greater_than_b.condition": "great_expectations.expectations.metrics.column_pair_map_metrics.column_pair_values_greater",
+    "column_pair_values.a_greater_than_b.filtered_row_count": "great_expectations.expectations.metrics.column_pair_map_metrics.column_pair_values_greater",
+    "column_pair_values.a_greater_than_b.unexpected_count": "great_expectations.expectations.metrics.column_pair_map_metrics.column_pair_values_greater",
+    "column_pair_values.a_greater_than_b.unexpected_index_list": "great_expectations.expectations.metrics.column_pair_map_metrics.column_pair_values_greater",
+    "column_pair_values.a_greater_than_b.unexpected_index_query": "great_expectations.expectations.metrics.column_pair_map_metrics.column_pair_values_greater",
+    "column_pair_values.a_greater_than_b.unexpected_rows": "great_expectations.expectations.metrics.column_pair_map_metrics.column_pair_values_greater",
+    "column_pair_values.a_greater_than_b.unexpected_values": "great_expectations.expectations.metrics.column_pair_map_metrics.column_pair_values_greater",
+    "column_pair_values.equal.condition": "great_expectations.expectations.metrics.column_pair_map_metrics.column_pair_values_equal",
+    "column_pair_values.equal.filtered_row_count": "great_expectations.expectations.metrics.column_pair_map_metrics.column_pair_values_equal",
+    "column_pair_values.equal.unexpected_count": "great_expectations.expectations.metrics.column_pair_map_metrics.column_pair_values_equal",
+    "column_pair_values.equal.unexpected_index_list": "great_expectations.expectations.metrics.column_pair_map_metrics.column_pair_values_equal",
+    "column_pair_values.equal.unexpected_index_query": "great_expectations.expectations.metrics.column_pair_map_metrics.column_pair_values_equal",
+    "column_pair_values.equal.unexpected_rows": "great_expectations.expectations.metrics.column_pair_map_metrics.column_pair_values_equal",
+    "column_pair_values.equal.unexpected_values": "great_expectations.expectations.metrics.column_pair_map_metrics.column_pair_values_equal",
+    "column_pair_values.in_set.condition": "great_expectations.expectations.metrics.column_pair_map_metrics.column_pair_values_in_set",
+    "column_pair_values.in_set.filtered_row_count": "great_expectations.expectations.metrics.column_pair_map_metrics.column_pair_values_in_set",
+    "column_pair_values.in_set.unexpected_count": "great_expectations.expectations.metrics.column_pair_map_metrics.column_pair_values_in_set",
+    "column_pair_values.in_set.unexpected_index_list": "great_expectations.expectations.metrics.column_pair_map_metrics.column_pair_values_in_set",
+    "column_pair_values.in_set.unexpected_index_query": "great_expectations.expectations.metrics.column_pair_map_metrics.column_pair_values_in_set",
+    "column_pair_values.in_set.unexpected_rows": "great_expectations.expectations.metrics.column_pair_map_metrics.column_pair_values_in_set",
+    "column_pair_values.in_set.unexpected_values": "great_expectations.expectations.metrics.column_pair_map_metrics.column_pair_values_in_set",
+    "column_values.between.condition": "great_expectations.expectations.metrics.column_map_metrics.column_values_between",
+    "column_values.between.count": "great_expectations.expectations.metrics.column_aggregate_metrics.column_values_between_count",
+    "column_values.between.unexpected_count": "great_expectations.expectations.metrics.column_map_metrics.column_values_between",
+    "column_values.between.unexpected_count.aggregate_fn": "great_expectations.expectations.metrics.column_map_metrics.column_values_between",
+    "column_values.between.unexpected_index_list": "great_expectations.expectations.metrics.column_map_metrics.column_values_between",
+    "column_values.between.unexpected_index_query": "great_expectations.expectations.metrics.column_map_metrics.column_values_between",
+    "column_values.between.unexpected_rows": "great_expectations.expectations.metrics.column_map_metrics.column_values_between",
+    "column_values.between.unexpected_value_counts": "great_expectations.expectations.metrics.column_map_metrics.column_values_between",
+    "column_values.between.unexpected_values": "great_expectations.expectations.metrics.column_map_metrics.column_values_between",
+    "column_values.dateutil_parseable.condition": "great_expectations.expectations.metrics.column_map_metrics.column_values_dateutil_parseable",
+    "column_values.dateutil_parseable.unexpected_count": "great_expectations.expectations.metrics.column_map_metrics.column_values_dateutil_parseable",
+    "column_values.dateutil_parseable.unexpected_index_list": "great_expectations.expectations.metrics.column_map_metrics.column_values_dateutil_parseable",
+    "column_values.dateutil_parseable.unexpected_index_query": "great_expectations.expectations.metrics.column_map_metrics.column_values_dateutil_parseable",
+    "column_values.dateutil_parseable.unexpected_rows": "great_expectations.expectations.metrics.column_map_metrics.column_values_dateutil_parseable",
+    "column_values.dateutil_parseable.unexpected_value_counts": "great_expectations.expectations.metrics.column_map_metrics.column_values_dateutil_parseable",
+    "column_values.dateutil_parseable.unexpected_values": "great_expectations.expectations.metrics.column_map_metrics.column_values_dateutil_parseable",
+    "column_values.decreasing.condition": "great_expectations.expectations.metrics.column_map_metrics.column_values_decreasing",
+    "column_values.decreasing.unexpected_count": "great_expectations.expectations.metrics.column_map_metrics.column_values_decreasing",
+    "column_values.decreasing.unexpected_index_list": "great_expectations.expectations.metrics.column_map_metrics.column_values_decreasing",
+    "column_values.decreasing.unexpected_index_query": "great_expectations.expectations.metrics.column_map_metrics.column_values_decreasing",
+    "column_values.decreasing.unexpected_rows": "great_expectations.expectations.metrics.column_map_metrics.column_values_decreasing",
+    "column_values.decreasing.unexpected_value_counts": "great_expectations.expectations.metrics.column_map_metrics.column_values_decreasing",
+    "column_values.decreasing.unexpected_values": "great_expectations.expectations.metrics.column_map_metrics.column_values_decreasing",
+    "column_values.in_set.condition": "great_expectations.expectations.metrics.column_map_metrics.column_values_in_set",
+    "column_values.in_set.unexpected_count": "great_expectations.expectations.metrics.column_map_metrics.column_values_in_set",
+    "column_values.in_set.unexpected_count.aggregate_fn": "great_expectations.expectations.metrics.column_map_metrics.column_values_in_set",
+    "column_values.in_set.unexpected_index_list": "great_expectations.expectations.metrics.column_map_metrics.column_values_in_set",
+    "column_values.in_set.unexpected_index_query": "great_expectations.expectations.metrics.column_map_metrics.column_values_in_set",
+    "column_values.in_set.unexpected_rows": "great_expectations.expectations.metrics.column_map_metrics.column_values_in_set",
+    "column_values.in_set.unexpected_value_counts": "great_expectations.expectations.metrics.column_map_metrics.column_values_in_set",
+    "column_values.in_set.unexpected_values": "great_expectations.expectations.metrics.column_map_metrics.column_values_in_set",
+    "column_values.in_type_list.condition": "great_expectations.expectations.metrics.column_map_metrics.column_values_in_type_list",
+    "column_values.in_type_list.unexpected_count": "great_expectations.expectations.metrics.column_map_metrics.column_values_in_type_list",
+    "column_values.in_type_list.unexpected_index_list": "great_expectations.expectations.metrics.column_map_metrics.column_values_in_type_list",
+    "column_values.in_type_list.unexpected_index_query": "great_expectations.expectations.metrics.column_map_metrics.column_values_in_type_list",
+    "column_values.in_type_list.unexpected_rows": "great_expectations.expectations.metrics.column_map_metrics.column_values_in_type_list",
+    "column_values.in_type_list.unexpected_value_counts": "great_expectations.expectations.metrics.column_map_metrics.column_values_in_type_list",
+    "column_values.in_type_list.unexpected_values": "great_expectations.expectations.metrics.column_map_metrics.column_values_in_type_list",
+    "column_values.increasing.condition": "great_expectations.expectations.metrics.column_map_metrics.column_values_increasing",
+    "column_values.increasing.unexpected_count": "great_expectations.expectations.metrics.column_map_metrics.column_values_increasing",
+    "column_values.increasing.unexpected_index_list": "great_expectations.expectations.metrics.column_map_metrics.column_values_increasing",
+    "column_values.increasing.unexpected_index_query": "great_expectations.expectations.metrics.column_map_metrics.column_values_increasing",
+    "column_values.increasing.unexpected_rows": "great_expectations.expectations.metrics.column_map_metrics.column_values_increasing",
+    "column_values.increasing.unexpected_value_counts": "great_expectations.expectations.metrics.column_map_metrics.column_values_increasing",
+    "column_values.increasing.unexpected_values": "great_expectations.expectations.metrics.column_map_metrics.column_values_increasing",
+    "column_values.json_parseable.condition": "great_expectations.expectations.metrics.column_map_metrics.column_values_json_parseable",
+    "column_values.json_parseable.unexpected_count": "great_expectations.expectations.metrics.column_map_metrics.column_values_json_parseable",
+    "column_values.json_parseable.unexpected_count.aggregate_fn": "great_expectations.expectations.metrics.column_map_metrics.column_values_json_parseable",
+    "column_values.json_parseable.unexpected_index_list": "great_expectations.expectations.metrics.column_map_metrics.column_values_json_parseable",
+    "column_values.json_parseable.unexpected_index_query": "great_expectations.expectations.metrics.column_map_metrics.column_values_json_parseable",
+    "column_values.json_parseable.unexpected_rows": "great_expectations.expectations.metrics.column_map_metrics.column_values_json_parseable",
+    "column_values.json_parseable.unexpected_value_counts": "great_expectations.expectations.metrics.column_map_metrics.column_values_json_parseable",
+    "column_values.json_parseable.unexpected_values": "great_expectations.expectations.metrics.column_map_metrics.column_values_json_parseable",
+    "column_values.length.max": "great_expectations.expectations.metrics.column_aggregate_metrics.column_values_length_max",
+    "column_values.length.max.aggregate_fn": "great_expectations.expectations.metrics.column_aggregate_metrics.column_values_length_max",
+    "column_values.length.min": "great_expectations.expectations.metrics.column_aggregate_metrics.column_values_length_min",
+    "column_values.length.min.aggregate_fn": "great_expectations.expectations.metrics.column_aggregate_metrics.column_values_length_min",
+    "column_values.match_json_schema.condition": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_json_schema",
+    "column_values.match_json_schema.unexpected_count": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_json_schema",
+    "column_values.match_json_schema.unexpected_count.aggregate_fn": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_json_schema",
+    "column_values.match_json_schema.unexpected_index_list": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_json_schema",
+    "column_values.match_json_schema.unexpected_index_query": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_json_schema",
+    "column_values.match_json_schema.unexpected_rows": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_json_schema",
+    "column_values.match_json_schema.unexpected_value_counts": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_json_schema",
+    "column_values.match_json_schema.unexpected_values": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_json_schema",
+    "column_values.match_like_pattern.condition": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_like_pattern",
+    "column_values.match_like_pattern.unexpected_count": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_like_pattern",
+    "column_values.match_like_pattern.unexpected_count.aggregate_fn": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_like_pattern",
+    "column_values.match_like_pattern.unexpected_index_list": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_like_pattern",
+    "column_values.match_like_pattern.unexpected_index_query": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_like_pattern",
+    "column_values.match_like_pattern.unexpected_rows": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_like_pattern",
+    "column_values.match_like_pattern.unexpected_value_counts": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_like_pattern",
+    "column_values.match_like_pattern.unexpected_values": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_like_pattern",
+    "column_values.match_like_pattern_list.condition": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_like_pattern_list",
+    "column_values.match_like_pattern_list.unexpected_count": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_like_pattern_list",
+    "column_values.match_like_pattern_list.unexpected_count.aggregate_fn": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_like_pattern_list",
+    "column_values.match_like_pattern_list.unexpected_index_list": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_like_pattern_list",
+    "column_values.match_like_pattern_list.unexpected_index_query": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_like_pattern_list",
+    "column_values.match_like_pattern_list.unexpected_rows": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_like_pattern_list",
+    "column_values.match_like_pattern_list.unexpected_value_counts": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_like_pattern_list",
+    "column_values.match_like_pattern_list.unexpected_values": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_like_pattern_list",
+    "column_values.match_regex.condition": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_regex",
+    "column_values.match_regex.unexpected_count": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_regex",
+    "column_values.match_regex.unexpected_count.aggregate_fn": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_regex",
+    "column_values.match_regex.unexpected_index_list": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_regex",
+    "column_values.match_regex.unexpected_index_query": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_regex",
+    "column_values.match_regex.unexpected_rows": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_regex",
+    "column_values.match_regex.unexpected_value_counts": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_regex",
+    "column_values.match_regex.unexpected_values": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_regex",
+    "column_values.match_regex_list.condition": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_regex_list",
+    "column_values.match_regex_list.unexpected_count": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_regex_list",
+    "column_values.match_regex_list.unexpected_count.aggregate_fn": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_regex_list",
+    "column_values.match_regex_list.unexpected_index_list": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_regex_list",
+    "column_values.match_regex_list.unexpected_index_query": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_regex_list",
+    "column_values.match_regex_list.unexpected_rows": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_regex_list",
+    "column_values.match_regex_list.unexpected_value_counts": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_regex_list",
+    "column_values.match_regex_list.unexpected_values": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_regex_list",
+    "column_values.match_strftime_format.condition": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_strftime_format",
+    "column_values.match_strftime_format.unexpected_count": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_strftime_format",
+    "column_values.match_strftime_format.unexpected_count.aggregate_fn": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_strftime_format",
+    "column_values.match_strftime_format.unexpected_index_list": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_strftime_format",
+    "column_values.match_strftime_format.unexpected_index_query": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_strftime_format",
+    "column_values.match_strftime_format.unexpected_rows": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_strftime_format",
+    "column_values.match_strftime_format.unexpected_value_counts": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_strftime_format",
+    "column_values.match_strftime_format.unexpected_values": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_strftime_format",
+    "column_values.nonnull.condition": "great_expectations.expectations.metrics.column_map_metrics.column_values_non_null",
+    "column_values.nonnull.count": "great_expectations.expectations.metrics.column_map_metrics.column_values_non_null",
+    "column_values.nonnull.unexpected_count": "great_expectations.expectations.metrics.column_map_metrics.column_values_non_null",
+    "column_values.nonnull.unexpected_count.aggregate_fn": "great_expectations.expectations.metrics.column_map_metrics.column_values_non_null",
+    "column_values.nonnull.unexpected_index_list": "great_expectations.expectations.metrics.column_map_metrics.column_values_non_null",
+    "column_values.nonnull.unexpected_index_query": "great_expectations.expectations.metrics.column_map_metrics.column_values_non_null",
+    "column_values.nonnull.unexpected_rows": "great_expectations.expectations.metrics.column_map_metrics.column_values_non_null",
+    "column_values.nonnull.unexpected_value_counts": "great_expectations.expectations.metrics.column_map_metrics.column_values_non_null",
+    "column_values.nonnull.unexpected_values": "great_expectations.expectations.metrics.column_map_metrics.column_values_non_null",
+    "column_values.not_in_set.condition": "great_expectations.expectations.metrics.column_map_metrics.column_values_not_in_set",
+    "column_values.not_in_set.unexpected_count": "great_expectations.expectations.metrics.column_map_metrics.column_values_not_in_set",
+    "column_values.not_in_set.unexpected_count.aggregate_fn": "great_expectations.expectations.metrics.column_map_metrics.column_values_not_in_set",
+    "column_values.not_in_set.unexpected_index_list": "great_expectations.expectations.metrics.column_map_metrics.column_values_not_in_set",
+    "column_values.not_in_set.unexpected_index_query": "great_expectations.expectations.metrics.column_map_metrics.column_values_not_in_set",
+    "column_values.not_in_set.unexpected_rows": "great_expectations.expectations.metrics.column_map_metrics.column_values_not_in_set",
+    "column_values.not_in_set.unexpected_value_counts": "great_expectations.expectations.metrics.column_map_metrics.column_values_not_in_set",
+    "column_values.not_in_set.unexpected_values": "great_expectations.expectations.metrics.column_map_metrics.column_values_not_in_set",
+    "column_values.not_match_like_pattern.condition": "great_expectations.expectations.metrics.column_map_metrics.column_values_not_match_like_pattern",
+    "column_values.not_match_like_pattern.unexpected_count": "great_expectations.expectations.metrics.column_map_metrics.column_values_not_match_like_pattern",
+    "column_values.not_match_like_pattern.unexpected_count.aggregate_fn": "great_expectations.expectations.metrics.column_map_metrics.column_values_not_match_like_pattern",
+    "column_values.not_match_like_pattern.unexpected_index_list": "great_expectations.expectations.metrics.column_map_metrics.column_values_not_match_like_pattern",
+    "column_values.not_match_like_pattern.unexpected_index_query": "great_expectations.expectations.metrics.column_map_metrics.column_values_not_match_like_pattern",
+    "column_values.not_match_like_pattern.unexpected_rows": "great_expectations.expectations.metrics.column_map_metrics.column_values_not_match_like_pattern",
+    "column_values.not_match_like_pattern.unexpected_value_counts": "great_expectations.expectations.metrics.column_map_metrics.column_values_not_match_like_pattern",
+    "column_values.not_match_like_pattern.unexpected_values": "great_expectations.expectations.metrics.column_map_metrics.column_values_not_match_like_pattern",
+    "column_values.not_match_like_pattern_list.condition": "great_expectations.expectations.metrics.column_map_metrics.column_values_not_match_like_pattern_list",
+    "column_values.not_match_like_pattern_list.unexpected_count": "great_expectations.expectations.metrics.column_map_metrics.column_values_not_match_like_pattern_list",
+    "column_values.not_match_like_pattern_list.unexpected_count.aggregate_fn": "great_expectations.expectations.metrics.column_map_metrics.column_values_not_match_like_pattern_list",
+    "column_values.not_match_like_pattern_list.unexpected_index_list": "great_expectations.expectations.metrics.column_map_metrics.column_values_not_match_like_pattern_list",
+    "column_values.not_match_like_pattern_list.unexpected_index_query": "great_expectations.expectations.metrics.column_map_metrics.column_values_not_match_like_pattern_list",
+    "column_values.not_match_like_pattern_list.unexpected_rows": "great_expectations.expectations.metrics.column_map_metrics.column_values_not_match_like_pattern_list",
+    "column_values.not_match_like_pattern_list.unexpected_value_counts": "great_expectations.expectations.metrics.column_map_metrics.column_values_not_match_like_pattern_list",
+    "column_values.not_match_like_pattern_list.unexpected_values": "great_expectations.expectations.metrics.column_map_metrics.column_values_not_match_like_pattern_list",
+    "column_values.not_match_regex.condition": "great_expectations.expectations.metrics.column_map_metrics.column_values_not_match_regex",
+    "column_values.not_match_regex.unexpected_count": "great_expectations.expectations.metrics.column_map_metrics.column_values_not_match_regex",
+    "column_values.not_match_regex.unexpected_count.aggregate_fn": "great_expectations.expectations.metrics.column_map_metrics.column_values_not_match_regex",
+    "column_values.not_match_regex.unexpected_index_list": "great_expectations.expectations.metrics.column_map_metrics.column_values_not_match_regex",
+    "column_values.not_match_regex.unexpected_index_query": "great_expectations.expectations.metrics.column_map_metrics.column_values_not_match_regex",
+    "column_values.not_match_regex.unexpected_rows": "great_expectations.expectations.metrics.column_map_metrics.column_values_not_match_regex",
+    "column_values.not_match_regex.unexpected_value_counts": "great_expectations.expectations.metrics.column_map_metrics.column_values_not_match_regex",
+    "column_values.not_match_regex.unexpected_values": "great_expectations.expectations.metrics.column_map_metrics.column_values_not_match_regex",
+    "column_values.not_match_regex_list.condition": "great_expectations.expectations.metrics.column_map_metrics.column_values_not_match_regex_list",
+    "column_values.not_match_regex_list.unexpected_count": "great_expectations.expectations.metrics.column_map_metrics.column_values_not_match_regex_list",
+    "column_values.not_match_regex_list.unexpected_count.aggregate_fn": "great_expectations.expectations.metrics.column_map_metrics.column_values_not_match_regex_list",
+    "column_values.not_match_regex_list.unexpected_index_list": "great_expectations.expectations.metrics.column_map_metrics.column_values_not_match_regex_list",
+    "column_values.not_match_regex_list.unexpected_index_query": "great_expectations.expectations.metrics.column_map_metrics.column_values_not_match_regex_list",
+    "column_values.not_match_regex_list.unexpected_rows": "great_expectations.expectations.metrics.column_map_metrics.column_values_not_match_regex_list",
+    "column_values.not_match_regex_list.unexpected_value_counts": "great_expectations.expectations.metrics.column_map_metrics.column_values_not_match_regex_list",
+    "column_values.not_match_regex_list.unexpected_values": "great_expectations.expectations.metrics.column_map_metrics.column_values_not_match_regex_list",
+    "column_values.null.condition": "great_expectations.expectations.metrics.column_map_metrics.column_values_null",
+    "column_values.null.count": "great_expectations.expectations.metrics.column_map_metrics.column_values_null",
+    "column_values.null.unexpected_count": "great_expectations.expectations.metrics.column_map_metrics.column_values_null",
+    "column_values.null.unexpected_count.aggregate_fn": "great_expectations.expectations.metrics.column_map_metrics.column_values_null",
+    "column_values.null.unexpected_index_list": "great_expectations.expectations.metrics.column_map_metrics.column_values_null",
+    "column_values.null.unexpected_index_query": "great_expectations.expectations.metrics.column_map_metrics.column_values_null",
+    "column_values.null.unexpected_rows": "great_expectations.expectations.metrics.column_map_metrics.column_values_null",
+    "column_values.null.unexpected_value_counts": "great_expectations.expectations.metrics.column_map_metrics.column_values_null",
+    "column_values.null.unexpected_values": "great_expectations.expectations.metrics.column_map_metrics.column_values_null",
+    "column_values.of_type.condition": "great_expectations.expectations.metrics.column_map_metrics.column_values_of_type",
+    "column_values.of_type.unexpected_count": "great_expectations.expectations.metrics.column_map_metrics.column_values_of_type",
+    "column_values.of_type.unexpected_index_list": "great_expectations.expectations.metrics.column_map_metrics.column_values_of_type",
+    "column_values.of_type.unexpected_index_query": "great_expectations.expectations.metrics.column_map_metrics.column_values_of_type",
+    "column_values.of_type.unexpected_rows": "great_expectations.expectations.metrics.column_map_metrics.column_values_of_type",
+    "column_values.of_type.unexpected_value_counts": "great_expectations.expectations.metrics.column_map_metrics.column_values_of_type",
+    "column_values.of_type.unexpected_values": "great_expectations.expectations.metrics.column_map_metrics.column_values_of_type",
+    "column_values.unique.condition": "great_expectations.expectations.metrics.column_map_metrics.column_values_unique",
+    "column_values.unique.unexpected_count": "great_expectations.expectations.metrics.column_map_metrics.column_values_unique",
+    "column_values.unique.unexpected_index_list": "great_expectations.expectations.metrics.column_map_metrics.column_values_unique",
+    "column_values.unique.unexpected_index_query": "great_expectations.expectations.metrics.column_map_metrics.column_values_unique",
+    "column_values.unique.unexpected_rows": "great_expectations.expectations.metrics.column_map_metrics.column_values_unique",
+    "column_values.unique.unexpected_value_counts": "great_expectations.expectations.metrics.column_map_metrics.column_values_unique",
+    "column_values.unique.unexpected_values": "great_expectations.expectations.metrics.column_map_metrics.column_values_unique",
+    "column_values.value_length.between.condition": "great_expectations.expectations.metrics.column_map_metrics.column_value_lengths",
+    "column_values.value_length.between.unexpected_count": "great_expectations.expectations.metrics.column_map_metrics.column_value_lengths",
+    "column_values.value_length.between.unexpected_count.aggregate_fn": "great_expectations.expectations.metrics.column_map_metrics.column_value_lengths",
+    "column_values.value_length.between.unexpected_index_list": "great_expectations.expectations.metrics.column_map_metrics.column_value_lengths",
+    "column_values.value_length.between.unexpected_index_query": "great_expectations.expectations.metrics.column_map_metrics.column_value_lengths",
+    "column_values.value_length.between.unexpected_rows": "great_expectations.expectations.metrics.column_map_metrics.column_value_lengths",
+    "column_values.value_length.between.unexpected_value_counts": "great_expectations.expectations.metrics.column_map_metrics.column_value_lengths",
+    "column_values.value_length.between.unexpected_values": "great_expectations.expectations.metrics.column_map_metrics.column_value_lengths",
+    "column_values.value_length.equals.condition": "great_expectations.expectations.metrics.column_map_metrics.column_value_lengths",
+    "column_values.value_length.equals.unexpected_count": "great_expectations.expectations.metrics.column_map_metrics.column_value_lengths",
+    "column_values.value_length.equals.unexpected_count.aggregate_fn": "great_expectations.expectations.metrics.column_map_metrics.column_value_lengths",
+    "column_values.value_length.equals.unexpected_index_list": "great_expectations.expectations.metrics.column_map_metrics.column_value_lengths",
+    "column_values.value_length.equals.unexpected_index_query": "great_expectations.expectations.metrics.column_map_metrics.column_value_lengths",
+    "column_values.value_length.equals.unexpected_rows": "great_expectations.expectations.metrics.column_map_metrics.column_value_lengths",
+    "column_values.value_length.equals.unexpected_value_counts": "great_expectations.expectations.metrics.column_map_metrics.column_value_lengths",
+    "column_values.value_length.equals.unexpected_values": "great_expectations.expectations.metrics.column_map_metrics.column_value_lengths",
+    "column_values.value_length.map": "great_expectations.expectations.metrics.column_map_metrics.column_value_lengths",
+    "column_values.z_score.map": "great_expectations.expectations.metrics.column_map_metrics.column_values_z_score",
+    "column_values.z_score.under_threshold.condition": "great_expectations.expectations.metrics.column_map_metrics.column_values_z_score",
+    "column_values.z_score.under_threshold.unexpected_count": "great_expectations.expectations.metrics.column_map_metrics.column_values_z_score",
+    "column_values.z_score.under_threshold.unexpected_count.aggregate_fn": "great_expectations.expectations.metrics.column_map_metrics.column_values_z_score",
+    "column_values.z_score.under_threshold.unexpected_index_list": "great_expectations.expectations.metrics.column_map_metrics.column_values_z_score",
+    "column_values.z_score.under_threshold.unexpected_index_query": "great_expectations.expectations.metrics.column_map_metrics.column_values_z_score",
+    "column_values.z_score.under_threshold.unexpected_rows": "great_expectations.expectations.metrics.column_map_metrics.column_values_z_score",
+    "column_values.z_score.under_threshold.unexpected_value_counts": "great_expectations.expectations.metrics.column_map_metrics.column_values_z_score",
+    "column_values.z_score.under_threshold.unexpected_values": "great_expectations.expectations.metrics.column_map_metrics.column_values_z_score",
+    "compound_columns.count.map": "great_expectations.expectations.metrics.multicolumn_map_metrics.compound_columns_unique",
+    "compound_columns.unique.condition": "great_expectations.expectations.metrics.multicolumn_map_metrics.compound_columns_unique",
+    "compound_columns.unique.filtered_row_count": "great_expectations.expectations.metrics.multicolumn_map_metrics.compound_columns_unique",
+    "compound_columns.unique.unexpected_count": "great_expectations.expectations.metrics.multicolumn_map_metrics.compound_columns_unique",
+    "compound_columns.unique.unexpected_index_list": "great_expectations.expectations.metrics.multicolumn_map_metrics.compound_columns_unique",
+    "compound_columns.unique.unexpected_index_query": "great_expectations.expectations.metrics.multicolumn_map_metrics.compound_columns_unique",
+    "compound_columns.unique.unexpected_rows": "great_expectations.expectations.metrics.multicolumn_map_metrics.compound_columns_unique",
+    "compound_columns.unique.unexpected_values": "great_expectations.expectations.metrics.multicolumn_map_metrics.compound_columns_unique",
+    "multicolumn_sum.equal.condition": "great_expectations.expectations.metrics.multicolumn_map_metrics.multicolumn_sum_equal",
+    "multicolumn_sum.equal.filtered_row_count": "great_expectations.expectations.metrics.multicolumn_map_metrics.multicolumn_sum_equal",
+    "multicolumn_sum.equal.unexpected_count": "great_expectations.expectations.metrics.multicolumn_map_metrics.multicolumn_sum_equal",
+    "multicolumn_sum.equal.unexpected_index_list": "great_expectations.expectations.metrics.multicolumn_map_metrics.multicolumn_sum_equal",
+    "multicolumn_sum.equal.unexpected_index_query": "great_expectations.expectations.metrics.multicolumn_map_metrics.multicolumn_sum_equal",
+    "multicolumn_sum.equal.unexpected_rows": "great_expectations.expectations.metrics.multicolumn_map_metrics.multicolumn_sum_equal",
+    "multicolumn_sum.equal.unexpected_values": "great_expectations.expectations.metrics.multicolumn_map_metrics.multicolumn_sum_equal",
+    "query.column": "great_expectations.expectations.metrics.query_metrics.query_column",
+    "query.column_pair": "great_expectations.expectations.metrics.query_metrics.query_column_pair",
+    "query.multiple_columns": "great_expectations.expectations.metrics.query_metrics.query_multiple_columns",
+    "query.row_count": "great_expectations.expectations.metrics.query_metrics.query_row_count",
+    "query.table": "great_expectations.expectations.metrics.query_metrics.query_table",
+    "query.template_values": "great_expectations.expectations.metrics.query_metrics.query_template_values",
+    "select_column_values.unique.within_record.condition": "great_expectations.expectations.metrics.multicolumn_map_metrics.select_column_values_unique_within_record",
+    "select_column_values.unique.within_record.filtered_row_count": "great_expectations.expectations.metrics.multicolumn_map_metrics.select_column_values_unique_within_record",
+    "select_column_values.unique.within_record.unexpected_count": "great_expectations.expectations.metrics.multicolumn_map_metrics.select_column_values_unique_within_record",
+    "select_column_values.unique.within_record.unexpected_index_list": "great_expectations.expectations.metrics.multicolumn_map_metrics.select_column_values_unique_within_record",
+    "select_column_values.unique.within_record.unexpected_index_query": "great_expectations.expectations.metrics.multicolumn_map_metrics.select_column_values_unique_within_record",
+    "select_column_values.unique.within_record.unexpected_rows": "great_expectations.expectations.metrics.multicolumn_map_metrics.select_column_values_unique_within_record",
+    "select_column_values.unique.within_record.unexpected_values": "great_expectations.expectations.metrics.multicolumn_map_metrics.select_column_values_unique_within_record",
+    "table.column_count": "great_expectations.expectations.metrics.table_metrics.table_column_count",
+    "table.column_types": "great_expectations.expectations.metrics.table_metrics.table_column_types",
+    "table.columns": "great_expectations.expectations.metrics.table_metrics.table_columns",
+    "table.head": "great_expectations.expectations.metrics.table_metrics.table_head",
+    "table.row_count": "great_expectations.expectations.metrics.table_metrics.table_row_count",
+    "table.row_count.aggregate_fn": "great_expectations.expectations.metrics.table_metrics.table_row_count",
+    "unexpected_rows_query.row_count": "great_expectations.expectations.metrics.query_metrics.unexpected_rows_query_row_count",
+    "unexpected_rows_query.table": "great_expectations.expectations.metrics.query_metrics.unexpected_rows_query_table",
+}
+
+# Module defining the renderers of each core Expectation or Metric, by object name.
+RENDERER_MODULES: Dict[str, str] = {
+    "batch_expectation": "great_expectations.expectations.expectation",
+    "column_aggregate_expectation": "great_expectations.expectations.expectation",
+    "column_map_expectation": "great_expectations.expectations.expectation",
+    "column_pair_map_expectation": "great_expectations.expectations.expectation",
+    "expect_column_distinct_values_to_be_in_set": "great_expectations.expectations.core.expect_column_distinct_values_to_be_in_set",
+    "expect_column_distinct_values_to_contain_set": "great_expectations.expectations.core.expect_column_distinct_values_to_contain_set",
+    "expect_column_distinct_values_to_equal_set": "great_expectations.expectations.core.expect_column_distinct_values_to_equal_set",
+    "expect_column_kl_divergence_to_be_less_than": "great_expectations.expectations.core.expect_column_kl_divergence_to_be_less_than",
+    "expect_column_max_to_be_between": "great_expectations.expectations.core.expect_column_max_to_be_between",
+    "expect_column_mean_to_be_between": "great_expectations.expectations.core.expect_column_mean_to_be_between",
+    "expect_column_median_to_be_between": "great_expectations.expectations.core.expect_column_median_to_be_between",
+    "expect_column_min_to_be_between": "great_expectations.expectations.core.expect_column_min_to_be_between",
+    "expect_column_most_common_value_to_be_in_set": "great_expectations.expectations.core.expect_column_most_common_value_to_be_in_set",
+    "expect_column_pair_values_a_to_be_greater_than_b": "great_expectations.expectations.core.expect_column_pair_values_a_to_be_greater_than_b",
+    "expect_column_pair_values_to_be_equal": "great_expectations.expectations.core.expect_column_pair_values_to_be_equal",
+    "expect_column_pair_values_to_be_in_set": "great_expectations.expectations.core.expect_column_pair_values_to_be_in_set",
+    "expect_column_proportion_of_unique_values_to_be_between": "great_expectations.expectations.core.expect_column_proportion_of_unique_values_to_be_between",
+    "expect_column_quantile_values_to_be_between": "great_expectations.expectations.core.expect_column_quantile_values_to_be_between",
+    "expect_column_stdev_to_be_between": "great_expectations.expectations.core.expect_column_stdev_to_be_between",
+    "expect_column_sum_to_be_between": "great_expectations.expectations.core.expect_column_sum_to_be_between",
+    "expect_column_to_exist": "great_expectations.expectations.core.expect_column_to_exist",
+    "expect_column_unique_value_count_to_be_between": "great_expectations.expectations.core.expect_column_unique_value_count_to_be_between",
+    "expect_column_value_lengths_to_be_between": "great_expectations.expectations.core.expect_column_value_lengths_to_be_between",
+    "expect_column_value_lengths_to_equal": "great_expectations.expectations.core.expect_column_value_lengths_to_equal",
+    "expect_column_value_z_scores_to_be_less_than": "great_expectations.expectations.core.expect_column_value_z_scores_to_be_less_than",
+    "expect_column_values_to_be_between": "great_expectations.expectations.core.expect_column_values_to_be_between",
+    "expect_column_values_to_be_dateutil_parseable": "great_expectations.expectations.core.expect_column_values_to_be_dateutil_parseable",
+    "expect_column_values_to_be_decreasing": "great_expectations.expectations.core.expect_column_values_to_be_decreasing",
+    "expect_column_values_to_be_in_set": "great_expectations.expectations.core.expect_column_values_to_be_in_set",
+    "expect_column_values_to_be_in_type_list": "great_expectations.expectations.core.expect_column_values_to_be_in_type_list",
+    "expect_column_values_to_be_increasing": "great_expectations.expectations.core.expect_column_values_to_be_increasing",
+    "expect_column_values_to_be_json_parseable": "great_expectations.expectations.core.expect_column_values_to_be_json_parseable",
+    "expect_column_values_to_be_null": "great_expectations.expectations.core.expect_column_values_to_be_null",
+    "expect_column_values_to_be_of_type": "great_expectations.expectations.core.expect_column_values_to_be_of_type",
+    "expect_column_values_to_be_unique": "great_expectations.expectations.core.expect_column_values_to_be_unique",
+    "expect_column_values_to_match_json_schema": "great_expectations.expectations.core.expect_column_values_to_match_json_schema",
+    "expect_column_values_to_match_like_pattern": "great_expectations.expectations.core.expect_column_values_to_match_like_pattern",
+    "expect_column_values_to_match_like_pattern_list": "great_expectations.expectations.core.expect_column_values_to_match_like_pattern_list",
+    "expect_column_values_to_match_regex": "great_expectations.expectations.core.expect_column_values_to_match_regex",
+    "expect_column_values_to_match_regex_list": "great_expectations.expectations.core.expect_column_values_to_match_regex_list",
+    "expect_column_values_to_match_strftime_format": "great_expectations.expectations.core.expect_column_values_to_match_strftime_format",
+    "expect_column_values_to_not_be_in_set": "great_expectations.expectations.core.expect_column_values_to_not_be_in_set",
+    "expect_column_values_to_not_be_null": "great_expectations.expectations.core.expect_column_values_to_not_be_null",
+    "expect_column_values_to_not_match_like_pattern": "great_expectations.expectations.core.expect_column_values_to_not_match_like_pattern",
+    "expect_column_values_to_not_match_like_pattern_list": "great_expectations.expectations.core.expect_column_values_to_not_match_like_pattern_list",
+    "expect_column_values_to_not_match_regex": "great_expectations.expectations.core.expect_column_values_to_not_match_regex",
+    "expect_column_values_to_not_match_regex_list": "great_expectations.expectations.core.expect_column_values_to_not_match_regex_list",
+    "expect_compound_columns_to_be_unique": "great_expectations.expectations.core.expect_compound_columns_to_be_unique",
+    "expect_multicolumn_sum_to_equal": "great_expectations.expectations.core.expect_multicolumn_sum_to_equal",
+    "expect_multicolumn_values_to_be_unique": "great_expectations.expectations.core.expect_multicolumn_values_to_be_unique",
+    "expect_select_column_values_to_be_unique_within_record": "great_expectations.expectations.core.expect_select_column_values_to_be_unique_within_record",
+    "expect_table_column_count_to_be_between": "great_expectations.expectations.core.expect_table_column_count_to_be_between",
+    "expect_table_column_count_to_equal": "great_expectations.expectations.core.expect_table_column_count_to_equal",
+    "expect_table_columns_to_match_ordered_list": "great_expectations.expectations.core.expect_table_columns_to_match_ordered_list",
+    "expect_table_columns_to_match_set": "great_expectations.expectations.core.expect_table_columns_to_match_set",
+    "expect_table_row_count_to_be_between": "great_expectations.expectations.core.expect_table_row_count_to_be_between",
+    "expect_table_row_count_to_equal": "great_expectations.expectations.core.expect_table_row_count_to_equal",
+    "expect_table_row_count_to_equal_other_table": "great_expectations.expectations.core.expect_table_row_count_to_equal_other_table",
+    "expectation": "great_expectations.expectations.expectation",
+    "multicolumn_map_expectation": "great_expectations.expectations.expectation",
+    "query_expectation": "great_expectations.expectations.expectation",
+    "unexpected_rows_expectation": "great_expectations.expectations.core.unexpected_rows_expectation",
+}
+
+# Module defining each name exported by a lazily loaded package, by package.
+PACKAGE_EXPORTS: Dict[str, Dict[str, str]] = {
+    "great_expectations.expectations": {
+        "ExpectColumnDistinctValuesToBeInSet": "great_expectations.expectations.core.expect_column_distinct_values_to_be_in_set",
+        "ExpectColumnDistinctValuesToContainSet": "great_expectations.expectations.core.expect_column_distinct_values_to_contain_set",
+        "ExpectColumnDistinctValuesToEqualSet": "great_expectations.expectations.core.expect_column_distinct_values_to_equal_set",
+        "ExpectColumnKLDivergenceToBeLessThan": "great_expectations.expectations.core.expect_column_kl_divergence_to_be_less_than",
+        "ExpectColumnMaxToBeBetween": "great_expectations.expectations.core.expect_column_max_to_be_between",
+        "ExpectColumnMeanToBeBetween": "great_expectations.expectations.core.expect_column_mean_to_be_between",
+        "ExpectColumnMedianToBeBetween": "great_expectations.expectations.core.expect_column_median_to_be_between",
+        "ExpectColumnMinToBeBetween": "great_expectations.expectations.core.expect_column_min_to_be_between",
+        "ExpectColumnMostCommonValueToBeInSet": "great_expectations.expectations.core.expect_column_most_common_value_to_be_in_set",
+        "ExpectColumnPairValuesAToBeGreaterThanB": "great_expectations.expectations.core.expect_column_pair_values_a_to_be_greater_than_b",
+        "ExpectColumnPairValuesToBeEqual": "great_expectations.expectations.core.expect_column_pair_values_to_be_equal",
+        "ExpectColumnPairValuesToBeInSet": "great_expectations.expectations.core.expect_column_pair_values_to_be_in_set",
+        "ExpectColumnProportionOfUniqueValuesToBeBetween": "great_expectations.expectations.core.expect_column_proportion_of_unique_values_to_be_between",
+        "ExpectColumnQuantileValuesToBeBetween": "great_expectations.expectations.core.expect_column_quantile_values_to_be_between",
+        "ExpectColumnStdevToBeBetween": "great_expectations.expectations.core.expect_column_stdev_to_be_between",
+        "ExpectColumnSumToBeBetween": "great_expectations.expectations.core.expect_column_sum_to_be_between",
+        "ExpectColumnToExist": "great_expectations.expectations.core.expect_column_to_exist",
+        "ExpectColumnUniqueValueCountToBeBetween": "great_expectations.expectations.core.expect_column_unique_value_count_to_be_between",
+        "ExpectColumnValueLengthsToBeBetween": "great_expectations.expectations.core.expect_column_value_lengths_to_be_between",
+        "ExpectColumnValueLengthsToEqual": "great_expectations.expectations.core.expect_column_value_lengths_to_equal",
+        "ExpectColumnValueZScoresToBeLessThan": "great_expectations.expectations.core.expect_column_value_z_scores_to_be_less_than",
+        "ExpectColumnValuesToBeBetween": "great_expectations.expectations.core.expect_column_values_to_be_between",
+        "ExpectColumnValuesToBeDateutilParseable": "great_expectations.expectations.core.expect_column_values_to_be_dateutil_parseable",
+        "ExpectColumnValuesToBeDecreasing": "great_expectations.expectations.core.expect_column_values_to_be_decreasing",
+        "ExpectColumnValuesToBeInSet": "great_expectations.expectations.core.expect_column_values_to_be_in_set",
+        "ExpectColumnValuesToBeInTypeList": "great_expectations.expectations.core.expect_column_values_to_be_in_type_list",
+        "ExpectColumnValuesToBeIncreasing": "great_expectations.expectations.core.expect_column_values_to_be_increasing",
+        "ExpectColumnValuesToBeJsonParseable": "great_expectations.expectations.core.expect_column_values_to_be_json_parseable",
+        "ExpectColumnValuesToBeNull": "great_expectations.expectations.core.expect_column_values_to_be_null",
+        "ExpectColumnValuesToBeOfType": "great_expectations.expectations.core.expect_column_values_to_be_of_type",
+        "ExpectColumnValuesToBeUnique": "great_expectations.expectations.core.expect_column_values_to_be_unique",
+        "ExpectColumnValuesToMatchJsonSchema": "great_expectations.expectations.core.expect_column_values_to_match_json_schema",
+        "ExpectColumnValuesToMatchLikePattern": "great_expectations.expectations.core.expect_column_values_to_match_like_pattern",
+        "ExpectColumnValuesToMatchLikePatternList": "great_expectations.expectations.core.expect_column_values_to_match_like_pattern_list",
+        "ExpectColumnValuesToMatchRegex": "great_expectations.expectations.core.expect_column_values_to_match_regex",
+        "ExpectColumnValuesToMatchRegexList": "great_expectations.expectations.core.expect_column_values_to_match_regex_list",
+        "ExpectColumnValuesToMatchStrftimeFormat": "great_expectations.expectations.core.expect_column_values_to_match_strftime_format",
+        "ExpectColumnValuesToNotBeInSet": "great_expectations.expectations.core.expect_column_values_to_not_be_in_set",
+        "ExpectColumnValuesToNotBeNull": "great_expectations.expectations.core.expect_column_values_to_not_be_null",
+        "ExpectColumnValuesToNotMatchLikePattern": "great_expectations.expectations.core.expect_column_values_to_not_match_like_pattern",
+        "ExpectColumnValuesToNotMatchLikePatternList": "great_expectations.expectations.core.expect_column_values_to_not_match_like_pattern_list",
+        "ExpectColumnValuesToNotMatchRegex": "great_expectations.expectations.core.expect_column_values_to_not_match_regex",
+        "ExpectColumnValuesToNotMatchRegexList": "great_expectations.expectations.core.expect_column_values_to_not_match_regex_list",
+        "ExpectCompoundColumnsToBeUnique": "great_expectations.expectations.core.expect_compound_columns_to_be_unique",
+        "ExpectMulticolumnSumToEqual": "great_expectations.expectations.core.expect_multicolumn_sum_to_equal",
+        "ExpectMulticolumnValuesToBeUnique": "great_expectations.expectations.core.expect_multicolumn_values_to_be_unique",
+        "ExpectSelectColumnValuesToBeUniqueWithinRecord": "great_expectations.expectations.core.expect_select_column_values_to_be_unique_within_record",
+        "ExpectTableColumnCountToBeBetween": "great_expectations.expectations.core.expect_table_column_count_to_be_between",
+        "ExpectTableColumnCountToEqual": "great_expectations.expectations.core.expect_table_column_count_to_equal",
+        "ExpectTableColumnsToMatchOrderedList": "great_expectations.expectations.core.expect_table_columns_to_match_ordered_list",
+        "ExpectTableColumnsToMatchSet": "great_expectations.expectations.core.expect_table_columns_to_match_set",
+        "ExpectTableRowCountToBeBetween": "great_expectations.expectations.core.expect_table_row_count_to_be_between",
+        "ExpectTableRowCountToEqual": "great_expectations.expectations.core.expect_table_row_count_to_equal",
+        "ExpectTableRowCountToEqualOtherTable": "great_expectations.expectations.core.expect_table_row_count_to_equal_other_table",
+        "UnexpectedRowsExpectation": "great_expectations.expectations.core.unexpected_rows_expectation",
+    },
+    "great_expectations.expectations.core": {
+        "ExpectColumnDistinctValuesToBeInSet": "great_expectations.expectations.core.expect_column_distinct_values_to_be_in_set",
+        "ExpectColumnDistinctValuesToContainSet": "great_expectations.expectations.core.expect_column_distinct_values_to_contain_set",
+        "ExpectColumnDistinctValuesToEqualSet": "great_expectations.expectations.core.expect_column_distinct_values_to_equal_set",
+        "ExpectColumnKLDivergenceToBeLessThan": "great_expectations.expectations.core.expect_column_kl_divergence_to_be_less_than",
+        "ExpectColumnMaxToBeBetween": "great_expectations.expectations.core.expect_column_max_to_be_between",
+        "ExpectColumnMeanToBeBetween": "great_expectations.expectations.core.expect_column_mean_to_be_between",
+        "ExpectColumnMedianToBeBetween": "great_expectations.expectations.core.expect_column_median_to_be_between",
+        "ExpectColumnMinToBeBetween": "great_expectations.expectations.core.expect_column_min_to_be_between",
+        "ExpectColumnMostCommonValueToBeInSet": "great_expectations.expectations.core.expect_column_most_common_value_to_be_in_set",
+        "ExpectColumnPairValuesAToBeGreaterThanB": "great_expectations.expectations.core.expect_column_pair_values_a_to_be_greater_than_b",
+        "ExpectColumnPairValuesToBeEqual": "great_expectations.expectations.core.expect_column_pair_values_to_be_equal",
+        "ExpectColumnPairValuesToBeInSet": "great_expectations.expectations.core.expect_column_pair_values_to_be_in_set",
+        "ExpectColumnProportionOfUniqueValuesToBeBetween": "great_expectations.expectations.core.expect_column_proportion_of_unique_values_to_be_between",
+        "ExpectColumnQuantileValuesToBeBetween": "great_expectations.expectations.core.expect_column_quantile_values_to_be_between",
+        "ExpectColumnStdevToBeBetween": "great_expectations.expectations.core.expect_column_stdev_to_be_between",
+        "ExpectColumnSumToBeBetween": "great_expectations.expectations.core.expect_column_sum_to_be_between",
+        "ExpectColumnToExist": "great_expectations.expectations.core.expect_column_to_exist",
+        "ExpectColumnUniqueValueCountToBeBetween": "great_expectations.expectations.core.expect_column_unique_value_count_to_be_between",
+        "ExpectColumnValueLengthsToBeBetween": "great_expectations.expectations.core.expect_column_value_lengths_to_be_between",
+        "ExpectColumnValueLengthsToEqual": "great_expectations.expectations.core.expect_column_value_lengths_to_equal",
+        "ExpectColumnValueZScoresToBeLessThan": "great_expectations.expectations.core.expect_column_value_z_scores_to_be_less_than",
+        "ExpectColumnValuesToBeBetween": "great_expectations.expectations.core.expect_column_values_to_be_between",
+        "ExpectColumnValuesToBeDateutilParseable": "great_expectations.expectations.core.expect_column_values_to_be_dateutil_parseable",
+        "ExpectColumnValuesToBeDecreasing": "great_expectations.expectations.core.expect_column_values_to_be_decreasing",
+        "ExpectColumnValuesToBeInSet": "great_expectations.expectations.core.expect_column_values_to_be_in_set",
+        "ExpectColumnValuesToBeInTypeList": "great_expectations.expectations.core.expect_column_values_to_be_in_type_list",
+        "ExpectColumnValuesToBeIncreasing": "great_expectations.expectations.core.expect_column_values_to_be_increasing",
+        "ExpectColumnValuesToBeJsonParseable": "great_expectations.expectations.core.expect_column_values_to_be_json_parseable",
+        "ExpectColumnValuesToBeNull": "great_expectations.expectations.core.expect_column_values_to_be_null",
+        "ExpectColumnValuesToBeOfType": "great_expectations.expectations.core.expect_column_values_to_be_of_type",
+        "ExpectColumnValuesToBeUnique": "great_expectations.expectations.core.expect_column_values_to_be_unique",
+        "ExpectColumnValuesToMatchJsonSchema": "great_expectations.expectations.core.expect_column_values_to_match_json_schema",
+        "ExpectColumnValuesToMatchLikePattern": "great_expectations.expectations.core.expect_column_values_to_match_like_pattern",
+        "ExpectColumnValuesToMatchLikePatternList": "great_expectations.expectations.core.expect_column_values_to_match_like_pattern_list",
+        "ExpectColumnValuesToMatchRegex": "great_expectations.expectations.core.expect_column_values_to_match_regex",
+        "ExpectColumnValuesToMatchRegexList": "great_expectations.expectations.core.expect_column_values_to_match_regex_list",
+        "ExpectColumnValuesToMatchStrftimeFormat": "great_expectations.expectations.core.expect_column_values_to_match_strftime_format",
+        "ExpectColumnValuesToNotBeInSet": "great_expectations.expectations.core.expect_column_values_to_not_be_in_set",
+        "ExpectColumnValuesToNotBeNull": "great_expectations.expectations.core.expect_column_values_to_not_be_null",
+        "ExpectColumnValuesToNotMatchLikePattern": "great_expectations.expectations.core.expect_column_values_to_not_match_like_pattern",
+        "ExpectColumnValuesToNotMatchLikePatternList": "great_expectations.expectations.core.expect_column_values_to_not_match_like_pattern_list",
+        "ExpectColumnValuesToNotMatchRegex": "great_expectations.expectations.core.expect_column_values_to_not_match_regex",
+        "ExpectColumnValuesToNotMatchRegexList": "great_expectations.expectations.core.expect_column_values_to_not_match_regex_list",
+        "ExpectCompoundColumnsToBeUnique": "great_expectations.expectations.core.expect_compound_columns_to_be_unique",
+        "ExpectMulticolumnSumToEqual": "great_expectations.expectations.core.expect_multicolumn_sum_to_equal",
+        "ExpectMulticolumnValuesToBeUnique": "great_expectations.expectations.core.expect_multicolumn_values_to_be_unique",
+        "ExpectSelectColumnValuesToBeUniqueWithinRecord": "great_expectations.expectations.core.expect_select_column_values_to_be_unique_within_record",
+        "ExpectTableColumnCountToBeBetween": "great_expectations.expectations.core.expect_table_column_count_to_be_between",
+        "ExpectTableColumnCountToEqual": "great_expectations.expectations.core.expect_table_column_count_to_equal",
+        "ExpectTableColumnsToMatchOrderedList": "great_expectations.expectations.core.expect_table_columns_to_match_ordered_list",
+        "ExpectTableColumnsToMatchSet": "great_expectations.expectations.core.expect_table_columns_to_match_set",
+        "ExpectTableRowCountToBeBetween": "great_expectations.expectations.core.expect_table_row_count_to_be_between",
+        "ExpectTableRowCountToEqual": "great_expectations.expectations.core.expect_table_row_count_to_equal",
+        "ExpectTableRowCountToEqualOtherTable": "great_expectations.expectations.core.expect_table_row_count_to_equal_other_table",
+        "UnexpectedRowsExpectation": "great_expectations.expectations.core.unexpected_rows_expectation",
+    },
+    "great_expectations.expectations.metrics": {
+        "ColumnApproxDistinctValuesCount": "great_expectations.expectations.metrics.column_aggregate_metrics.column_distinct_values",
+        "ColumnApproxUniqueProportion": "great_expectations.expectations.metrics.column_aggregate_metrics.column_proportion_of_unique_values",
+        "ColumnDistinctValues": "great_expectations.expectations.metrics.column_aggregate_metrics.column_distinct_values",
+        "ColumnDistinctValuesCount": "great_expectations.expectations.metrics.column_aggregate_metrics.column_distinct_values",
+        "ColumnDistinctValuesCountUnderThreshold": "great_expectations.expectations.metrics.column_aggregate_metrics.column_distinct_values",
+        "ColumnHistogram": "great_expectations.expectations.metrics.column_aggregate_metrics.column_histogram",
+        "ColumnMax": "great_expectations.expectations.metrics.column_aggregate_metrics.column_max",
+        "ColumnMean": "great_expectations.expectations.metrics.column_aggregate_metrics.column_mean",
+        "ColumnMedian": "great_expectations.expectations.metrics.column_aggregate_metrics.column_median",
+        "ColumnMin": "great_expectations.expectations.metrics.column_aggregate_metrics.column_min",
+        "ColumnMostCommonValue": "great_expectations.expectations.metrics.column_aggregate_metrics.column_most_common_value",
+        "ColumnPairValuesAGreaterThanB": "great_expectations.expectations.metrics.column_pair_map_metrics.column_pair_values_greater",
+        "ColumnPairValuesEqual": "great_expectations.expectations.metrics.column_pair_map_metrics.column_pair_values_equal",
+        "ColumnPairValuesInSet": "great_expectations.expectations.metrics.column_pair_map_metrics.column_pair_values_in_set",
+        "ColumnParameterizedDistributionKSTestPValue": "great_expectations.expectations.metrics.column_aggregate_metrics.column_parameterized_distribution_ks_test_p_value",
+        "ColumnPartition": "great_expectations.expectations.metrics.column_aggregate_metrics.column_partition",
+        "ColumnQuantileSketch": "great_expectations.expectations.metrics.column_aggregate_metrics.column_quantile_sketch",
+        "ColumnQuantileValues": "great_expectations.expectations.metrics.column_aggregate_metrics.column_quantile_values",
+        "ColumnStandardDeviation": "great_expectations.expectations.metrics.column_aggregate_metrics.column_standard_deviation",
+        "ColumnSum": "great_expectations.expectations.metrics.column_aggregate_metrics.column_sum",
+        "ColumnTopValueCounts": "great_expectations.expectations.metrics.column_aggregate_metrics.column_value_counts",
+        "ColumnTypes": "great_expectations.expectations.metrics.table_metrics.table_column_types",
+        "ColumnUniqueProportion": "great_expectations.expectations.metrics.column_aggregate_metrics.column_proportion_of_unique_values",
+        "ColumnValueCounts": "great_expectations.expectations.metrics.column_aggregate_metrics.column_value_counts",
+        "ColumnValuesBetween": "great_expectations.expectations.metrics.column_map_metrics.column_values_between",
+        "ColumnValuesBetweenCount": "great_expectations.expectations.metrics.column_aggregate_metrics.column_values_between_count",
+        "ColumnValuesDateutilParseable": "great_expectations.expectations.metrics.column_map_metrics.column_values_dateutil_parseable",
+        "ColumnValuesDecreasing": "great_expectations.expectations.metrics.column_map_metrics.column_values_decreasing",
+        "ColumnValuesInSet": "great_expectations.expectations.metrics.column_map_metrics.column_values_in_set",
+        "ColumnValuesInTypeList": "great_expectations.expectations.metrics.column_map_metrics.column_values_in_type_list",
+        "ColumnValuesIncreasing": "great_expectations.expectations.metrics.column_map_metrics.column_values_increasing",
+        "ColumnValuesJsonParseable": "great_expectations.expectations.metrics.column_map_metrics.column_values_json_parseable",
+        "ColumnValuesLengthMax": "great_expectations.expectations.metrics.column_aggregate_metrics.column_values_length_max",
+        "ColumnValuesLengthMin": "great_expectations.expectations.metrics.column_aggregate_metrics.column_values_length_min",
+        "ColumnValuesMatchJsonSchema": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_json_schema",
+        "ColumnValuesMatchLikePattern": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_like_pattern",
+        "ColumnValuesMatchLikePatternList": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_like_pattern_list",
+        "ColumnValuesMatchRegex": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_regex",
+        "ColumnValuesMatchRegexList": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_regex_list",
+        "ColumnValuesMatchStrftimeFormat": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_strftime_format",
+        "ColumnValuesNonNull": "great_expectations.expectations.metrics.column_map_metrics.column_values_non_null",
+        "ColumnValuesNotInSet": "great_expectations.expectations.metrics.column_map_metrics.column_values_not_in_set",
+        "ColumnValuesNotMatchLikePattern": "great_expectations.expectations.metrics.column_map_metrics.column_values_not_match_like_pattern",
+        "ColumnValuesNotMatchLikePatternList": "great_expectations.expectations.metrics.column_map_metrics.column_values_not_match_like_pattern_list",
+        "ColumnValuesNotMatchRegex": "great_expectations.expectations.metrics.column_map_metrics.column_values_not_match_regex",
+        "ColumnValuesNotMatchRegexList": "great_expectations.expectations.metrics.column_map_metrics.column_values_not_match_regex_list",
+        "ColumnValuesNull": "great_expectations.expectations.metrics.column_map_metrics.column_values_null",
+        "ColumnValuesOfType": "great_expectations.expectations.metrics.column_map_metrics.column_values_of_type",
+        "ColumnValuesUnique": "great_expectations.expectations.metrics.column_map_metrics.column_values_unique",
+        "ColumnValuesValueLength": "great_expectations.expectations.metrics.column_map_metrics.column_value_lengths",
+        "ColumnValuesValueLengthEquals": "great_expectations.expectations.metrics.column_map_metrics.column_value_lengths",
+        "ColumnValuesZScore": "great_expectations.expectations.metrics.column_map_metrics.column_values_z_score",
+        "CompoundColumnsUnique": "great_expectations.expectations.metrics.multicolumn_map_metrics.compound_columns_unique",
+        "MulticolumnSumEqual": "great_expectations.expectations.metrics.multicolumn_map_metrics.multicolumn_sum_equal",
+        "QueryColumn": "great_expectations.expectations.metrics.query_metrics.query_column",
+        "QueryColumnPair": "great_expectations.expectations.metrics.query_metrics.query_column_pair",
+        "QueryMultipleColumns": "great_expectations.expectations.metrics.query_metrics.query_multiple_columns",
+        "QueryRowCount": "great_expectations.expectations.metrics.query_metrics.query_row_count",
+        "QueryTable": "great_expectations.expectations.metrics.query_metrics.query_table",
+        "QueryTemplateValues": "great_expectations.expectations.metrics.query_metrics.query_template_values",
+        "SelectColumnValuesUniqueWithinRecord": "great_expectations.expectations.metrics.multicolumn_map_metrics.select_column_values_unique_within_record",
+        "TableColumnCount": "great_expectations.expectations.metrics.table_metrics.table_column_count",
+        "TableColumns": "great_expectations.expectations.metrics.table_metrics.table_columns",
+        "TableHead": "great_expectations.expectations.metrics.table_metrics.table_head",
+        "TableRowCount": "great_expectations.expectations.metrics.table_metrics.table_row_count",
+        "UnexpectedRowsQueryRowCount": "great_expectations.expectations.metrics.query_metrics.unexpected_rows_query_row_count",
+        "UnexpectedRowsQueryTable": "great_expectations.expectations.metrics.query_metrics.unexpected_rows_query_table",
+    },
+    "great_expectations.expectations.metrics.column_aggregate_metrics": {
+        "ColumnApproxDistinctValuesCount": "great_expectations.expectations.metrics.column_aggregate_metrics.column_distinct_values",
+        "ColumnApproxUniqueProportion": "great_expectations.expectations.metrics.column_aggregate_metrics.column_proportion_of_unique_values",
+        "ColumnDistinctValues": "great_expectations.expectations.metrics.column_aggregate_metrics.column_distinct_values",
+        "ColumnDistinctValuesCount": "great_expectations.expectations.metrics.column_aggregate_metrics.column_distinct_values",
+        "ColumnDistinctValuesCountUnderThreshold": "great_expectations.expectations.metrics.column_aggregate_metrics.column_distinct_values",
+        "ColumnHistogram": "great_expectations.expectations.metrics.column_aggregate_metrics.column_histogram",
+        "ColumnMax": "great_expectations.expectations.metrics.column_aggregate_metrics.column_max",
+        "ColumnMean": "great_expectations.expectations.metrics.column_aggregate_metrics.column_mean",
+        "ColumnMedian": "great_expectations.expectations.metrics.column_aggregate_metrics.column_median",
+        "ColumnMin": "great_expectations.expectations.metrics.column_aggregate_metrics.column_min",
+        "ColumnMostCommonValue": "great_expectations.expectations.metrics.column_aggregate_metrics.column_most_common_value",
+        "ColumnParameterizedDistributionKSTestPValue": "great_expectations.expectations.metrics.column_aggregate_metrics.column_parameterized_distribution_ks_test_p_value",
+        "ColumnPartition": "great_expectations.expectations.metrics.column_aggregate_metrics.column_partition",
+        "ColumnQuantileSketch": "great_expectations.expectations.metrics.column_aggregate_metrics.column_quantile_sketch",
+        "ColumnQuantileValues": "great_expectations.expectations.metrics.column_aggregate_metrics.column_quantile_values",
+        "ColumnStandardDeviation": "great_expectations.expectations.metrics.column_aggregate_metrics.column_standard_deviation",
+        "ColumnSum": "great_expectations.expectations.metrics.column_aggregate_metrics.column_sum",
+        "ColumnTopValueCounts": "great_expectations.expectations.metrics.column_aggregate_metrics.column_value_counts",
+        "ColumnUniqueProportion": "great_expectations.expectations.metrics.column_aggregate_metrics.column_proportion_of_unique_values",
+        "ColumnValueCounts": "great_expectations.expectations.metrics.column_aggregate_metrics.column_value_counts",
+        "ColumnValuesBetweenCount": "great_expectations.expectations.metrics.column_aggregate_metrics.column_values_between_count",
+        "ColumnValuesLengthMax": "great_expectations.expectations.metrics.column_aggregate_metrics.column_values_length_max",
+        "ColumnValuesLengthMin": "great_expectations.expectations.metrics.column_aggregate_metrics.column_values_length_min",
+    },
+    "great_expectations.expectations.metrics.column_map_metrics": {
+        "ColumnValuesBetween": "great_expectations.expectations.metrics.column_map_metrics.column_values_between",
+        "ColumnValuesDateutilParseable": "great_expectations.expectations.metrics.column_map_metrics.column_values_dateutil_parseable",
+        "ColumnValuesDecreasing": "great_expectations.expectations.metrics.column_map_metrics.column_values_decreasing",
+        "ColumnValuesInSet": "great_expectations.expectations.metrics.column_map_metrics.column_values_in_set",
+        "ColumnValuesInTypeList": "great_expectations.expectations.metrics.column_map_metrics.column_values_in_type_list",
+        "ColumnValuesIncreasing": "great_expectations.expectations.metrics.column_map_metrics.column_values_increasing",
+        "ColumnValuesJsonParseable": "great_expectations.expectations.metrics.column_map_metrics.column_values_json_parseable",
+        "ColumnValuesMatchJsonSchema": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_json_schema",
+        "ColumnValuesMatchLikePattern": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_like_pattern",
+        "ColumnValuesMatchLikePatternList": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_like_pattern_list",
+        "ColumnValuesMatchRegex": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_regex",
+        "ColumnValuesMatchRegexList": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_regex_list",
+        "ColumnValuesMatchStrftimeFormat": "great_expectations.expectations.metrics.column_map_metrics.column_values_match_strftime_format",
+        "ColumnValuesNonNull": "great_expectations.expectations.metrics.column_map_metrics.column_values_non_null",
+        "ColumnValuesNotInSet": "great_expectations.expectations.metrics.column_map_metrics.column_values_not_in_set",
+        "ColumnValuesNotMatchLikePattern": "great_expectations.expectations.metrics.column_map_metrics.column_values_not_match_like_pattern",
+        "ColumnValuesNotMatchLikePatternList": "great_expectations.expectations.metrics.column_map_metrics.column_values_not_match_like_pattern_list",
+        "ColumnValuesNotMatchRegex": "great_expectations.expectations.metrics.column_map_metrics.column_values_not_match_regex",
+        "ColumnValuesNotMatchRegexList": "great_expectations.expectations.metrics.column_map_metrics.column_values_not_match_regex_list",
+        "ColumnValuesNull": "great_expectations.expectations.metrics.column_map_metrics.column_values_null",
+        "ColumnValuesOfType": "great_expectations.expectations.metrics.column_map_metrics.column_values_of_type",
+        "ColumnValuesUnique": "great_expectations.expectations.metrics.column_map_metrics.column_values_unique",
+        "ColumnValuesValueLength": "great_expectations.expectations.metrics.column_map_metrics.column_value_lengths",
+        "ColumnValuesValueLengthEquals": "great_expectations.expectations.metrics.column_map_metrics.column_value_lengths",
+        "ColumnValuesZScore": "great_expectations.expectations.metrics.column_map_metrics.column_values_z_score",
+    },
+    "great_expectations.expectations.metrics.column_pair_map_metrics": {
+        "ColumnPairValuesAGreaterThanB": "great_expectations.expectations.metrics.column_pair_map_metrics.column_pair_values_greater",
+        "ColumnPairValuesEqual": "great_expectations.expectations.metrics.column_pair_map_metrics.column_pair_values_equal",
+        "ColumnPairValuesInSet": "great_expectations.expectations.metrics.column_pair_map_metrics.column_pair_values_in_set",
+    },
+    "great_expectations.expectations.metrics.multicolumn_map_metrics": {
+        "CompoundColumnsUnique": "great_expectations.expectations.metrics.multicolumn_map_metrics.compound_columns_unique",
+        "MulticolumnSumEqual": "great_expectations.expectations.metrics.multicolumn_map_metrics.multicolumn_sum_equal",
+        "SelectColumnValuesUniqueWithinRecord": "great_expectations.expectations.metrics.multicolumn_map_metrics.select_column_values_unique_within_record",
+    },
+    "great_expectations.expectations.metrics.query_metrics": {
+        "QueryColumn": "great_expectations.expectations.metrics.query_metrics.query_column",
+        "QueryColumnPair": "great_expectations.expectations.metrics.query_metrics.query_column_pair",
+        "QueryMultipleColumns": "great_expectations.expectations.metrics.query_metrics.query_multiple_columns",
+        "QueryRowCount": "great_expectations.expectations.metrics.query_metrics.query_row_count",
+        "QueryTable": "great_expectations.expectations.metrics.query_metrics.query_table",
+        "QueryTemplateValues": "great_expectations.expectations.metrics.query_metrics.query_template_values",
+        "UnexpectedRowsQueryRowCount": "great_expectations.expectations.metrics.query_metrics.unexpected_rows_query_row_count",
+        "UnexpectedRowsQueryTable": "great_expectations.expectations.metrics.query_metrics.unexpected_rows_query_table",
+    },
+    "great_expectations.expectations.metrics.table_metrics": {
+        "ColumnTypes": "great_expectations.expectations.metrics.table_metrics.table_column_types",
+        "TableColumnCount": "great_expectations.expectations.metrics.table_metrics.table_column_count",
+        "TableColumns": "great_expectations.expectations.metrics.table_metrics.table_columns",
+        "TableHead": "great_expectations.expectations.metrics.table_metrics.table_head",
+        "TableRowCount": "great_expectations.expectations.metrics.table_metrics.table_row_count",
+    },
+}
@@ -21,7 +21,7 @@ class CardinalityLimit(abc.ABC, SerializableDictDot):
 @dataclass(frozen=True)
 class RelativeCardinalityLimit(CardinalityLimit):
     max_proportion_unique: float
-    metric_name_defining_limit: str = "column.unique_proportion"
+    metric_name_defining_limit: str = "column.unique_proportion.approx"
 
     @override
     def to_json_dict(self) -> dict:
@@ -37,7 +37,7 @@ class RelativeCardinalityLimit(CardinalityLimit):
 @dataclass(frozen=True)
 class AbsoluteCardinalityLimit(CardinalityLimit):
     max_unique_values: int
-    metric_name_defining_limit: str = "column.distinct_values.count"
+    metric_name_defining_limit: str = "column.distinct_values.count.approx"
 
     @override
     def to_json_dict(self) -> dict:
@@ -98,6 +98,9 @@ class CardinalityChecker:
     various types of settings. You can choose one of the attributes listed
     below to create an instance.
 
+    Cardinality is measured by approximate distinct count metrics, so that
+    distinct values of high-cardinality columns are never materialized.
+
     Attributes:
         cardinality_limit_mode: CardinalityLimitMode or string name of the mode
             defining the maximum allowable cardinality.
@@ -1,22 +1,36 @@
 from __future__ import annotations
 
+import inspect
+import itertools
+import json
 import logging
 import os
 import pathlib
 import traceback
 import urllib
-from collections import OrderedDict
-from typing import TYPE_CHECKING, Any, List, Optional, Tuple
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Deque, Dict, Iterator, List, Optional, Set, Tuple
 
 from great_expectations import exceptions
 from great_expectations.core import ExpectationSuite
+from great_expectations.core.expectation_suite import ExpectationSuiteSchema
+from great_expectations.core.expectation_validation_result import (
+    ExpectationSuiteValidationResultSchema,
+)
 from great_expectations.core.util import nested_update
 from great_expectations.data_context.cloud_constants import GXCloudRESTResource
+from great_expectations.data_context.store.expectations_store import ExpectationsStore
 from great_expectations.data_context.store.html_site_store import (
     HtmlSiteStore,
+    SiteBuildManifest,
     SiteSectionIdentifier,
 )
 from great_expectations.data_context.store.json_site_store import JsonSiteStore
+from great_expectations.data_context.store.validation_results_store import (
+    ValidationResultsStore,
+)
 from great_expectations.data_context.types.resource_identifiers import (
     ExpectationSuiteIdentifier,
     GXCloudIdentifier,
@@ -24,12 +38,15 @@ from great_expectations.data_context.types.resource_identifiers import (
 )
 from great_expectations.data_context.util import instantiate_class_from_config
 from great_expectations.render.util import resource_key_passes_run_name_filter
+from great_expectations.util import convert_to_json_serializable  # noqa: TID251
 
 if TYPE_CHECKING:
     from great_expectations.core.expectation_validation_result import (
+        ExpectationSuiteValidationResult,
         ExpectationValidationResult,
     )
     from great_expectations.data_context import AbstractDataContext
+    from great_expectations.data_context.store.store import Store
 
 logger = logging.getLogger(__name__)
 
@@ -118,6 +135,21 @@ class SiteBuilder:
                     view:
                         module_name: great_expectations.render.view
                         class_name: DefaultJinjaIndexPageView
+
+    Pages are rendered one at a time, unless "render_max_workers" (of the site, or of
+    individual section builder) is greater than 1; then pages are rendered by a pool of
+    that many worker processes::
+
+        local_site:
+            class_name: SiteBuilder
+            render_max_workers: 4
+            store_backend:
+                class_name: TupleFilesystemStoreBackend
+                base_directory: uncommitted/data_docs/local_site/
+
+    Worker processes have no Data Context; their page renderers are only given meta of Expectation
+    Suites.  Hence, sections with custom (i.e., not built-in) renderer or view classes, which may
+    use Data Context otherwise, are always rendered one page at a time.
     """
 
     def __init__(  # noqa: C901, PLR0912, PLR0913
@@ -130,6 +162,7 @@ class SiteBuilder:
         site_section_builders=None,
         runtime_environment=None,
         cloud_mode=False,
+        render_max_workers: Optional[int] = None,
         # <GX_RENAME> Deprecated 0.15.37
         ge_cloud_mode=False,
         **kwargs,
@@ -236,6 +269,7 @@ class SiteBuilder:
                     "data_context_id": self.data_context_id,
                     "show_how_to_buttons": self.show_how_to_buttons,
                     "cloud_mode": self.cloud_mode,
+                    "render_max_workers": render_max_workers,
                 },
                 config_defaults={
                     "name": site_section_name,
@@ -317,6 +351,7 @@ class SiteBuilder:
         self.target_store.copy_static_assets()
 
         _, index_links_dict = self.site_index_builder.build(build_index=build_index)
+        self.target_store.write_build_manifest()
         return (
             self.get_resource_url(only_if_exists=False),
             index_links_dict,
@@ -357,8 +392,14 @@ class DefaultSiteSectionBuilder:
         cloud_mode=False,
         # <GX_RENAME> Deprecated 0.15.37
         ge_cloud_mode=False,
+        render_max_workers: Optional[int] = None,
         **kwargs,
     ) -> None:
+        if render_max_workers is not None and render_max_workers < 1:
+            raise ValueError(  # noqa: TRY003
+                f"render_max_workers must be positive; {render_max_workers} was given."
+            )
+
         self.name = name
         self.data_context = data_context
         self.source_store = data_context.stores[source_store_name]
@@ -371,11 +412,16 @@ class DefaultSiteSectionBuilder:
             cloud_mode = ge_cloud_mode
         self.cloud_mode = cloud_mode
         self.ge_cloud_mode = cloud_mode
+        self.render_max_workers = render_max_workers
+        self.custom_styles_directory = custom_styles_directory
+        self.custom_views_directory = custom_views_directory
         if renderer is None:
             raise exceptions.InvalidConfigError(  # noqa: TRY003
                 "SiteSectionBuilder requires a renderer configuration " "with a class_name key."
             )
         module_name = renderer.get("module_name") or "great_expectations.render.renderer"
+        # Worker processes of "render_max_workers" instantiate their own renderer and view.
+        self._renderer_config: dict = {**renderer, "module_name": module_name}
         self.renderer_class = instantiate_class_from_config(
             config=renderer,
             runtime_environment={"data_context": data_context},
@@ -395,6 +441,7 @@ class DefaultSiteSectionBuilder:
                 "class_name": "DefaultJinjaPageView",
             }
         module_name = view.get("module_name") or module_name
+        self._view_config: dict = {**view, "module_name": module_name}
         self.view_class = instantiate_class_from_config(
             config=view,
             runtime_environment={
@@ -417,6 +464,7 @@ class DefaultSiteSectionBuilder:
                 source_store_keys, key=lambda x: x.run_id.run_time, reverse=True
             )[: self.validation_results_limit]
 
+        resource_keys = []
         for resource_key in source_store_keys:
             # if no resource_identifiers are passed, the section
             # builder will build
@@ -429,32 +477,38 @@ class DefaultSiteSectionBuilder:
             if self.run_name_filter and not isinstance(resource_key, GXCloudIdentifier):
                 if not resource_key_passes_run_name_filter(resource_key, self.run_name_filter):
                     continue
-            try:
-                resource = self.source_store.get(resource_key)
-                if isinstance(resource_key, ExpectationSuiteIdentifier):
-                    resource = ExpectationSuite(**resource)
-            except exceptions.InvalidKeyError:
-                logger.warning(
-                    f"Object with Key: {resource_key!s} could not be retrieved. Skipping..."
-                )
-                continue
 
+            resource_keys.append(resource_key)
+
+        build_manifest: Optional[SiteBuildManifest] = None
+        if not self.source_store.cloud_mode:
+            build_manifest = _get_build_manifest(target_store=self.target_store)
+
+        content_hashes: Dict[Any, str] = {}
+        if self._renders_in_worker_processes():
+            self._render_in_worker_processes(
+                resource_keys=resource_keys,
+                build_manifest=build_manifest,
+                content_hashes=content_hashes,
+            )
+            return
+
+        resources: Iterator[Tuple[Any, Any]]
+        if build_manifest is None:
+            # Resources are fetched (concurrently, if store backend supports it) ahead of rendering.
+            resources = _get_many_skipping_failed_keys(store=self.source_store, keys=resource_keys)
+        else:
+            resources = self._get_new_or_changed_resources(
+                resource_keys=resource_keys,
+                build_manifest=build_manifest,
+                content_hashes=content_hashes,
+            )
+
+        for resource_key, resource in resources:
             if isinstance(resource_key, ExpectationSuiteIdentifier):
-                expectation_suite_name = resource_key.name
-                logger.debug(f"        Rendering expectation suite {expectation_suite_name}")
-            elif isinstance(resource_key, ValidationResultIdentifier):
-                run_id = resource_key.run_id
-                run_name = run_id.run_name
-                run_time = run_id.run_time
-                expectation_suite_name = resource_key.expectation_suite_identifier.name
-                if self.name == "profiling":
-                    logger.debug(
-                        f"        Rendering profiling for batch {resource_key.batch_identifier}"
-                    )
-                else:
-                    logger.debug(
-                        f"        Rendering validation: run name: {run_name}, run time: {run_time}, suite {expectation_suite_name} for batch {resource_key.batch_identifier}"  # noqa: E501
-                    )
+                resource = ExpectationSuite(**resource)  # noqa: PLW2901
+
+            self._log_resource_rendering(resource_key=resource_key)
 
             try:
                 rendered_content = self.renderer_class.render(resource)
@@ -472,25 +526,261 @@ class DefaultSiteSectionBuilder:
                         data_context_id=self.data_context_id,
                         show_how_to_buttons=self.show_how_to_buttons,
                     )
-                    # Verify type
-                    self.target_store.set(
-                        SiteSectionIdentifier(
-                            site_section_name=self.name,
-                            resource_identifier=resource_key,
+                    self._set_page(
+                        resource_key=resource_key,
+                        viewable_content=viewable_content,
+                        build_manifest=build_manifest,
+                        content_hashes=content_hashes,
+                        summary=(
+                            _summarize_validation_result(resource)
+                            if isinstance(resource_key, ValidationResultIdentifier)
+                            else {}
                         ),
-                        viewable_content,
                     )
             except Exception as e:
-                exception_message = """\
-An unexpected Exception occurred during data docs rendering.  Because of this error, certain parts of data docs will \
-not be rendered properly and/or may not appear altogether.  Please use the trace, included in this message, to \
-diagnose and repair the underlying issue.  Detailed information follows:
-                """  # noqa: E501
-                exception_traceback = traceback.format_exc()
-                exception_message += (
-                    f'{type(e).__name__}: "{e!s}".  ' f'Traceback: "{exception_traceback}".'
+                _log_rendering_error(e)
+
+    def _log_resource_rendering(self, resource_key: Any) -> None:
+        if isinstance(resource_key, ExpectationSuiteIdentifier):
+            expectation_suite_name = resource_key.name
+            logger.debug(f"        Rendering expectation suite {expectation_suite_name}")
+        elif isinstance(resource_key, ValidationResultIdentifier):
+            run_id = resource_key.run_id
+            run_name = run_id.run_name
+            run_time = run_id.run_time
+            expectation_suite_name = resource_key.expectation_suite_identifier.name
+            if self.name == "profiling":
+                logger.debug(
+                    f"        Rendering profiling for batch {resource_key.batch_identifier}"
+                )
+            else:
+                logger.debug(
+                    f"        Rendering validation: run name: {run_name}, run time: {run_time}, suite {expectation_suite_name} for batch {resource_key.batch_identifier}"  # noqa: E501
+                )
+
+    def _set_page(
+        self,
+        resource_key: Any,
+        viewable_content: str,
+        build_manifest: Optional[SiteBuildManifest],
+        content_hashes: Dict[Any, str],
+        summary: dict,
+    ) -> None:
+        self.target_store.set(
+            SiteSectionIdentifier(
+                site_section_name=self.name,
+                resource_identifier=resource_key,
+            ),
+            viewable_content,
+        )
+        if build_manifest is not None:
+            build_manifest.set_entry(
+                section_name=self.name,
+                resource_key=resource_key,
+                content_hash=content_hashes.pop(resource_key),
+                **summary,
+            )
+
+    def _renders_in_worker_processes(self) -> bool:
+        # Worker processes deserialize resources themselves, which is supported for built-in stores only.  # noqa: E501
+        # They also stand in for Data Context by "_RenderWorkerDataContext", which only built-in renderers and views are known to be content with.  # noqa: E501
+        return (
+            self.render_max_workers is not None
+            and self.render_max_workers > 1
+            and not self.cloud_mode
+            and not self.source_store.cloud_mode
+            and isinstance(self.source_store, (ExpectationsStore, ValidationResultsStore))
+            and _is_built_in_class(type(self.renderer_class))
+            and _is_built_in_class(type(self.view_class))
+        )
+
+    def _render_in_worker_processes(
+        self,
+        resource_keys: List[Any],
+        build_manifest: Optional[SiteBuildManifest],
+        content_hashes: Dict[Any, str],
+    ) -> None:
+        """Renders pages in pool of "render_max_workers" processes; pages are written by this (parent) process.
+
+        Workers receive resources as serialized by source store (so that they are deserialized by workers too), and
+        instantiate renderer and view (with its Jinja environment) only once, when started.
+        """  # noqa: E501
+        serialized_resources: Iterator[Tuple[Any, Any]] = self._get_serialized_resources(
+            resource_keys=resource_keys,
+            build_manifest=build_manifest,
+            content_hashes=content_hashes,
+        )
+        first_resources: List[Tuple[Any, Any]] = list(itertools.islice(serialized_resources, 1))
+        if not first_resources:
+            return
+
+        max_workers: int = min(self.render_max_workers, len(resource_keys))  # type: ignore[type-var]
+        executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_initialize_render_worker,
+            initargs=(
+                self._renderer_config,
+                self._view_config,
+                self.custom_styles_directory,
+                self.custom_views_directory,
+                self._get_suite_metas(resource_keys=resource_keys),
+                {
+                    "data_context_id": self.data_context_id,
+                    "show_how_to_buttons": self.show_how_to_buttons,
+                },
+            ),
+        )
+        # At most "2 * max_workers" pages are rendered ahead of being written, so that memory use does not grow with number of pages.  # noqa: E501
+        remaining_resources: Iterator[Tuple[Any, Any]] = itertools.chain(
+            first_resources, serialized_resources
+        )
+        pending: Deque[Tuple[Any, Future]] = deque()
+        try:
+            for resource_key, serialized_resource in itertools.islice(
+                remaining_resources, 2 * max_workers
+            ):
+                self._log_resource_rendering(resource_key=resource_key)
+                pending.append(
+                    (
+                        resource_key,
+                        executor.submit(_render_page_in_worker, resource_key, serialized_resource),
+                    )
+                )
+
+            while pending:
+                resource_key, future = pending.popleft()
+                for next_resource_key, next_serialized_resource in itertools.islice(
+                    remaining_resources, 1
+                ):
+                    self._log_resource_rendering(resource_key=next_resource_key)
+                    pending.append(
+                        (
+                            next_resource_key,
+                            executor.submit(
+                                _render_page_in_worker, next_resource_key, next_serialized_resource
+                            ),
+                        )
+                    )
+
+                try:
+                    viewable_content, summary = future.result()
+                    self._set_page(
+                        resource_key=resource_key,
+                        viewable_content=viewable_content,
+                        build_manifest=build_manifest,
+                        content_hashes=content_hashes,
+                        summary=summary,
+                    )
+                except Exception as e:
+                    _log_rendering_error(e)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _get_suite_metas(self, resource_keys: List[Any]) -> Dict[str, Any]:
+        """Returns meta of Expectation Suites of validation results (page renderers read it from Data Context, which worker processes do not have)."""  # noqa: E501
+        suite_names = {
+            resource_key.expectation_suite_identifier.name
+            for resource_key in resource_keys
+            if isinstance(resource_key, ValidationResultIdentifier)
+        }
+        suite_metas: Dict[str, Any] = {}
+        for suite_name in suite_names:
+            try:
+                suite_metas[suite_name] = self.data_context.suites.get(suite_name).meta
+            except Exception:
+                logger.debug(f"Meta of Expectation Suite {suite_name} could not be retrieved.")
+
+        return suite_metas
+
+    def _get_serialized_resources(
+        self,
+        resource_keys: List[Any],
+        build_manifest: Optional[SiteBuildManifest],
+        content_hashes: Dict[Any, str],
+    ) -> Iterator[Tuple[Any, Any]]:
+        """Yields resources, as serialized by source store; if build manifest is given, only those, whose pages are missing from it or have been rendered from different content.
+
+        Content hashes of yielded resources are added to "content_hashes" (to be recorded in manifest, once rendered).
+        Resources, whose pages are missing from target store (e.g., have been deleted), are yielded regardless.
+        """  # noqa: E501
+        render_signature: str = self._get_render_signature()
+        existing_page_keys: Optional[Set[tuple]] = None
+        keys_by_tuple = {self.source_store.key_to_tuple(key): key for key in resource_keys}
+        for key_tuple, serialized_resource in self.source_store.store_backend.get_many(
+            keys=keys_by_tuple.keys(), skip_missing_keys=True
+        ):
+            resource_key = keys_by_tuple[key_tuple]
+            if build_manifest is not None:
+                content_hash: str = SiteBuildManifest.compute_content_hash(
+                    serialized_value=serialized_resource, render_signature=render_signature
+                )
+                if build_manifest.has_unchanged_entry(
+                    section_name=self.name, resource_key=resource_key, content_hash=content_hash
+                ):
+                    if existing_page_keys is None:
+                        # Pages are listed once (rather than checked one by one), since cloud store backends check keys by listing them.  # noqa: E501
+                        existing_page_keys = self._list_existing_page_keys(
+                            resource_type=type(resource_key)
+                        )
+
+                    if resource_key.to_tuple() in existing_page_keys:
+                        logger.debug(f"        Skipping unchanged resource {resource_key!s}")
+                        continue
+
+                content_hashes[resource_key] = content_hash
+
+            yield resource_key, serialized_resource
+
+    def _get_render_signature(self) -> str:
+        """Identifies everything (besides resource itself), which pages are rendered from, so that changes to it invalidate them.
+
+        Signature covers configurations of renderer and view, source files of their classes, and files (with their
+        modification times) of custom styles and views directories.
+        """  # noqa: E501
+        return json.dumps(
+            {
+                "renderer": self._renderer_config,
+                "view": self._view_config,
+                "renderer_class": _describe_class_source(type(self.renderer_class)),
+                "view_class": _describe_class_source(type(self.view_class)),
+                "data_context_id": self.data_context_id,
+                "show_how_to_buttons": self.show_how_to_buttons,
+                "custom_styles_directory": _describe_directory(self.custom_styles_directory),
+                "custom_views_directory": _describe_directory(self.custom_views_directory),
+            },
+            sort_keys=True,
+            default=str,
+        )
+
+    def _list_existing_page_keys(self, resource_type: type) -> Set[tuple]:
+        try:
+            return set(self.target_store.store_backends[resource_type].list_keys())
+        except Exception as e:
+            logger.debug(f"Pages of section {self.name} could not be listed: {e}")
+            return set()
+
+    def _get_new_or_changed_resources(
+        self,
+        resource_keys: List[Any],
+        build_manifest: SiteBuildManifest,
+        content_hashes: Dict[Any, str],
+    ) -> Iterator[Tuple[Any, Any]]:
+        """Yields (deserialized) resources, whose pages are missing from build manifest or have been rendered from different content."""  # noqa: E501
+        for resource_key, serialized_resource in self._get_serialized_resources(
+            resource_keys=resource_keys,
+            build_manifest=build_manifest,
+            content_hashes=content_hashes,
+        ):
+            try:
+                resource = self.source_store.deserialize(serialized_resource)
+            except Exception:
+                logger.warning(
+                    f"Object with Key: {resource_key!s} could not be deserialized. Skipping..."
                 )
-                logger.error(exception_message)  # noqa: TRY400
+                content_hashes.pop(resource_key)
+                continue
+
+            yield resource_key, resource
 
 
 class DefaultSiteIndexBuilder:
@@ -783,6 +1073,9 @@ diagnose and repair the underlying issue.  Detailed information follows:
                         self.target_store.store_backends[ExpectationSuiteIdentifier].remove_key(
                             expectation_suite_site_key
                         )
+                        self._remove_build_manifest_entries(
+                            section_names=("expectations",), resource_key=expectation_suite_site_key
+                        )
                     else:
                         cleaned_keys.append(expectation_suite_site_key)
                 expectation_suite_site_keys = cleaned_keys
@@ -829,12 +1122,71 @@ diagnose and repair the underlying issue.  Detailed information follows:
                         self.target_store.store_backends[ValidationResultIdentifier].remove_key(
                             validation_result_site_key
                         )
+                        self._remove_build_manifest_entries(
+                            section_names=("validations", "profiling"),
+                            resource_key=validation_result_site_key,
+                        )
                     else:
                         cleaned_keys.append(validation_result_site_key)
                 validation_and_profiling_result_site_keys = cleaned_keys
 
         return validation_and_profiling_result_site_keys
 
+    def _remove_build_manifest_entries(
+        self, section_names: Tuple[str, ...], resource_key: Any
+    ) -> None:
+        build_manifest: Optional[SiteBuildManifest] = _get_build_manifest(
+            target_store=self.target_store
+        )
+        if build_manifest is None:
+            return
+
+        for section_name in section_names:
+            build_manifest.remove_entry(section_name=section_name, resource_key=resource_key)
+
+    def _get_validation_result_summaries(
+        self, section_name: str, validation_result_keys: List[ValidationResultIdentifier]
+    ) -> Iterator[Tuple[ValidationResultIdentifier, dict]]:
+        """Yields index page fields of Validation Results of section (in order of "validation_result_keys").
+
+        Fields are taken from build manifest; only Validation Results, missing from it, are loaded (concurrently, if
+        store backend supports it).  Validation Results, which cannot be loaded, are skipped.
+        """  # noqa: E501
+        build_manifest: Optional[SiteBuildManifest] = _get_build_manifest(
+            target_store=self.target_store
+        )
+        summaries: Dict[ValidationResultIdentifier, dict] = {}
+        keys_to_load: List[ValidationResultIdentifier] = []
+        for validation_result_key in validation_result_keys:
+            entry: Optional[dict] = (
+                build_manifest.get_entry(
+                    section_name=section_name, resource_key=validation_result_key
+                )
+                if build_manifest
+                else None
+            )
+            if entry and "success" in entry:
+                summaries[validation_result_key] = entry
+            else:
+                keys_to_load.append(validation_result_key)
+
+        validation_results_store_name: str = (
+            self.source_stores.get(section_name) or self.data_context.validation_results_store_name
+        )
+        for validation_result_key, validation_result in _get_many_skipping_failed_keys(
+            store=self.data_context.stores[validation_results_store_name], keys=keys_to_load
+        ):
+            try:
+                summaries[validation_result_key] = _summarize_validation_result(validation_result)
+            except Exception:
+                logger.warning(
+                    f"Validation result could not be summarized: {validation_result_key!s} - skipping"  # noqa: E501
+                )
+
+        for validation_result_key in validation_result_keys:
+            if validation_result_key in summaries:
+                yield validation_result_key, summaries[validation_result_key]
+
     def _add_profiling_to_index_links(
         self,
         index_links_dict: OrderedDict,
@@ -852,18 +1204,10 @@ diagnose and repair the underlying issue.  Detailed information follows:
                     validation_result_key, profiling_run_name_filter
                 )
             ]
-            for profiling_result_key in profiling_result_site_keys:
+            for profiling_result_key, summary in self._get_validation_result_summaries(
+                section_name="profiling", validation_result_keys=profiling_result_site_keys
+            ):
                 try:
-                    validation = self.data_context.get_validation_result(
-                        batch_identifier=profiling_result_key.batch_identifier,
-                        expectation_suite_name=profiling_result_key.expectation_suite_identifier.name,
-                        run_id=profiling_result_key.run_id,
-                        validation_results_store_name=self.source_stores.get("profiling"),
-                    )
-
-                    batch_kwargs = validation.meta.get("batch_kwargs", {})
-                    batch_spec = validation.meta.get("batch_spec", {})
-
                     self.add_resource_info_to_index_links_dict(
                         index_links_dict=index_links_dict,
                         expectation_suite_name=profiling_result_key.expectation_suite_identifier.name,
@@ -872,9 +1216,9 @@ diagnose and repair the underlying issue.  Detailed information follows:
                         run_id=profiling_result_key.run_id,
                         run_time=profiling_result_key.run_id.run_time,
                         run_name=profiling_result_key.run_id.run_name,
-                        asset_name=_resolve_asset_name(validation),
-                        batch_kwargs=batch_kwargs,
-                        batch_spec=batch_spec,
+                        asset_name=summary["asset_name"],
+                        batch_kwargs=summary["batch_kwargs"],
+                        batch_spec=summary["batch_spec"],
                     )
                 except Exception:
                     error_msg = f"Profiling result not found: {profiling_result_key.to_tuple()!s:s} - skipping"  # noqa: E501
@@ -906,31 +1250,22 @@ diagnose and repair the underlying issue.  Detailed information follows:
                 validation_result_site_keys = validation_result_site_keys[
                     : self.validation_results_limit
                 ]
-            for validation_result_key in validation_result_site_keys:
+            for validation_result_key, summary in self._get_validation_result_summaries(
+                section_name="validations", validation_result_keys=validation_result_site_keys
+            ):
                 try:
-                    validation = self.data_context.get_validation_result(
-                        batch_identifier=validation_result_key.batch_identifier,
-                        expectation_suite_name=validation_result_key.expectation_suite_identifier.name,
-                        run_id=validation_result_key.run_id,
-                        validation_results_store_name=self.source_stores.get("validations"),
-                    )
-
-                    validation_success = validation.success
-                    batch_kwargs = validation.meta.get("batch_kwargs", {})
-                    batch_spec = validation.meta.get("batch_spec", {})
-
                     self.add_resource_info_to_index_links_dict(
                         index_links_dict=index_links_dict,
                         expectation_suite_name=validation_result_key.expectation_suite_identifier.name,
                         section_name="validations",
                         batch_identifier=validation_result_key.batch_identifier,
                         run_id=validation_result_key.run_id,
-                        validation_success=validation_success,
+                        validation_success=summary["success"],
                         run_time=validation_result_key.run_id.run_time,
                         run_name=validation_result_key.run_id.run_name,
-                        asset_name=_resolve_asset_name(validation),
-                        batch_kwargs=batch_kwargs,
-                        batch_spec=batch_spec,
+                        asset_name=summary["asset_name"],
+                        batch_kwargs=summary["batch_kwargs"],
+                        batch_spec=summary["batch_spec"],
                     )
                 except Exception:
                     error_msg = f"Validation result not found: {validation_result_key.to_tuple()!s:s} - skipping"  # noqa: E501
@@ -954,6 +1289,180 @@ def _resolve_asset_name(validation_results: ExpectationValidationResult) -> str
     return active_batch.get("data_asset_name")
 
 
+def _summarize_validation_result(validation_result: ExpectationSuiteValidationResult) -> dict:
+    """Returns fields of Validation Result, which are shown on index page (and recorded in build manifest)."""  # noqa: E501
+    return {
+        "success": validation_result.success,
+        "asset_name": _resolve_asset_name(validation_result),  # type: ignore[arg-type]
+        "batch_kwargs": convert_to_json_serializable(
+            validation_result.meta.get("batch_kwargs", {})
+        ),
+        "batch_spec": convert_to_json_serializable(validation_result.meta.get("batch_spec", {})),
+    }
+
+
+def _get_many_skipping_failed_keys(store: Store, keys: List[Any]) -> Iterator[Tuple[Any, Any]]:
+    """Yields "(key, value)" pairs of "keys", retrieved by "Store.get_many()" (concurrently, if store backend supports it).
+
+    Should batched retrieval fail (e.g., on value, which cannot be read), remaining keys are retrieved one by one, so that
+    only keys, which fail individually, are logged and skipped.
+    """  # noqa: E501
+    retrieved_keys: Set[Any] = set()
+    try:
+        for key, value in store.get_many(keys=keys, skip_failed_keys=True):
+            retrieved_keys.add(key)
+            yield key, value
+
+        return
+    except Exception as e:
+        logger.warning(
+            f"Resources could not be retrieved at once ({type(e).__name__}: {e}); retrieving remaining resources one by one."  # noqa: E501
+        )
+
+    for key in keys:
+        if key in retrieved_keys:
+            continue
+
+        try:
+            value = store.get(key)
+        except Exception:
+            logger.warning(f"Resource could not be retrieved: {key!s} - skipping")
+            continue
+
+        yield key, value
+
+
+def _is_built_in_class(class_: type) -> bool:
+    return class_.__module__.split(".")[0] == "great_expectations"
+
+
+def _describe_class_source(class_: type) -> List[Any]:
+    """Returns qualified name of class, as well as path and modification time of its source file (if any)."""  # noqa: E501
+    description: List[Any] = [f"{class_.__module__}.{class_.__qualname__}"]
+    try:
+        source_file: Optional[str] = inspect.getsourcefile(class_)
+        if source_file:
+            description.extend((source_file, os.stat(source_file).st_mtime_ns))  # noqa: PTH116
+    except (OSError, TypeError):
+        pass
+
+    return description
+
+
+def _describe_directory(directory: Optional[str]) -> Optional[List[Tuple[str, int, int]]]:
+    """Returns relative path, modification time, and size of every file in directory (if it exists)."""  # noqa: E501
+    if not directory or not os.path.isdir(directory):  # noqa: PTH112
+        return None
+
+    files: List[Tuple[str, int, int]] = []
+    for root, _, file_names in os.walk(directory):
+        for file_name in file_names:
+            file_path: str = os.path.join(root, file_name)  # noqa: PTH118
+            file_stat = os.stat(file_path)  # noqa: PTH116
+            files.append(
+                (os.path.relpath(file_path, directory), file_stat.st_mtime_ns, file_stat.st_size)
+            )
+
+    return sorted(files)
+
+
+def _get_build_manifest(target_store: Any) -> Optional[SiteBuildManifest]:
+    # Only HTML sites (as opposed to JSON sites of GX Cloud) are built incrementally.
+    if isinstance(target_store, HtmlSiteStore):
+        return target_store.build_manifest
+
+    return None
+
+
+def _log_rendering_error(e: Exception) -> None:
+    exception_message = """\
+An unexpected Exception occurred during data docs rendering.  Because of this error, certain parts of data docs will \
+not be rendered properly and/or may not appear altogether.  Please use the trace, included in this message, to \
+diagnose and repair the underlying issue.  Detailed information follows:
+            """  # noqa: E501
+    exception_traceback = traceback.format_exc()
+    exception_message += f'{type(e).__name__}: "{e!s}".  ' f'Traceback: "{exception_traceback}".'
+    logger.error(exception_message)
+
+
+class _RenderWorkerDataContext:
+    """Stands in for Data Context in rendering worker processes; it only serves meta of Expectation Suites (to page renderers)."""  # noqa: E501
+
+    def __init__(self, suite_metas: Dict[str, Any]) -> None:
+        self._suite_metas = suite_metas
+
+    @property
+    def suites(self) -> _RenderWorkerDataContext:
+        return self
+
+    def get(self, name: str) -> SimpleNamespace:
+        return SimpleNamespace(meta=self._suite_metas[name])
+
+
+# Renderer, view, and deserialization schemas of current rendering worker process (set by its initializer).  # noqa: E501
+_render_worker_state: Dict[str, Any] = {}
+
+
+def _initialize_render_worker(  # noqa: PLR0913
+    renderer_config: dict,
+    view_config: dict,
+    custom_styles_directory: Optional[str],
+    custom_views_directory: Optional[str],
+    suite_metas: Dict[str, Any],
+    view_kwargs: dict,
+) -> None:
+    _render_worker_state["renderer"] = instantiate_class_from_config(
+        config=renderer_config,
+        runtime_environment={"data_context": _RenderWorkerDataContext(suite_metas=suite_metas)},
+    )
+    _render_worker_state["view"] = instantiate_class_from_config(
+        config=view_config,
+        runtime_environment={
+            "custom_styles_directory": custom_styles_directory,
+            "custom_views_directory": custom_views_directory,
+        },
+    )
+    _render_worker_state["view_kwargs"] = view_kwargs
+    _render_worker_state["expectation_suite_schema"] = ExpectationSuiteSchema()
+    _render_worker_state["validation_result_schema"] = ExpectationSuiteValidationResultSchema()
+
+
+def _render_page_in_worker(resource_key: Any, serialized_resource: Any) -> Tuple[str, dict]:
+    """Deserializes and renders resource in rendering worker process; returns page and its build manifest summary."""  # noqa: E501
+    resource: Any
+    if isinstance(resource_key, ExpectationSuiteIdentifier):
+        resource = ExpectationSuite(
+            **_load_serialized_resource(
+                schema=_render_worker_state["expectation_suite_schema"],
+                serialized_resource=serialized_resource,
+            )
+        )
+    else:
+        resource = _load_serialized_resource(
+            schema=_render_worker_state["validation_result_schema"],
+            serialized_resource=serialized_resource,
+        )
+
+    rendered_content = _render_worker_state["renderer"].render(resource)
+    viewable_content: str = _render_worker_state["view"].render(
+        rendered_content, **_render_worker_state["view_kwargs"]
+    )
+    summary: dict = (
+        _summarize_validation_result(resource)
+        if isinstance(resource_key, ValidationResultIdentifier)
+        else {}
+    )
+    return viewable_content, summary
+
+
+def _load_serialized_resource(schema: Any, serialized_resource: Any) -> Any:
+    # Same as "deserialize()" of "ExpectationsStore" and "ValidationResultsStore".
+    if isinstance(serialized_resource, dict):
+        return schema.load(serialized_resource)
+
+    return schema.loads(serialized_resource)
+
+
 class CallToActionButton:
     def __init__(self, title, link) -> None:
         self.title = title
@@ -987,9 +987,12 @@ def build_spark_validator_with_data(
 
 def build_pandas_engine(
     df: pd.DataFrame,
+    **execution_engine_kwargs,
 ) -> PandasExecutionEngine:
     batch = Batch(data=df)  # type: ignore[arg-type]
-    execution_engine = PandasExecutionEngine(batch_data_dict={batch.id: batch.data})
+    execution_engine = PandasExecutionEngine(
+        batch_data_dict={batch.id: batch.data}, **execution_engine_kwargs
+    )
     return execution_engine
 
 
@@ -1002,6 +1005,7 @@ def build_sa_execution_engine(  # noqa: PLR0913
     index: bool = False,
     dtype: Optional[dict] = None,
     table_name: str = "test",
+    **execution_engine_kwargs,
 ) -> SqlAlchemyExecutionEngine:
     # noinspection PyUnresolvedReferences
     sqlalchemy_engine: sqlalchemy.Engine = sa.create_engine("sqlite://", echo=False)
@@ -1025,7 +1029,9 @@ def build_sa_execution_engine(  # noqa: PLR0913
         batch_id = batch.id
 
     execution_engine = SqlAlchemyExecutionEngine(
-        engine=sqlalchemy_engine, batch_data_dict={batch_id: batch_data}
+        engine=sqlalchemy_engine,
+        batch_data_dict={batch_id: batch_data},
+        **execution_engine_kwargs,
     )
 
     return execution_engine
@@ -1095,7 +1095,7 @@ def convert_to_json_serializable(
 ) -> None: ...
 
 
-def convert_to_json_serializable(  # noqa: C901, PLR0911, PLR0912
+def convert_to_json_serializable(
     data: JSONConvertable,
 ) -> JSONValues:
     """Converts an object to one that is JSON-serializable.
@@ -1120,154 +1120,312 @@ def convert_to_json_serializable(  # noqa: C901, PLR0911, PLR0912
     Raises:
         TypeError: A non-JSON-serializable field was found.
     """
-    if isinstance(data, pydantic.BaseModel):
-        return json.loads(data.json())
+    data_type: type = type(data)
+    try:
+        converter: Callable[[Any], JSONValues] = _JSON_SERIALIZABLE_CONVERTERS[data_type]
+    except KeyError:
+        converter = _get_json_serializable_converter(data_type=data_type)
+        _JSON_SERIALIZABLE_CONVERTERS[data_type] = converter
 
-    if isinstance(data, (SerializableDictDot, SerializableDotDict)):
-        return data.to_json_dict()
+    return converter(data)
 
-    # Handling "float(nan)" separately is required by Python-3.6 and Pandas-0.23 versions.
-    if isinstance(data, float) and np.isnan(data):
-        return None
 
-    if isinstance(data, (str, int, float, bool)):
-        # No problem to encode json
-        return data
+# Converters are looked up once per type (the chain of "issubclass()" checks below is walked only on first encounter).  # noqa: E501
+_JSON_SERIALIZABLE_CONVERTERS: Dict[type, Callable[[Any], JSONValues]] = {}
 
-    if isinstance(data, range):
-        return list(data)
 
-    if isinstance(data, dict):
-        new_dict = {}
-        for key in data:
-            # A pandas index can be numeric, and a dict key can be numeric, but a json key must be a string  # noqa: E501
-            new_dict[str(key)] = convert_to_json_serializable(data[key])
+def _get_json_serializable_converter(  # noqa: C901, PLR0911, PLR0912
+    data_type: type,
+) -> Callable[[Any], JSONValues]:
+    """Returns function, which converts objects of "data_type" to JSON-serializable ones.
 
-        return new_dict
+    Order of checks is significant (e.g., "np.float64" is subclass of "float", and "bool" is subclass of "int").
+    """  # noqa: E501
+    if issubclass(data_type, pydantic.BaseModel):
+        return _convert_pydantic_model_to_json_serializable
 
-    if isinstance(data, (list, tuple, set)):
-        new_list: List[JSONValues] = []
-        for val in data:
-            new_list.append(convert_to_json_serializable(val))
+    if issubclass(data_type, (SerializableDictDot, SerializableDotDict)):
+        return _convert_serializable_to_json_dict
 
-        return new_list
+    # Handling "float(nan)" separately is required by Python-3.6 and Pandas-0.23 versions.
+    if issubclass(data_type, float):
+        return _convert_float_to_json_serializable
 
-    if isinstance(data, (np.ndarray, pd.Index)):
-        # test_obj[key] = test_obj[key].tolist()
-        # If we have an array or index, convert it first to a list--causing coercion to float--and then round  # noqa: E501
-        # to the number of digits for which the string representation will equal the float representation  # noqa: E501
-        return [convert_to_json_serializable(x) for x in data.tolist()]
+    if issubclass(data_type, (str, int, bool)):
+        # No problem to encode json
+        return _return_as_is
 
-    if isinstance(data, np.int64):
-        return int(data)
+    if issubclass(data_type, range):
+        return list
 
-    if isinstance(data, np.float64):
-        return float(data)
+    if issubclass(data_type, dict):
+        return _convert_dict_to_json_serializable
 
-    if isinstance(data, (datetime.datetime, datetime.date)):
-        return data.isoformat()
+    if issubclass(data_type, (list, tuple, set)):
+        return _convert_collection_to_json_serializable
 
-    if isinstance(data, (np.datetime64)):
-        return np.datetime_as_string(data)
+    if issubclass(data_type, (np.ndarray, pd.Index)):
+        return _convert_array_to_json_serializable
 
-    if isinstance(data, uuid.UUID):
-        return str(data)
+    if issubclass(data_type, np.int64):
+        return int
 
-    if isinstance(data, bytes):
-        return str(data)
+    if issubclass(data_type, (datetime.datetime, datetime.date)):
+        return _convert_to_isoformat
 
-    if isinstance(data, slice):
-        return str(data)
+    if issubclass(data_type, np.datetime64):
+        return np.datetime_as_string
 
-    if isinstance(data, pathlib.PurePath):
-        return str(data)
+    if issubclass(data_type, (uuid.UUID, bytes, slice, pathlib.PurePath)):
+        return str
 
     # noinspection PyTypeChecker
-    if Polygon and isinstance(data, (Point, Polygon, MultiPolygon, LineString)):
-        return str(data)
+    if Polygon and issubclass(data_type, (Point, Polygon, MultiPolygon, LineString)):
+        return str
 
     # Use built in base type from numpy, https://docs.scipy.org/doc/numpy-1.13.0/user/basics.types.html
     # https://github.com/numpy/numpy/pull/9505
-    if np.issubdtype(type(data), np.bool_):
-        return bool(data)
+    if np.issubdtype(data_type, np.bool_):
+        return bool
 
-    if np.issubdtype(type(data), np.integer) or np.issubdtype(type(data), np.uint):
-        return int(data)  # type: ignore[arg-type] # could be None
+    if np.issubdtype(data_type, np.integer) or np.issubdtype(data_type, np.uint):
+        return int
 
-    if np.issubdtype(type(data), np.floating):
+    if np.issubdtype(data_type, np.floating):
         # Note: Use np.floating to avoid FutureWarning from numpy
-        return float(round(data, sys.float_info.dig))  # type: ignore[arg-type] # could be None
+        return _convert_numpy_float_to_json_serializable
 
-    # Note: This clause has to come after checking for np.ndarray or we get:
-    #      `ValueError: The truth value of an array with more than one element is ambiguous. Use a.any() or a.all()`  # noqa: E501
-    if data is None:
+    if data_type is type(None):
         # No problem to encode json
-        return data
+        return _return_as_is
 
-    try:
-        if not isinstance(data, list) and pd.isna(data):  # type: ignore[arg-type]
-            # pd.isna is functionally vectorized, but we only want to apply this to single objects
-            # Hence, why we test for `not isinstance(list)`
-            return None
-    except TypeError:
-        pass
-    except ValueError:
-        pass
+    # "pd.isna()" of Series or DataFrame is never scalar; hence, these are converted without checking for missing value.  # noqa: E501
+    if issubclass(data_type, pd.Series):
+        return _convert_series_to_json_serializable
 
-    if isinstance(data, pd.Series):
-        # Converting a series is tricky since the index may not be a string, but all json
-        # keys must be strings. So, we use a very ugly serialization strategy
-        index_name = data.index.name or "index"
-        value_name = data.name or "value"
-        return [
-            {
-                index_name: convert_to_json_serializable(idx),  # type: ignore[call-overload]
-                value_name: convert_to_json_serializable(val),  # type: ignore[dict-item]
-            }
-            for idx, val in data.items()
-        ]
+    if issubclass(data_type, pd.DataFrame):
+        return _convert_dataframe_to_json_serializable
 
-    if isinstance(data, pd.DataFrame):
-        return convert_to_json_serializable(data.to_dict(orient="records"))
+    return _convert_missing_value_to_none(
+        converter=_get_json_serializable_converter_of_non_missing_value(data_type=data_type)
+    )
 
-    if pyspark.DataFrame and isinstance(data, pyspark.DataFrame):  # type: ignore[truthy-function]
-        # using StackOverflow suggestion for converting pyspark df into dictionary
-        # https://stackoverflow.com/questions/43679880/pyspark-dataframe-to-dictionary-columns-as-keys-and-list-of-column-values-ad-di
-        return convert_to_json_serializable(dict(zip(data.schema.names, zip(*data.collect()))))
+
+def _get_json_serializable_converter_of_non_missing_value(  # noqa: C901, PLR0911
+    data_type: type,
+) -> Callable[[Any], JSONValues]:
+    if pyspark.DataFrame and issubclass(data_type, pyspark.DataFrame):  # type: ignore[truthy-function]
+        return _convert_spark_dataframe_to_json_serializable
 
     # SQLAlchemy serialization
-    if LegacyRow and isinstance(data, LegacyRow):
-        return dict(data)
+    if LegacyRow and issubclass(data_type, LegacyRow):
+        return dict
 
     # sqlalchemy text for SqlAlchemy 2 compatibility
-    if sqlalchemy.TextClause and isinstance(data, sqlalchemy.TextClause):  # type: ignore[truthy-function]
-        return str(data)
+    if sqlalchemy.TextClause and issubclass(data_type, sqlalchemy.TextClause):  # type: ignore[truthy-function]
+        return str
 
-    if Row and isinstance(data, Row):  # type: ignore[truthy-function]
-        return str(data)
+    if Row and issubclass(data_type, Row):  # type: ignore[truthy-function]
+        return str
 
-    if isinstance(data, decimal.Decimal):
-        return convert_decimal_to_float(d=data)
+    if issubclass(data_type, decimal.Decimal):
+        return convert_decimal_to_float
 
     from great_expectations.core.run_identifier import RunIdentifier
 
-    if isinstance(data, RunIdentifier):
-        return data.to_json_dict()
+    if issubclass(data_type, RunIdentifier):
+        return _convert_serializable_to_json_dict
 
     # PySpark schema serialization
-    if pyspark.types and isinstance(data, pyspark.types.StructType):
-        return dict(data.jsonValue())
+    if pyspark.types and issubclass(data_type, pyspark.types.StructType):
+        return _convert_spark_schema_to_json_serializable
 
-    if sqlalchemy.Connection and isinstance(data, sqlalchemy.Connection):  # type: ignore[truthy-function]
+    if sqlalchemy.Connection and issubclass(data_type, sqlalchemy.Connection):  # type: ignore[truthy-function]
         # Connection is a module, which is non-serializable. Return module name instead.
-        return "sqlalchemy.engine.base.Connection"
+        return _convert_sqlalchemy_connection_to_json_serializable
+
+    if issubclass(data_type, RenderedContent):
+        return _convert_serializable_to_json_dict
+
+    if issubclass(data_type, re.Pattern):
+        return _convert_pattern_to_json_serializable
+
+    return _raise_not_json_serializable
+
+
+def _return_as_is(data: Any) -> JSONValues:
+    return data
+
+
+def _convert_pydantic_model_to_json_serializable(data: pydantic.BaseModel) -> JSONValues:
+    return json.loads(data.json())
+
+
+def _convert_serializable_to_json_dict(data: Any) -> JSONValues:
+    return data.to_json_dict()
+
+
+def _convert_float_to_json_serializable(data: float) -> Optional[float]:
+    return None if np.isnan(data) else data
+
+
+def _convert_numpy_float_to_json_serializable(data: np.floating) -> float:
+    return float(round(data, sys.float_info.dig))
+
+
+def _convert_to_isoformat(data: Union[datetime.datetime, datetime.date]) -> str:
+    return data.isoformat()
+
+
+def _convert_dict_to_json_serializable(data: dict) -> dict:
+    # A pandas index can be numeric, and a dict key can be numeric, but a json key must be a string
+    return {str(key): convert_to_json_serializable(data[key]) for key in data}
+
+
+def _convert_collection_to_json_serializable(data: Union[list, tuple, set]) -> list:
+    return [convert_to_json_serializable(val) for val in data]
+
+
+def _convert_array_to_json_serializable(data: Union[npt.NDArray, pd.Index]) -> list:
+    # If we have an array or index, convert it first to a list--causing coercion to float--and then round  # noqa: E501
+    # to the number of digits for which the string representation will equal the float representation  # noqa: E501
+    return _convert_array_values_to_json_serializable(array=data, values=data.tolist())
+
+
+def _convert_array_values_to_json_serializable(  # noqa: C901
+    array: Union[npt.NDArray, pd.Index, pd.Series], values: list
+) -> list:
+    """Converts "values" (elements of "array", as listed by "tolist()"), handling homogeneous dtypes in bulk.
+
+    Elements of numeric, boolean, and string dtypes are already listed as Python scalars; only missing values of
+    floating point dtypes are replaced, and elements of datetime dtypes are formatted without per-element dispatch.
+    """  # noqa: E501
+    dtype = array.dtype
+    if isinstance(dtype, np.dtype) and array.ndim > 0:
+        if dtype.kind in "biuU":
+            return values
+
+        if array.ndim == 1:
+            if dtype.kind == "f":
+                idx: int
+                for idx in np.flatnonzero(np.isnan(array)):
+                    values[idx] = None
+
+                return values
+
+            if dtype.kind == "M":
+                # Unlike NumPy arrays, Pandas objects list "pd.Timestamp" elements (and "pd.NaT" is formatted as "NaT").  # noqa: E501
+                strings: Optional[list] = (
+                    _convert_datetime64_array_to_isoformat(array=array)
+                    if isinstance(array, np.ndarray)
+                    else None
+                )
+                if strings is not None:
+                    return strings
+
+                # Depending on unit, "tolist()" yields "datetime.date", "datetime.datetime", or "int" (e.g., for "ns").  # noqa: E501
+                return [
+                    val if val is None or isinstance(val, int) else val.isoformat()
+                    for val in values
+                ]
+
+            if dtype.kind == "O" and pd.api.types.infer_dtype(array, skipna=False) == "string":
+                return values
+
+    return [convert_to_json_serializable(val) for val in values]
+
+
+def _convert_datetime64_array_to_isoformat(array: npt.NDArray) -> Optional[list]:
+    """Formats "datetime64" values of date (or whole second) units exactly as "isoformat()" of their "tolist()" elements.
+
+    Returns None for other units (whose "isoformat()" omits zero microseconds per element) and for values out of range
+    of "datetime.datetime" (which "tolist()" lists as integers).
+    """  # noqa: E501
+    unit: str = np.datetime_data(array.dtype)[0]
+    if unit in _DATETIME64_DATE_UNITS:
+        string_unit = "D"
+    elif unit in _DATETIME64_TIME_UNITS:
+        string_unit = "s"
+    else:
+        return None
+
+    is_nat: npt.NDArray = np.isnat(array)
+    not_nat_values: npt.NDArray = array[~is_nat]
+    if not_nat_values.size > 0 and (
+        not_nat_values.min() < _MIN_DATETIME64 or not_nat_values.max() > _MAX_DATETIME64
+    ):
+        return None
+
+    strings: list = np.datetime_as_string(array, unit=string_unit).tolist()
+    idx: int
+    for idx in np.flatnonzero(is_nat):
+        strings[idx] = None
+
+    return strings
+
+
+_DATETIME64_DATE_UNITS: Tuple[str, ...] = ("Y", "M", "W", "D")
+_DATETIME64_TIME_UNITS: Tuple[str, ...] = ("h", "m", "s")
+_MIN_DATETIME64 = np.datetime64(datetime.datetime.min)
+_MAX_DATETIME64 = np.datetime64(datetime.datetime.max)
+
+
+def _convert_series_to_json_serializable(data: pd.Series) -> list:
+    # Converting a series is tricky since the index may not be a string, but all json
+    # keys must be strings. So, we use a very ugly serialization strategy
+    index_name = data.index.name or "index"
+    value_name = data.name or "value"
+    values: list = _convert_array_values_to_json_serializable(
+        array=data,
+        # Unlike "tolist()", iteration of extension arrays yields their scalar types (e.g., "pd.Timestamp").  # noqa: E501
+        values=data.tolist() if isinstance(data.dtype, np.dtype) else list(data),
+    )
+    return [
+        {index_name: idx, value_name: val}
+        for idx, val in zip(_convert_array_to_json_serializable(data.index), values)
+    ]
+
+
+def _convert_dataframe_to_json_serializable(data: pd.DataFrame) -> list:
+    return convert_to_json_serializable(data.to_dict(orient="records"))
+
+
+def _convert_spark_dataframe_to_json_serializable(data: pyspark.DataFrame) -> JSONValues:
+    # using StackOverflow suggestion for converting pyspark df into dictionary
+    # https://stackoverflow.com/questions/43679880/pyspark-dataframe-to-dictionary-columns-as-keys-and-list-of-column-values-ad-di
+    return convert_to_json_serializable(dict(zip(data.schema.names, zip(*data.collect()))))
+
+
+def _convert_spark_schema_to_json_serializable(data: pyspark.types.StructType) -> dict:
+    return dict(data.jsonValue())
+
+
+def _convert_sqlalchemy_connection_to_json_serializable(data: Any) -> str:
+    return "sqlalchemy.engine.base.Connection"
+
+
+def _convert_pattern_to_json_serializable(data: re.Pattern) -> str:
+    return data.pattern
+
+
+def _convert_missing_value_to_none(
+    converter: Callable[[Any], JSONValues],
+) -> Callable[[Any], JSONValues]:
+    def _convert(data: Any) -> JSONValues:
+        try:
+            if pd.isna(data):
+                return None
+        except TypeError:
+            pass
+        except ValueError:
+            pass
+
+        return converter(data)
 
-    if isinstance(data, RenderedContent):
-        return data.to_json_dict()
+    return _convert
 
-    if isinstance(data, re.Pattern):
-        return data.pattern
 
+def _raise_not_json_serializable(data: Any) -> JSONValues:
     # Unable to serialize (unrecognized data type).
     raise TypeError(f"{data!s} is of type {type(data).__name__} which cannot be serialized.")  # noqa: TRY003
 
@@ -0,0 +1,134 @@
+"""Derive the columns, which a batch must load to validate the given Expectations.
+
+See "great_expectations/execution_engine/column_projection.py" for how batches load these columns.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Any, Iterable, List, Optional, Set
+
+from great_expectations.exceptions import ExpectationNotFoundError
+from great_expectations.expectations.registry import get_expectation_impl
+
+if TYPE_CHECKING:
+    from great_expectations.core.result_format import ResultFormatUnion
+    from great_expectations.expectations.expectation_configuration import (
+        ExpectationConfiguration,
+    )
+
+# Domain keys, which name the columns of the domain.
+COLUMN_DOMAIN_KEYS = ("column", "column_A", "column_B")
+COLUMN_LIST_DOMAIN_KEYS = ("column_list",)
+
+# Domain keys, which do not reference columns (besides any row condition).
+NON_COLUMN_DOMAIN_KEYS = ("batch_id", "table", "row_condition", "condition_parser", "ignore_row_if")
+
+# Table Expectations, which only depend on the schema and the number of rows of the table.
+SCHEMA_ONLY_EXPECTATION_TYPES = (
+    "expect_column_to_exist",
+    "expect_table_column_count_to_be_between",
+    "expect_table_column_count_to_equal",
+    "expect_table_columns_to_match_ordered_list",
+    "expect_table_columns_to_match_set",
+    "expect_table_row_count_to_be_between",
+    "expect_table_row_count_to_equal",
+)
+
+# Quoted strings and identifiers of a row condition, any of which may name a column.
+ROW_CONDITION_TOKEN_PATTERN = re.compile(
+    r"\"((?:[^\"\\]|\\.)*)\"|'((?:[^'\\]|\\.)*)'|`([^`]*)`|([A-Za-z_][A-Za-z0-9_]*)"
+)
+
+
+def get_referenced_columns(
+    expectation_configurations: Iterable[ExpectationConfiguration],
+    result_format: Optional[ResultFormatUnion] = None,
+) -> Optional[List[str]]:
+    """Return the columns referenced by the given Expectations, or None if all columns are needed.
+
+    Referenced columns are the columns of the domain of every Expectation ("column", "column_A" and
+    "column_B", and "column_list"), the columns, which may be named by its row condition, and the
+    "unexpected_index_column_names" of the result format.  Since row conditions are not parsed,
+    every identifier and quoted string of a row condition is included; callers only load columns
+    present in the data.
+
+    All columns are needed if any Expectation has a domain, which cannot be derived up front (e.g.,
+    a parameterized column, or a table Expectation, which does not only depend on the schema), or if
+    the result format includes unexpected rows.
+
+    Args:
+        expectation_configurations: The Expectations to validate.
+        result_format: The result format of the validation run.
+
+    Returns:
+        The referenced columns, in order of first reference, or None if all columns are needed.
+    """
+    referenced_columns: List[str] = []
+    if not _add_result_format_columns(referenced_columns, result_format):
+        return None
+
+    for configuration in expectation_configurations:
+        if not _add_expectation_columns(referenced_columns, configuration):
+            return None
+
+    return list(dict.fromkeys(referenced_columns))
+
+
+def _add_expectation_columns(
+    referenced_columns: List[str], configuration: ExpectationConfiguration
+) -> bool:
+    try:
+        expectation_impl = get_expectation_impl(configuration.type)
+    except ExpectationNotFoundError:
+        return False
+
+    domain_keys: Set[str] = set(expectation_impl.domain_keys)
+    column_keys = domain_keys.intersection(COLUMN_DOMAIN_KEYS + COLUMN_LIST_DOMAIN_KEYS)
+    if domain_keys - column_keys - set(NON_COLUMN_DOMAIN_KEYS):
+        return False
+
+    if not column_keys and configuration.type not in SCHEMA_ONLY_EXPECTATION_TYPES:
+        return False
+
+    kwargs: dict = configuration.kwargs
+    for key in sorted(column_keys):
+        value: Any = kwargs.get(key)
+        values: List[Any] = list(value or []) if key in COLUMN_LIST_DOMAIN_KEYS else [value]
+        if not all(isinstance(column, str) for column in values):
+            return False
+
+        referenced_columns.extend(values)
+
+    row_condition: Any = kwargs.get("row_condition")
+    if row_condition is not None:
+        if not isinstance(row_condition, str):
+            return False
+
+        referenced_columns.extend(_get_row_condition_tokens(row_condition))
+
+    return _add_result_format_columns(referenced_columns, kwargs.get("result_format"))
+
+
+def _add_result_format_columns(
+    referenced_columns: List[str], result_format: Optional[ResultFormatUnion]
+) -> bool:
+    if not isinstance(result_format, dict):
+        return True
+
+    if result_format.get("include_unexpected_rows"):
+        return False
+
+    unexpected_index_column_names: Any = result_format.get("unexpected_index_column_names") or []
+    if not all(isinstance(column, str) for column in unexpected_index_column_names):
+        return False
+
+    referenced_columns.extend(unexpected_index_column_names)
+    return True
+
+
+def _get_row_condition_tokens(row_condition: str) -> List[str]:
+    return [
+        next(group for group in match.groups() if group is not None)
+        for match in ROW_CONDITION_TOKEN_PATTERN.finditer(row_condition)
+    ]
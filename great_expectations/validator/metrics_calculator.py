@@ -43,6 +43,10 @@ class MetricsCalculator:
         self._execution_engine: ExecutionEngine = execution_engine
         self._show_progress_bars: bool = show_progress_bars
 
+        # Shared by all graphs built by this calculator, so that identical metrics requested by
+        # different expectations are represented by (and compute their "id" on) single object.
+        self._interned_metric_configurations: Dict[_MetricKey, MetricConfiguration] = {}
+
     @property
     def show_progress_bars(self) -> bool:
         return self._show_progress_bars
@@ -192,7 +196,10 @@ class MetricsCalculator:
         Returns:
             Resulting "ValidationGraph" object.
         """  # noqa: E501
-        graph: ValidationGraph = ValidationGraph(execution_engine=self._execution_engine)
+        graph: ValidationGraph = ValidationGraph(
+            execution_engine=self._execution_engine,
+            interned_metric_configurations=self._interned_metric_configurations,
+        )
 
         metric_configuration: MetricConfiguration
         for metric_configuration in metric_configurations:
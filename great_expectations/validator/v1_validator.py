@@ -1,8 +1,7 @@
 from __future__ import annotations
 
 from copy import copy
-from functools import cached_property
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, List, Optional, Set
 
 from great_expectations import __version__ as ge_version
 from great_expectations.core.expectation_validation_result import (
@@ -15,6 +14,7 @@ from great_expectations.core.result_format import (
 )
 from great_expectations.data_context.data_context.context_factory import project_manager
 from great_expectations.util import convert_to_json_serializable  # noqa: TID251
+from great_expectations.validator.column_projection import get_referenced_columns
 from great_expectations.validator.validator import Validator as OldValidator
 from great_expectations.validator.validator import calc_validation_statistics
 
@@ -34,6 +34,9 @@ class Validator:
     """Validator.
 
     Responsible for running expectations on a batch definition.
+
+    If "project_columns" is True, then the batch only loads the columns referenced by the
+    expectations (see "get_referenced_columns"), where its data asset supports it.
     """
 
     def __init__(
@@ -41,10 +44,18 @@ class Validator:
         batch_definition: BatchDefinition,
         result_format: ResultFormatUnion = DEFAULT_RESULT_FORMAT,
         batch_parameters: Optional[BatchParameters] = None,
+        project_columns: bool = False,
     ) -> None:
         self._batch_definition = batch_definition
         self._batch_parameters = batch_parameters
         self.result_format = result_format
+        self._project_columns = project_columns
+        # Columns loaded by the batch (None means all columns).
+        self._columns: Optional[List[str]] = None
+        # Batches already loaded by the execution engine before this validator loaded its batch.
+        self._preloaded_batch_ids: Optional[Set[str]] = None
+        # Validator of the loaded batch (None until the batch is loaded).
+        self._validator: Optional[OldValidator] = None
 
         self._get_validator = project_manager.get_validator
 
@@ -103,23 +114,70 @@ class Validator:
     def active_batch_id(self) -> Optional[str]:
         return self._wrapped_validator.active_batch_id
 
+    def unload_batch(self) -> None:
+        """Release the batch data and the metrics cached for it (if this validator loaded them).
+
+        Batches, which were already loaded (e.g., by an interactive user holding a batch with the
+        same batch_id), are left in place.
+        """
+        if self._validator is None:
+            return
+
+        batch_id = self._wrapped_validator.active_batch_id
+        if batch_id is not None and batch_id not in (self._preloaded_batch_ids or set()):
+            self._wrapped_validator.execution_engine.unload_batch_data(batch_id=batch_id)
+
     @property
     def _include_rendered_content(self) -> bool:
         return project_manager.is_using_cloud()
 
-    @cached_property
+    @property
     def _wrapped_validator(self) -> OldValidator:
+        # Not a functools.cached_property, which (before Python 3.12) holds a lock shared by all
+        # instances while loading, and would thus serialize concurrent validation runs.
+        if self._validator is None:
+            self._validator = self._load_validator()
+        return self._validator
+
+    def _load_validator(self) -> OldValidator:
         batch_request = self._batch_definition.build_batch_request(
             batch_parameters=self._batch_parameters
         )
+        if self._columns is not None:
+            batch_request.columns = self._columns
+        if self._preloaded_batch_ids is None:
+            execution_engine = self._batch_definition.data_asset.datasource.get_execution_engine()
+            self._preloaded_batch_ids = set(execution_engine.batch_manager.loaded_batch_ids)
         return self._get_validator(batch_request=batch_request)
 
+    def _project_batch_columns(self, expectation_configs: list[ExpectationConfiguration]) -> None:
+        """Restrict the batch to the columns referenced by the given expectations.
+
+        If the batch is already loaded without some of these columns, then it is reloaded with the
+        columns referenced so far.
+        """
+        columns = get_referenced_columns(
+            expectation_configurations=expectation_configs, result_format=self.result_format
+        )
+        if self._validator is None:
+            self._columns = columns
+            return
+
+        if self._columns is None or (columns is not None and set(columns) <= set(self._columns)):
+            return
+
+        self._columns = None if columns is None else list(dict.fromkeys(self._columns + columns))
+        self._validator = None
+
     def _validate_expectation_configs(
         self,
         expectation_configs: list[ExpectationConfiguration],
         expectation_parameters: Optional[SuiteParameterDict] = None,
     ) -> list[ExpectationValidationResult]:
         """Run a list of expectation configurations against the batch definition"""
+        if self._project_columns:
+            self._project_batch_columns(expectation_configs)
+
         processed_expectation_configs = self._wrapped_validator.process_expectations_for_validation(
             expectation_configs, expectation_parameters
         )
@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import logging
 import traceback
+from collections import defaultdict
 from typing import (
     TYPE_CHECKING,
     Callable,
     Dict,
+    Iterable,
     List,
     Optional,
     Set,
@@ -79,7 +81,15 @@ class ValidationGraph:
         self,
         execution_engine: ExecutionEngine,
         edges: Optional[List[MetricEdge]] = None,
+        interned_metric_configurations: Optional[Dict[_MetricKey, MetricConfiguration]] = None,
     ) -> None:
+        """
+        Args:
+            execution_engine: ExecutionEngine, whose metric providers supply metric dependencies.
+            edges: Optional initial "MetricEdge" objects.
+            interned_metric_configurations: Optional intern table (metric "id" to "MetricConfiguration" object),
+                which may be shared among several graphs so that identical metrics are represented by single object.
+        """  # noqa: E501
         self._execution_engine = execution_engine
 
         if edges:
@@ -89,6 +99,16 @@ class ValidationGraph:
 
         self._edge_ids = {edge.id for edge in self._edges}
 
+        if interned_metric_configurations is None:
+            interned_metric_configurations = {}
+
+        self._interned_metric_configurations: Dict[_MetricKey, MetricConfiguration] = (
+            interned_metric_configurations
+        )
+
+        # Metrics, whose complete dependency sub-graph has already been added to this graph.
+        self._built_metric_ids: Set[_MetricKey] = set()
+
     @override
     def __eq__(self, other) -> bool:
         """Supports comparing two "ValidationGraph" objects."""
@@ -133,6 +153,12 @@ class ValidationGraph:
             metric_configuration=metric_configuration
         )
 
+        metric_configuration = self._intern_metric_configuration(
+            metric_configuration=metric_configuration
+        )
+        if metric_configuration.id in self._built_metric_ids:
+            return
+
         metric_dependencies = metric_impl_klass.get_evaluation_dependencies(
             metric=metric_configuration,
             execution_engine=self._execution_engine,
@@ -147,13 +173,24 @@ class ValidationGraph:
             )
         else:
             metric_configuration.metric_dependencies = metric_dependencies
-            for metric_dependency in metric_dependencies.values():
+            metric_dependency_name: str
+            metric_dependency: MetricConfiguration
+            for metric_dependency_name, metric_dependency in metric_dependencies.items():
                 # TODO: <Alex>In the future, provide a more robust cycle detection mechanism.</Alex>
                 if metric_dependency.id == metric_configuration.id:
                     logger.warning(
                         f"Metric {metric_configuration.id!s} has created a circular dependency"
                     )
                     continue
+
+                self.set_metric_configuration_default_kwargs_if_absent(
+                    metric_configuration=metric_dependency
+                )
+                metric_dependency = self._intern_metric_configuration(  # noqa: PLW2901
+                    metric_configuration=metric_dependency
+                )
+                metric_configuration.metric_dependencies[metric_dependency_name] = metric_dependency
+
                 self.add(
                     MetricEdge(
                         left=metric_configuration,
@@ -165,6 +202,16 @@ class ValidationGraph:
                     runtime_configuration=runtime_configuration,
                 )
 
+        self._built_metric_ids.add(metric_configuration.id)
+
+    def _intern_metric_configuration(
+        self, metric_configuration: MetricConfiguration
+    ) -> MetricConfiguration:
+        """Returns canonical "MetricConfiguration" object for "id" of supplied one (registering it, if first seen)."""  # noqa: E501
+        return self._interned_metric_configurations.setdefault(
+            metric_configuration.id, metric_configuration
+        )
+
     def set_metric_configuration_default_kwargs_if_absent(
         self, metric_configuration: MetricConfiguration
     ) -> Tuple[MetricProvider, Callable]:
@@ -232,16 +279,21 @@ class ValidationGraph:
         failed_metric_info: _AbortedMetricsInfoDict = {}
         aborted_metrics_info: _AbortedMetricsInfoDict = {}
 
-        ready_metrics: Set[MetricConfiguration]
-        needed_metrics: Set[MetricConfiguration]
+        ready_metrics: List[MetricConfiguration]
+        needed_metrics: List[MetricConfiguration]
 
         exception_info: ExceptionInfo
 
         progress_bar: Optional[tqdm] = None
 
+        scheduler: _MetricResolutionScheduler = self._build_resolution_scheduler(metrics=metrics)
+
+        resolved_metrics: Dict[_MetricKey, MetricValue]
+
         done: bool = False
         while not done:
-            ready_metrics, needed_metrics = self._parse(metrics=metrics)
+            ready_metrics = scheduler.ready_metrics
+            needed_metrics = scheduler.needed_metrics
 
             # Check to see if the user has disabled progress bars
             disable = not show_progress_bars
@@ -272,13 +324,13 @@ class ValidationGraph:
 
             try:
                 # Access "ExecutionEngine.resolve_metrics()" method, to resolve missing "MetricConfiguration" objects.  # noqa: E501
-                metrics.update(
-                    self._execution_engine.resolve_metrics(
-                        metrics_to_resolve=computable_metrics,  # type: ignore[arg-type]  # Metric typing needs further refinement.
-                        metrics=metrics,  # type: ignore[arg-type]  # Metric typing needs further refinement.
-                        runtime_configuration=runtime_configuration,
-                    )
+                resolved_metrics = self._execution_engine.resolve_metrics(
+                    metrics_to_resolve=computable_metrics,  # type: ignore[arg-type]  # Metric typing needs further refinement.
+                    metrics=metrics,  # type: ignore[arg-type]  # Metric typing needs further refinement.
+                    runtime_configuration=runtime_configuration,
                 )
+                metrics.update(resolved_metrics)
+                scheduler.mark_resolved(metric_ids=resolved_metrics.keys())
                 progress_bar.update(len(computable_metrics))
                 progress_bar.refresh()
             except gx_exceptions.MetricResolutionError as err:
@@ -321,29 +373,12 @@ class ValidationGraph:
 
         return aborted_metrics_info
 
-    def _parse(
+    def _build_resolution_scheduler(
         self,
         metrics: Dict[_MetricKey, MetricValue],
-    ) -> Tuple[Set[MetricConfiguration], Set[MetricConfiguration]]:
-        """Given validation graph, returns the ready and needed metrics necessary for validation using a traversal of
-        validation graph (a graph structure of metric ids) edges"""  # noqa: E501
-        unmet_dependency_ids = set()
-        unmet_dependency = set()
-        maybe_ready_ids = set()
-        maybe_ready = set()
-
-        for edge in self.edges:
-            if edge.left.id not in metrics:
-                if edge.right is None or edge.right.id in metrics:
-                    if edge.left.id not in maybe_ready_ids:
-                        maybe_ready_ids.add(edge.left.id)
-                        maybe_ready.add(edge.left)
-                else:  # noqa: PLR5501
-                    if edge.left.id not in unmet_dependency_ids:
-                        unmet_dependency_ids.add(edge.left.id)
-                        unmet_dependency.add(edge.left)
-
-        return maybe_ready - unmet_dependency, unmet_dependency
+    ) -> _MetricResolutionScheduler:
+        """Indexes edges of this "ValidationGraph" once, so that resolution waves do not rescan the graph."""  # noqa: E501
+        return _MetricResolutionScheduler(edges=self.edges, metrics=metrics)
 
     @staticmethod
     def _set_default_metric_kwargs_if_absent(
@@ -365,6 +400,84 @@ class ValidationGraph:
         return ", ".join([edge.__repr__() for edge in self._edges])
 
 
+class _MetricResolutionScheduler:
+    """Indexed view of "ValidationGraph" edges, which hands out metrics whose dependencies are all resolved.
+
+    Each edge (and the "id" of each of its vertices) is visited once, when the index is built.  Afterwards, resolving
+    a metric only touches its reverse-dependency list: in-degree counter of every dependent metric is decremented,
+    and dependents, whose counters reach zero, are moved from "needed" to "ready".  Hence, every edge is processed a
+    constant number of times, regardless of how many resolution waves are required.
+
+    Args:
+        edges: "MetricEdge" objects of "ValidationGraph" to be resolved.
+        metrics: already-computed metrics (their dependents are considered to have these dependencies satisfied).
+    """  # noqa: E501
+
+    def __init__(
+        self,
+        edges: Iterable[MetricEdge],
+        metrics: Dict[_MetricKey, MetricValue],
+    ) -> None:
+        self._metric_configurations: Dict[_MetricKey, MetricConfiguration] = {}
+        self._in_degree: Dict[_MetricKey, int] = {}
+        self._dependents: Dict[_MetricKey, List[_MetricKey]] = defaultdict(list)
+
+        edge: MetricEdge
+        left_id: _MetricKey
+        right_id: _MetricKey
+        for edge in edges:
+            left_id = edge.left.id
+            if left_id in metrics:
+                continue
+
+            if left_id not in self._metric_configurations:
+                self._metric_configurations[left_id] = edge.left
+                self._in_degree[left_id] = 0
+
+            if edge.right is not None:
+                right_id = edge.right.id
+                if right_id not in metrics:
+                    self._dependents[right_id].append(left_id)
+                    self._in_degree[left_id] += 1
+
+        # Dictionaries (rather than sets) are used in order to keep scheduling order deterministic.
+        self._ready: Dict[_MetricKey, None] = {}
+        self._needed: Dict[_MetricKey, None] = {}
+
+        metric_id: _MetricKey
+        in_degree: int
+        for metric_id, in_degree in self._in_degree.items():
+            if in_degree == 0:
+                self._ready[metric_id] = None
+            else:
+                self._needed[metric_id] = None
+
+    @property
+    def ready_metrics(self) -> List[MetricConfiguration]:
+        """Returns unresolved metrics, all of whose dependencies have been resolved."""
+        return [self._metric_configurations[metric_id] for metric_id in self._ready]
+
+    @property
+    def needed_metrics(self) -> List[MetricConfiguration]:
+        """Returns unresolved metrics, which still have at least one unresolved dependency."""
+        return [self._metric_configurations[metric_id] for metric_id in self._needed]
+
+    def mark_resolved(self, metric_ids: Iterable[_MetricKey]) -> None:
+        """Records resolution of specified metrics and promotes dependents that became ready."""
+        metric_id: _MetricKey
+        dependent_id: _MetricKey
+        for metric_id in metric_ids:
+            self._ready.pop(metric_id, None)
+            self._needed.pop(metric_id, None)
+
+            # Popping guarantees that dependents of a given metric are released exactly once.
+            for dependent_id in self._dependents.pop(metric_id, ()):
+                self._in_degree[dependent_id] -= 1
+                if self._in_degree[dependent_id] == 0 and dependent_id in self._needed:
+                    del self._needed[dependent_id]
+                    self._ready[dependent_id] = None
+
+
 class ExpectationValidationGraph:
     def __init__(
         self,
@@ -414,13 +527,13 @@ class ExpectationValidationGraph:
         self,
         metric_info: _AbortedMetricsInfoDict,
     ) -> _AbortedMetricsInfoDict:
-        graph_metric_ids: List[_MetricKey] = []
+        graph_metric_ids: Set[_MetricKey] = set()
         edge: MetricEdge
         vertex: MetricConfiguration
         for edge in self.graph.edges:
             for vertex in [edge.left, edge.right]:
                 if vertex is not None:
-                    graph_metric_ids.append(vertex.id)
+                    graph_metric_ids.add(vertex.id)
 
         metric_id: _MetricKey
         metric_info_item: Dict[str, Union[MetricConfiguration, Set[ExceptionInfo], int]]
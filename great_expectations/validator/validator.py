@@ -581,6 +581,19 @@ class Validator:
         Returns:
             A list of Validations, validating that all necessary metrics are available.
         """
+        try:
+            return self._graph_validate(
+                configurations=configurations, runtime_configuration=runtime_configuration
+            )
+        finally:
+            # Temporary resources (e.g., scratch tables) are not needed once all Expectations are validated.  # noqa: E501
+            self._execution_engine.release_validation_resources()
+
+    def _graph_validate(
+        self,
+        configurations: List[ExpectationConfiguration],
+        runtime_configuration: Optional[dict] = None,
+    ) -> List[ExpectationValidationResult]:
         if runtime_configuration is None:
             runtime_configuration = {}
 
@@ -0,0 +1,109 @@
+"""Report the time taken by `import great_expectations`, as measured by `python -X importtime`.
+
+Fails if the import loads any module, which is meant to be imported on first use only (e.g., core
+Expectations and Metrics, see "great_expectations/expectations/registry_manifest.py"), or if it
+takes longer than the given maximum.
+
+Usage (from the repository root):
+    invoke import-time
+    invoke import-time --max-seconds 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import subprocess
+import sys
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+# Modules, which `import great_expectations` must not load.
+DEFERRED_MODULE_PATTERNS: Tuple[str, ...] = (
+    r"great_expectations\.expectations\.core\..+",
+    r"great_expectations\.expectations\.metrics\.[a-z_]+_metrics\..+",
+    r"scipy(\..+)?",
+)
+
+IMPORT_TIME_LINE_PATTERN = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+class ModuleImportTime(NamedTuple):
+    module_name: str
+    self_us: int
+    cumulative_us: int
+
+
+def measure_import_time(module_name: str = "great_expectations") -> List[ModuleImportTime]:
+    """Import the given module in a fresh interpreter and return the import time of every module."""
+    completed_process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_times: List[ModuleImportTime] = []
+    for line in completed_process.stderr.splitlines():
+        match = IMPORT_TIME_LINE_PATTERN.match(line)
+        if match:
+            import_times.append(
+                ModuleImportTime(
+                    module_name=match.group(4),
+                    self_us=int(match.group(1)),
+                    cumulative_us=int(match.group(2)),
+                )
+            )
+
+    return import_times
+
+
+def get_deferred_modules(import_times: List[ModuleImportTime]) -> List[str]:
+    """Return the imported modules, which are meant to be imported on first use only."""
+    return sorted(
+        {
+            import_time.module_name
+            for import_time in import_times
+            if any(
+                re.fullmatch(pattern, import_time.module_name)
+                for pattern in DEFERRED_MODULE_PATTERNS
+            )
+        }
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="great_expectations", help="Module to import.")
+    parser.add_argument("--top", type=int, default=20, help="Number of slowest modules to list.")
+    parser.add_argument("--max-seconds", type=float, help="Fail if the import takes longer.")
+    args = parser.parse_args(argv)
+
+    import_times = measure_import_time(module_name=args.module)
+    # Top-level packages of the import are reported last.
+    total_by_top_level_package: Dict[str, int] = {
+        import_time.module_name: import_time.cumulative_us
+        for import_time in import_times
+        if "." not in import_time.module_name
+    }
+    total_seconds = total_by_top_level_package.get(args.module, 0) / 1_000_000
+
+    print(f"`import {args.module}` took {total_seconds:.2f}s; slowest modules (self time):")
+    for import_time in sorted(import_times, key=lambda t: t.self_us, reverse=True)[: args.top]:
+        print(f"  {import_time.self_us / 1_000:9.1f}ms  {import_time.module_name}")
+
+    exit_code = 0
+    deferred_modules = get_deferred_modules(import_times)
+    if deferred_modules:
+        print(f"❌  {len(deferred_modules)} modules should only be imported on first use:")
+        for module_name in deferred_modules:
+            print(f"  {module_name}")
+        exit_code = 1
+
+    if args.max_seconds is not None and total_seconds > args.max_seconds:
+        print(f"❌  `import {args.module}` took longer than {args.max_seconds:.2f}s")
+        exit_code = 1
+
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,197 @@
+"""Generate "great_expectations/expectations/registry_manifest.py".
+
+The manifest maps every core Expectation, Metric and renderer to the module defining it, and
+every name exported by the lazily loaded "great_expectations.expectations" packages to the module
+defining it, so that "great_expectations.expectations.registry" can import these modules on first
+use.
+
+Usage (from the repository root):
+    invoke registry-manifest          # report whether the checked-in manifest is up to date
+    invoke registry-manifest --sync   # regenerate the checked-in manifest
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import importlib
+import pathlib
+import sys
+from typing import Dict, Iterator, List, Tuple
+
+GX_PACKAGE_DIR: pathlib.Path = pathlib.Path(__file__).parent.parent / "great_expectations"
+
+MANIFEST_PATH: pathlib.Path = GX_PACKAGE_DIR / "expectations" / "registry_manifest.py"
+
+# Packages, whose exports are only imported on first access (see their "TYPE_CHECKING" imports).
+LAZY_PACKAGES: Tuple[str, ...] = (
+    "great_expectations.expectations",
+    "great_expectations.expectations.core",
+    "great_expectations.expectations.metrics",
+    "great_expectations.expectations.metrics.column_aggregate_metrics",
+    "great_expectations.expectations.metrics.column_map_metrics",
+    "great_expectations.expectations.metrics.column_pair_map_metrics",
+    "great_expectations.expectations.metrics.multicolumn_map_metrics",
+    "great_expectations.expectations.metrics.query_metrics",
+    "great_expectations.expectations.metrics.table_metrics",
+)
+
+CORE_MODULE_PREFIX: str = "great_expectations.expectations."
+
+MANIFEST_HEADER: str = '''"""Modules of core Expectations and Metrics, imported on first use by "great_expectations.expectations.registry".
+
+Generated by "invoke registry-manifest --sync"; do not edit by hand.
+"""
+
+from __future__ import annotations
+
+from typing import Dict'''  # noqa: E501
+
+
+def _iter_type_checking_imports(package_name: str) -> Iterator[ast.ImportFrom]:
+    init_path = GX_PACKAGE_DIR.joinpath(*package_name.split(".")[1:], "__init__.py")
+    tree = ast.parse(init_path.read_text())
+    for node in tree.body:
+        if (
+            isinstance(node, ast.If)
+            and isinstance(node.test, ast.Name)
+            and node.test.id == "TYPE_CHECKING"
+        ):
+            yield from (child for child in node.body if isinstance(child, ast.ImportFrom))
+
+
+def _resolve_module_name(package_name: str, node: ast.ImportFrom) -> str:
+    if node.level == 0:
+        return node.module or ""
+
+    base = package_name.rsplit(".", node.level - 1)[0] if node.level > 1 else package_name
+    return f"{base}.{node.module}" if node.module else base
+
+
+def get_package_exports() -> Dict[str, Dict[str, str]]:
+    """Map every name exported by each lazy package to the module defining it."""
+    package_exports: Dict[str, Dict[str, str]] = {}
+
+    def _get_exports(package_name: str) -> Dict[str, str]:
+        if package_name in package_exports:
+            return package_exports[package_name]
+
+        exports: Dict[str, str] = {}
+        for node in _iter_type_checking_imports(package_name):
+            module_name = _resolve_module_name(package_name=package_name, node=node)
+            source_exports = _get_exports(module_name) if module_name in LAZY_PACKAGES else {}
+            for alias in node.names:
+                if alias.name == "*":
+                    exports.update(source_exports)
+                else:
+                    exports[alias.name] = source_exports.get(alias.name, module_name)
+
+        package_exports[package_name] = dict(sorted(exports.items()))
+        return package_exports[package_name]
+
+    for package_name in LAZY_PACKAGES:
+        _get_exports(package_name)
+
+    return {package_name: package_exports[package_name] for package_name in LAZY_PACKAGES}
+
+
+def generate_registry_manifest() -> str:
+    """Import every module exported by the lazy packages and render the resulting registry."""
+    from great_expectations.expectations import registry
+
+    package_exports = get_package_exports()
+    for module_name in sorted(
+        {module_name for exports in package_exports.values() for module_name in exports.values()}
+    ):
+        importlib.import_module(module_name)
+
+    expectation_modules = _get_core_modules(
+        {
+            expectation_type: [expectation]
+            for expectation_type, expectation in registry._registered_expectations.items()
+        }
+    )
+    metric_modules = _get_core_modules(
+        {
+            metric_name: [
+                metric_class for metric_class, _ in metric_definition["providers"].values()
+            ]
+            for metric_name, metric_definition in registry._registered_metrics.items()
+        }
+    )
+    renderer_modules = _get_core_modules(
+        {
+            object_name: [parent_class for parent_class, _ in renderers.values()]
+            for object_name, renderers in registry._registered_renderers.items()
+        }
+    )
+
+    lines: List[str] = [MANIFEST_HEADER]
+    lines += _render_dict(
+        name="EXPECTATION_MODULES",
+        comment="Module defining each core Expectation, by expectation type.",
+        annotation="Dict[str, str]",
+        items=expectation_modules,
+    )
+    lines += _render_dict(
+        name="METRIC_MODULES",
+        comment="Module defining the provider of each core Metric, by metric name.",
+        annotation="Dict[str, str]",
+        items=metric_modules,
+    )
+    lines += _render_dict(
+        name="RENDERER_MODULES",
+        comment="Module defining the renderers of each core Expectation or Metric, by object name.",
+        annotation="Dict[str, str]",
+        items=renderer_modules,
+    )
+    lines += ["", "# Module defining each name exported by a lazily loaded package, by package."]
+    lines.append("PACKAGE_EXPORTS: Dict[str, Dict[str, str]] = {")
+    for package_name, exports in package_exports.items():
+        lines.append(f'    "{package_name}": {{')
+        lines += [f'        "{name}": "{module_name}",' for name, module_name in exports.items()]
+        lines.append("    },")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def _get_core_modules(classes_by_name: Dict[str, List[type]]) -> Dict[str, str]:
+    return {
+        name: cls.__module__
+        for name, classes in classes_by_name.items()
+        for cls in classes
+        if cls.__module__.startswith(CORE_MODULE_PREFIX)
+    }
+
+
+def _render_dict(name: str, comment: str, annotation: str, items: Dict[str, str]) -> List[str]:
+    return [
+        "",
+        f"# {comment}",
+        f"{name}: {annotation} = {{",
+        *(f'    "{key}": "{value}",' for key, value in sorted(items.items())),
+        "}",
+    ]
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sync", action="store_true", help="Regenerate the checked-in manifest.")
+    args = parser.parse_args(argv)
+
+    manifest = generate_registry_manifest()
+    if MANIFEST_PATH.exists() and MANIFEST_PATH.read_text() == manifest:
+        print(f"✅  {MANIFEST_PATH.name} unchanged")
+        return 0
+
+    if args.sync:
+        MANIFEST_PATH.write_text(manifest)
+        print(f"🔃  {MANIFEST_PATH.name} updated")
+        return 0
+
+    print(f"❌  {MANIFEST_PATH.name} is out of date; run `invoke registry-manifest --sync`")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
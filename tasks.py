@@ -650,6 +650,42 @@ def type_schema(  # noqa: C901 - too complex
     raise invoke.Exit(code=0)
 
 
+@invoke.task(
+    help={
+        "sync": "Update the checked-in registry manifest",
+    },
+)
+def registry_manifest(ctx: Context, sync: bool = False):
+    """
+    Check the name -> module manifest of core Expectations & Metrics (used to import them lazily).
+
+    Regenerate great_expectations/expectations/registry_manifest.py with `--sync`.
+    """
+    from scripts.generate_registry_manifest import main
+
+    raise invoke.Exit(code=main(["--sync"] if sync else []))
+
+
+@invoke.task(
+    help={
+        "top": "Number of slowest modules to list. Default: 20",
+        "max-seconds": "Fail if `import great_expectations` takes longer than this value.",
+    },
+)
+def import_time(ctx: Context, top: int = 20, max_seconds: Union[str, None] = None):
+    """
+    Measure `import great_expectations` with `python -X importtime`.
+
+    Fails if core Expectations, Metrics or other lazily imported modules are loaded on import.
+    """
+    from scripts.check_import_time import main
+
+    args = ["--top", str(top)]
+    if max_seconds is not None:
+        args += ["--max-seconds", str(max_seconds)]
+    raise invoke.Exit(code=main(args))
+
+
 def _exit_with_error_if_not_in_repo_root(task_name: str):
     """Exit if the command was not run from the repository root."""
     filedir = os.path.realpath(
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import threading
+from typing import ClassVar, List, Literal
+
+import pytest
+
+from great_expectations.checkpoint.action_dispatcher import (
+    ActionDispatcher,
+    get_action_dispatcher,
+    set_action_dispatcher,
+)
+from great_expectations.checkpoint.actions import ActionContext, ValidationAction
+
+# Every independent action waits for the other one, so that sequential runs would break the barrier.
+BARRIER = threading.Barrier(parties=2, timeout=10)
+RELEASE_BLOCKING_ACTION = threading.Event()
+
+
+class IndependentAction(ValidationAction):
+    type: Literal["independent"] = "independent"
+    runs_independently: ClassVar[bool] = True
+
+    def run(self, checkpoint_result, action_context: ActionContext | None = None) -> dict:
+        BARRIER.wait()
+        return {"name": self.name}
+
+
+class DependentAction(ValidationAction):
+    type: Literal["dependent"] = "dependent"
+
+    def run(self, checkpoint_result, action_context: ActionContext | None = None) -> dict:
+        assert action_context is not None
+        return {"prior_results": [result for _, result in action_context.data]}
+
+
+class BlockingAction(ValidationAction):
+    type: Literal["blocking"] = "blocking"
+
+    def run(self, checkpoint_result, action_context: ActionContext | None = None) -> dict:
+        RELEASE_BLOCKING_ACTION.wait(timeout=10)
+        return {}
+
+
+class FailingAction(ValidationAction):
+    type: Literal["failing"] = "failing"
+    runs_independently: ClassVar[bool] = True
+
+    def run(self, checkpoint_result, action_context: ActionContext | None = None) -> dict:
+        raise ValueError(f"{self.name} failed.")
+
+
+@pytest.fixture
+def action_dispatcher():
+    action_dispatcher = ActionDispatcher(max_workers=2, max_queue_size=2)
+    yield action_dispatcher
+    RELEASE_BLOCKING_ACTION.set()
+    action_dispatcher.shutdown()
+    RELEASE_BLOCKING_ACTION.clear()
+    BARRIER.reset()
+
+
+@pytest.mark.unit
+def test_run_actions_runs_independent_actions_concurrently_and_preserves_order_of_results(
+    action_dispatcher: ActionDispatcher, mocker
+):
+    actions: List[ValidationAction] = [
+        IndependentAction(name="first"),
+        IndependentAction(name="second"),
+        DependentAction(name="third"),
+    ]
+
+    action_context = action_dispatcher.run_actions(
+        actions=actions, checkpoint_result=mocker.Mock(), concurrently=True
+    )
+
+    assert action_context.data == [
+        (actions[0], {"name": "first"}),
+        (actions[1], {"name": "second"}),
+        (actions[2], {"prior_results": [{"name": "first"}, {"name": "second"}]}),
+    ]
+
+
+@pytest.mark.unit
+def test_run_actions_raises_error_of_earliest_failed_action(
+    action_dispatcher: ActionDispatcher, mocker
+):
+    actions: List[ValidationAction] = [
+        FailingAction(name="first"),
+        FailingAction(name="second"),
+        DependentAction(name="third"),
+    ]
+
+    with pytest.raises(ValueError, match="first failed."):
+        action_dispatcher.run_actions(
+            actions=actions, checkpoint_result=mocker.Mock(), concurrently=True
+        )
+
+
+@pytest.mark.unit
+def test_run_actions_runs_actions_sequentially_by_default(
+    action_dispatcher: ActionDispatcher, mocker
+):
+    run_threads: List[threading.Thread] = []
+
+    class RecordingAction(ValidationAction):
+        type: Literal["recording"] = "recording"
+        runs_independently: ClassVar[bool] = True
+
+        def run(self, checkpoint_result, action_context: ActionContext | None = None) -> dict:
+            run_threads.append(threading.current_thread())
+            return {}
+
+    action_dispatcher.run_actions(
+        actions=[RecordingAction(name="first"), RecordingAction(name="second")],
+        checkpoint_result=mocker.Mock(),
+    )
+
+    assert run_threads == [threading.current_thread()] * 2
+
+
+@pytest.mark.unit
+def test_dispatch_does_not_wait_for_actions(action_dispatcher: ActionDispatcher, mocker):
+    action = BlockingAction(name="blocking")
+
+    future = action_dispatcher.dispatch(actions=[action], checkpoint_result=mocker.Mock())
+
+    assert not future.done()
+    assert action_dispatcher.num_pending_dispatches == 1
+    with pytest.raises(TimeoutError):
+        action_dispatcher.flush(timeout=0.01)
+
+    RELEASE_BLOCKING_ACTION.set()
+    action_dispatcher.flush(timeout=10)
+
+    assert future.result().data == [(action, {})]
+
+
+@pytest.mark.unit
+def test_dispatch_sets_error_on_future_and_flush_raises_it(
+    action_dispatcher: ActionDispatcher, mocker
+):
+    future = action_dispatcher.dispatch(
+        actions=[FailingAction(name="failing")], checkpoint_result=mocker.Mock()
+    )
+    with pytest.raises(ValueError, match="failing failed."):
+        action_dispatcher.flush(timeout=10)
+
+    with pytest.raises(ValueError, match="failing failed."):
+        future.result()
+
+    # Errors are raised only once.
+    action_dispatcher.flush(timeout=10)
+
+
+@pytest.mark.unit
+def test_set_action_dispatcher_shuts_down_replaced_action_dispatcher(mocker):
+    replaced_action_dispatcher = mocker.Mock(spec=ActionDispatcher)
+    set_action_dispatcher(replaced_action_dispatcher)
+    action_dispatcher = ActionDispatcher()
+    try:
+        set_action_dispatcher(action_dispatcher)
+
+        replaced_action_dispatcher.shutdown.assert_called_once_with(wait=False)
+        assert get_action_dispatcher() is action_dispatcher
+    finally:
+        set_action_dispatcher(ActionDispatcher())
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("kwargs", [{"max_workers": 0}, {"max_queue_size": 0}])
+def test_action_dispatcher_with_non_positive_limits_raises_error(kwargs: dict):
+    with pytest.raises(ValueError, match="must be positive"):
+        ActionDispatcher(**kwargs)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import pathlib
+import threading
 import uuid
 from typing import TYPE_CHECKING, List, Type
 from unittest import mock
@@ -63,6 +64,7 @@ from great_expectations.exceptions.exceptions import (
     ValidationDefinitionNotFoundError,
 )
 from great_expectations.exceptions.resource_freshness import ResourceFreshnessAggregateError
+from great_expectations.execution_engine import PandasExecutionEngine
 from great_expectations.expectations.expectation_configuration import ExpectationConfiguration
 from tests.test_utils import working_directory
 
@@ -510,6 +512,7 @@ class TestCheckpointResult:
     def mock_suite(self, mocker: MockerFixture):
         suite = mocker.Mock(spec=ExpectationSuite)
         suite.name = self.suite_name
+        suite.expectations = [gxe.ExpectColumnToExist(column="a")]
         suite.is_fresh.return_value = ExpectationSuiteFreshnessDiagnostics(errors=[])
         return suite
 
@@ -640,6 +643,61 @@ class TestCheckpointResult:
             checkpoint_result=result, action_context=mock.ANY
         )
 
+    @pytest.mark.unit
+    def test_checkpoint_run_actions_in_background(
+        self,
+        validation_definition: ValidationDefinition,
+        mocker: MockerFixture,
+    ):
+        set_context(project=mocker.Mock(spec=AbstractDataContext))
+        action_dispatcher = mocker.patch(
+            "great_expectations.checkpoint.checkpoint.get_action_dispatcher"
+        ).return_value
+        action = mocker.Mock(spec=UpdateDataDocsAction, type="update_data_docs")
+        checkpoint = Checkpoint(
+            name=self.checkpoint_name,
+            validation_definitions=[validation_definition],
+            actions=[action],
+        )
+
+        result = checkpoint.run(run_actions_in_background=True)
+
+        action_dispatcher.dispatch.assert_called_once_with(
+            actions=checkpoint.actions, checkpoint_result=result, concurrently=False
+        )
+        action_dispatcher.run_actions.assert_not_called()
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("run_actions_concurrently", [False, True])
+    def test_checkpoint_runs_actions_concurrently_only_if_requested(
+        self,
+        validation_definition: ValidationDefinition,
+        mocker: MockerFixture,
+        run_actions_concurrently: bool,
+    ):
+        set_context(project=mocker.Mock(spec=AbstractDataContext))
+        get_action_dispatcher = mocker.patch(
+            "great_expectations.checkpoint.checkpoint.get_action_dispatcher"
+        )
+        action = mocker.Mock(spec=UpdateDataDocsAction, type="update_data_docs")
+        checkpoint = Checkpoint(
+            name=self.checkpoint_name,
+            validation_definitions=[validation_definition],
+            actions=[action],
+        )
+
+        result = checkpoint.run(run_actions_concurrently=run_actions_concurrently)
+
+        if run_actions_concurrently:
+            get_action_dispatcher.return_value.run_actions.assert_called_once_with(
+                actions=checkpoint.actions, checkpoint_result=result, concurrently=True
+            )
+        else:
+            get_action_dispatcher.assert_not_called()
+            action._copy_and_set_values().run.assert_called_once_with(
+                checkpoint_result=result, action_context=mock.ANY
+            )
+
     @pytest.mark.unit
     def test_checkpoint_sorts_actions(self, validation_definition: ValidationDefinition):
         """
@@ -694,6 +752,7 @@ class TestCheckpointResult:
             expectation_parameters=expectation_parameters,
             result_format=ResultFormat.SUMMARY,
             run_id=mock.ANY,
+            project_columns=False,
         )
 
     @pytest.mark.unit
@@ -1344,6 +1403,185 @@ def test_is_fresh_raises_errors_for_all_child_validation_definitions(in_memory_r
     ]
 
 
+class TestCheckpointConcurrentRun:
+    suite_name: str = "my_suite"
+    checkpoint_name: str = "my_checkpoint"
+
+    @pytest.fixture(autouse=True)
+    def fresh_checkpoint(self):
+        with mock.patch.object(
+            Checkpoint, "is_fresh", return_value=CheckpointFreshnessDiagnostics(errors=[])
+        ):
+            yield
+
+    def _build_validation_definition(
+        self, mocker: MockerFixture, datasource: object, batch_id: str
+    ) -> ValidationDefinition:
+        suite = mocker.Mock(spec=ExpectationSuite)
+        suite.name = self.suite_name
+        suite.expectations = [gxe.ExpectColumnToExist(column="a")]
+        suite.is_fresh.return_value = ExpectationSuiteFreshnessDiagnostics(errors=[])
+        batch_definition = mocker.Mock(spec=BatchDefinition)
+        batch_definition._copy_and_set_values().is_fresh.return_value = (
+            BatchDefinitionFreshnessDiagnostics(errors=[])
+        )
+        validation_definition = ValidationDefinition(
+            name=f"my_validation_def_{batch_id}",
+            id=str(uuid.uuid4()),
+            data=batch_definition,
+            suite=suite,
+        )
+        validation_definition.data.data_asset.datasource = datasource
+        return validation_definition
+
+    def _build_checkpoint(self, mocker: MockerFixture, datasources: List[object]) -> Checkpoint:
+        set_context(project=mocker.Mock(spec=AbstractDataContext))
+        return Checkpoint(
+            id=str(uuid.uuid4()),
+            name=self.checkpoint_name,
+            validation_definitions=[
+                self._build_validation_definition(
+                    mocker=mocker, datasource=datasource, batch_id=f"batch_{idx}"
+                )
+                for idx, datasource in enumerate(datasources)
+            ],
+        )
+
+    @staticmethod
+    def _build_result(validation_definition: ValidationDefinition):
+        return ExpectationSuiteValidationResult(
+            success=True,
+            results=[],
+            suite_name=validation_definition.suite.name,
+            batch_id=validation_definition.name,
+        )
+
+    @pytest.mark.unit
+    def test_checkpoint_run_concurrently_collects_run_results_in_order(self, mocker: MockerFixture):
+        checkpoint = self._build_checkpoint(mocker=mocker, datasources=[object() for _ in range(3)])
+        # Every run waits for all others, so that sequential runs would break the barrier.
+        barrier = threading.Barrier(parties=3, timeout=10)
+
+        def _run(validation_definition: ValidationDefinition, **kwargs):
+            barrier.wait()
+            return self._build_result(validation_definition)
+
+        with mock.patch.object(ValidationDefinition, "run", autospec=True, side_effect=_run):
+            result = checkpoint.run(max_workers=3)
+
+        assert [key.batch_identifier for key in result.run_results] == [
+            validation_definition.name
+            for validation_definition in checkpoint.validation_definitions
+        ]
+
+    @pytest.mark.unit
+    def test_checkpoint_run_concurrently_runs_validation_definitions_of_datasource_concurrently(
+        self, mocker: MockerFixture
+    ):
+        datasource = object()
+        checkpoint = self._build_checkpoint(mocker=mocker, datasources=[datasource] * 3)
+        # Every run waits for all others, so that sequential runs would break the barrier.
+        barrier = threading.Barrier(parties=3, timeout=10)
+
+        def _run(validation_definition: ValidationDefinition, **kwargs):
+            barrier.wait()
+            return self._build_result(validation_definition)
+
+        with mock.patch.object(ValidationDefinition, "run", autospec=True, side_effect=_run):
+            result = checkpoint.run(max_workers=3)
+
+        assert result.success
+
+    @pytest.mark.unit
+    def test_checkpoint_run_concurrently_isolates_failed_validation_definition(
+        self, mocker: MockerFixture
+    ):
+        datasource = object()
+        checkpoint = self._build_checkpoint(
+            mocker=mocker, datasources=[datasource, datasource, object()]
+        )
+        failed_validation_definition = checkpoint.validation_definitions[0]
+
+        def _run(validation_definition: ValidationDefinition, **kwargs):
+            if validation_definition is failed_validation_definition:
+                raise ValueError("Batch could not be loaded.")
+
+            return self._build_result(validation_definition)
+
+        with mock.patch.object(
+            ValidationDefinition, "run", autospec=True, side_effect=_run
+        ) as mock_run:
+            result = checkpoint.run(max_workers=2)
+
+        assert mock_run.call_count == len(checkpoint.validation_definitions)
+        assert not result.success
+        run_results = list(result.run_results.values())
+        assert [run_result.success for run_result in run_results] == [False, True, True]
+        failed_result = run_results[0]
+        assert failed_result.meta["validation_id"] == failed_validation_definition.id
+        assert failed_result.meta["exception_info"]["exception_message"] == (
+            "ValueError: Batch could not be loaded."
+        )
+        assert [
+            expectation_result.exception_info["raised_exception"]
+            for expectation_result in failed_result.results
+        ] == [True]
+
+    @pytest.mark.unit
+    def test_checkpoint_run_concurrently_validates_with_execution_engines_of_workers(self):
+        context = gx.get_context(mode="ephemeral")
+        datasource = context.data_sources.add_pandas(name="my_pandas_datasource")
+        suite = context.suites.add(
+            ExpectationSuite(
+                name=self.suite_name, expectations=[gxe.ExpectColumnValuesToNotBeNull(column="a")]
+            )
+        )
+        validation_definitions = [
+            context.validation_definitions.add(
+                ValidationDefinition(
+                    name=f"my_validation_def_{idx}",
+                    data=datasource.add_dataframe_asset(
+                        name=f"my_asset_{idx}"
+                    ).add_batch_definition_whole_dataframe(name="my_batch_definition"),
+                    suite=suite,
+                )
+            )
+            for idx in range(2)
+        ]
+        checkpoint = context.checkpoints.add(
+            Checkpoint(name=self.checkpoint_name, validation_definitions=validation_definitions)
+        )
+        # Both validation definitions load their Batches at once, so that sequential runs would
+        # break the barrier.
+        barrier = threading.Barrier(parties=2, timeout=10)
+        execution_engines: List[PandasExecutionEngine] = []
+        load_batch_data = PandasExecutionEngine.load_batch_data
+
+        def _load_batch_data(self, *args, **kwargs):
+            execution_engines.append(self)
+            barrier.wait()
+            return load_batch_data(self, *args, **kwargs)
+
+        with mock.patch.object(PandasExecutionEngine, "load_batch_data", _load_batch_data):
+            result = checkpoint.run(
+                batch_parameters={"dataframe": pd.DataFrame({"a": [1, 2]})}, max_workers=2
+            )
+
+        assert result.success
+        assert len({id(execution_engine) for execution_engine in execution_engines}) == 2
+        assert all(
+            execution_engine is not datasource.get_execution_engine()
+            for execution_engine in execution_engines
+        )
+
+    @pytest.mark.unit
+    def test_checkpoint_run_with_non_positive_max_workers_raises_error(self, mocker: MockerFixture):
+        checkpoint = self._build_checkpoint(mocker=mocker, datasources=[object()])
+
+        with pytest.raises(ValueError, match="max_workers must be positive"):
+            checkpoint.run(max_workers=0)
+
+
 class TestCheckpointPydanticSerializationMethods:
     """
     Test overridden Pydantic serialization methods for Checkpoint
@@ -1,8 +1,15 @@
+import os
 from typing import Dict
+from unittest import mock
 
 import pytest
 
-from great_expectations.core.config_provider import _CloudConfigurationProvider
+from great_expectations.core.config_provider import (
+    _CloudConfigurationProvider,
+    _ConfigurationProvider,
+    _ConfigurationVariablesConfigurationProvider,
+    yaml,
+)
 from great_expectations.data_context.cloud_constants import GXCloudEnvironmentVariable
 from great_expectations.data_context.types.base import GXCloudConfig
 
@@ -45,3 +52,53 @@ def test_CloudConfigurationProvider_get_values(
 ):
     provider = _CloudConfigurationProvider(cloud_config)
     assert provider.get_values() == expected_values
+
+
+@pytest.mark.filesystem
+def test_ConfigurationVariablesConfigurationProvider_get_values_is_cached(
+    tmp_path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("MY_HOST", "localhost")
+    config_variables_file = tmp_path / "config_variables.yml"
+    config_variables_file.write_text("host: ${MY_HOST}\nport: 5432\n")
+    provider = _ConfigurationVariablesConfigurationProvider(
+        config_variables_file_path="config_variables.yml", root_directory=str(tmp_path)
+    )
+
+    with mock.patch.object(yaml, "load", wraps=yaml.load) as load_spy:
+        values = provider.get_values()
+        values["port"] = 1234  # returned values may be updated by callers
+        assert provider.get_values() == {"host": "localhost", "port": 5432}
+        assert load_spy.call_count == 1
+
+        monkeypatch.setenv("MY_HOST", "example.com")
+        assert provider.get_values() == {"host": "example.com", "port": 5432}
+        assert load_spy.call_count == 2
+
+        config_variables_file.write_text("host: ${MY_HOST}\nport: 6543\n")
+        stat_result = config_variables_file.stat()
+        os.utime(config_variables_file, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1))
+        assert provider.get_values() == {"host": "example.com", "port": 6543}
+        assert load_spy.call_count == 3
+
+
+@pytest.mark.filesystem
+def test_ConfigurationProvider_invalidate_cache(tmp_path):
+    config_variables_file = tmp_path / "config_variables.yml"
+    config_variables_file.write_text("key: value_1\n")
+    stat_result = config_variables_file.stat()
+    config_provider = _ConfigurationProvider()
+    config_provider.register_provider(
+        _ConfigurationVariablesConfigurationProvider(
+            config_variables_file_path=str(config_variables_file)
+        )
+    )
+    assert config_provider.get_values() == {"key": "value_1"}
+
+    # Rewritten within the resolution of the modification time, with the same size.
+    config_variables_file.write_text("key: value_2\n")
+    os.utime(config_variables_file, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns))
+    assert config_provider.get_values() == {"key": "value_1"}
+
+    config_provider.invalidate_cache()
+    assert config_provider.get_values() == {"key": "value_2"}
@@ -21,6 +21,7 @@ from great_expectations.analytics.events import (
 )
 from great_expectations.core.expectation_suite import (
     ExpectationSuite,
+    _ExpectationIndex,
 )
 from great_expectations.core.serdes import _IdentifierBundle
 from great_expectations.data_context import AbstractDataContext
@@ -702,6 +703,146 @@ class TestCRUDMethods:
             == updated_column_name
         )
 
+    @pytest.mark.unit
+    def test_add_expectations_persists_saved_suite_once(self, expectation):
+        context = Mock(spec=AbstractDataContext)
+        context.expectations_store.has_key.return_value = True
+        set_context(project=context)
+        suite = ExpectationSuite(name=self.expectation_suite_name)
+        expectations = [expectation.copy(update={"column": column}) for column in ["a", "b"]]
+
+        with mock.patch.object(ExpectationSuite, "_submit_expectation_created_event"):
+            suite.add_expectations([*expectations, copy(expectations[0])])
+
+        assert suite.expectations == expectations
+        context.expectations_store.add_expectation.assert_not_called()
+        context.expectations_store.update.assert_called_once_with(
+            key=context.expectations_store.get_key.return_value, value=suite
+        )
+
+    @pytest.mark.unit
+    def test_batch_edit_does_not_persist_unsaved_suite(self, expectation):
+        context = Mock(spec=AbstractDataContext)
+        context.expectations_store.has_key.return_value = False
+        set_context(project=context)
+        suite = ExpectationSuite(name=self.expectation_suite_name)
+
+        with suite.batch_edit():
+            suite.add_expectation(expectation)
+            suite.delete_expectation(expectation)
+
+        assert suite.expectations == []
+        context.expectations_store.update.assert_not_called()
+
+    @pytest.mark.unit
+    def test_batch_edit_does_not_persist_changes_when_block_raises(self, expectation):
+        context = Mock(spec=AbstractDataContext)
+        context.expectations_store.has_key.return_value = True
+        set_context(project=context)
+        suite = ExpectationSuite(name=self.expectation_suite_name)
+
+        with pytest.raises(ConnectionError):  # exception type isn't important
+            with suite.batch_edit(), suite.batch_edit():
+                suite.add_expectation(expectation)
+                raise ConnectionError()
+
+        context.expectations_store.add_expectation.assert_not_called()
+        context.expectations_store.update.assert_not_called()
+
+    @pytest.mark.unit
+    def test_add_distinguishes_expectations_of_different_types(self):
+        context = Mock(spec=AbstractDataContext)
+        context.expectations_store.has_key.return_value = False
+        set_context(project=context)
+        suite = ExpectationSuite(name=self.expectation_suite_name)
+
+        suite.add_expectation(gxe.ExpectColumnValuesToBeInSet(column="a", value_set=[1, 2]))
+        suite.add_expectation(gxe.ExpectColumnValuesToNotBeInSet(column="a", value_set=[1, 2]))
+        suite.add_expectation(gxe.ExpectColumnValuesToBeInSet(column="a", value_set=[1.0, 2.0]))
+
+        assert len(suite.expectations) == 2
+
+    @pytest.mark.unit
+    def test_add_does_not_duplicate_expectation_edited_in_place(self):
+        context = Mock(spec=AbstractDataContext)
+        context.expectations_store.has_key.return_value = False
+        set_context(project=context)
+        suite = ExpectationSuite(name=self.expectation_suite_name)
+        suite.add_expectation(gxe.ExpectColumnToExist(column="a"))
+
+        suite.expectations[0].column = "b"
+        suite.add_expectation(gxe.ExpectColumnToExist(column="b"))
+
+        assert [expectation.column for expectation in suite.expectations] == ["b"]
+
+    @pytest.mark.unit
+    def test_add_does_not_duplicate_expectation_saved_after_nested_edit(self):
+        context = Mock(spec=AbstractDataContext)
+        context.expectations_store.has_key.return_value = False
+        set_context(project=context)
+        suite = ExpectationSuite(name=self.expectation_suite_name)
+        suite.add_expectation(gxe.ExpectColumnValuesToBeInSet(column="a", value_set=[1, 2]))
+
+        with suite.batch_edit():
+            suite.expectations[0].value_set.append(3)
+            suite.expectations[0].save()
+            suite.add_expectation(gxe.ExpectColumnValuesToBeInSet(column="a", value_set=[1, 2, 3]))
+
+        assert [expectation.value_set for expectation in suite.expectations] == [[1, 2, 3]]
+
+    @pytest.mark.unit
+    def test_add_expectation_does_not_reindex_suite_for_every_new_expectation(self):
+        context = Mock(spec=AbstractDataContext)
+        context.expectations_store.has_key.return_value = False
+        set_context(project=context)
+
+        def _count_identity_keys(num_expectations: int) -> int:
+            suite = ExpectationSuite(name=self.expectation_suite_name)
+            with mock.patch.object(
+                _ExpectationIndex, "_identity_key", wraps=_ExpectationIndex._identity_key
+            ) as identity_key:
+                for idx in range(num_expectations):
+                    suite.add_expectation(gxe.ExpectColumnToExist(column=f"col_{idx}"))
+
+            assert len(suite.expectations) == num_expectations
+            return identity_key.call_count
+
+        # Cost of adding new Expectations grows linearly (not quadratically) with their number.
+        assert _count_identity_keys(200) == 2 * _count_identity_keys(100)
+
+    @pytest.mark.unit
+    def test_add_does_not_duplicate_expectation_replaced_in_list(self):
+        context = Mock(spec=AbstractDataContext)
+        context.expectations_store.has_key.return_value = False
+        set_context(project=context)
+        suite = ExpectationSuite(name=self.expectation_suite_name)
+        suite.add_expectation(gxe.ExpectColumnToExist(column="a"))
+
+        suite.expectations[0] = gxe.ExpectColumnToExist(column="b")
+        suite.add_expectation(gxe.ExpectColumnToExist(column="b"))
+        suite.add_expectation_configuration(
+            gxe.ExpectColumnToExist(column="b").configuration, match_type="domain"
+        )
+
+        assert [expectation.column for expectation in suite.expectations] == ["b"]
+
+    @pytest.mark.filesystem
+    def test_filesystem_add_expectations_adds_ids(self, empty_data_context, expectation):
+        context = empty_data_context
+        suite = context.suites.add(ExpectationSuite(name=self.expectation_suite_name))
+        expectations = [expectation.copy(update={"column": column}) for column in ["a", "b"]]
+
+        suite.add_expectations(expectations)
+
+        assert all(expectation.id for expectation in expectations)
+        fetched_suite = context.suites.get(name=self.expectation_suite_name)
+        assert [expectation.id for expectation in fetched_suite.expectations] == [
+            expectation.id for expectation in expectations
+        ]
+
+        suite.remove_expectation(id=expectations[0].id)
+        assert suite.expectations == [expectations[1]]
+
     @pytest.mark.unit
     def test_expectation_suite_name_can_be_updated(self, empty_cloud_context_fluent):
         """Expect that ExpectationSuite.name can be updated directly"""
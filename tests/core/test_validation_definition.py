@@ -178,6 +178,45 @@ def cloud_validation_definition(
     )
 
 
+@pytest.mark.unit
+def test_run_releases_batch_data_and_cached_metrics(
+    dataframe_validation_definition: ValidationDefinition,
+):
+    dataframe_validation_definition.suite.add_expectation(
+        gxe.ExpectColumnMaxToBeBetween(column="a", max_value=5)
+    )
+
+    result = dataframe_validation_definition.run(
+        batch_parameters={"dataframe": pd.DataFrame({"a": [1, 2, 3]})}
+    )
+
+    assert result.success
+    execution_engine = dataframe_validation_definition.data_source.get_execution_engine()
+    assert execution_engine.batch_manager.loaded_batch_ids == []
+    assert len(execution_engine.metric_cache) == 0
+
+
+@pytest.mark.unit
+def test_run_keeps_batch_loaded_before_run(
+    dataframe_validation_definition: ValidationDefinition,
+):
+    expectation = gxe.ExpectColumnMaxToBeBetween(column="a", max_value=5)
+    dataframe_validation_definition.suite.add_expectation(expectation)
+    batch_parameters = {"dataframe": pd.DataFrame({"a": [1, 2, 3]})}
+    # Interactive user holds batch with same batch_id as the one of validation definition.
+    batch = dataframe_validation_definition.batch_definition.get_batch(
+        batch_parameters=batch_parameters
+    )
+    assert batch.validate(expectation).success
+
+    execution_engine = dataframe_validation_definition.data_source.get_execution_engine()
+    assert execution_engine.batch_manager.loaded_batch_ids == [batch.id]
+
+    assert dataframe_validation_definition.run(batch_parameters=batch_parameters).success
+    assert execution_engine.batch_manager.loaded_batch_ids == [batch.id]
+    assert len(execution_engine.metric_cache) > 0
+
+
 @pytest.mark.unit
 def test_validation_definition_data_properties(validation_definition: ValidationDefinition):
     assert validation_definition.data.name == BATCH_DEFINITION_NAME
@@ -330,6 +369,18 @@ class TestValidationRun:
             "great_expectations_version": GX_VERSION,
         }
 
+    @pytest.mark.unit
+    def test_unloads_batch_after_validation(
+        self,
+        mock_validator: MagicMock,
+        validation_definition: ValidationDefinition,
+    ) -> None:
+        mock_validator.graph_validate.return_value = []
+
+        validation_definition.run()
+
+        mock_validator.execution_engine.unload_batch_data.assert_called_once_with(batch_id=BATCH_ID)
+
     @pytest.mark.parametrize(
         "batch_parameters",
         [
@@ -180,3 +180,29 @@ def test_store_add_or_update(previous_key_exists: bool):
 
     store.add_or_update(key=key, value=value)
     assert store.get(key) == value
+
+
+@pytest.mark.unit
+def test_store_get_many_yields_values_in_order_of_keys():
+    store = Store()
+    keys = [StringKey(f"key_{idx}") for idx in range(5)]
+    for idx, key in enumerate(keys):
+        store.add(key=key, value=f"value_{idx}")
+
+    assert list(store.get_many(keys=reversed(keys))) == [
+        (key, f"value_{idx}") for idx, key in reversed(list(enumerate(keys)))
+    ]
+
+
+@pytest.mark.unit
+def test_store_get_many_with_missing_key():
+    store = Store()
+    present_key = StringKey("present")
+    missing_key = StringKey("missing")
+    store.add(key=present_key, value="value")
+
+    assert list(store.get_many(keys=[missing_key, present_key], skip_failed_keys=True)) == [
+        (present_key, "value")
+    ]
+    with pytest.raises(gx_exceptions.InvalidKeyError):
+        list(store.get_many(keys=[present_key, missing_key]))
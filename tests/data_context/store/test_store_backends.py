@@ -1,6 +1,7 @@
 import datetime
 import json
 import os
+import threading
 import uuid
 from typing import Optional
 from unittest import mock
@@ -418,6 +419,57 @@ def test_TupleFilesystemStoreBackend_get_all(tmp_path_factory):
     assert sorted(all_values) == [value_a, value_b]
 
 
+@pytest.mark.filesystem
+def test_TupleFilesystemStoreBackend_get_many_fetches_values_concurrently(tmp_path, mocker):
+    my_store = TupleFilesystemStoreBackend(
+        base_directory=str(tmp_path),
+        filepath_template="my_file_{0}",
+        get_many_max_workers=2,
+    )
+    keys = [(f"key_{idx}",) for idx in range(6)]
+    for key in keys:
+        my_store.set(key, f"value_of_{key[0]}")
+
+    # Every fetch waits for another one, so that sequential fetches would break the barrier.
+    barrier = threading.Barrier(parties=2, timeout=10)
+    original_get = my_store._get
+
+    def _get(key):
+        barrier.wait()
+        return original_get(key)
+
+    mocker.patch.object(my_store, "_get", side_effect=_get)
+
+    assert list(my_store.get_many(keys)) == [(key, f"value_of_{key[0]}") for key in keys]
+
+
+@pytest.mark.filesystem
+def test_TupleFilesystemStoreBackend_get_many_with_missing_keys(tmp_path):
+    my_store = TupleFilesystemStoreBackend(
+        base_directory=str(tmp_path),
+        filepath_template="my_file_{0}",
+        get_many_max_workers=4,
+    )
+    my_store.set(("AAA",), "aaa")
+    my_store.set(("BBB",), "bbb")
+    keys = [("AAA",), ("missing",), ("BBB",)]
+
+    assert list(my_store.get_many(keys, skip_missing_keys=True)) == [
+        (("AAA",), "aaa"),
+        (("BBB",), "bbb"),
+    ]
+    with pytest.raises(InvalidKeyError):
+        list(my_store.get_many(keys))
+
+
+@pytest.mark.unit
+def test_TupleFilesystemStoreBackend_with_non_positive_get_many_max_workers_raises_error(
+    tmp_path,
+):
+    with pytest.raises(ValueError, match="get_many_max_workers must be positive"):
+        TupleFilesystemStoreBackend(base_directory=str(tmp_path), get_many_max_workers=0)
+
+
 @pytest.mark.filesystem
 def test_TupleFilesystemStoreBackend_ignores_jupyter_notebook_checkpoints(
     tmp_path_factory,
@@ -593,6 +645,28 @@ def test_TupleS3StoreBackend_get_all(aws_credentials):
     assert sorted(result) == [val_a, val_b]
 
 
+@mock_s3
+@pytest.mark.aws_deps
+def test_TupleS3StoreBackend_get_many(aws_credentials):
+    bucket = "leakybucket"
+
+    # create a bucket in Moto's mock AWS environment
+    conn = boto3.resource("s3", region_name="us-east-1")
+    conn.create_bucket(Bucket=bucket)
+
+    my_store = TupleS3StoreBackend(filepath_template="my_file_{0}", bucket=bucket)
+    assert my_store.get_many_max_workers == TupleS3StoreBackend.DEFAULT_GET_MANY_MAX_WORKERS
+
+    keys = [(f"key_{idx}",) for idx in range(50)]
+    for key in keys:
+        my_store.set(key, f"value_of_{key[0]}", content_type="text/html; charset=utf-8")
+
+    result = list(my_store.get_many([*keys, ("missing",)], skip_missing_keys=True))
+
+    assert result == [(key, f"value_of_{key[0]}") for key in keys]
+    assert sorted(my_store.get_all()) == sorted(value for _, value in result)
+
+
 @mock_s3
 @pytest.mark.aws_deps
 def test_tuple_s3_store_backend_slash_conditions(aws_credentials):  # noqa: PLR0915
@@ -1072,6 +1146,47 @@ def test_TupleGCSStoreBackend_get_all(mocker: MockerFixture):
         assert sorted(result) == [val_a, val_b]
 
 
+@pytest.mark.skipif(
+    not is_library_loadable(library_name="google"),
+    reason="google is not installed",
+)
+@pytest.mark.big
+def test_TupleGCSStoreBackend_get_many(mocker: MockerFixture):
+    bucket = "leakybucket"
+    prefix = "this_is_a_test_prefix"
+    project = "dummy-project"
+    keys = [(f"blob_{idx}",) for idx in range(20)]
+
+    from great_expectations.compatibility import google
+
+    def mock_get_blob(gcs_object_key):
+        """Test double for bucket::get_blob."""
+        if gcs_object_key == f"{prefix}/missing":
+            return None
+
+        return mocker.Mock(
+            download_as_bytes=mocker.Mock(return_value=f"value_of_{gcs_object_key}".encode())
+        )
+
+    mock_gcs_client = mocker.MagicMock(spec=google.storage.Client)
+    mock_gcs_client.bucket.return_value = mocker.Mock(
+        get_blob=mocker.Mock(side_effect=mock_get_blob)
+    )
+
+    with mocker.patch("google.cloud.storage.Client", return_value=mock_gcs_client):
+        my_store = TupleGCSStoreBackend(
+            filepath_template=None,
+            bucket=bucket,
+            prefix=prefix,
+            project=project,
+            get_many_max_workers=4,
+        )
+
+        result = list(my_store.get_many([*keys, ("missing",)], skip_missing_keys=True))
+
+    assert result == [(key, f"value_of_{prefix}/{key[0]}") for key in keys]
+
+
 @pytest.mark.unit
 def test_TupleAzureBlobStoreBackend_credential():
     pytest.importorskip("azure.storage.blob")
@@ -4,6 +4,7 @@ import copy
 import inspect
 import logging
 import pathlib
+import threading
 import uuid
 from pprint import pformat as pf
 from typing import TYPE_CHECKING, Any, Callable, Type
@@ -32,6 +33,9 @@ from great_expectations.datasource.fluent.sources import (
 )
 from great_expectations.exceptions.exceptions import BuildBatchRequestError
 from great_expectations.execution_engine.pandas_batch_data import PandasBatchData
+from great_expectations.execution_engine.persistent_metric_cache import (
+    SqlitePersistentMetricCache,
+)
 from great_expectations.util import camel_to_snake
 
 if TYPE_CHECKING:
@@ -471,6 +475,118 @@ def test_read_dataframe(empty_data_context: AbstractDataContext, test_df_pandas:
         b.data.dataframe.equals(test_df_pandas)
 
 
+@pytest.mark.filesystem
+def test_metrics_are_computed_concurrently_if_configured_by_datasource(
+    mocker, empty_data_context: AbstractDataContext, test_df_pandas: pd.DataFrame
+):
+    datasource = empty_data_context.data_sources.add_pandas(
+        name="my_pandas_datasource",
+        metric_computation_max_workers=4,
+        metric_computation_timeout=30,
+    )
+    assert (
+        empty_data_context.data_sources.get("my_pandas_datasource").dict()[
+            "metric_computation_max_workers"
+        ]
+        == 4
+    )
+
+    batch = (
+        datasource.add_dataframe_asset(name="my_dataframe_asset")
+        .add_batch_definition_whole_dataframe(name="bd")
+        .get_batch(batch_parameters={"dataframe": test_df_pandas})
+    )
+    execution_engine_cls = (
+        great_expectations.execution_engine.pandas_execution_engine.PandasExecutionEngine
+    )
+    get_domain_records = execution_engine_cls.get_domain_records
+    metric_threads = set()
+
+    def _record_thread(self, *args, **kwargs):
+        metric_threads.add(threading.current_thread())
+        return get_domain_records(self, *args, **kwargs)
+
+    mocker.patch.object(execution_engine_cls, "get_domain_records", _record_thread)
+    column = test_df_pandas.columns[0]
+    result = batch.validate(gx.expectations.ExpectColumnValuesToNotBeNull(column=column))
+
+    assert result.success is not None
+    execution_engine = datasource.get_execution_engine()
+    assert execution_engine.config["metric_computation_max_workers"] == 4
+    assert execution_engine.config["metric_computation_timeout"] == 30
+    # Metrics are computed on worker threads of execution engine, not on calling thread.
+    assert metric_threads
+    assert threading.current_thread() not in metric_threads
+
+
+@pytest.mark.filesystem
+def test_metrics_are_persisted_if_configured_by_datasource(
+    mocker,
+    empty_data_context: AbstractDataContext,
+    test_df_pandas: pd.DataFrame,
+    tmp_path: pathlib.Path,
+):
+    persistent_metric_cache = {"path": str(tmp_path / "metrics.db")}
+    expectation = gx.expectations.ExpectColumnValuesToNotBeNull(column=test_df_pandas.columns[0])
+
+    get_many = mocker.spy(SqlitePersistentMetricCache, "get_many")
+    results = []
+    # Re-creating datasource (e.g., in next run of same project) starts with new execution engine.
+    for _ in range(2):
+        get_many.reset_mock()
+        if "my_pandas_datasource" in empty_data_context.data_sources.all():
+            empty_data_context.data_sources.delete("my_pandas_datasource")
+
+        datasource = empty_data_context.data_sources.add_pandas(
+            name="my_pandas_datasource", persistent_metric_cache=persistent_metric_cache
+        )
+        batch = (
+            datasource.add_dataframe_asset(name="my_dataframe_asset")
+            .add_batch_definition_whole_dataframe(name="bd")
+            .get_batch(batch_parameters={"dataframe": test_df_pandas})
+        )
+        results.append(batch.validate(expectation))
+
+    execution_engine = datasource.get_execution_engine()
+    assert execution_engine.config["persistent_metric_cache"]["path"] == str(
+        tmp_path / "metrics.db"
+    )
+    assert len(execution_engine.persistent_metric_cache) > 0
+    # Second execution engine is served metrics persisted by first one.
+    assert any(get_many.spy_return_list)
+    assert results[0].result == results[1].result
+
+
+@pytest.mark.filesystem
+def test_large_value_sets_are_semi_joined_if_configured_by_datasource(
+    mocker, empty_data_context: AbstractDataContext, test_df_pandas: pd.DataFrame
+):
+    expectation = gx.expectations.ExpectColumnValuesToBeInSet(column="col1", value_set=[1, 5])
+
+    get_value_set_index = mocker.spy(
+        great_expectations.execution_engine.pandas_execution_engine.PandasExecutionEngine,
+        "get_value_set_index",
+    )
+    results = {}
+    for value_set_semi_join_threshold in (None, 1):
+        get_value_set_index.reset_mock()
+        datasource = empty_data_context.data_sources.add_pandas(
+            name=f"my_pandas_datasource_{value_set_semi_join_threshold}",
+            value_set_semi_join_threshold=value_set_semi_join_threshold,
+        )
+        batch = (
+            datasource.add_dataframe_asset(name="my_dataframe_asset")
+            .add_batch_definition_whole_dataframe(name="bd")
+            .get_batch(batch_parameters={"dataframe": test_df_pandas})
+        )
+        results[value_set_semi_join_threshold] = batch.validate(expectation).result
+        # Value set of 2 values is only larger than configured threshold (not than default one).
+        assert get_value_set_index.called is (value_set_semi_join_threshold == 1)
+
+    assert results[1] == results[None]
+    assert results[1]["partial_unexpected_list"] == [2]
+
+
 @pytest.mark.cloud
 def test_cloud_get_csv_asset_not_in_memory(valid_file_path: pathlib.Path):
     # this test runs end-to-end in a real Cloud Data Context
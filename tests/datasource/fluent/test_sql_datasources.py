@@ -158,6 +158,8 @@ class TestConfigPasstrough:
             **ds_kwargs.get("kwargs", {}),
             # config substitution should have been performed
             **ds.dict(include={"connection_string"}, config_provider=ds._config_provider),
+            # schema metadata is shared by all execution engines of datasource
+            "schema_metadata_cache": ds.schema_metadata_cache,
         }
         assert "create_temp_table" in expected_args
 
@@ -165,6 +167,37 @@ class TestConfigPasstrough:
         gx_sqlalchemy_execution_engine_spy.assert_called_once_with(**expected_args)
 
 
+@pytest.mark.unit
+def test_get_execution_engine_is_reused_until_fields_or_config_values_change(
+    gx_sqlalchemy_execution_engine_spy: mock.MagicMock,  # noqa: TID251
+    monkeypatch: pytest.MonkeyPatch,
+    ephemeral_context_with_defaults: EphemeralDataContext,
+    filter_gx_datasource_warnings: None,
+):
+    monkeypatch.setenv("MY_CONN_STR", "sqlite:///")
+    ds = ephemeral_context_with_defaults.data_sources.add_or_update_sql(
+        name="my_datasource", connection_string="${MY_CONN_STR}"
+    )
+    ds.get_execution_engine()
+
+    with mock.patch.object(SQLDatasource, "dict", autospec=True) as dict_spy:
+        ds.get_execution_engine()
+    dict_spy.assert_not_called()
+    assert gx_sqlalchemy_execution_engine_spy.call_count == 1
+
+    monkeypatch.setenv("MY_CONN_STR", "sqlite:///:memory:")
+    ds.get_execution_engine()
+    assert gx_sqlalchemy_execution_engine_spy.call_count == 2
+    assert (
+        gx_sqlalchemy_execution_engine_spy.call_args.kwargs["connection_string"]
+        == "sqlite:///:memory:"
+    )
+
+    ds.create_temp_table = not ds.create_temp_table
+    ds.get_execution_engine()
+    assert gx_sqlalchemy_execution_engine_spy.call_count == 3
+
+
 @pytest.mark.unit
 def test_table_quoted_name_type_does_not_exist(
     mocker,
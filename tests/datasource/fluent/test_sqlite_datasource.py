@@ -2,11 +2,13 @@ from __future__ import annotations
 
 import pathlib
 from contextlib import _GeneratorContextManager, contextmanager
-from typing import TYPE_CHECKING, Any, Callable, Generator, Optional
+from typing import TYPE_CHECKING, Any, Callable, Generator, List, Optional
 
 import pytest
 
+import great_expectations.expectations as gxe
 from great_expectations.compatibility.pydantic import ValidationError
+from great_expectations.core.expectation_suite import ExpectationSuite
 from great_expectations.core.partitioners import (
     PartitionerConvertedDatetime,
 )
@@ -181,3 +183,180 @@ def test_create_temp_table(empty_data_context, create_sqlite_source):
         asset = source.add_query_asset(name="query_asset", query="SELECT * from table")
         _ = asset.get_batch(asset.build_batch_request())
         assert source._execution_engine._create_temp_table is False
+
+
+@pytest.mark.sqlite
+def test_schema_metadata_is_shared_by_execution_engines(
+    sa, empty_data_context, tmp_path: pathlib.Path
+):
+    sqlite_datasource = empty_data_context.data_sources.add_sqlite(
+        name="sqlite_datasource",
+        connection_string=f"sqlite:///{tmp_path / 'metadata.db'}",
+        schema_metadata_cache_enabled=True,
+        schema_metadata_cache_ttl_seconds=60,
+    )
+    execution_engine = sqlite_datasource.get_execution_engine()
+    assert execution_engine.schema_metadata_cache is sqlite_datasource.schema_metadata_cache
+    assert execution_engine.schema_metadata_cache.ttl_seconds == 60
+    with execution_engine.get_connection() as connection:
+        connection.execute(sa.text("CREATE TABLE trips (id INTEGER, fare REAL)"))
+
+    asset = sqlite_datasource.add_table_asset(name="trips", table_name="trips")
+    assert asset.get_batch(asset.build_batch_request()).columns() == ["id", "fare"]
+    assert sqlite_datasource.schema_metadata_cache.num_cached_tables == 1
+
+    assert sqlite_datasource.refresh_schema_metadata() == 1
+    assert sqlite_datasource.schema_metadata_cache.num_cached_tables == 0
+
+
+@pytest.mark.sqlite
+def test_schema_metadata_is_not_cached_by_default(empty_data_context, tmp_path: pathlib.Path):
+    sqlite_datasource = empty_data_context.data_sources.add_sqlite(
+        name="sqlite_datasource", connection_string=f"sqlite:///{tmp_path / 'metadata.db'}"
+    )
+    execution_engine = sqlite_datasource.get_execution_engine()
+    assert sqlite_datasource.schema_metadata_cache is None
+    assert execution_engine.schema_metadata_cache is None
+    assert sqlite_datasource.refresh_schema_metadata() == 0
+
+    # Enabling cache replaces execution engine, which does not share it otherwise.
+    sqlite_datasource.schema_metadata_cache_enabled = True
+    assert (
+        sqlite_datasource.get_execution_engine().schema_metadata_cache
+        is sqlite_datasource.schema_metadata_cache
+        is not None
+    )
+
+
+@pytest.mark.sqlite
+def test_metric_cache_limits_are_passed_to_execution_engine(tmp_path: pathlib.Path):
+    sqlite_datasource = SqliteDatasource(
+        name="sqlite_datasource",
+        connection_string=f"sqlite:///{tmp_path / 'metrics.db'}",
+        metric_cache_max_entries=100,
+        metric_cache_max_bytes=1024,
+    )
+
+    metric_cache = sqlite_datasource.get_execution_engine().metric_cache
+    assert (metric_cache.max_entries, metric_cache.max_bytes) == (100, 1024)
+
+
+@pytest.mark.sqlite
+def test_concurrent_metric_computation_is_configured_by_datasource(
+    empty_data_context, tmp_path: pathlib.Path
+):
+    empty_data_context.data_sources.add_sqlite(
+        name="sqlite_datasource",
+        connection_string=f"sqlite:///{tmp_path / 'metrics.db'}",
+        metric_computation_max_workers=4,
+        metric_computation_timeout=30,
+    )
+
+    config = empty_data_context.data_sources.get("sqlite_datasource").get_execution_engine().config
+    assert config["metric_computation_max_workers"] == 4
+    assert config["metric_computation_timeout"] == 30
+
+
+@pytest.mark.sqlite
+def test_unexpected_rows_queries_are_fused_if_configured_by_datasource(
+    sa, empty_data_context, tmp_path: pathlib.Path
+):
+    database_path = tmp_path / "animals.db"
+    engine = sa.create_engine(f"sqlite:///{database_path}")
+    with engine.begin() as connection:
+        connection.execute(sa.text("CREATE TABLE animals (id INTEGER, animal TEXT)"))
+        connection.execute(
+            sa.text("INSERT INTO animals VALUES (1, 'cat'), (2, 'lion'), (3, 'fish')")
+        )
+    engine.dispose()
+
+    suite = ExpectationSuite(
+        name="animals_suite",
+        expectations=[
+            gxe.ExpectColumnValuesToBeInSet(column="animal", value_set=["cat", "dog"]),
+            gxe.ExpectColumnValuesToNotBeInSet(column="animal", value_set=["lion"]),
+        ],
+    )
+
+    statements: List[str] = []
+
+    def _record_statement(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    results = {}
+    for fuse_unexpected_rows_queries in (False, True):
+        statements.clear()
+        sqlite_datasource = empty_data_context.data_sources.add_sqlite(
+            name=f"sqlite_datasource_{fuse_unexpected_rows_queries}",
+            connection_string=f"sqlite:///{database_path}",
+            fuse_unexpected_rows_queries=fuse_unexpected_rows_queries,
+        )
+        batch = (
+            sqlite_datasource.add_table_asset(name="animals", table_name="animals")
+            .add_batch_definition_whole_table(name="all_animals")
+            .get_batch()
+        )
+        sa.event.listen(
+            batch.data.execution_engine.engine, "before_cursor_execute", _record_statement
+        )
+        results[fuse_unexpected_rows_queries] = [
+            result.result for result in batch.validate(suite, result_format="SUMMARY").results
+        ]
+        # Without "unexpected_index_column_names", order of sampled rows is not defined.
+        for result in results[fuse_unexpected_rows_queries]:
+            result["partial_unexpected_list"] = sorted(result["partial_unexpected_list"])
+
+        assert any("gx_unexpected_rank" in statement for statement in statements) is (
+            fuse_unexpected_rows_queries
+        )
+
+    assert results[True] == results[False]
+    assert results[True][0]["partial_unexpected_list"] == ["fish", "lion"]
+
+
+@pytest.mark.sqlite
+def test_large_value_sets_are_semi_joined_if_configured_by_datasource(
+    sa, empty_data_context, tmp_path: pathlib.Path
+):
+    database_path = tmp_path / "animals.db"
+    engine = sa.create_engine(f"sqlite:///{database_path}")
+    with engine.begin() as connection:
+        connection.execute(sa.text("CREATE TABLE animals (id INTEGER, animal TEXT)"))
+        connection.execute(
+            sa.text("INSERT INTO animals VALUES (1, 'cat'), (2, 'lion'), (3, 'fish')")
+        )
+    engine.dispose()
+
+    expectation = gxe.ExpectColumnValuesToBeInSet(column="animal", value_set=["cat", "dog"])
+
+    statements: List[str] = []
+
+    def _record_statement(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    results = {}
+    for value_set_semi_join_threshold in (None, 1):
+        statements.clear()
+        sqlite_datasource = empty_data_context.data_sources.add_sqlite(
+            name=f"sqlite_datasource_{value_set_semi_join_threshold}",
+            connection_string=f"sqlite:///{database_path}",
+            value_set_semi_join_threshold=value_set_semi_join_threshold,
+        )
+        batch = (
+            sqlite_datasource.add_table_asset(name="animals", table_name="animals")
+            .add_batch_definition_whole_table(name="all_animals")
+            .get_batch()
+        )
+        sa.event.listen(
+            batch.data.execution_engine.engine, "before_cursor_execute", _record_statement
+        )
+        result = batch.validate(expectation, result_format="SUMMARY").result
+        result["partial_unexpected_list"] = sorted(result["partial_unexpected_list"])
+        results[value_set_semi_join_threshold] = result
+        # Value set of 2 values is only larger than configured threshold (not than default one).
+        assert any("EXISTS" in statement for statement in statements) is (
+            value_set_semi_join_threshold == 1
+        )
+
+    assert results[1] == results[None]
+    assert results[1]["partial_unexpected_list"] == ["fish", "lion"]
@@ -1,8 +1,10 @@
 import datetime
+import hashlib
 import os
 from typing import List
 from unittest import mock
 
+import numpy as np
 import pandas as pd
 import pandas.api.types as ptypes
 import pytest
@@ -482,3 +484,267 @@ def test_get_batch_with_partition_on_hashed_column(test_df):
         )
     )
     assert partitioned_df.dataframe.shape == (8, 10)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "partitioner_method_name, partitioner_kwargs, expected_filters",
+    [
+        pytest.param(
+            "partition_on_year_and_month",
+            {"column_name": "ts", "batch_identifiers": {"ts": {"year": 2020, "month": 12}}},
+            [
+                ("ts", ">=", datetime.datetime(2020, 12, 1)),  # noqa: DTZ001
+                ("ts", "<", datetime.datetime(2021, 1, 1)),  # noqa: DTZ001
+            ],
+            id="year_and_month",
+        ),
+        pytest.param(
+            "_partition_on_year_and_month_and_day",
+            {"column_name": "ts", "batch_identifiers": {"ts": "2020-02-28"}},
+            [
+                ("ts", ">=", datetime.datetime(2020, 2, 28)),  # noqa: DTZ001
+                ("ts", "<", datetime.datetime(2020, 2, 29)),  # noqa: DTZ001
+            ],
+            id="year_and_month_and_day_from_datetime_string",
+        ),
+        pytest.param(
+            "partition_on_date_parts",
+            {
+                "column_name": "ts",
+                "date_parts": ["month"],
+                "batch_identifiers": {"ts": {"month": 10}},
+            },
+            None,
+            id="date_parts_not_identifying_range",
+        ),
+        pytest.param(
+            "partition_on_converted_datetime",
+            {"column_name": "ts", "batch_identifiers": {"ts": "2020-01-31"}},
+            [
+                ("ts", ">=", datetime.datetime(2020, 1, 31)),  # noqa: DTZ001
+                ("ts", "<", datetime.datetime(2020, 2, 1)),  # noqa: DTZ001
+            ],
+            id="converted_datetime",
+        ),
+        pytest.param(
+            "partition_on_column_value",
+            {"column_name": "color", "batch_identifiers": {"color": "red"}},
+            [("color", "==", "red")],
+            id="column_value",
+        ),
+        pytest.param(
+            "partition_on_multi_column_values",
+            {"column_names": ["y", "m"], "batch_identifiers": {"y": 2020, "m": 1}},
+            [("y", "==", 2020), ("m", "==", 1)],
+            id="multi_column_values",
+        ),
+        pytest.param(
+            "partition_on_divided_integer",
+            {"column_name": "id", "divisor": 10, "batch_identifiers": {"id": 5}},
+            [("id", ">=", 50), ("id", "<", 60)],
+            id="divided_integer",
+        ),
+        pytest.param(
+            "partition_on_mod_integer",
+            {"column_name": "id", "mod": 10, "batch_identifiers": {"id": 5}},
+            None,
+            id="mod_integer_not_translatable",
+        ),
+        pytest.param(
+            "partition_on_column_value",
+            {"column_name": "color", "batch_identifiers": {}},
+            None,
+            id="missing_batch_identifier",
+        ),
+    ],
+)
+def test_get_partition_filters(
+    partitioner_method_name: str, partitioner_kwargs: dict, expected_filters
+):
+    assert (
+        PandasDataPartitioner().get_partition_filters(
+            partitioner_method_name=partitioner_method_name,
+            partitioner_kwargs=partitioner_kwargs,
+        )
+        == expected_filters
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("quotient", range(-4, 5))
+def test_divided_integer_partition_filters_match_partition(quotient: int):
+    df = pd.DataFrame({"id": range(-35, 36)})
+    partitioner_kwargs = {"column_name": "id", "divisor": 7, "batch_identifiers": {"id": quotient}}
+    filters = PandasDataPartitioner().get_partition_filters(
+        partitioner_method_name="partition_on_divided_integer",
+        partitioner_kwargs=partitioner_kwargs,
+    )
+    comparisons = {"==": "eq", "<": "lt", "<=": "le", ">": "gt", ">=": "ge"}
+
+    filtered_df = df
+    for column_name, operator_name, value in filters:
+        filtered_df = filtered_df[
+            getattr(filtered_df[column_name], comparisons[operator_name])(value)
+        ]
+
+    partitioned_df = PandasDataPartitioner.partition_on_divided_integer(df, **partitioner_kwargs)
+    assert filtered_df["id"].tolist() == partitioned_df["id"].tolist()
+
+
+@pytest.mark.unit
+def test_get_batch_data_pushes_partition_filters_down_to_parquet_reader(
+    simple_multi_year_pandas_df: pd.DataFrame,
+):
+    read_parquet = mock.create_autospec(pd.read_parquet, return_value=simple_multi_year_pandas_df)
+    with mock.patch("pandas.read_parquet", read_parquet):
+        batch_data = PandasExecutionEngine().get_batch_data(
+            PathBatchSpec(
+                path="data.parquet",
+                reader_method="read_parquet",
+                partitioner_method="partition_on_year",
+                partitioner_kwargs={
+                    "column_name": "timestamp",
+                    "batch_identifiers": {"timestamp": {"year": 2019}},
+                },
+            )
+        )
+
+    read_parquet.assert_called_once_with(
+        "data.parquet",
+        filters=[
+            ("timestamp", ">=", datetime.datetime(2019, 1, 1)),  # noqa: DTZ001
+            ("timestamp", "<", datetime.datetime(2020, 1, 1)),  # noqa: DTZ001
+        ],
+    )
+    assert batch_data.dataframe["timestamp"].dt.year.tolist() == [2019, 2019, 2019]
+
+
+@pytest.mark.unit
+def test_get_batch_data_falls_back_to_in_memory_partitioning_if_reader_rejects_filters(
+    simple_multi_year_pandas_df: pd.DataFrame,
+):
+    read_parquet = mock.create_autospec(
+        pd.read_parquet,
+        side_effect=[
+            TypeError("Cannot compare timestamp with timezone"),
+            simple_multi_year_pandas_df,
+        ],
+    )
+    with mock.patch("pandas.read_parquet", read_parquet):
+        batch_data = PandasExecutionEngine().get_batch_data(
+            PathBatchSpec(
+                path="data.parquet",
+                reader_method="read_parquet",
+                partitioner_method="partition_on_year",
+                partitioner_kwargs={
+                    "column_name": "timestamp",
+                    "batch_identifiers": {"timestamp": {"year": 2019}},
+                },
+            )
+        )
+
+    assert read_parquet.call_count == 2
+    assert read_parquet.call_args == mock.call("data.parquet")
+    assert batch_data.dataframe["timestamp"].dt.year.tolist() == [2019, 2019, 2019]
+
+
+@pytest.fixture
+def mixed_type_df() -> pd.DataFrame:
+    timestamps = pd.Series(pd.date_range("2020-01-01", periods=120, freq="7h"))
+    return pd.DataFrame(
+        {
+            "timestamp": timestamps,
+            "timestamp_tz": timestamps.dt.tz_localize("Europe/Berlin"),
+            "id": range(-60, 60),
+            "mixed": [1, 1.0, True, "1", None, np.nan] * 20,
+            "float": [1.5, np.nan, -2.0] * 40,
+            "nullable_int": pd.array([1, None, 3, 4] * 30, dtype="Int64"),
+        }
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "column_name", ["timestamp", "timestamp_tz", "id", "mixed", "float", "nullable_int"]
+)
+@pytest.mark.parametrize("hash_value", ["0", "7", "f"])
+def test_partition_on_hashed_column_matches_hashing_every_value(
+    mixed_type_df: pd.DataFrame, column_name: str, hash_value: str
+):
+    expected_df = mixed_type_df[
+        mixed_type_df[column_name].map(
+            lambda x: hashlib.md5(str(x).encode()).hexdigest()[-1:] == hash_value
+        )
+    ]
+
+    partitioned_df = PandasDataPartitioner.partition_on_hashed_column(
+        mixed_type_df,
+        column_name=column_name,
+        hash_digits=1,
+        batch_identifiers={"hash_value": hash_value},
+    )
+
+    pd.testing.assert_frame_equal(partitioned_df, expected_df)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("column_name", ["timestamp", "timestamp_tz"])
+@pytest.mark.parametrize(
+    "date_format_string, matching_string",
+    [
+        pytest.param("%Y-%m-%d", "2020-01-05", id="day"),
+        pytest.param("%Y-%m-%d %H", "2020-01-05 03", id="hour"),
+        pytest.param("%Y", "2020", id="year"),
+        pytest.param("%d", "05", id="day_of_every_month"),
+        pytest.param("%Y-%m-%d", "2020-1-5", id="not_produced_by_format"),
+        pytest.param("%Y-%m-%d", "not a date", id="not_parsed_by_format"),
+    ],
+)
+def test_partition_on_converted_datetime_matches_converting_every_value(
+    mixed_type_df: pd.DataFrame, column_name: str, date_format_string: str, matching_string: str
+):
+    expected_df = mixed_type_df[
+        mixed_type_df[column_name].map(lambda x: x.strftime(date_format_string)) == matching_string
+    ]
+
+    partitioned_df = PandasDataPartitioner.partition_on_converted_datetime(
+        mixed_type_df,
+        column_name=column_name,
+        batch_identifiers={column_name: matching_string},
+        date_format_string=date_format_string,
+    )
+
+    pd.testing.assert_frame_equal(partitioned_df, expected_df)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("matching_value", [-9, -1, 0, 1, 2])
+def test_partition_on_divided_and_mod_integer_match_every_value(
+    mixed_type_df: pd.DataFrame, matching_value: int
+):
+    batch_identifiers = {"id": matching_value}
+
+    pd.testing.assert_frame_equal(
+        PandasDataPartitioner.partition_on_divided_integer(
+            mixed_type_df, column_name="id", divisor=7, batch_identifiers=batch_identifiers
+        ),
+        mixed_type_df[mixed_type_df["id"].map(lambda x: int(x / 7) == matching_value)],
+    )
+    pd.testing.assert_frame_equal(
+        PandasDataPartitioner.partition_on_mod_integer(
+            mixed_type_df, column_name="id", mod=3, batch_identifiers=batch_identifiers
+        ),
+        mixed_type_df[mixed_type_df["id"].map(lambda x: x % 3 == matching_value)],
+    )
+
+
+@pytest.mark.unit
+def test_partition_on_multi_column_values_skips_missing_values(mixed_type_df: pd.DataFrame):
+    partitioned_df = PandasDataPartitioner.partition_on_multi_column_values(
+        mixed_type_df,
+        column_names=["nullable_int", "float"],
+        batch_identifiers={"nullable_int": 1, "float": 1.5},
+    )
+
+    assert partitioned_df["id"].tolist() == [-60, -48, -36, -24, -12, 0, 12, 24, 36, 48]
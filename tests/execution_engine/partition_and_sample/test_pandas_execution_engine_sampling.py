@@ -1,4 +1,5 @@
 import datetime
+import hashlib
 import random
 
 import pandas as pd
@@ -124,3 +125,20 @@ def test_sample_using_md5(test_df):
             datetime.date(2020, 1, 29),
         ]
     ).all()
+
+
+@pytest.mark.unit
+def test_sample_using_hash_matches_hashing_every_value():
+    df = pd.DataFrame({"mixed": [1, 1.0, True, "1", None, float("nan"), "a", 2] * 50})
+
+    sampled_df = PandasExecutionEngine().get_batch_data(
+        RuntimeDataBatchSpec(
+            batch_data=df,
+            sampling_method="sample_using_hash",
+            sampling_kwargs={"column_name": "mixed", "hash_digits": 1, "hash_value": "b"},
+        )
+    )
+
+    expected_df = df[df["mixed"].map(lambda x: hashlib.md5(str(x).encode()).hexdigest()[-1] == "b")]
+    pd.testing.assert_frame_equal(sampled_df.dataframe, expected_df)
+    assert not sampled_df.dataframe.empty
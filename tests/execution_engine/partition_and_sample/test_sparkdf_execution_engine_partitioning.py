@@ -632,3 +632,32 @@ def test_get_batch_with_partition_on_hashed_column(test_sparkdf, basic_spark_df_
     ).dataframe
     assert partitioned_df.count() == 8
     assert len(partitioned_df.columns) == 10
+
+
+@pytest.mark.skipif(
+    not pyarrow.pyarrow,
+    reason='Could not import "pyarrow"',
+)
+def test_get_batch_with_partition_on_divided_integer_parquet_pushes_filters_down(
+    tmp_path, test_sparkdf, basic_spark_df_execution_engine
+):
+    path = str(tmp_path / "test.parquet")
+    test_sparkdf.write.parquet(path)
+
+    partitioned_df = basic_spark_df_execution_engine.get_batch_data(
+        PathBatchSpec(
+            path=path,
+            reader_method="parquet",
+            partitioner_method="partition_on_divided_integer",
+            partitioner_kwargs={
+                "column_name": "id",
+                "divisor": 10,
+                "batch_identifiers": {"id": 5},
+            },
+        )
+    ).dataframe
+
+    assert partitioned_df.count() == 10
+    assert sorted(row["id"] for row in partitioned_df.select("id").collect()) == list(range(50, 60))
+    executed_plan = partitioned_df._jdf.queryExecution().executedPlan().toString()
+    assert "GreaterThanOrEqual(id,50)" in executed_plan
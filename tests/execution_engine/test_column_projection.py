@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from functools import partial
+from io import BytesIO
+
+import pandas as pd
+import pytest
+
+from great_expectations.core.batch_spec import PathBatchSpec, RuntimeDataBatchSpec
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.execution_engine.column_projection import (
+    get_projected_columns,
+    project_pandas_reader_options,
+)
+
+CSV_CONTENT: bytes = b"a,b,c,d\n1,x,1.5,0\n2,y,,0\n3,z,3.5,0\n"
+
+
+@pytest.mark.unit
+def test_get_projected_columns_includes_partitioner_and_sampler_columns():
+    batch_spec = PathBatchSpec(
+        path="data.csv",
+        columns=["a", "b"],
+        partitioner_method="partition_on_multi_column_values",
+        partitioner_kwargs={"column_names": ["c", "a"], "batch_identifiers": {}},
+        sampling_method="sample_using_hash",
+        sampling_kwargs={"column_name": "d"},
+    )
+
+    assert get_projected_columns(batch_spec) == ["a", "b", "c", "d"]
+    assert get_projected_columns(PathBatchSpec(path="data.csv")) is None
+
+
+@pytest.mark.unit
+def test_project_pandas_reader_options_csv():
+    reader_options, source_columns = project_pandas_reader_options(
+        reader_fn=pd.read_csv,
+        source=BytesIO(CSV_CONTENT),
+        reader_options={"sep": ","},
+        columns=["c", "a", "not_a_column"],
+    )
+
+    assert reader_options == {"sep": ",", "usecols": ["a", "c"]}
+    assert source_columns == ["a", "b", "c", "d"]
+
+
+@pytest.mark.unit
+def test_project_pandas_reader_options_loads_one_column_if_none_is_referenced():
+    reader_options, source_columns = project_pandas_reader_options(
+        reader_fn=partial(pd.read_csv, sep=","),
+        source=BytesIO(CSV_CONTENT),
+        reader_options={},
+        columns=[],
+    )
+
+    assert reader_options == {"usecols": ["a"]}
+    assert source_columns == ["a", "b", "c", "d"]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "reader_fn, reader_options",
+    [
+        pytest.param(pd.read_csv, {"usecols": ["b"]}, id="columns_selected_by_user"),
+        pytest.param(pd.read_json, {}, id="reader_without_projection"),
+    ],
+)
+def test_project_pandas_reader_options_skipped(reader_fn, reader_options: dict):
+    assert project_pandas_reader_options(
+        reader_fn=reader_fn,
+        source=BytesIO(CSV_CONTENT),
+        reader_options=reader_options,
+        columns=["a"],
+    ) == (reader_options, None)
+
+
+@pytest.mark.filesystem
+def test_pandas_execution_engine_loads_projected_columns(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_bytes(CSV_CONTENT)
+    execution_engine = PandasExecutionEngine()
+
+    batch_data, _ = execution_engine.get_batch_data_and_markers(
+        batch_spec=PathBatchSpec(path=str(path), reader_method="read_csv", columns=["c", "a"])
+    )
+
+    assert list(batch_data.dataframe.columns) == ["a", "c"]
+    assert batch_data.source_columns == ["a", "b", "c", "d"]
+
+
+@pytest.mark.unit
+def test_pandas_execution_engine_does_not_project_runtime_data():
+    execution_engine = PandasExecutionEngine()
+    df = pd.read_csv(BytesIO(CSV_CONTENT))
+
+    batch_data, _ = execution_engine.get_batch_data_and_markers(
+        batch_spec=RuntimeDataBatchSpec(batch_data=df, columns=["a"])
+    )
+
+    assert list(batch_data.dataframe.columns) == ["a", "b", "c", "d"]
+    assert batch_data.source_columns is None
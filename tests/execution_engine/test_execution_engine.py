@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Dict, Tuple
+import time
+from typing import Dict, List, Tuple
 
 import pandas as pd
 import pytest
@@ -12,6 +13,7 @@ from great_expectations.core.metric_function_types import (
     SummarizationMetricNameSuffixes,
 )
 from great_expectations.execution_engine import ExecutionEngine, PandasExecutionEngine
+from great_expectations.execution_engine.metric_cache import DEFAULT_METRIC_CACHE_MAX_BYTES
 from great_expectations.expectations.row_conditions import (
     RowCondition,
     RowConditionParserType,
@@ -315,3 +317,223 @@ def test_resolve_metrics_with_incomplete_metric_input():
     # Ensuring that incomplete metrics given raises a GreatExpectationsError
     with pytest.raises(gx_exceptions.GreatExpectationsError):
         engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics={})
+
+
+@pytest.mark.unit
+def test_resolve_metrics_concurrently_matches_sequential_resolution():
+    df = pd.DataFrame({f"col_{idx}": [1.0, 2.0, 3.0, None] for idx in range(8)})
+
+    results_by_max_workers: Dict[int, Dict[Tuple[str, str, str], MetricValue]] = {}
+    for max_workers in (1, 4):
+        engine = PandasExecutionEngine(
+            batch_data_dict={"my_id": df}, metric_computation_max_workers=max_workers
+        )
+        table_columns_metric, metrics = get_table_columns_metric(execution_engine=engine)
+
+        desired_metrics = []
+        for column in df.columns:
+            for metric_name in ("column.mean", "column.standard_deviation", "column.max"):
+                metric = MetricConfiguration(
+                    metric_name=metric_name,
+                    metric_domain_kwargs={"column": column},
+                    metric_value_kwargs=None,
+                )
+                metric.metric_dependencies = {"table.columns": table_columns_metric}
+                desired_metrics.append(metric)
+
+        results_by_max_workers[max_workers] = engine.resolve_metrics(
+            metrics_to_resolve=desired_metrics, metrics=metrics
+        )
+
+    assert len(results_by_max_workers[4]) == 24
+    assert results_by_max_workers[4] == results_by_max_workers[1]
+
+
+@pytest.mark.unit
+def test_resolve_metrics_concurrently_attributes_error_to_failing_metric():
+    df = pd.DataFrame({"a": [1, 2, 3, None]})
+    engine = PandasExecutionEngine(batch_data_dict={"my_id": df}, metric_computation_max_workers=4)
+    table_columns_metric, metrics = get_table_columns_metric(execution_engine=engine)
+
+    good_metric = MetricConfiguration(
+        metric_name="column.mean",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    bad_metric = MetricConfiguration(
+        metric_name="column.mean",
+        metric_domain_kwargs={"column": "not_in_table"},
+        metric_value_kwargs=None,
+    )
+    for metric in (good_metric, bad_metric):
+        metric.metric_dependencies = {"table.columns": table_columns_metric}
+
+    with pytest.raises(gx_exceptions.MetricResolutionError) as e:
+        engine.resolve_metrics(metrics_to_resolve=(good_metric, bad_metric), metrics=metrics)
+
+    assert [metric.id for metric in e.value.failed_metrics] == [bad_metric.id]
+
+
+@pytest.mark.unit
+def test_resolve_metrics_concurrently_reports_timed_out_metrics(mocker):
+    df = pd.DataFrame({"a": [1, 2, 3, None]})
+    engine = PandasExecutionEngine(
+        batch_data_dict={"my_id": df},
+        metric_computation_max_workers=2,
+        metric_computation_timeout=0.01,
+    )
+    table_columns_metric, metrics = get_table_columns_metric(execution_engine=engine)
+
+    metric = MetricConfiguration(
+        metric_name="column.mean",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    metric.metric_dependencies = {"table.columns": table_columns_metric}
+
+    finished_computations: List[bool] = []
+
+    def _slow_computation(**kwargs) -> dict:
+        time.sleep(0.5)
+        finished_computations.append(True)
+        return {}
+
+    mocker.patch.object(
+        engine,
+        "_resolve_direct_metric_computation_configuration",
+        side_effect=_slow_computation,
+    )
+    with pytest.raises(gx_exceptions.MetricResolutionError) as e:
+        engine.resolve_metrics(metrics_to_resolve=(metric,), metrics=metrics)
+
+    assert "did not complete within 0.01 seconds" in str(e.value)
+    assert [failed_metric.id for failed_metric in e.value.failed_metrics] == [metric.id]
+    # Computation, which was already underway, is not left running against engine after error.
+    assert len(finished_computations) == 1
+
+
+@pytest.mark.unit
+def test_resolve_metrics_concurrently_reuses_thread_pool_of_engine():
+    df = pd.DataFrame({"a": [1, 2, 3, None], "b": [4, 5, 6, None]})
+    engine = PandasExecutionEngine(batch_data_dict={"my_id": df}, metric_computation_max_workers=2)
+    table_columns_metric, metrics = get_table_columns_metric(execution_engine=engine)
+
+    executors = []
+    for metric_name in ("column.mean", "column.max"):
+        desired_metrics = []
+        for column in df.columns:
+            metric = MetricConfiguration(
+                metric_name=metric_name,
+                metric_domain_kwargs={"column": column},
+                metric_value_kwargs=None,
+            )
+            metric.metric_dependencies = {"table.columns": table_columns_metric}
+            desired_metrics.append(metric)
+
+        engine.resolve_metrics(metrics_to_resolve=desired_metrics, metrics=metrics)
+        executors.append(engine._metric_computation_executor)
+
+    assert executors[0] is not None
+    assert executors[0] is executors[1]
+
+
+@pytest.mark.unit
+def test_metric_computation_max_workers_must_be_positive(test_execution_engine):
+    with pytest.raises(ValueError):
+        type(test_execution_engine)(metric_computation_max_workers=0)
+
+    assert "metric_computation_max_workers" not in test_execution_engine.config
+    assert (
+        type(test_execution_engine)(metric_computation_max_workers=3).config[
+            "metric_computation_max_workers"
+        ]
+        == 3
+    )
+
+
+@pytest.mark.unit
+def test_resolve_metrics_uses_metric_cache_for_missing_dependencies():
+    df = pd.DataFrame({"a": [1.0, 2.0, 3.0]})
+    engine = PandasExecutionEngine(batch_data_dict={"my_id": df})
+    table_columns_metric, metrics = get_table_columns_metric(execution_engine=engine)
+
+    mean = MetricConfiguration(
+        metric_name="column.mean",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    mean.metric_dependencies = {"table.columns": table_columns_metric}
+    engine.resolve_metrics(metrics_to_resolve=(mean,), metrics=metrics)
+    assert engine.metric_cache.get(key=mean.id) == 2.0
+
+    # Dependency is absent from "metrics", so it must be served from metric cache.
+    engine.metric_cache.reset_statistics()
+    mean_again = MetricConfiguration(
+        metric_name="column.mean",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    mean_again.metric_dependencies = {"table.columns": table_columns_metric}
+    results = engine.resolve_metrics(metrics_to_resolve=(mean_again,), metrics={})
+    assert results[mean_again.id] == 2.0
+    assert engine.metric_cache_statistics.hits == 1
+
+
+@pytest.mark.unit
+def test_metric_cache_is_scoped_to_batch():
+    engine = PandasExecutionEngine(
+        batch_data_dict={
+            "batch_1": pd.DataFrame({"a": [1, 2]}),
+            "batch_2": pd.DataFrame({"a": [1, 2, 3]}),
+        },
+        metric_cache_max_entries=10,
+    )
+    metrics_by_batch_id = {}
+    for batch_id in ("batch_1", "batch_2"):
+        metric = MetricConfiguration(
+            metric_name="table.row_count",
+            metric_domain_kwargs={"batch_id": batch_id},
+            metric_value_kwargs=None,
+        )
+        metrics_by_batch_id[batch_id] = metric
+        engine.resolve_metrics(metrics_to_resolve=(metric,))
+
+    assert engine.config["metric_cache_max_entries"] == 10
+    assert len(engine.metric_cache) == 2
+
+    # Reloading same data keeps metrics; loading different data under same "batch_id" drops them.
+    batch_2_data = engine.batch_manager.batch_data_cache["batch_2"]
+    engine.load_batch_data(batch_id="batch_2", batch_data=batch_2_data)
+    assert metrics_by_batch_id["batch_2"].id in engine.metric_cache
+    engine.load_batch_data(batch_id="batch_1", batch_data=pd.DataFrame({"a": [1, 2, 3, 4]}))
+    assert metrics_by_batch_id["batch_1"].id not in engine.metric_cache
+
+    engine.unload_batch_data(batch_id="batch_2")
+    assert "batch_2" not in engine.batch_manager.loaded_batch_ids
+    assert len(engine.metric_cache) == 0
+    assert engine.metric_cache_statistics.invalidations == 2
+
+
+@pytest.mark.unit
+def test_metric_cache_is_bounded_by_default():
+    engine = PandasExecutionEngine()
+
+    assert engine.metric_cache.max_bytes == DEFAULT_METRIC_CACHE_MAX_BYTES
+    assert "metric_cache_max_bytes" not in engine.config
+    assert PandasExecutionEngine(metric_cache_max_bytes=1024).metric_cache.max_bytes == 1024
+
+
+@pytest.mark.unit
+def test_metric_cache_disabled_when_caching_is_off():
+    engine = PandasExecutionEngine(
+        batch_data_dict={"my_id": pd.DataFrame({"a": [1, 2]})}, caching=False
+    )
+    metric = MetricConfiguration(
+        metric_name="table.row_count",
+        metric_domain_kwargs={},
+        metric_value_kwargs=None,
+    )
+    engine.resolve_metrics(metrics_to_resolve=(metric,))
+
+    assert metric.id not in engine.metric_cache
+    assert len(engine.metric_cache) == 0
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.execution_engine.metric_cache import (
+    MISSING,
+    LRUMetricCache,
+    NoOpMetricCache,
+    estimate_size_in_bytes,
+)
+
+
+def _key(name: str) -> tuple:
+    return (name, tuple(), tuple())
+
+
+@pytest.mark.unit
+def test_lru_metric_cache_records_hits_and_misses():
+    cache = LRUMetricCache()
+    cache.put(key=_key("a"), value=None, batch_id="batch_1")
+
+    assert cache.get(key=_key("a")) is None
+    assert cache.get(key=_key("b")) is MISSING
+
+    statistics = cache.statistics
+    assert (statistics.hits, statistics.misses, statistics.entries) == (1, 1, 1)
+    assert statistics.hit_rate == 0.5
+
+    cache.reset_statistics()
+    assert cache.statistics.hits == 0
+    assert cache.statistics.entries == 1
+
+
+@pytest.mark.unit
+def test_lru_metric_cache_evicts_least_recently_used_entries():
+    cache = LRUMetricCache(max_entries=2)
+    cache.put(key=_key("a"), value=1)
+    cache.put(key=_key("b"), value=2)
+    cache.get(key=_key("a"))
+    cache.put(key=_key("c"), value=3)
+
+    assert _key("a") in cache
+    assert _key("b") not in cache
+    assert _key("c") in cache
+    assert cache.statistics.evictions == 1
+
+
+@pytest.mark.unit
+def test_lru_metric_cache_enforces_byte_budget():
+    large_df = pd.DataFrame({"a": np.arange(1_000)})
+    budget = estimate_size_in_bytes(large_df) + 1_000
+    cache = LRUMetricCache(max_bytes=budget)
+
+    cache.put(key=_key("small"), value=1)
+    cache.put(key=_key("large"), value=large_df)
+    cache.put(key=_key("other_large"), value=large_df.copy())
+
+    assert _key("small") not in cache
+    assert _key("large") not in cache
+    assert _key("other_large") in cache
+    assert cache.statistics.size_in_bytes <= budget
+
+    # Value exceeding the whole budget is not cached (and does not flush other values).
+    cache.put(key=_key("too_large"), value=pd.concat([large_df] * 3))
+    assert _key("too_large") not in cache
+    assert _key("other_large") in cache
+
+
+@pytest.mark.unit
+def test_lru_metric_cache_invalidates_batch():
+    cache = LRUMetricCache()
+    cache.update({_key("a"): 1, _key("b"): 2}, batch_id="batch_1")
+    cache.put(key=_key("c"), value=3, batch_id="batch_2")
+
+    assert cache.invalidate_batch(batch_id="batch_1") == 2
+    assert cache.invalidate_batch(batch_id="batch_1") == 0
+    assert len(cache) == 1
+    assert cache.statistics.invalidations == 2
+
+    # Re-putting existing key under different Batch moves it to that Batch.
+    cache.put(key=_key("c"), value=3, batch_id="batch_3")
+    assert cache.invalidate_batch(batch_id="batch_2") == 0
+    assert cache.invalidate_batch(batch_id="batch_3") == 1
+
+
+@pytest.mark.unit
+def test_no_op_metric_cache_stores_nothing():
+    cache = NoOpMetricCache()
+    cache.put(key=_key("a"), value=1, batch_id="batch_1")
+
+    assert _key("a") not in cache
+    assert cache.get(key=_key("a")) is MISSING
+    assert cache.statistics.misses == 1
+    assert len(cache) == 0
@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import datetime
+import json
+import pathlib
+import pickle
+import sqlite3
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.core.batch_spec import RuntimeDataBatchSpec, SqlAlchemyDatasourceBatchSpec
+from great_expectations.core.metric_function_types import MetricPartialFunctionTypeSuffixes
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.execution_engine.persistent_metric_cache import (
+    SqlitePersistentMetricCache,
+    fingerprint_batch_spec,
+)
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from tests.expectations.test_util import get_table_columns_metric
+
+
+def _key(name: str) -> tuple:
+    return (name, "domain_id", tuple())
+
+
+@pytest.fixture
+def cache(tmp_path) -> SqlitePersistentMetricCache:
+    return SqlitePersistentMetricCache(path=tmp_path / "metrics" / "cache.db")
+
+
+@pytest.mark.unit
+def test_sqlite_persistent_metric_cache_round_trip(cache: SqlitePersistentMetricCache):
+    cache.put_many(
+        fingerprint="fp_1",
+        metrics={_key("a"): None, _key("b"): pd.DataFrame({"x": [1, 2]})},
+    )
+
+    metrics = cache.get_many(fingerprint="fp_1", metric_ids=[_key("a"), _key("b"), _key("c")])
+    assert set(metrics.keys()) == {_key("a"), _key("b")}
+    assert metrics[_key("a")] is None
+    assert metrics[_key("b")].equals(pd.DataFrame({"x": [1, 2]}))
+
+    # Same metric of different Batch data is not shared.
+    assert cache.get_many(fingerprint="fp_2", metric_ids=[_key("a")]) == {}
+
+    # Values, which cannot be serialized, are skipped.
+    cache.put_many(fingerprint="fp_1", metrics={_key("lock"): threading.Lock()})
+    assert cache.get_many(fingerprint="fp_1", metric_ids=[_key("lock")]) == {}
+
+    # New cache object over same file sees stored metrics.
+    assert len(SqlitePersistentMetricCache(path=cache.path)) == 2
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "value",
+    [
+        pytest.param([1, 2.5, "a", True, None], id="list"),
+        pytest.param((1, ("a", None)), id="tuple"),
+        pytest.param({"a", "b"}, id="set"),
+        pytest.param({("a", 1): {"b": [1, 2]}}, id="dict"),
+        pytest.param(np.int64(3), id="numpy_int"),
+        pytest.param(np.float32(1.5), id="numpy_float"),
+        pytest.param(
+            datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc), id="datetime"
+        ),
+        pytest.param(pd.Timestamp("2024-01-02", tz="UTC"), id="timestamp"),
+    ],
+)
+def test_sqlite_persistent_metric_cache_restores_types(cache: SqlitePersistentMetricCache, value):
+    cache.put_many(fingerprint="fp_1", metrics={_key("a"): value})
+
+    restored_value = cache.get_many(fingerprint="fp_1", metric_ids=[_key("a")])[_key("a")]
+    assert type(restored_value) is type(value)
+    assert restored_value == value
+
+
+@pytest.mark.unit
+def test_sqlite_persistent_metric_cache_restores_numpy_and_pandas_values(
+    cache: SqlitePersistentMetricCache,
+):
+    array = np.array([[1.5, np.nan], [2.0, 3.0]])
+    series = pd.Series([3, 1], index=pd.Index(["a", "b"], name="value"), name="count")
+    cache.put_many(fingerprint="fp_1", metrics={_key("array"): array, _key("series"): series})
+
+    metrics = cache.get_many(fingerprint="fp_1", metric_ids=[_key("array"), _key("series")])
+    assert metrics[_key("array")].dtype == array.dtype
+    np.testing.assert_array_equal(metrics[_key("array")], array)
+    pd.testing.assert_series_equal(metrics[_key("series")], series)
+
+
+@pytest.mark.unit
+def test_sqlite_persistent_metric_cache_stores_values_as_json(
+    cache: SqlitePersistentMetricCache, tmp_path: pathlib.Path
+):
+    cache.put_many(fingerprint="fp_1", metrics={_key("a"): np.int64(3)})
+    with sqlite3.connect(str(cache.path)) as connection:
+        (value,) = connection.execute("SELECT value FROM gx_metric_cache").fetchone()
+    assert json.loads(value)["value"] == 3
+
+    # Shared cache file, into which arbitrary bytes were written, does not execute them when read.
+    marker_path = tmp_path / "payload_executed"
+
+    class _Payload:
+        def __reduce__(self):
+            return pathlib.Path.touch, (marker_path,)
+
+    with sqlite3.connect(str(cache.path)) as connection:
+        connection.execute("UPDATE gx_metric_cache SET value = ?", (pickle.dumps(_Payload()),))
+    assert cache.get_many(fingerprint="fp_1", metric_ids=[_key("a")]) == {}
+    assert not marker_path.exists()
+
+
+@pytest.mark.unit
+def test_sqlite_persistent_metric_cache_expires_entries(tmp_path, mocker):
+    time_mock = mocker.patch(
+        "great_expectations.execution_engine.persistent_metric_cache.time.time",
+        return_value=1_000.0,
+    )
+    cache = SqlitePersistentMetricCache(path=tmp_path / "cache.db", ttl_seconds=60)
+    cache.put_many(fingerprint="fp_1", metrics={_key("a"): 1})
+
+    time_mock.return_value = 1_059.0
+    assert cache.get_many(fingerprint="fp_1", metric_ids=[_key("a")]) == {_key("a"): 1}
+
+    time_mock.return_value = 1_061.0
+    assert cache.get_many(fingerprint="fp_1", metric_ids=[_key("a")]) == {}
+    assert len(cache) == 0
+
+
+@pytest.mark.unit
+def test_sqlite_persistent_metric_cache_enforces_size_limits(tmp_path, mocker):
+    time_mock = mocker.patch(
+        "great_expectations.execution_engine.persistent_metric_cache.time.time",
+        return_value=1_000.0,
+    )
+    cache = SqlitePersistentMetricCache(path=tmp_path / "cache.db", max_entries=2)
+    for idx, name in enumerate(("a", "b", "c")):
+        time_mock.return_value = 1_000.0 + idx
+        cache.put_many(fingerprint="fp_1", metrics={_key(name): idx})
+
+    assert set(
+        cache.get_many(fingerprint="fp_1", metric_ids=[_key("a"), _key("b"), _key("c")])
+    ) == {
+        _key("b"),
+        _key("c"),
+    }
+
+    cache = SqlitePersistentMetricCache(path=tmp_path / "bytes.db", max_bytes=250)
+    for idx, name in enumerate(("a", "b", "c")):
+        time_mock.return_value = 2_000.0 + idx
+        cache.put_many(fingerprint="fp_1", metrics={_key(name): "x" * 100})
+
+    assert set(
+        cache.get_many(fingerprint="fp_1", metric_ids=[_key("a"), _key("b"), _key("c")])
+    ) == {
+        _key("b"),
+        _key("c"),
+    }
+
+
+@pytest.mark.unit
+def test_sqlite_persistent_metric_cache_invalidate(cache: SqlitePersistentMetricCache):
+    cache.put_many(fingerprint="fp_1", metrics={_key("a"): 1, _key("b"): 2})
+    cache.put_many(fingerprint="fp_2", metrics={_key("a"): 3})
+
+    assert cache.invalidate(fingerprint="fp_1") == 2
+    assert len(cache) == 1
+    assert cache.invalidate() == 1
+    assert len(cache) == 0
+
+
+@pytest.mark.unit
+def test_fingerprint_batch_spec():
+    batch_spec = SqlAlchemyDatasourceBatchSpec(table_name="my_table", schema_name="public")
+
+    assert fingerprint_batch_spec(batch_spec, url="sqlite://a") == fingerprint_batch_spec(
+        SqlAlchemyDatasourceBatchSpec(schema_name="public", table_name="my_table"), url="sqlite://a"
+    )
+    assert fingerprint_batch_spec(batch_spec, url="sqlite://a") != fingerprint_batch_spec(
+        batch_spec, url="sqlite://b"
+    )
+    assert fingerprint_batch_spec(RuntimeDataBatchSpec(batch_data=pd.DataFrame())) is None
+
+
+@pytest.mark.unit
+def test_execution_engine_reuses_persisted_metrics(tmp_path, mocker):
+    df = pd.DataFrame({"a": [1.0, 2.0, 3.0]})
+    persistent_metric_cache = {"path": str(tmp_path / "cache.db")}
+
+    row_count = MetricConfiguration(
+        metric_name="table.row_count",
+        metric_domain_kwargs={},
+        metric_value_kwargs=None,
+    )
+    condition = MetricConfiguration(
+        metric_name=f"column_values.nonnull.{MetricPartialFunctionTypeSuffixes.CONDITION.value}",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+
+    engine = PandasExecutionEngine(
+        batch_data_dict={"my_id": df}, persistent_metric_cache=persistent_metric_cache
+    )
+    assert engine.config["persistent_metric_cache"]["path"] == str(tmp_path / "cache.db")
+    table_columns_metric, metrics = get_table_columns_metric(execution_engine=engine)
+    condition.metric_dependencies = {"table.columns": table_columns_metric}
+    engine.resolve_metrics(metrics_to_resolve=(row_count, condition), metrics=metrics)
+
+    # Only final metric values are persisted (condition is deferred computation of this engine).
+    fingerprint = engine._get_batch_fingerprint(batch_id="my_id")
+    assert set(
+        engine.persistent_metric_cache.get_many(
+            fingerprint=fingerprint, metric_ids=[row_count.id, condition.id]
+        )
+    ) == {row_count.id}
+    num_persisted_metrics = len(engine.persistent_metric_cache)
+
+    # Different engine over equal data does not recompute persisted metric.
+    engine = PandasExecutionEngine(
+        batch_data_dict={"other_id": df.copy()}, persistent_metric_cache=persistent_metric_cache
+    )
+    spy = mocker.spy(engine, "_build_direct_and_bundled_metric_computation_configurations")
+    results = engine.resolve_metrics(metrics_to_resolve=(row_count,))
+    assert results == {row_count.id: 3}
+    assert spy.call_args.kwargs["metrics_to_resolve"] == []
+
+    # Different data is not served from persisted metrics.
+    engine = PandasExecutionEngine(
+        batch_data_dict={"my_id": pd.DataFrame({"a": [1.0]})},
+        persistent_metric_cache=persistent_metric_cache,
+    )
+    assert engine.resolve_metrics(metrics_to_resolve=(row_count,)) == {row_count.id: 1}
+    assert len(engine.persistent_metric_cache) == num_persisted_metrics + 1
+
+    assert engine.invalidate_persisted_metrics(batch_id="my_id") == 1
+    assert engine.invalidate_persisted_metrics() == num_persisted_metrics
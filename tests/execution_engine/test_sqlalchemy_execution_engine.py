@@ -1,6 +1,6 @@
 import logging
 import os
-from typing import Dict, Tuple, cast
+from typing import Dict, List, Tuple, cast
 
 import pandas as pd
 import pytest
@@ -252,6 +252,28 @@ def test_instantiation_error_states(sa, test_db_connection_string):
 
 
 # Testing batching of aggregate metrics
+@pytest.mark.sqlite
+def test_instantiation_with_concurrent_metric_computation_config(sa):
+    db_file = file_relative_path(
+        __file__,
+        os.path.join(  # noqa: PTH118
+            "..", "test_sets", "test_cases_for_sql_data_connector.db"
+        ),
+    )
+    my_execution_engine = SqlAlchemyExecutionEngine(
+        url="sqlite:///" + db_file,
+        metric_computation_max_workers=4,
+        metric_computation_timeout=60,
+        max_concurrent_connections=2,
+    )
+    assert my_execution_engine.config["metric_computation_max_workers"] == 4
+    assert my_execution_engine.config["metric_computation_timeout"] == 60
+    assert my_execution_engine.config["max_concurrent_connections"] == 2
+
+    # sqlite keeps temp tables in single persisted connection, which cannot serve concurrent queries.  # noqa: E501
+    assert my_execution_engine._supports_concurrent_metric_computation is False
+
+
 @pytest.mark.sqlite
 def test_sa_batch_aggregate_metrics(caplog, sa):
     import datetime
@@ -1090,6 +1112,181 @@ def test_sa_batch_unexpected_condition_temp_table(caplog, sa):
     validate_tmp_tables(execution_engine=execution_engine)
 
 
+@pytest.mark.sqlite
+def test_sa_unexpected_count_scratch_table_is_reused_without_reflection(sa, mocker):
+    execution_engine = build_sa_execution_engine(
+        pd.DataFrame({"a": [1, 2, 1, 2, 3, 3], "b": [4, 4, 4, 4, 4, 4]}), sa
+    )
+
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    table_columns_metric: MetricConfiguration
+    results: Dict[Tuple[str, str, str], MetricValue]
+
+    table_columns_metric, results = get_table_columns_metric(execution_engine=execution_engine)
+    metrics.update(results)
+
+    desired_metrics: List[MetricConfiguration] = []
+    for column in ["a", "b"]:
+        condition_metric = MetricConfiguration(
+            metric_name=f"column_values.unique.{MetricPartialFunctionTypeSuffixes.CONDITION.value}",
+            metric_domain_kwargs={"column": column},
+            metric_value_kwargs=None,
+        )
+        condition_metric.metric_dependencies = {
+            "table.columns": table_columns_metric,
+        }
+        metrics.update(
+            execution_engine.resolve_metrics(
+                metrics_to_resolve=(condition_metric,), metrics=metrics
+            )
+        )
+
+        desired_metric = MetricConfiguration(
+            metric_name=f"column_values.unique.{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}",
+            metric_domain_kwargs={"column": column},
+            metric_value_kwargs=None,
+        )
+        desired_metric.metric_dependencies = {
+            "unexpected_condition": condition_metric,
+        }
+        desired_metrics.append(desired_metric)
+
+    statements: List[str] = []
+
+    def _record_statement(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    sa.event.listen(execution_engine.engine, "before_cursor_execute", _record_statement)
+    # Scratch tables are only used by dialects (e.g., MSSQL), which cannot count window function conditions directly.  # noqa: E501
+    mocker.patch.object(
+        SqlAlchemyExecutionEngine,
+        "dialect_name",
+        new_callable=mocker.PropertyMock,
+        return_value=GXSqlDialect.MSSQL,
+    )
+
+    for desired_metric in desired_metrics:
+        results = execution_engine.resolve_metrics(
+            metrics_to_resolve=(desired_metric,), metrics=metrics
+        )
+        assert results[desired_metric.id] == 6
+
+    reflection_statements: List[str] = [
+        statement
+        for statement in statements
+        if "sqlite_master" in statement or statement.lstrip().upper().startswith("PRAGMA")
+    ]
+    assert reflection_statements == []
+    assert sum(statement.lstrip().upper().startswith("CREATE") for statement in statements) == 1
+    assert execution_engine.scratch_table_manager.num_scratch_tables == 1
+
+    execution_engine.release_validation_resources()
+
+    assert execution_engine.scratch_table_manager.num_scratch_tables == 0
+    assert not [
+        table_name
+        for table_name in sa.inspect(execution_engine.engine).get_table_names()
+        if "ge_temp_" in table_name
+    ]
+
+
+@pytest.mark.sqlite
+def test_sa_value_set_table_is_shared_and_dropped(sa):
+    execution_engine = build_sa_execution_engine(
+        pd.DataFrame({"a": ["x", "y", "z"], "b": ["y", "y", "w"]}), sa
+    )
+    manager = execution_engine.scratch_table_manager
+
+    with execution_engine.get_connection() as connection:
+        table = manager.get_value_set_table(
+            connection=connection, rows=[("x",), ("y",)], column_types=[sa.String(length=1)]
+        )
+        # Same values (and types) are loaded once.
+        assert (
+            manager.get_value_set_table(
+                connection=connection, rows=[("x",), ("y",)], column_types=[sa.String(length=1)]
+            )
+            is table
+        )
+        assert (
+            manager.get_value_set_table(
+                connection=connection, rows=[("x",), ("z",)], column_types=[sa.String(length=1)]
+            )
+            is not table
+        )
+        assert sorted(
+            value for (value,) in connection.execute(sa.select(table.c.ge_value_0)).fetchall()
+        ) == ["x", "y"]
+
+    assert manager.num_value_set_tables == 2
+    assert manager.num_scratch_tables == 0
+
+    execution_engine.release_validation_resources()
+
+    assert manager.num_value_set_tables == 0
+    assert not [
+        table_name
+        for table_name in sa.inspect(execution_engine.engine).get_table_names()
+        if "ge_temp_" in table_name
+    ]
+
+
+@pytest.mark.sqlite
+def test_sa_value_set_table_is_temporary_on_persisted_connection(sa):
+    execution_engine = build_sa_execution_engine(pd.DataFrame({"a": ["x", "y", "z"]}), sa)
+
+    table = execution_engine.get_value_set_table(
+        rows=[("x",), ("y",)], column_types=[sa.String(length=1)]
+    )
+
+    assert table is not None
+    with execution_engine.get_connection() as connection:
+        inspector = sa.inspect(connection)
+        assert table.name in inspector.get_temp_table_names()
+        assert table.name not in inspector.get_table_names()
+
+    execution_engine.release_validation_resources()
+
+    assert execution_engine.scratch_table_manager.num_value_set_tables == 0
+    with execution_engine.get_connection() as connection:
+        assert table.name not in sa.inspect(connection).get_temp_table_names()
+
+
+@pytest.mark.sqlite
+def test_sa_value_set_table_is_dropped_if_loading_fails(sa, mocker):
+    execution_engine = build_sa_execution_engine(pd.DataFrame({"a": ["x", "y", "z"]}), sa)
+    manager = execution_engine.scratch_table_manager
+
+    def _create_table_and_fail_to_load(connection, table, rows) -> None:
+        # Tables created by non-transactional DDL (e.g., of MySQL) outlive failed load.
+        with execution_engine.engine.connect() as other_connection:
+            table.create(bind=other_connection, checkfirst=False)
+            if hasattr(other_connection, "commit"):
+                other_connection.commit()
+
+        raise sa.exc.OperationalError("INSERT", {}, Exception("load failed"))
+
+    mocker.patch.object(
+        manager, "_create_and_load_value_set_table", side_effect=_create_table_and_fail_to_load
+    )
+
+    with execution_engine.get_connection() as connection:
+        assert (
+            manager.get_value_set_table(
+                connection=connection, rows=[("x",), ("y",)], column_types=[sa.String(length=1)]
+            )
+            is None
+        )
+
+    assert manager.num_value_set_tables == 0
+    assert not [
+        table_name
+        for table_name in sa.inspect(execution_engine.engine).get_table_names()
+        if "ge_temp_" in table_name
+    ]
+
+
 @pytest.fixture
 def pd_dataframe() -> pd.DataFrame:
     return pd.DataFrame({"a": [1, 2], "b": [4, 4]})
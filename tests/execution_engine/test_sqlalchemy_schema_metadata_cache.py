@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+from typing import List
+
+import pandas as pd
+import pytest
+
+from great_expectations.execution_engine import (
+    SqlAlchemyExecutionEngine,
+    sqlalchemy_schema_metadata_cache,
+)
+from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
+from great_expectations.execution_engine.sqlalchemy_schema_metadata_cache import (
+    SqlAlchemySchemaMetadataCache,
+)
+from great_expectations.expectations.metrics import util as metrics_util
+from great_expectations.expectations.metrics.util import get_sqlalchemy_column_metadata
+from great_expectations.self_check.util import build_sa_execution_engine
+
+
+@pytest.fixture
+def execution_engine(sa) -> SqlAlchemyExecutionEngine:
+    execution_engine = build_sa_execution_engine(pd.DataFrame({"a": [1], "b": ["x"]}), sa)
+    execution_engine._schema_metadata_cache = SqlAlchemySchemaMetadataCache()
+    return execution_engine
+
+
+def _record_statements(sa, execution_engine: SqlAlchemyExecutionEngine) -> List[str]:
+    statements: List[str] = []
+
+    def _record_statement(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    sa.event.listen(execution_engine.engine, "before_cursor_execute", _record_statement)
+    return statements
+
+
+@pytest.mark.sqlite
+def test_schema_metadata_cache_serves_reflected_columns_from_memory(
+    mocker, execution_engine: SqlAlchemyExecutionEngine
+):
+    reflect = mocker.spy(metrics_util, "_reflect_sqlalchemy_column_metadata")
+
+    columns = get_sqlalchemy_column_metadata(execution_engine, "test")
+    assert [column["name"] for column in columns] == ["a", "b"]
+    assert reflect.call_count == 1
+
+    # Cached columns are copies, so that callers cannot alter cache.
+    columns[0]["name"] = "altered"
+    assert [
+        column["name"] for column in get_sqlalchemy_column_metadata(execution_engine, "test")
+    ] == ["a", "b"]
+    assert reflect.call_count == 1
+    assert execution_engine.schema_metadata_cache.num_cached_tables == 1
+
+    assert execution_engine.schema_metadata_cache.refresh() == 1
+    get_sqlalchemy_column_metadata(execution_engine, "test")
+    assert reflect.call_count == 2
+
+
+@pytest.mark.sqlite
+def test_schema_metadata_cache_reflects_expired_tables(
+    mocker, execution_engine: SqlAlchemyExecutionEngine
+):
+    execution_engine._schema_metadata_cache = SqlAlchemySchemaMetadataCache(ttl_seconds=0)
+    reflect = mocker.spy(metrics_util, "_reflect_sqlalchemy_column_metadata")
+
+    get_sqlalchemy_column_metadata(execution_engine, "test")
+    get_sqlalchemy_column_metadata(execution_engine, "test")
+
+    assert reflect.call_count == 2
+
+
+@pytest.mark.sqlite
+def test_schema_metadata_cache_evicts_expired_tables(
+    sa, mocker, execution_engine: SqlAlchemyExecutionEngine
+):
+    monotonic = mocker.patch(
+        "great_expectations.execution_engine.sqlalchemy_schema_metadata_cache.time.monotonic",
+        return_value=1000.0,
+    )
+    cache = SqlAlchemySchemaMetadataCache(ttl_seconds=60)
+    reflect = mocker.Mock(return_value=[{"name": "a", "type": sa.INTEGER()}])
+    for table_name in ("orders", "customers"):
+        cache.get_columns(
+            execution_engine=execution_engine,
+            table_name=table_name,
+            schema_name=None,
+            reflect=reflect,
+        )
+    assert cache.num_cached_tables == 2
+
+    monotonic.return_value = 1060.0
+    cache.get_columns(
+        execution_engine=execution_engine, table_name="orders", schema_name=None, reflect=reflect
+    )
+
+    # Entries of tables, which are not requested again, do not outlive their TTL.
+    assert cache.num_cached_tables == 1
+    assert reflect.call_count == 3
+
+
+@pytest.mark.sqlite
+def test_schema_metadata_cache_reflects_tables_without_holding_lock(
+    sa, execution_engine: SqlAlchemyExecutionEngine
+):
+    cache = SqlAlchemySchemaMetadataCache()
+
+    def _reflect() -> List[dict]:
+        # Other tables are served while this one is reflected.
+        assert not cache._lock.locked()
+        return [{"name": "a", "type": sa.INTEGER()}]
+
+    columns = cache.get_columns(
+        execution_engine=execution_engine, table_name="orders", schema_name=None, reflect=_reflect
+    )
+
+    assert [column["name"] for column in columns] == ["a"]
+    assert cache.num_cached_tables == 1
+
+
+@pytest.mark.sqlite
+def test_schema_metadata_cache_loads_information_schema_columns_in_bulk(
+    sa, mocker, execution_engine: SqlAlchemyExecutionEngine
+):
+    with execution_engine.get_connection() as connection:
+        # SQLite has no "information_schema"; attached database of same name stands in for it.
+        connection.execute(sa.text("ATTACH DATABASE ':memory:' AS information_schema"))
+        connection.execute(
+            sa.text(
+                """CREATE TABLE information_schema.columns (
+                    table_schema TEXT, table_name TEXT, column_name TEXT,
+                    ordinal_position INTEGER, data_type TEXT, is_nullable TEXT,
+                    column_default TEXT, character_maximum_length INTEGER,
+                    numeric_precision INTEGER, numeric_scale INTEGER
+                )"""
+            )
+        )
+        connection.execute(
+            sa.text(
+                """INSERT INTO information_schema.columns VALUES
+                    ('main', 'orders', 'id', 1, 'INTEGER', 'NO', NULL, NULL, 32, 0),
+                    ('main', 'orders', 'status', 2, 'VARCHAR', 'YES', NULL, 16, NULL, NULL),
+                    ('main', 'orders', 'amount', 3, 'NUMERIC', 'YES', NULL, NULL, 10, 2),
+                    ('main', 'events', 'payload', 1, 'UNKNOWN', 'YES', NULL, NULL, NULL, NULL),
+                    ('main', 'customers', 'name', 1, 'TEXT', 'YES', NULL, NULL, NULL, NULL)"""
+            )
+        )
+
+    mocker.patch.object(
+        SqlAlchemyExecutionEngine,
+        "dialect_name",
+        new_callable=mocker.PropertyMock,
+        return_value=GXSqlDialect.POSTGRESQL,
+    )
+    statements: List[str] = _record_statements(sa, execution_engine)
+    reflect = mocker.Mock(return_value=[{"name": "a", "type": sa.INTEGER()}])
+    cache = execution_engine.schema_metadata_cache
+
+    orders_columns = cache.get_columns(
+        execution_engine=execution_engine, table_name="orders", schema_name=None, reflect=reflect
+    )
+    customers_columns = cache.get_columns(
+        execution_engine=execution_engine,
+        table_name="customers",
+        schema_name=None,
+        reflect=reflect,
+    )
+
+    assert len(statements) == 1
+    assert "information_schema.columns" in statements[0]
+    reflect.assert_not_called()
+    assert [(column["name"], column["nullable"]) for column in orders_columns] == [
+        ("id", False),
+        ("status", True),
+        ("amount", True),
+    ]
+    assert isinstance(orders_columns[0]["type"], sa.INTEGER)
+    assert isinstance(orders_columns[1]["type"], sa.VARCHAR)
+    assert orders_columns[1]["type"].length == 16
+    assert (orders_columns[2]["type"].precision, orders_columns[2]["type"].scale) == (10, 2)
+    assert [column["name"] for column in customers_columns] == ["name"]
+
+    # Tables of types unknown to dialect (and tables missing from schema) are reflected.
+    assert cache.get_columns(
+        execution_engine=execution_engine, table_name="events", schema_name=None, reflect=reflect
+    ) == [{"name": "a", "type": reflect.return_value[0]["type"]}]
+    reflect.assert_called_once()
+    assert len(statements) == 1
+
+    assert execution_engine.schema_metadata_cache.refresh(schema_name="other") == 0
+    assert execution_engine.schema_metadata_cache.refresh() == 3
+
+
+@pytest.mark.unit
+def test_schema_metadata_cache_rejects_negative_ttl():
+    with pytest.raises(ValueError):
+        SqlAlchemySchemaMetadataCache(ttl_seconds=-1)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "dialect_module_name,data_type,full_data_type",
+    [
+        pytest.param("postgresql", "timestamp with time zone", None, id="postgresql_timestamptz"),
+        pytest.param("postgresql", "time with time zone", None, id="postgresql_timetz"),
+        pytest.param("mysql", "int", "int unsigned", id="mysql_unsigned"),
+        pytest.param("mysql", "decimal", "decimal(10,2) unsigned zerofill", id="mysql_zerofill"),
+        pytest.param("mysql", "enum", "enum('a','b')", id="mysql_enum"),
+    ],
+)
+def test_schema_metadata_cache_reflects_types_with_unsupported_attributes(
+    sa, dialect_module_name: str, data_type: str, full_data_type: str
+):
+    dialect = getattr(sa.dialects, dialect_module_name).dialect()
+
+    assert (
+        sqlalchemy_schema_metadata_cache._get_column_type(
+            dialect=dialect,
+            data_type=data_type,
+            full_data_type=full_data_type,
+            character_maximum_length=None,
+            numeric_precision=None,
+            numeric_scale=None,
+        )
+        is None
+    )
+
+
+@pytest.mark.unit
+def test_schema_metadata_cache_loads_types_without_attributes(sa):
+    column_type = sqlalchemy_schema_metadata_cache._get_column_type(
+        dialect=sa.dialects.mysql.dialect(),
+        data_type="int",
+        full_data_type="int",
+        character_maximum_length=None,
+        numeric_precision=10,
+        numeric_scale=0,
+    )
+
+    assert isinstance(column_type, sa.INTEGER)
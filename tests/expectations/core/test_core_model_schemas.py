@@ -9,7 +9,8 @@ from great_expectations.expectations import core
 from great_expectations.expectations.core import schemas
 from great_expectations.expectations.expectation import MetaExpectation
 
-expectation_dictionary = dict(core.__dict__)
+# Core Expectations are exported lazily, so are not part of core.__dict__ until first accessed.
+expectation_dictionary = {name: getattr(core, name) for name in dir(core)}
 
 
 @pytest.fixture
@@ -1,8 +1,10 @@
-from typing import Dict, Tuple
+import logging
+from typing import Dict, List, Tuple
 
 import pandas as pd
 import pytest
 
+import great_expectations.exceptions as gx_exceptions
 from great_expectations.core.metric_function_types import (
     MetricPartialFunctionTypeSuffixes,
     SummarizationMetricNameSuffixes,
@@ -768,3 +770,153 @@ def test_spark_unexpected_index_query_metric_without_id_pk(
             val
             == "df.filter(F.expr((animals IS NOT NULL) AND (NOT (animals IN (cat, fish, dog)))))"
         )
+
+
+@pytest.mark.unit
+def test_sa_fused_unexpected_rows_queries_match_individual_queries(sa, animal_table_df, mocker):
+    summary_result_format: dict = {
+        "result_format": "SUMMARY",
+        "unexpected_index_column_names": ["pk_1", "pk_2"],
+        "partial_unexpected_count": 2,
+    }
+    metric_value_kwargs_list: list = [
+        {"value_set": ["cat", "fish", "dog"], "result_format": summary_result_format},
+        {"value_set": ["lion"], "result_format": summary_result_format},
+    ]
+
+    results_by_fusion: Dict[bool, Dict[Tuple[str, str, str], MetricValue]] = {}
+    for fuse_unexpected_rows_queries in (False, True):
+        engine: SqlAlchemyExecutionEngine = build_sa_execution_engine(
+            df=animal_table_df, sa=sa, fuse_unexpected_rows_queries=fuse_unexpected_rows_queries
+        )
+
+        table_columns_metric, metrics = get_table_columns_metric(execution_engine=engine)
+        metrics_to_resolve: list = []
+        for metric_value_kwargs in metric_value_kwargs_list:
+            unexpected_condition = MetricConfiguration(
+                metric_name=f"column_values.in_set.{MetricPartialFunctionTypeSuffixes.CONDITION.value}",
+                metric_domain_kwargs={"column": "animals"},
+                metric_value_kwargs=metric_value_kwargs,
+            )
+            unexpected_condition.metric_dependencies = {"table.columns": table_columns_metric}
+            metrics.update(
+                engine.resolve_metrics(metrics_to_resolve=(unexpected_condition,), metrics=metrics)
+            )
+            for suffix in (
+                SummarizationMetricNameSuffixes.UNEXPECTED_VALUES,
+                SummarizationMetricNameSuffixes.UNEXPECTED_INDEX_LIST,
+            ):
+                metric = MetricConfiguration(
+                    metric_name=f"column_values.in_set.{suffix.value}",
+                    metric_domain_kwargs={"column": "animals"},
+                    metric_value_kwargs=metric_value_kwargs,
+                )
+                metric.metric_dependencies = {
+                    "unexpected_condition": unexpected_condition,
+                    "table.columns": table_columns_metric,
+                }
+                metrics_to_resolve.append(metric)
+
+        execute_query_spy = mocker.spy(engine, "execute_query")
+        results_by_fusion[fuse_unexpected_rows_queries] = engine.resolve_metrics(
+            metrics_to_resolve=metrics_to_resolve, metrics=metrics
+        )
+        assert execute_query_spy.call_count == (1 if fuse_unexpected_rows_queries else 4)
+        if fuse_unexpected_rows_queries:
+            fused_query: str = str(execute_query_spy.call_args.args[0])
+            # Running counts are ordered by index columns, so that samples are deterministic.
+            assert "OVER (ORDER BY pk_1, pk_2, animals ROWS" in fused_query
+
+    assert results_by_fusion[True] == results_by_fusion[False]
+    assert sorted(map(str, results_by_fusion[True].values())) == sorted(
+        [
+            "['giraffe', 'lion']",
+            "[{'pk_1': 3, 'pk_2': 'three', 'animals': 'giraffe'}, {'pk_1': 4, 'pk_2': 'four', 'animals': 'lion'}]",  # noqa: E501
+            "['cat', 'fish']",
+            "[{'pk_1': 0, 'pk_2': 'zero', 'animals': 'cat'}, {'pk_1': 1, 'pk_2': 'one', 'animals': 'fish'}]",  # noqa: E501
+        ]
+    )
+
+
+def _in_set_unexpected_values_metrics(
+    engine: SqlAlchemyExecutionEngine, metrics: dict
+) -> List[MetricConfiguration]:
+    table_columns_metric, table_metrics = get_table_columns_metric(execution_engine=engine)
+    metrics.update(table_metrics)
+    metrics_to_resolve: List[MetricConfiguration] = []
+    for value_set in (["cat", "fish", "dog"], ["lion"]):
+        metric_value_kwargs: dict = {
+            "value_set": value_set,
+            "result_format": {"result_format": "SUMMARY", "partial_unexpected_count": 2},
+        }
+        unexpected_condition = MetricConfiguration(
+            metric_name=f"column_values.in_set.{MetricPartialFunctionTypeSuffixes.CONDITION.value}",
+            metric_domain_kwargs={"column": "animals"},
+            metric_value_kwargs=metric_value_kwargs,
+        )
+        unexpected_condition.metric_dependencies = {"table.columns": table_columns_metric}
+        metrics.update(
+            engine.resolve_metrics(metrics_to_resolve=(unexpected_condition,), metrics=metrics)
+        )
+        metric = MetricConfiguration(
+            metric_name=f"column_values.in_set.{SummarizationMetricNameSuffixes.UNEXPECTED_VALUES.value}",
+            metric_domain_kwargs={"column": "animals"},
+            metric_value_kwargs=metric_value_kwargs,
+        )
+        metric.metric_dependencies = {
+            "unexpected_condition": unexpected_condition,
+            "table.columns": table_columns_metric,
+        }
+        metrics_to_resolve.append(metric)
+
+    return metrics_to_resolve
+
+
+@pytest.mark.unit
+def test_sa_fused_unexpected_rows_queries_fall_back_to_individual_queries(
+    sa, animal_table_df, mocker, caplog
+):
+    engine: SqlAlchemyExecutionEngine = build_sa_execution_engine(
+        df=animal_table_df, sa=sa, fuse_unexpected_rows_queries=True
+    )
+    mocker.patch(
+        "great_expectations.expectations.metrics.map_metric_provider.sqlalchemy_fused_map_condition_auxilliary_methods._sqlalchemy_fetch_unexpected_rows_samples",
+        side_effect=sa.exc.OperationalError("SELECT", {}, Exception("no window functions")),
+    )
+
+    metrics: dict = {}
+    metrics_to_resolve = _in_set_unexpected_values_metrics(engine=engine, metrics=metrics)
+    with caplog.at_level(logging.INFO):
+        results = engine.resolve_metrics(metrics_to_resolve=metrics_to_resolve, metrics=metrics)
+
+    assert [results[metric.id] for metric in metrics_to_resolve] == [
+        ["giraffe", "lion"],
+        ["cat", "fish"],
+    ]
+    assert any(
+        record.levelno == logging.INFO and "computing 2 metrics individually" in record.message
+        for record in caplog.records
+    )
+
+
+@pytest.mark.unit
+def test_sa_fused_unexpected_rows_queries_raise_errors_not_raised_by_database(
+    sa, animal_table_df, mocker
+):
+    engine: SqlAlchemyExecutionEngine = build_sa_execution_engine(
+        df=animal_table_df, sa=sa, fuse_unexpected_rows_queries=True
+    )
+    mocker.patch(
+        "great_expectations.expectations.metrics.map_metric_provider.sqlalchemy_fused_map_condition_auxilliary_methods._sqlalchemy_fetch_unexpected_rows_samples",
+        side_effect=ValueError("broken condition"),
+    )
+
+    metrics: dict = {}
+    metrics_to_resolve = _in_set_unexpected_values_metrics(engine=engine, metrics=metrics)
+    with pytest.raises(gx_exceptions.MetricResolutionError) as e:
+        engine.resolve_metrics(metrics_to_resolve=metrics_to_resolve, metrics=metrics)
+
+    assert "broken condition" in str(e.value)
+    assert {metric.id for metric in e.value.failed_metrics} == {
+        metric.id for metric in metrics_to_resolve
+    }
@@ -1,5 +1,6 @@
 import copy
 import datetime
+import inspect
 import logging
 from decimal import Decimal
 from typing import Dict, Tuple, Union
@@ -20,13 +21,21 @@ from great_expectations.core.metric_function_types import (
     SummarizationMetricNameSuffixes,
 )
 from great_expectations.execution_engine import (
+    ExecutionEngine,
     PandasExecutionEngine,
     SparkDFExecutionEngine,
 )
+from great_expectations.execution_engine.execution_engine import (
+    DEFAULT_VALUE_SET_SEMI_JOIN_THRESHOLD,
+)
 from great_expectations.execution_engine.sqlalchemy_execution_engine import (
     SqlAlchemyBatchData,
     SqlAlchemyExecutionEngine,
 )
+from great_expectations.expectations.metrics.column_aggregate_metrics import (
+    ColumnApproxDistinctValuesCount,
+)
+from great_expectations.expectations.metrics.sketches import KllQuantileSketch
 from great_expectations.expectations.metrics.util import (
     get_dbms_compatible_column_names,
 )
@@ -39,6 +48,7 @@ from great_expectations.self_check.util import (
 from great_expectations.util import isclose
 from great_expectations.validator.computed_metric import MetricValue
 from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.metrics_calculator import MetricsCalculator
 from tests.expectations.test_util import get_table_columns_metric
 
 
@@ -3924,6 +3934,82 @@ def test_map_column_pairs_in_set_metric_sa(sa):
     ]
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize("backend", ["pandas", "sqlite"])
+@pytest.mark.parametrize(
+    "metric_name_prefix, domain_kwargs, value_kwargs",
+    [
+        pytest.param(
+            "column_values.in_set",
+            {"column": "a"},
+            {"value_set": ["x", "y", "q"]},
+            id="in_set",
+        ),
+        pytest.param(
+            "column_values.not_in_set",
+            {"column": "a"},
+            {"value_set": ["x", "y", "q"]},
+            id="not_in_set",
+        ),
+        pytest.param(
+            "column_values.in_set",
+            {"column": "b"},
+            {"value_set": [1, 2, 7]},
+            id="in_set_of_numbers",
+        ),
+        pytest.param(
+            "column_pair_values.in_set",
+            {"column_A": "a", "column_B": "b", "ignore_row_if": "either_value_is_missing"},
+            {"value_pairs_set": [("x", 1), ("y", 3), ("z", 3), ("q", None)]},
+            id="column_pair_in_set",
+        ),
+    ],
+)
+def test_large_value_sets_are_semi_joined(
+    sa, backend: str, metric_name_prefix: str, domain_kwargs: dict, value_kwargs: dict
+):
+    df = pd.DataFrame({"a": ["x", "y", "z", "w", None, "x"], "b": [1, 2, 3, 4, 5, 1]})
+
+    def _compute_metrics(value_set_semi_join_threshold: int) -> list:
+        engine: ExecutionEngine = (
+            build_pandas_engine(df, value_set_semi_join_threshold=value_set_semi_join_threshold)
+            if backend == "pandas"
+            else build_sa_execution_engine(
+                df, sa, value_set_semi_join_threshold=value_set_semi_join_threshold
+            )
+        )
+        unexpected_count_metric = MetricConfiguration(
+            metric_name=f"{metric_name_prefix}.{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}",
+            metric_domain_kwargs=domain_kwargs,
+            metric_value_kwargs=value_kwargs,
+        )
+        unexpected_values_metric = MetricConfiguration(
+            metric_name=f"{metric_name_prefix}.{SummarizationMetricNameSuffixes.UNEXPECTED_VALUES.value}",
+            metric_domain_kwargs=domain_kwargs,
+            metric_value_kwargs={
+                **value_kwargs,
+                "result_format": {"result_format": "COMPLETE"},
+            },
+        )
+        results, aborted_metrics = MetricsCalculator(execution_engine=engine).compute_metrics(
+            metric_configurations=[unexpected_count_metric, unexpected_values_metric]
+        )
+        assert aborted_metrics == {}
+        if backend == "sqlite":
+            assert engine.scratch_table_manager.num_value_set_tables == int(
+                value_set_semi_join_threshold == 0
+            )
+            engine.release_validation_resources()
+            assert engine.scratch_table_manager.num_value_set_tables == 0
+
+        return [results[unexpected_count_metric.id], results[unexpected_values_metric.id]]
+
+    # Every value set is larger than threshold of 0, and smaller than default threshold.
+    assert _compute_metrics(value_set_semi_join_threshold=0) == _compute_metrics(
+        value_set_semi_join_threshold=DEFAULT_VALUE_SET_SEMI_JOIN_THRESHOLD
+    )
+
+
 @pytest.mark.spark
 def test_map_column_pairs_in_set_metric_spark(spark_session):
     engine: SparkDFExecutionEngine = build_spark_engine(
@@ -4197,6 +4283,69 @@ def test_column_median_metric_sa(sa, dataframe: pd.DataFrame, median: int):
     assert results == {desired_metric.id: median}
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize("backend", ["pandas", "sqlite"])
+def test_column_approximate_median_and_quantile_values_metrics(sa, backend: str):
+    df = pd.DataFrame({"a": np.concatenate([np.arange(1, 10001, dtype=float), [np.nan] * 100])})
+    engine: ExecutionEngine = (
+        build_pandas_engine(df) if backend == "pandas" else build_sa_execution_engine(df, sa)
+    )
+
+    relative_error = 0.01
+    median_metric = MetricConfiguration(
+        metric_name="column.median",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"approximate_relative_error": relative_error},
+    )
+    quantile_values_metric = MetricConfiguration(
+        metric_name="column.quantile_values",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={
+            "quantiles": [0.1, 0.9],
+            "allow_relative_error": False,
+            "approximate_relative_error": relative_error,
+        },
+    )
+    quantile_sketch_metric = MetricConfiguration(
+        metric_name="column.quantile_sketch",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"relative_error": relative_error},
+    )
+    results, aborted_metrics = MetricsCalculator(execution_engine=engine).compute_metrics(
+        metric_configurations=[median_metric, quantile_values_metric, quantile_sketch_metric]
+    )
+
+    assert aborted_metrics == {}
+    assert results[median_metric.id] == pytest.approx(5000, abs=10000 * relative_error)
+    assert results[quantile_values_metric.id] == pytest.approx(
+        [1000, 9000], abs=10000 * relative_error
+    )
+    sketch = KllQuantileSketch.from_json_dict(results[quantile_sketch_metric.id])
+    assert sketch.count == 10000
+    assert sketch.quantiles([0.5]) == [pytest.approx(5000, abs=10000 * relative_error)]
+
+
+@pytest.mark.sqlite
+def test_sqlite_approximate_median_is_computed_by_server(sa, mocker):
+    df = pd.DataFrame({"a": np.arange(1, 1001, dtype=float)})
+    engine: SqlAlchemyExecutionEngine = build_sa_execution_engine(df, sa)
+    update_sketch = mocker.spy(KllQuantileSketch, "update")
+
+    median_metric = MetricConfiguration(
+        metric_name="column.median",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"approximate_relative_error": 0.01},
+    )
+    results, aborted_metrics = MetricsCalculator(execution_engine=engine).compute_metrics(
+        metric_configurations=[median_metric]
+    )
+
+    # SQLite has no approximate percentile function, so exact median is computed without streaming column.  # noqa: E501
+    assert aborted_metrics == {}
+    assert results[median_metric.id] == 500.5
+    update_sketch.assert_not_called()
+
+
 @pytest.mark.spark
 def test_column_median_metric_spark(spark_session):
     engine: SparkDFExecutionEngine = build_spark_engine(
@@ -4290,6 +4439,121 @@ def test_value_counts_metric_sa(sa):
     ).equals(metrics[desired_metric_b.id])
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize("backend", ["pandas", "sqlite"])
+def test_top_value_counts_metrics(sa, backend: str):
+    df = pd.DataFrame({"a": ["x"] * 4 + ["y"] * 3 + ["z"] * 2 + ["w"] + [None] * 5})
+    engine: ExecutionEngine = (
+        build_pandas_engine(df) if backend == "pandas" else build_sa_execution_engine(df, sa)
+    )
+
+    value_counts_metric = MetricConfiguration(
+        metric_name="column.value_counts",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"sort": "value", "collate": None, "limit": 2},
+    )
+    top_value_counts_metric = MetricConfiguration(
+        metric_name="column.top_value_counts",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"limit": 3},
+    )
+    all_top_value_counts_metric = MetricConfiguration(
+        metric_name="column.top_value_counts",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"limit": 4},
+    )
+    results, aborted_metrics = MetricsCalculator(execution_engine=engine).compute_metrics(
+        metric_configurations=[
+            value_counts_metric,
+            top_value_counts_metric,
+            all_top_value_counts_metric,
+        ]
+    )
+
+    assert aborted_metrics == {}
+    # Most frequent values are ordered according to "sort".
+    assert results[value_counts_metric.id].to_dict() == {"x": 4, "y": 3}
+    assert results[top_value_counts_metric.id]["value_counts"].to_dict() == {
+        "x": 4,
+        "y": 3,
+        "z": 2,
+    }
+    assert results[top_value_counts_metric.id]["truncated"] is True
+    assert results[all_top_value_counts_metric.id]["value_counts"].to_dict() == {
+        "x": 4,
+        "y": 3,
+        "z": 2,
+        "w": 1,
+    }
+    assert results[all_top_value_counts_metric.id]["truncated"] is False
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("limit", [0, -1, 1.5, True])
+def test_value_counts_metric_rejects_invalid_limit(limit):
+    engine = build_pandas_engine(pd.DataFrame({"a": [1, 2, 1]}))
+
+    metric = MetricConfiguration(
+        metric_name="column.value_counts",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"sort": "count", "collate": None, "limit": limit},
+    )
+    with pytest.raises(gx_exceptions.MetricResolutionError):
+        engine.resolve_metrics(metrics_to_resolve=(metric,))
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("backend", ["pandas", "sqlite"])
+def test_column_approximate_distinct_values_count_metrics(sa, backend: str):
+    df = pd.DataFrame(
+        {"a": [f"user_{idx % 5000}" for idx in range(20000)] + [None] * 100},
+    )
+    engine: ExecutionEngine = (
+        build_pandas_engine(df) if backend == "pandas" else build_sa_execution_engine(df, sa)
+    )
+
+    relative_error = 0.01
+    distinct_values_count_metric = MetricConfiguration(
+        metric_name="column.distinct_values.count.approx",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"relative_error": relative_error},
+    )
+    unique_proportion_metric = MetricConfiguration(
+        metric_name="column.unique_proportion.approx",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    results, aborted_metrics = MetricsCalculator(execution_engine=engine).compute_metrics(
+        metric_configurations=[distinct_values_count_metric, unique_proportion_metric]
+    )
+
+    assert aborted_metrics == {}
+    assert results[distinct_values_count_metric.id] == pytest.approx(5000, rel=3 * relative_error)
+    assert results[unique_proportion_metric.id] == pytest.approx(0.25, rel=3 * relative_error)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "dialect_name,expected_sql",
+    [
+        pytest.param("mssql", "approx_count_distinct(a)", id="mssql"),
+        pytest.param("redshift", "approximate count(DISTINCT a)", id="redshift"),
+        pytest.param("snowflake", "approx_count_distinct(a)", id="snowflake"),
+        pytest.param("sqlite", "count(DISTINCT a)", id="exact_fallback"),
+    ],
+)
+def test_column_approximate_distinct_values_count_uses_native_sql_aggregate(
+    sa, dialect_name: str, expected_sql: str
+):
+    dialect = sa.dialects.postgresql.dialect()
+    dialect.name = dialect_name
+    aggregate = inspect.unwrap(ColumnApproxDistinctValuesCount._sqlalchemy)(
+        ColumnApproxDistinctValuesCount, column=sa.column("a"), _dialect=dialect
+    )
+
+    assert str(aggregate.compile(dialect=dialect)) == expected_sql
+
+
 @pytest.mark.spark
 def test_value_counts_metric_spark(spark_session):
     engine: SparkDFExecutionEngine = build_spark_engine(
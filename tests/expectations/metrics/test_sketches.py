@@ -0,0 +1,142 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.expectations.metrics.sketches import (
+    HyperLogLogSketch,
+    KllQuantileSketch,
+)
+
+QUANTILES = [0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99]
+
+
+def _max_rank_error(values: np.ndarray, sketch: KllQuantileSketch) -> float:
+    sorted_values: np.ndarray = np.sort(values)
+    estimates = sketch.quantiles(QUANTILES)
+    return max(
+        abs(np.searchsorted(sorted_values, estimate, side="right") / values.size - quantile)
+        for estimate, quantile in zip(estimates, QUANTILES)
+    )
+
+
+@pytest.fixture(scope="module")
+def values() -> np.ndarray:
+    return np.random.default_rng(seed=7).lognormal(size=200_000)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("relative_error", [0.05, 0.01, 0.002])
+def test_kll_quantile_sketch_rank_error_is_bounded(values: np.ndarray, relative_error: float):
+    sketch = KllQuantileSketch.from_relative_error(relative_error=relative_error)
+    for start in range(0, values.size, 10_000):
+        sketch.update(values[start : start + 10_000])
+
+    assert sketch.count == values.size
+    assert sketch.num_retained < values.size
+    assert _max_rank_error(values=values, sketch=sketch) <= relative_error
+    assert sketch.quantiles([0.0, 1.0]) == [values.min(), values.max()]
+
+
+@pytest.mark.unit
+def test_kll_quantile_sketch_merges_serialized_sketches(values: np.ndarray):
+    relative_error = 0.01
+    serialized_sketches = []
+    for batch in np.array_split(values, 4):
+        sketch = KllQuantileSketch.from_relative_error(relative_error=relative_error)
+        sketch.update(batch)
+        serialized_sketches.append(json.dumps(sketch.to_json_dict()))
+
+    merged = KllQuantileSketch.merge_all(
+        KllQuantileSketch.from_json_dict(json.loads(serialized_sketch))
+        for serialized_sketch in serialized_sketches
+    )
+
+    assert merged.count == values.size
+    assert _max_rank_error(values=values, sketch=merged) <= relative_error
+
+
+@pytest.mark.unit
+def test_kll_quantile_sketch_ignores_missing_values():
+    sketch = KllQuantileSketch()
+    assert sketch.quantiles([0.5]) == [None]
+
+    sketch.update([3, None, 1, float("nan"), 2])
+
+    assert sketch.count == 3
+    assert sketch.quantiles([0.0, 0.5, 1.0]) == [1.0, 2.0, 3.0]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("tz", [None, "US/Eastern"])
+def test_kll_quantile_sketch_summarizes_datetime_values(tz):
+    timestamps = pd.date_range("2024-01-01", periods=1001, freq="h", tz=tz)
+    sketch = KllQuantileSketch()
+    sketch.update(timestamps.to_series().to_numpy())
+    sketch.update([None, pd.NaT])
+
+    restored = KllQuantileSketch.from_json_dict(json.loads(json.dumps(sketch.to_json_dict())))
+
+    assert restored.count == timestamps.size
+    assert restored.quantiles([0.0, 1.0]) == [timestamps[0], timestamps[-1]]
+    median = restored.quantiles([0.5])[0]
+    assert isinstance(median, pd.Timestamp)
+    assert str(median.tz) == str(timestamps.tz)
+    assert abs(median - timestamps[500]) <= pd.Timedelta(hours=1001 * sketch.relative_error)
+
+    with pytest.raises(ValueError):
+        restored.update([1.0])
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("relative_error", [0, 1, -0.5, "0.01"])
+def test_kll_quantile_sketch_rejects_invalid_relative_error(relative_error):
+    with pytest.raises(ValueError):
+        KllQuantileSketch.from_relative_error(relative_error=relative_error)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("num_distinct_values", [0, 1, 10, 1_000, 50_000, 500_000])
+@pytest.mark.parametrize("relative_error", [0.05, 0.01])
+def test_hyper_log_log_sketch_estimate_is_accurate(num_distinct_values: int, relative_error: float):
+    values = np.random.default_rng(seed=7).permutation(np.arange(num_distinct_values).repeat(2))
+    sketch = HyperLogLogSketch.from_relative_error(relative_error=relative_error)
+    sketch.update(pd.Series(values))
+
+    # Estimate is within three standard errors.
+    assert sketch.relative_error <= relative_error
+    assert sketch.estimate() == pytest.approx(num_distinct_values, rel=3 * relative_error, abs=1)
+
+
+@pytest.mark.unit
+def test_hyper_log_log_sketch_merges_serialized_sketches():
+    serialized_sketches = []
+    for start in range(0, 40_000, 10_000):
+        # Every Batch shares half of its values with next one.
+        sketch = HyperLogLogSketch()
+        sketch.update([f"user_{idx}" for idx in range(start, start + 20_000)])
+        serialized_sketches.append(json.dumps(sketch.to_json_dict()))
+
+    merged = HyperLogLogSketch.merge_all(
+        HyperLogLogSketch.from_json_dict(json.loads(serialized_sketch))
+        for serialized_sketch in serialized_sketches
+    )
+
+    assert merged.estimate() == pytest.approx(50_000, rel=3 * merged.relative_error)
+
+
+@pytest.mark.unit
+def test_hyper_log_log_sketch_ignores_missing_values():
+    sketch = HyperLogLogSketch()
+    assert sketch.estimate() == 0
+
+    sketch.update(["a", None, "b", float("nan"), "a"])
+
+    assert sketch.estimate() == 2
+
+
+@pytest.mark.unit
+def test_hyper_log_log_sketch_rejects_sketch_of_different_precision():
+    with pytest.raises(ValueError):
+        HyperLogLogSketch(precision=12).merge(HyperLogLogSketch(precision=14))
@@ -1,3 +1,8 @@
+import pathlib
+import subprocess
+import sys
+import textwrap
+
 import pytest
 
 import great_expectations.exceptions as gx_exceptions
@@ -27,3 +32,113 @@ def test_registry_from_configuration():
 def test_registry_raises_error_when_invalid_expectation_requested():
     with pytest.raises(gx_exceptions.ExpectationNotFoundError):
         get_expectation_impl("expect_something_in_beta")
+
+
+def test_lazily_loaded_package_lists_and_exports_core_expectations():
+    assert "ExpectColumnValuesToBeInSet" in dir(gxe)
+    assert gxe.core.ExpectColumnValuesToBeInSet is gxe.ExpectColumnValuesToBeInSet
+
+
+def test_lazily_loaded_package_raises_attribute_error_for_unknown_name():
+    with pytest.raises(AttributeError, match="has no attribute 'ExpectSomethingInBeta'"):
+        _ = gxe.ExpectSomethingInBeta
+
+
+def test_user_metric_provider_is_not_overwritten_by_lazily_loaded_core_metric():
+    """Runs in a fresh interpreter, so that the core "column.max" provider is not yet loaded."""
+    script = textwrap.dedent(
+        """
+        import sys
+
+        from great_expectations.execution_engine import PandasExecutionEngine
+        from great_expectations.expectations.metrics import (
+            ColumnAggregateMetricProvider,
+            column_aggregate_value,
+        )
+        from great_expectations.expectations.registry import get_metric_provider
+
+        CORE_MODULE = "great_expectations.expectations.metrics.column_aggregate_metrics.column_max"
+        assert CORE_MODULE not in sys.modules
+
+
+        class UserColumnMax(ColumnAggregateMetricProvider):
+            metric_name = "column.max"
+
+            @column_aggregate_value(engine=PandasExecutionEngine)
+            def _pandas(cls, column, **kwargs):
+                return column.max()
+
+
+        provider, _ = get_metric_provider("column.max", PandasExecutionEngine())
+        assert CORE_MODULE in sys.modules
+        assert provider is UserColumnMax, provider
+        """
+    )
+    completed_process = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=pathlib.Path(__file__).parent.parent.parent,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert completed_process.returncode == 0, completed_process.stderr
+
+
+def test_lazily_loaded_core_metric_is_registered_while_another_thread_imports_it():
+    """Runs in a fresh interpreter, so that the core "column.max" provider is not yet loaded."""
+    script = textwrap.dedent(
+        """
+        import importlib.abc
+        import importlib.util
+        import sys
+        import threading
+        import time
+
+        from great_expectations.expectations.registry import get_metric_kwargs
+
+        CORE_MODULE = "great_expectations.expectations.metrics.column_aggregate_metrics.column_max"
+        assert CORE_MODULE not in sys.modules
+        import_started = threading.Event()
+
+
+        class SlowLoader(importlib.abc.Loader):
+            def __init__(self, loader):
+                self._loader = loader
+
+            def create_module(self, spec):
+                return self._loader.create_module(spec)
+
+            def exec_module(self, module):
+                import_started.set()
+                time.sleep(0.5)
+                self._loader.exec_module(module)
+
+
+        class SlowFinder(importlib.abc.MetaPathFinder):
+            def find_spec(self, fullname, path, target=None):
+                if fullname != CORE_MODULE:
+                    return None
+                sys.meta_path.remove(self)
+                spec = importlib.util.find_spec(fullname)
+                spec.loader = SlowLoader(spec.loader)
+                return spec
+
+
+        sys.meta_path.insert(0, SlowFinder())
+        thread = threading.Thread(target=importlib.import_module, args=(CORE_MODULE,))
+        thread.start()
+        import_started.wait()
+        assert CORE_MODULE in sys.modules
+
+        get_metric_kwargs("column.max")
+        thread.join()
+        """
+    )
+    completed_process = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=pathlib.Path(__file__).parent.parent.parent,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert completed_process.returncode == 0, completed_process.stderr
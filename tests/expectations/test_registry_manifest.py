@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import pathlib
+import subprocess
+import sys
+from typing import Final
+
+import pytest
+
+from scripts.check_import_time import get_deferred_modules, measure_import_time
+
+pytestmark = pytest.mark.project
+
+PROJECT_ROOT: Final = pathlib.Path(__file__).parent.parent.parent
+
+
+def test_registry_manifest_is_up_to_date():
+    """The manifest is generated in a fresh interpreter, so that test Expectations are not part of it."""  # noqa: E501
+    completed_process = subprocess.run(
+        [sys.executable, "-m", "scripts.generate_registry_manifest"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert completed_process.returncode == 0, completed_process.stdout + completed_process.stderr
+
+
+def test_import_does_not_load_core_expectations_and_metrics():
+    assert get_deferred_modules(measure_import_time()) == []
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pandas as pd
+import pytest
+
+from great_expectations.experimental.rule_based_profiler.helpers.cardinality_checker import (
+    AbsoluteCardinalityLimit,
+    CardinalityChecker,
+    CardinalityLimitMode,
+    RelativeCardinalityLimit,
+)
+from great_expectations.self_check.util import build_pandas_engine, build_sa_execution_engine
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.metrics_calculator import MetricsCalculator
+
+if TYPE_CHECKING:
+    from great_expectations.execution_engine import ExecutionEngine
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.mark.parametrize(
+    "cardinality_checker,expected_metric_name",
+    [
+        pytest.param(
+            CardinalityChecker(cardinality_limit_mode=CardinalityLimitMode.FEW),
+            "column.distinct_values.count.approx",
+            id="absolute_mode",
+        ),
+        pytest.param(
+            CardinalityChecker(cardinality_limit_mode="rel_10"),
+            "column.unique_proportion.approx",
+            id="relative_mode",
+        ),
+        pytest.param(
+            CardinalityChecker(max_unique_values=5),
+            "column.distinct_values.count.approx",
+            id="max_unique_values",
+        ),
+        pytest.param(
+            CardinalityChecker(max_proportion_unique=0.5),
+            "column.unique_proportion.approx",
+            id="max_proportion_unique",
+        ),
+    ],
+)
+def test_cardinality_limits_are_measured_by_approximate_metrics(
+    cardinality_checker: CardinalityChecker, expected_metric_name: str
+):
+    assert cardinality_checker.cardinality_limit_mode.metric_name_defining_limit == (
+        expected_metric_name
+    )
+
+
+@pytest.mark.parametrize(
+    "cardinality_limit_mode",
+    [
+        pytest.param(
+            {
+                "name": "FEW",
+                "max_unique_values": 100,
+                "metric_name_defining_limit": "column.distinct_values.count",
+            },
+            id="absolute_mode",
+        ),
+        pytest.param(
+            {
+                "name": "REL_50",
+                "max_proportion_unique": 0.5,
+                "metric_name_defining_limit": "column.unique_proportion",
+            },
+            id="relative_mode",
+        ),
+    ],
+)
+def test_cardinality_limit_configured_with_exact_metric_keeps_it(cardinality_limit_mode: dict):
+    cardinality_checker = CardinalityChecker(cardinality_limit_mode=cardinality_limit_mode)
+
+    assert (
+        cardinality_checker.cardinality_limit_mode.metric_name_defining_limit
+        == (cardinality_limit_mode["metric_name_defining_limit"])
+    )
+
+
+@pytest.mark.parametrize("backend", ["pandas", "sqlite"])
+@pytest.mark.parametrize(
+    "cardinality_limit_mode",
+    [
+        CardinalityLimitMode.VERY_FEW,
+        CardinalityLimitMode.FEW,
+        CardinalityLimitMode.SOME,
+        CardinalityLimitMode.REL_1,
+        CardinalityLimitMode.REL_25,
+    ],
+)
+def test_approximate_cardinality_check_agrees_with_exact_one(
+    sa, backend: str, cardinality_limit_mode: CardinalityLimitMode
+):
+    num_rows = 4000
+    df = pd.DataFrame(
+        {
+            "very_few": [f"v_{idx % 5}" for idx in range(num_rows)],
+            "few": [f"v_{idx % 50}" for idx in range(num_rows)],
+            "some": [f"v_{idx % 500}" for idx in range(num_rows)],
+            "many": [f"v_{idx % 2000}" for idx in range(num_rows)],
+        }
+    )
+    engine: ExecutionEngine = (
+        build_pandas_engine(df) if backend == "pandas" else build_sa_execution_engine(df, sa)
+    )
+
+    cardinality_limit: AbsoluteCardinalityLimit | RelativeCardinalityLimit = (
+        cardinality_limit_mode.value
+    )
+    exact_metric_name = (
+        "column.distinct_values.count"
+        if isinstance(cardinality_limit, AbsoluteCardinalityLimit)
+        else "column.unique_proportion"
+    )
+    approximate_metrics = {
+        column: MetricConfiguration(
+            metric_name=cardinality_limit.metric_name_defining_limit,
+            metric_domain_kwargs={"column": column},
+            metric_value_kwargs=None,
+        )
+        for column in df.columns
+    }
+    exact_metrics = {
+        column: MetricConfiguration(
+            metric_name=exact_metric_name,
+            metric_domain_kwargs={"column": column},
+            metric_value_kwargs=None,
+        )
+        for column in df.columns
+    }
+    results, aborted_metrics = MetricsCalculator(execution_engine=engine).compute_metrics(
+        metric_configurations=[*approximate_metrics.values(), *exact_metrics.values()]
+    )
+    assert aborted_metrics == {}
+
+    cardinality_checker = CardinalityChecker(cardinality_limit_mode=cardinality_limit_mode)
+    for column in df.columns:
+        assert cardinality_checker.cardinality_within_limit(
+            metric_value=results[approximate_metrics[column].id]
+        ) == cardinality_checker.cardinality_within_limit(
+            metric_value=results[exact_metrics[column].id]
+        )
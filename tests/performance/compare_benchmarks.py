@@ -0,0 +1,145 @@
+"""Compares two "pytest-benchmark" JSON result files (e.g., of "tests/performance/results") and reports regressions.
+
+Usage:
+    python tests/performance/compare_benchmarks.py BASELINE_JSON CANDIDATE_JSON [--threshold 0.1] [--stat median]
+
+Overall timing statistic of every benchmark, present in both files, is compared; so are per-phase timings and peak
+memory, recorded under "extra_info" (see "tests/performance/conftest.py").  Exit code is 1, if any measurement of
+candidate exceeds that of baseline by more than "threshold" (relative), and 0 otherwise.
+"""  # noqa: E501
+
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import sys
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+
+@dataclass(frozen=True)
+class BenchmarkComparison:
+    benchmark: str
+    measurement: str
+    baseline: float
+    candidate: float
+    threshold: float
+
+    @property
+    def relative_change(self) -> float:
+        if self.baseline == 0:
+            return 0.0 if self.candidate == 0 else float("inf")
+
+        return (self.candidate - self.baseline) / self.baseline
+
+    @property
+    def is_regression(self) -> bool:
+        return self.relative_change > self.threshold
+
+    @property
+    def is_improvement(self) -> bool:
+        return self.relative_change < -self.threshold
+
+
+def load_benchmarks(path: pathlib.Path) -> Dict[str, dict]:
+    """Returns benchmarks of "pytest-benchmark" JSON file, keyed by their full (node ID) names."""
+    with open(path) as f:
+        return {benchmark["fullname"]: benchmark for benchmark in json.load(f)["benchmarks"]}
+
+
+def _measurements(benchmark: dict, stat: str) -> Dict[str, float]:
+    measurements: Dict[str, float] = {f"stats.{stat}": benchmark["stats"][stat]}
+
+    extra_info: dict = benchmark.get("extra_info") or {}
+    if "peak_memory_bytes" in extra_info:
+        measurements["peak_memory_bytes"] = extra_info["peak_memory_bytes"]
+
+    phase: str
+    for phase, phase_measurements in (extra_info.get("phases") or {}).items():
+        measurements[f"phases.{phase}.median_seconds"] = phase_measurements["median_seconds"]
+        measurements[f"phases.{phase}.peak_memory_bytes"] = phase_measurements["peak_memory_bytes"]
+
+    return measurements
+
+
+def compare_benchmarks(
+    baseline: Dict[str, dict],
+    candidate: Dict[str, dict],
+    threshold: float = 0.1,
+    stat: str = "median",
+) -> List[BenchmarkComparison]:
+    """Compares every measurement of every benchmark, which is present in both "baseline" and "candidate"."""  # noqa: E501
+    comparisons: List[BenchmarkComparison] = []
+
+    name: str
+    for name in sorted(baseline.keys() & candidate.keys()):
+        baseline_measurements: Dict[str, float] = _measurements(baseline[name], stat=stat)
+        candidate_measurements: Dict[str, float] = _measurements(candidate[name], stat=stat)
+        comparisons.extend(
+            BenchmarkComparison(
+                benchmark=name,
+                measurement=measurement,
+                baseline=baseline_measurements[measurement],
+                candidate=candidate_measurements[measurement],
+                threshold=threshold,
+            )
+            for measurement in baseline_measurements
+            if measurement in candidate_measurements
+        )
+
+    return comparisons
+
+
+def format_report(comparisons: Sequence[BenchmarkComparison]) -> str:
+    lines: List[str] = []
+    comparison: BenchmarkComparison
+    for comparison in comparisons:
+        if comparison.is_regression:
+            verdict = "REGRESSION"
+        elif comparison.is_improvement:
+            verdict = "improvement"
+        else:
+            verdict = "unchanged"
+
+        lines.append(
+            f"{verdict:<12} {comparison.relative_change:+8.1%}  {comparison.baseline:>14.6g} -> "
+            f"{comparison.candidate:<14.6g} {comparison.benchmark} [{comparison.measurement}]"
+        )
+
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline", type=pathlib.Path)
+    parser.add_argument("candidate", type=pathlib.Path)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Relative increase, beyond which measurement is reported as regression.",
+    )
+    parser.add_argument(
+        "--stat",
+        default="median",
+        choices=("min", "max", "mean", "median"),
+        help="Timing statistic of pytest-benchmark to compare.",
+    )
+    args = parser.parse_args(argv)
+
+    comparisons: List[BenchmarkComparison] = compare_benchmarks(
+        baseline=load_benchmarks(args.baseline),
+        candidate=load_benchmarks(args.candidate),
+        threshold=args.threshold,
+        stat=args.stat,
+    )
+    print(format_report(comparisons))
+
+    num_regressions: int = sum(comparison.is_regression for comparison in comparisons)
+    print(f"\n{num_regressions} regression(s) among {len(comparisons)} measurement(s).")
+    return 1 if num_regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
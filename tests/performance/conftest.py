@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import statistics
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List
+
+import pytest
+
+
+class PhaseProfiler:
+    """Records duration and peak (traced) memory of named phases of benchmarked workload.
+
+    Durations are collected in every benchmark round (with memory tracing off, so that they are not distorted), while
+    peak memory is measured in one additional round, executed under "tracemalloc".
+    """  # noqa: E501
+
+    def __init__(self) -> None:
+        self._seconds: Dict[str, List[float]] = {}
+        self._peak_memory_bytes: Dict[str, int] = {}
+        self._tracing_memory: bool = False
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        if self._tracing_memory:
+            tracemalloc.reset_peak()
+
+        start: float = time.perf_counter()
+        try:
+            yield
+        finally:
+            if self._tracing_memory:
+                self._peak_memory_bytes[name] = tracemalloc.get_traced_memory()[1]
+            else:
+                self._seconds.setdefault(name, []).append(time.perf_counter() - start)
+
+    def trace_memory(self, workload: Callable[..., Any], **kwargs) -> int:
+        """Runs workload once under "tracemalloc"; returns its overall peak memory (in bytes)."""
+        tracemalloc.start()
+        self._tracing_memory = True
+        try:
+            workload(**kwargs)
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            self._tracing_memory = False
+            tracemalloc.stop()
+
+    def to_dict(self) -> Dict[str, Dict[str, float]]:
+        return {
+            name: {
+                "median_seconds": statistics.median(seconds),
+                "min_seconds": min(seconds),
+                "peak_memory_bytes": self._peak_memory_bytes.get(name, 0),
+            }
+            for name, seconds in self._seconds.items()
+        }
+
+
+@pytest.fixture
+def run_phase_benchmark(request, pytestconfig) -> Callable[..., Any]:
+    """Benchmarks "workload(profiler=PhaseProfiler, **kwargs)" and adds its per-phase timings and peak memory to "extra_info" of benchmark JSON."""  # noqa: E501
+    if not pytestconfig.getoption("--performance-tests"):
+        pytest.skip("Requires --performance-tests option.")
+
+    # Requested only after skip check ("pytest-benchmark" warns about unused "benchmark" fixture).
+    benchmark = request.getfixturevalue("benchmark")
+
+    def _run(workload: Callable[..., Any], rounds: int = 3, **kwargs) -> Any:
+        profiler = PhaseProfiler()
+        result = benchmark.pedantic(
+            workload,
+            kwargs={"profiler": profiler, **kwargs},
+            rounds=rounds,
+            iterations=1,
+        )
+        benchmark.extra_info["peak_memory_bytes"] = profiler.trace_memory(
+            workload, profiler=profiler, **kwargs
+        )
+        benchmark.extra_info["phases"] = profiler.to_dict()
+        return result
+
+    return _run
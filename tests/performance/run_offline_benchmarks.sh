@@ -0,0 +1,35 @@
+#!/usr/bin/env bash
+
+# Runs self-contained (Pandas and SQLite) performance tests multiple times; optionally compares results with baseline.
+
+set -eu
+
+if [ "$#" -lt 1 ]; then
+  echo "Usage: $0 [BENCHMARK_JSON_FILE_NAME_PREFIX] [OPTIONAL_BASELINE_BENCHMARK_JSON_FILE_NAME_PREFIX] [OPTIONAL_PYTEST_ARGS]" >&2
+  exit 1
+fi
+
+benchmark_json_file_name_prefix=$1
+baseline_json_file_name_prefix=${2:-}
+
+for i in {1..3}
+do
+  benchmark_json=tests/performance/results/${benchmark_json_file_name_prefix}_run_${i}.json
+  date
+  set -x
+  time pytest tests/performance/test_offline_benchmarks.py \
+    --benchmark-json=${benchmark_json} \
+    --performance-tests \
+    -q -p no:warnings \
+    "${@:3}" \
+    2> /dev/null
+  set +x
+  # Remove some unnecessary personally identifiable fields.
+  jq '(del( .machine_info["node", "release"]))' ${benchmark_json} | sponge ${benchmark_json}
+
+  if [ -n "${baseline_json_file_name_prefix}" ]; then
+    python tests/performance/compare_benchmarks.py \
+      tests/performance/results/${baseline_json_file_name_prefix}_run_${i}.json \
+      ${benchmark_json} || true
+  fi
+done
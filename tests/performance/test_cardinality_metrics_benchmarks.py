@@ -0,0 +1,97 @@
+"""Benchmarks for bounded-cardinality metrics of high-cardinality column, which do not materialize all distinct values.
+
+Run with:
+    pytest tests/performance/test_cardinality_metrics_benchmarks.py --performance-tests -p no:warnings --benchmark-json=results.json
+
+Peak memory of every benchmark is added to "extra_info" of benchmark JSON; every benchmark also asserts parity with
+exact metrics ("column.distinct_values.count" and "column.value_counts").
+"""  # noqa: E501
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.self_check.util import build_pandas_engine, build_sa_execution_engine
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.metrics_calculator import MetricsCalculator
+
+if TYPE_CHECKING:
+    from great_expectations.execution_engine import ExecutionEngine
+    from tests.performance.conftest import PhaseProfiler
+
+NUM_ROWS: int = 1_000_000
+NUM_USERS: int = 250_000
+TOP_VALUE_COUNTS_LIMIT: int = 10
+
+
+@pytest.fixture(scope="module")
+def user_ids_df() -> pd.DataFrame:
+    rng = np.random.default_rng(seed=42)
+    return pd.DataFrame(
+        {"user_id": [f"user_{idx}" for idx in rng.zipf(a=1.3, size=NUM_ROWS) % NUM_USERS]}
+    )
+
+
+def _compute_metric(engine: ExecutionEngine, metric_name: str, **metric_value_kwargs) -> Any:
+    metric = MetricConfiguration(
+        metric_name=metric_name,
+        metric_domain_kwargs={"column": "user_id"},
+        metric_value_kwargs=metric_value_kwargs or None,
+    )
+    results, aborted_metrics = MetricsCalculator(execution_engine=engine).compute_metrics(
+        metric_configurations=[metric], min_graph_edges_pbar_enable=1_000
+    )
+    assert aborted_metrics == {}
+    return results[metric.id]
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("backend", ["pandas", "sqlite"])
+def test_approximate_distinct_values_count(
+    run_phase_benchmark, sa, user_ids_df: pd.DataFrame, backend: str
+) -> None:
+    engine: ExecutionEngine = (
+        build_pandas_engine(user_ids_df)
+        if backend == "pandas"
+        else build_sa_execution_engine(user_ids_df, sa)
+    )
+
+    def workload(profiler: PhaseProfiler) -> int:
+        with profiler.phase("compute_metric"):
+            return _compute_metric(engine, "column.distinct_values.count.approx")
+
+    distinct_values_count = run_phase_benchmark(workload)
+    assert distinct_values_count == pytest.approx(
+        _compute_metric(engine, "column.distinct_values.count"), rel=0.03
+    )
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("backend", ["pandas", "sqlite"])
+def test_top_value_counts(run_phase_benchmark, sa, user_ids_df: pd.DataFrame, backend: str) -> None:
+    engine: ExecutionEngine = (
+        build_pandas_engine(user_ids_df)
+        if backend == "pandas"
+        else build_sa_execution_engine(user_ids_df, sa)
+    )
+
+    def workload(profiler: PhaseProfiler) -> Dict[str, Any]:
+        with profiler.phase("compute_metric"):
+            return _compute_metric(engine, "column.top_value_counts", limit=TOP_VALUE_COUNTS_LIMIT)
+
+    top_value_counts = run_phase_benchmark(workload)
+    value_counts: pd.Series = _compute_metric(
+        engine, "column.value_counts", sort="count", collate=None
+    )
+    assert top_value_counts["truncated"] is True
+    assert (
+        top_value_counts["value_counts"].to_numpy().tolist()
+        == value_counts.sort_values(ascending=False)
+        .iloc[:TOP_VALUE_COUNTS_LIMIT]
+        .to_numpy()
+        .tolist()
+    )
@@ -0,0 +1,69 @@
+import json
+import pathlib
+
+import pytest
+
+from tests.performance.compare_benchmarks import compare_benchmarks, load_benchmarks, main
+
+RESULTS_DIRECTORY = pathlib.Path(__file__).parent / "results"
+
+
+def _benchmark(name: str, median: float, phase_seconds: float, peak_memory_bytes: int) -> dict:
+    return {
+        "fullname": name,
+        "stats": {"median": median},
+        "extra_info": {
+            "peak_memory_bytes": peak_memory_bytes,
+            "phases": {
+                "resolve": {
+                    "median_seconds": phase_seconds,
+                    "min_seconds": phase_seconds,
+                    "peak_memory_bytes": peak_memory_bytes,
+                }
+            },
+        },
+    }
+
+
+@pytest.mark.unit
+def test_compare_benchmarks_flags_regressions_of_timings_and_memory():
+    baseline = {"b": _benchmark("b", median=1.0, phase_seconds=0.5, peak_memory_bytes=1000)}
+    candidate = {"b": _benchmark("b", median=1.05, phase_seconds=0.8, peak_memory_bytes=500)}
+
+    comparisons = {
+        comparison.measurement: comparison
+        for comparison in compare_benchmarks(baseline=baseline, candidate=candidate, threshold=0.1)
+    }
+
+    assert not comparisons["stats.median"].is_regression
+    assert comparisons["phases.resolve.median_seconds"].is_regression
+    assert comparisons["peak_memory_bytes"].is_improvement
+
+
+@pytest.mark.unit
+def test_compare_benchmarks_reads_existing_results():
+    baseline = load_benchmarks(RESULTS_DIRECTORY / "initial_baseline_run_1.json")
+
+    comparisons = compare_benchmarks(baseline=baseline, candidate=baseline)
+
+    assert len(comparisons) == len(baseline)
+    assert not any(comparison.is_regression for comparison in comparisons)
+
+
+@pytest.mark.unit
+def test_compare_benchmarks_exit_code(tmp_path: pathlib.Path):
+    baseline_path = tmp_path / "baseline.json"
+    candidate_path = tmp_path / "candidate.json"
+    baseline_path.write_text(
+        json.dumps(
+            {"benchmarks": [_benchmark("b", median=1.0, phase_seconds=0.5, peak_memory_bytes=0)]}
+        )
+    )
+    candidate_path.write_text(
+        json.dumps(
+            {"benchmarks": [_benchmark("b", median=2.0, phase_seconds=0.5, peak_memory_bytes=0)]}
+        )
+    )
+
+    assert main([str(baseline_path), str(baseline_path)]) == 0
+    assert main([str(baseline_path), str(candidate_path)]) == 1
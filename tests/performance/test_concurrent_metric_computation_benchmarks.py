@@ -0,0 +1,118 @@
+"""Benchmarks for concurrent metric computation ("metric_computation_max_workers") on wide tables.
+
+Run with:
+    pytest tests/performance/test_concurrent_metric_computation_benchmarks.py --performance-tests -p no:warnings
+
+Note: sqlite requires single persisted connection, so its metric queries are always issued one at a time; the sqlite
+cases measure overhead of the setting, while speedups are expected from Pandas and from networked SQL dialects.
+"""  # noqa: E501
+
+from __future__ import annotations
+
+from typing import List
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
+from great_expectations.compatibility.sqlalchemy_compatibility_wrappers import (
+    add_dataframe_to_db,
+)
+from great_expectations.core.batch import Batch
+from great_expectations.execution_engine import (
+    ExecutionEngine,
+    PandasExecutionEngine,
+    SqlAlchemyExecutionEngine,
+)
+from great_expectations.execution_engine.sqlalchemy_batch_data import SqlAlchemyBatchData
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.metrics_calculator import MetricsCalculator
+
+NUM_COLUMNS: int = 200
+NUM_ROWS: int = 100_000
+METRIC_NAMES: List[str] = [
+    "column.mean",
+    "column.standard_deviation",
+    "column.min",
+    "column.max",
+    "column_values.null.unexpected_count",
+]
+
+
+@pytest.fixture(scope="module")
+def wide_df() -> pd.DataFrame:
+    rng = np.random.default_rng(seed=42)
+    return pd.DataFrame(
+        rng.normal(size=(NUM_ROWS, NUM_COLUMNS)),
+        columns=[f"col_{idx}" for idx in range(NUM_COLUMNS)],
+    )
+
+
+def _metric_configurations(columns: List[str]) -> List[MetricConfiguration]:
+    return [
+        MetricConfiguration(
+            metric_name=metric_name,
+            metric_domain_kwargs={"column": column},
+        )
+        for column in columns
+        for metric_name in METRIC_NAMES
+    ]
+
+
+def _compute(execution_engine: ExecutionEngine, columns: List[str]) -> dict:
+    resolved_metrics, aborted_metrics_info = MetricsCalculator(
+        execution_engine=execution_engine
+    ).compute_metrics(metric_configurations=_metric_configurations(columns=columns))
+    assert aborted_metrics_info == {}
+    return resolved_metrics
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("max_workers", [1, 4, 8])
+def test_pandas_wide_table_metrics(
+    benchmark, pytestconfig, wide_df: pd.DataFrame, max_workers: int
+) -> None:
+    if not pytestconfig.getoption("--performance-tests"):
+        pytest.skip("Requires --performance-tests option.")
+
+    execution_engine = PandasExecutionEngine(
+        batch_data_dict={"wide": wide_df},
+        metric_computation_max_workers=max_workers,
+        caching=False,
+    )
+
+    resolved_metrics = benchmark.pedantic(
+        _compute,
+        kwargs={"execution_engine": execution_engine, "columns": list(wide_df.columns)},
+        rounds=3,
+        iterations=1,
+    )
+    assert len(resolved_metrics) >= NUM_COLUMNS * len(METRIC_NAMES)
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("max_workers", [1, 8])
+def test_sqlite_wide_table_metrics(
+    benchmark, pytestconfig, tmp_path, wide_df: pd.DataFrame, max_workers: int
+) -> None:
+    if not pytestconfig.getoption("--performance-tests"):
+        pytest.skip("Requires --performance-tests option.")
+
+    sqlalchemy_engine = sa.create_engine(f"sqlite:///{tmp_path / 'wide.db'}")
+    add_dataframe_to_db(df=wide_df, name="wide", con=sqlalchemy_engine, index=False)
+
+    execution_engine = SqlAlchemyExecutionEngine(
+        engine=sqlalchemy_engine,
+        metric_computation_max_workers=max_workers,
+    )
+    batch = Batch(data=SqlAlchemyBatchData(execution_engine=execution_engine, table_name="wide"))  # type: ignore[arg-type] # got SqlAlchemyBatchData
+    execution_engine.load_batch_data(batch_id=batch.id, batch_data=batch.data)  # type: ignore[arg-type] # got SqlAlchemyBatchData
+
+    resolved_metrics = benchmark.pedantic(
+        _compute,
+        kwargs={"execution_engine": execution_engine, "columns": list(wide_df.columns)},
+        rounds=3,
+        iterations=1,
+    )
+    assert len(resolved_metrics) >= NUM_COLUMNS * len(METRIC_NAMES)
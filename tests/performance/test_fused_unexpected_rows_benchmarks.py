@@ -0,0 +1,99 @@
+"""Benchmarks for fused "unexpected rows" queries ("fuse_unexpected_rows_queries") of SQL map expectations.
+
+Run with:
+    pytest tests/performance/test_fused_unexpected_rows_benchmarks.py --performance-tests -p no:warnings
+
+Note: sqlite scans of local files are cheap, so the sqlite cases mostly measure overhead of the wider fused query;
+savings are expected from networked SQL dialects, which bill (and wait) per scan.
+"""  # noqa: E501
+
+from __future__ import annotations
+
+from typing import List
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
+from great_expectations.compatibility.sqlalchemy_compatibility_wrappers import (
+    add_dataframe_to_db,
+)
+from great_expectations.core.batch import Batch
+from great_expectations.execution_engine import SqlAlchemyExecutionEngine
+from great_expectations.execution_engine.sqlalchemy_batch_data import SqlAlchemyBatchData
+from great_expectations.expectations.expectation_configuration import (
+    ExpectationConfiguration,
+)
+from great_expectations.validator.validator import Validator
+
+NUM_COLUMNS: int = 200
+NUM_ROWS: int = 20_000
+RESULT_FORMAT: dict = {
+    "result_format": "SUMMARY",
+    "unexpected_index_column_names": ["pk"],
+}
+
+
+@pytest.fixture(scope="module")
+def wide_df() -> pd.DataFrame:
+    rng = np.random.default_rng(seed=42)
+    values = rng.normal(size=(NUM_ROWS, NUM_COLUMNS))
+    values[rng.random(size=values.shape) < 0.01] = np.nan
+    df = pd.DataFrame(values, columns=[f"col_{idx}" for idx in range(NUM_COLUMNS)])
+    df.insert(0, "pk", range(NUM_ROWS))
+    return df
+
+
+def _expectation_configurations(columns: List[str]) -> List[ExpectationConfiguration]:
+    """Two map expectations (i.e., 400 on default table) with unexpected values per column."""
+    configurations: List[ExpectationConfiguration] = []
+    for column in columns:
+        configurations.append(
+            ExpectationConfiguration(
+                type="expect_column_values_to_not_be_null",
+                kwargs={"column": column, "result_format": RESULT_FORMAT},
+            )
+        )
+        configurations.append(
+            ExpectationConfiguration(
+                type="expect_column_values_to_be_between",
+                kwargs={
+                    "column": column,
+                    "min_value": -2,
+                    "max_value": 2,
+                    "result_format": RESULT_FORMAT,
+                },
+            )
+        )
+
+    return configurations
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("fuse_unexpected_rows_queries", [False, True])
+def test_sqlite_wide_table_map_expectations(
+    benchmark, pytestconfig, tmp_path, wide_df: pd.DataFrame, fuse_unexpected_rows_queries: bool
+) -> None:
+    if not pytestconfig.getoption("--performance-tests"):
+        pytest.skip("Requires --performance-tests option.")
+
+    sqlalchemy_engine = sa.create_engine(f"sqlite:///{tmp_path / 'wide.db'}")
+    add_dataframe_to_db(df=wide_df, name="wide", con=sqlalchemy_engine, index=False)
+
+    execution_engine = SqlAlchemyExecutionEngine(
+        engine=sqlalchemy_engine,
+        fuse_unexpected_rows_queries=fuse_unexpected_rows_queries,
+        caching=False,
+    )
+    batch = Batch(data=SqlAlchemyBatchData(execution_engine=execution_engine, table_name="wide"))  # type: ignore[arg-type] # got SqlAlchemyBatchData
+    validator = Validator(execution_engine=execution_engine, batches=[batch])
+    configurations = _expectation_configurations(columns=list(wide_df.columns[1:]))
+
+    results = benchmark.pedantic(
+        validator.graph_validate,
+        kwargs={"configurations": configurations},
+        rounds=3,
+        iterations=1,
+    )
+    assert len(results) == len(configurations)
@@ -0,0 +1,66 @@
+"""Benchmarks for "convert_to_json_serializable()" of typical metric and validation result values.
+
+Run with:
+    pytest tests/performance/test_json_serialization_benchmarks.py --performance-tests -p no:warnings
+
+Every benchmark also asserts parity of converted value with element-wise conversion (i.e., with output of
+"convert_to_json_serializable()" prior to its dtype-level fast paths).
+"""  # noqa: E501
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.util import convert_to_json_serializable
+
+NUM_VALUES: int = 100_000
+
+
+def _elementwise_conversion(data: Any) -> Any:
+    if isinstance(data, pd.Series):
+        index_name = data.index.name or "index"
+        value_name = data.name or "value"
+        return [
+            {
+                index_name: convert_to_json_serializable(idx),
+                value_name: convert_to_json_serializable(val),
+            }
+            for idx, val in data.items()
+        ]
+
+    return [convert_to_json_serializable(value) for value in data.tolist()]
+
+
+def _make_data() -> Dict[str, Callable[[], Any]]:
+    rng = np.random.default_rng(seed=42)
+    floats = rng.normal(size=NUM_VALUES)
+    floats[rng.random(size=NUM_VALUES) < 0.01] = np.nan
+    return {
+        "int_array": lambda: rng.integers(0, 1_000, size=NUM_VALUES),
+        "float_array": lambda: floats,
+        "bool_array": lambda: rng.random(size=NUM_VALUES) < 0.5,
+        "str_array": lambda: np.array([f"value_{idx % 100}" for idx in range(NUM_VALUES)]),
+        "str_object_array": lambda: np.array(
+            [f"value_{idx % 100}" for idx in range(NUM_VALUES)], dtype=object
+        ),
+        "datetime_array": lambda: np.arange(NUM_VALUES).astype("datetime64[s]"),
+        "value_counts_series": lambda: pd.Series(
+            rng.integers(0, 1_000, size=NUM_VALUES), name="count"
+        ).value_counts(),
+        "float_series": lambda: pd.Series(floats, name="value"),
+    }
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("data_name", list(_make_data()))
+def test_convert_to_json_serializable(benchmark, pytestconfig, data_name: str):
+    if not pytestconfig.getoption("--performance-tests"):
+        pytest.skip("Requires --performance-tests option.")
+
+    data = _make_data()[data_name]()
+    result = benchmark(convert_to_json_serializable, data)
+    assert result == _elementwise_conversion(data)
@@ -0,0 +1,366 @@
+"""Self-contained benchmarks (synthetic data, Pandas and SQLite only), which require neither network nor cloud resources.
+
+Run with:
+    tests/performance/run_offline_benchmarks.sh [BENCHMARK_JSON_FILE_NAME_PREFIX]
+
+or, for single run:
+    pytest tests/performance/test_offline_benchmarks.py --performance-tests -p no:warnings --benchmark-json=results.json
+
+Besides usual "pytest-benchmark" statistics, every benchmark records per-phase timings and peak memory under
+"extra_info"; results of two runs are compared with "tests/performance/compare_benchmarks.py".
+"""  # noqa: E501
+
+from __future__ import annotations
+
+import pathlib
+import tempfile
+from typing import TYPE_CHECKING, Callable, Dict, List
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import great_expectations as gx
+import great_expectations.expectations as gxe
+from great_expectations.checkpoint.checkpoint import Checkpoint, CheckpointResult
+from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
+from great_expectations.compatibility.sqlalchemy_compatibility_wrappers import (
+    add_dataframe_to_db,
+)
+from great_expectations.core import ExpectationSuiteValidationResult
+from great_expectations.core.batch import Batch
+from great_expectations.core.expectation_suite import ExpectationSuite
+from great_expectations.core.expectation_validation_result import (
+    ExpectationValidationResult,
+)
+from great_expectations.core.validation_definition import ValidationDefinition
+from great_expectations.data_context.store import ValidationResultsStore
+from great_expectations.data_context.types.resource_identifiers import (
+    ExpectationSuiteIdentifier,
+    ValidationResultIdentifier,
+)
+from great_expectations.execution_engine import (
+    ExecutionEngine,
+    PandasExecutionEngine,
+    SqlAlchemyExecutionEngine,
+)
+from great_expectations.execution_engine.sqlalchemy_batch_data import SqlAlchemyBatchData
+from great_expectations.expectations.expectation_configuration import (
+    ExpectationConfiguration,
+)
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.metrics_calculator import MetricsCalculator
+from great_expectations.validator.validator import Validator
+
+if TYPE_CHECKING:
+    from tests.performance.conftest import PhaseProfiler
+
+TABLE_SHAPES: Dict[str, Dict[str, int]] = {
+    "wide": {"num_rows": 10_000, "num_columns": 200},
+    "tall": {"num_rows": 1_000_000, "num_columns": 4},
+}
+
+
+def _synthetic_df(num_rows: int, num_columns: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed=42)
+    values = rng.normal(size=(num_rows, num_columns))
+    values[rng.random(size=values.shape) < 0.001] = np.nan
+    df = pd.DataFrame(values, columns=[f"col_{idx}" for idx in range(num_columns)])
+    df.insert(0, "pk", range(num_rows))
+    return df
+
+
+@pytest.fixture(scope="module")
+def synthetic_tables(tmp_path_factory, pytestconfig) -> Dict[str, Dict[str, object]]:
+    """Synthetic DataFrames and SQLite databases (built once per module, outside of timed code)."""
+    if not pytestconfig.getoption("--performance-tests"):
+        pytest.skip("Requires --performance-tests option.")
+
+    tables: Dict[str, Dict[str, object]] = {}
+    shape: str
+    for shape, dimensions in TABLE_SHAPES.items():
+        df: pd.DataFrame = _synthetic_df(**dimensions)
+        db_path: pathlib.Path = tmp_path_factory.mktemp(shape) / f"{shape}.db"
+        add_dataframe_to_db(
+            df=df, name=shape, con=sa.create_engine(f"sqlite:///{db_path}"), index=False
+        )
+        tables[shape] = {"df": df, "db_path": db_path}
+
+    return tables
+
+
+def _build_validator(backend: str, shape: str, tables: Dict[str, Dict[str, object]]) -> Validator:
+    execution_engine: ExecutionEngine
+    batch: Batch
+    if backend == "pandas":
+        execution_engine = PandasExecutionEngine()
+        batch = Batch(data=tables[shape]["df"])  # type: ignore[arg-type] # got DataFrame
+    else:
+        execution_engine = SqlAlchemyExecutionEngine(
+            engine=sa.create_engine(f"sqlite:///{tables[shape]['db_path']}")
+        )
+        batch = Batch(data=SqlAlchemyBatchData(execution_engine=execution_engine, table_name=shape))  # type: ignore[arg-type] # got SqlAlchemyBatchData
+
+    return Validator(execution_engine=execution_engine, batches=[batch])
+
+
+def _expectation_configurations(columns: List[str]) -> List[ExpectationConfiguration]:
+    """Map and aggregate Expectations (three per column)."""
+    configurations: List[ExpectationConfiguration] = []
+    for column in columns:
+        configurations.extend(
+            [
+                ExpectationConfiguration(
+                    type="expect_column_values_to_not_be_null", kwargs={"column": column}
+                ),
+                ExpectationConfiguration(
+                    type="expect_column_values_to_be_between",
+                    kwargs={"column": column, "min_value": -3, "max_value": 3},
+                ),
+                ExpectationConfiguration(
+                    type="expect_column_mean_to_be_between",
+                    kwargs={"column": column, "min_value": -1, "max_value": 1},
+                ),
+            ]
+        )
+
+    return configurations
+
+
+def _validate(
+    profiler: PhaseProfiler, backend: str, shape: str, tables: Dict[str, Dict[str, object]]
+) -> int:
+    with profiler.phase("load_batch"):
+        validator: Validator = _build_validator(backend=backend, shape=shape, tables=tables)
+
+    configurations = _expectation_configurations(columns=validator.columns()[1:])
+    with profiler.phase("graph_validate"):
+        results = validator.graph_validate(configurations=configurations)
+
+    return len(results)
+
+
+def _compute_metrics(
+    profiler: PhaseProfiler, backend: str, shape: str, tables: Dict[str, Dict[str, object]]
+) -> int:
+    with profiler.phase("load_batch"):
+        validator: Validator = _build_validator(backend=backend, shape=shape, tables=tables)
+
+    metric_configurations: List[MetricConfiguration] = [
+        MetricConfiguration(metric_name=metric_name, metric_domain_kwargs={"column": column})
+        for column in validator.columns()[1:]
+        for metric_name in ("column.mean", "column.min", "column.max", "column.median")
+    ]
+    with profiler.phase("compute_metrics"):
+        resolved_metrics, aborted_metrics_info = MetricsCalculator(
+            execution_engine=validator.execution_engine
+        ).compute_metrics(metric_configurations=metric_configurations)
+
+    assert aborted_metrics_info == {}
+    return len(resolved_metrics)
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("shape", list(TABLE_SHAPES))
+@pytest.mark.parametrize("backend", ["pandas", "sqlite"])
+def test_graph_validate(
+    run_phase_benchmark: Callable, synthetic_tables: dict, backend: str, shape: str
+) -> None:
+    num_results: int = run_phase_benchmark(
+        _validate, backend=backend, shape=shape, tables=synthetic_tables
+    )
+    assert num_results == 3 * TABLE_SHAPES[shape]["num_columns"]
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("shape", list(TABLE_SHAPES))
+@pytest.mark.parametrize("backend", ["pandas", "sqlite"])
+def test_metrics_calculator_compute_metrics(
+    run_phase_benchmark: Callable, synthetic_tables: dict, backend: str, shape: str
+) -> None:
+    num_metrics: int = run_phase_benchmark(
+        _compute_metrics, backend=backend, shape=shape, tables=synthetic_tables
+    )
+    assert num_metrics >= 4 * TABLE_SHAPES[shape]["num_columns"]
+
+
+def _build_and_resolve_suite_graph(
+    profiler: PhaseProfiler, df: pd.DataFrame, num_expectations: int
+) -> int:
+    validator = Validator(execution_engine=PandasExecutionEngine(), batches=[Batch(data=df)])  # type: ignore[arg-type] # got DataFrame
+    columns: List[str] = list(df.columns[1:])
+    configurations: List[ExpectationConfiguration] = [
+        ExpectationConfiguration(
+            type="expect_column_values_to_be_between",
+            kwargs={
+                "column": columns[idx % len(columns)],
+                "min_value": -(1 + idx // len(columns)),
+                "max_value": 1 + idx // len(columns),
+            },
+        )
+        for idx in range(num_expectations)
+    ]
+    metrics_calculator = MetricsCalculator(execution_engine=validator.execution_engine)
+
+    with profiler.phase("build_graph"):
+        metric_configurations: List[MetricConfiguration] = []
+        for configuration in configurations:
+            metric_configurations.extend(
+                configuration.to_domain_obj()
+                .get_validation_dependencies(execution_engine=validator.execution_engine)
+                .get_metric_configurations()
+            )
+        graph = metrics_calculator.build_metric_dependency_graph(
+            metric_configurations=metric_configurations
+        )
+
+    with profiler.phase("resolve"):
+        _, aborted_metrics_info = metrics_calculator.resolve_validation_graph(graph=graph)
+
+    assert aborted_metrics_info == {}
+    return len(graph.edges)
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("num_expectations", [1_000, 2_000])
+def test_suite_graph_build_and_resolve(
+    run_phase_benchmark: Callable, synthetic_tables: dict, num_expectations: int
+) -> None:
+    num_edges: int = run_phase_benchmark(
+        _build_and_resolve_suite_graph,
+        df=synthetic_tables["wide"]["df"],
+        num_expectations=num_expectations,
+    )
+    assert num_edges >= num_expectations
+
+
+def _validation_result(
+    suite_name: str, num_expectation_results: int
+) -> ExpectationSuiteValidationResult:
+    return ExpectationSuiteValidationResult(
+        success=True,
+        suite_name=suite_name,
+        results=[
+            ExpectationValidationResult(
+                success=True,
+                expectation_config=ExpectationConfiguration(
+                    type="expect_column_values_to_not_be_null",
+                    kwargs={"column": f"col_{idx}"},
+                ),
+                result={"element_count": 10_000, "unexpected_count": 0},
+            )
+            for idx in range(num_expectation_results)
+        ],
+        statistics={"evaluated_expectations": num_expectation_results},
+    )
+
+
+def _store_validation_results(
+    profiler: PhaseProfiler, base_directory: pathlib.Path, num_results: int
+) -> int:
+    store = ValidationResultsStore(
+        store_backend={
+            "class_name": "TupleFilesystemStoreBackend",
+            "base_directory": str(base_directory),
+        }
+    )
+    keys: List[ValidationResultIdentifier] = [
+        ValidationResultIdentifier(
+            expectation_suite_identifier=ExpectationSuiteIdentifier(name=f"suite_{idx % 10}"),
+            run_id=f"run_{idx}",
+            batch_identifier="batch",
+        )
+        for idx in range(num_results)
+    ]
+    value: ExpectationSuiteValidationResult = _validation_result(
+        suite_name="suite", num_expectation_results=20
+    )
+
+    with profiler.phase("set"):
+        for key in keys:
+            store.set(key, value)
+
+    with profiler.phase("list_keys"):
+        num_keys: int = len(store.list_keys())
+
+    with profiler.phase("get"):
+        for key in keys:
+            store.get(key)
+
+    with profiler.phase("remove"):
+        for key in keys:
+            store.remove_key(key)
+
+    return num_keys
+
+
+@pytest.mark.performance
+@pytest.mark.filterwarnings("ignore:String run_ids are deprecated*:DeprecationWarning")
+@pytest.mark.parametrize("num_results", [1_000, 2_000])
+def test_validation_results_store_io(
+    run_phase_benchmark: Callable, tmp_path: pathlib.Path, num_results: int
+) -> None:
+    num_keys: int = run_phase_benchmark(
+        _store_validation_results, base_directory=tmp_path, num_results=num_results
+    )
+    assert num_keys == num_results
+
+
+def _run_checkpoint(
+    profiler: PhaseProfiler,
+    project_root_dir: pathlib.Path,
+    df: pd.DataFrame,
+    num_validation_definitions: int,
+) -> CheckpointResult:
+    with profiler.phase("setup"):
+        # Every round starts from new (empty) project.
+        context = gx.get_context(
+            mode="file", project_root_dir=tempfile.mkdtemp(dir=project_root_dir)
+        )
+        batch_definition = (
+            context.data_sources.add_pandas("datasource")
+            .add_dataframe_asset("asset")
+            .add_batch_definition_whole_dataframe("batch_definition")
+        )
+        columns: List[str] = list(df.columns[1:])
+        validation_definitions: List[ValidationDefinition] = []
+        for idx in range(num_validation_definitions):
+            suite = context.suites.add(
+                ExpectationSuite(
+                    name=f"suite_{idx}",
+                    expectations=[
+                        gxe.ExpectColumnValuesToBeBetween(column=column, min_value=-5, max_value=5)
+                        for column in columns[idx::num_validation_definitions]
+                    ],
+                )
+            )
+            validation_definitions.append(
+                context.validation_definitions.add(
+                    ValidationDefinition(
+                        name=f"validation_definition_{idx}", data=batch_definition, suite=suite
+                    )
+                )
+            )
+        checkpoint = context.checkpoints.add(
+            Checkpoint(name="checkpoint", validation_definitions=validation_definitions)
+        )
+
+    with profiler.phase("run"):
+        return checkpoint.run(batch_parameters={"dataframe": df})
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("num_validation_definitions", [1, 10])
+def test_checkpoint_run(
+    run_phase_benchmark: Callable,
+    tmp_path: pathlib.Path,
+    synthetic_tables: dict,
+    num_validation_definitions: int,
+) -> None:
+    result: CheckpointResult = run_phase_benchmark(
+        _run_checkpoint,
+        project_root_dir=tmp_path,
+        df=synthetic_tables["wide"]["df"],
+        num_validation_definitions=num_validation_definitions,
+    )
+    assert len(result.run_results) == num_validation_definitions
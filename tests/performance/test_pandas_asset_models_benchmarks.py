@@ -0,0 +1,97 @@
+"""Benchmarks for generating the pandas "read_*" DataAsset models, which happens on `import great_expectations`.
+
+Run with:
+    pytest tests/performance/test_pandas_asset_models_benchmarks.py --performance-tests -p no:warnings --benchmark-json=results.json
+
+The import benchmark imports "pandas_datasource" in a fresh interpreter (see "scripts/check_import_time.py"), and adds
+the self time of the modules, which generate the models, to "extra_info" of benchmark JSON.
+"""  # noqa: E501
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, List, Type
+
+import pytest
+
+from great_expectations.datasource.fluent.data_asset.path.file_asset import FileDataAsset
+from great_expectations.datasource.fluent.data_asset.path.pandas.generated_assets import (
+    _FILE_PATH_ASSET_MODELS,
+    _PANDAS_FILE_TYPE_READER_METHOD_UNSUPPORTED_LIST,
+)
+from great_expectations.datasource.fluent.dynamic_pandas import (
+    _generate_pandas_data_asset_models,
+)
+from great_expectations.datasource.fluent.pandas_datasource import (
+    _PANDAS_ASSET_MODELS,
+    _PANDAS_READER_METHOD_UNSUPPORTED_LIST,
+    _PandasDataAsset,
+)
+from scripts.check_import_time import ModuleImportTime, measure_import_time
+
+if TYPE_CHECKING:
+    from great_expectations.datasource.fluent.interfaces import DataAsset
+    from tests.performance.conftest import PhaseProfiler
+
+MODEL_MODULES: List[str] = [
+    "great_expectations.datasource.fluent.pandas_datasource",
+    "great_expectations.datasource.fluent.data_asset.path.pandas.generated_assets",
+]
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize(
+    "base_model_class, blacklist, skip_first_param, expected_models",
+    [
+        pytest.param(
+            _PandasDataAsset,
+            _PANDAS_READER_METHOD_UNSUPPORTED_LIST,
+            False,
+            _PANDAS_ASSET_MODELS,
+            id="in_memory",
+        ),
+        pytest.param(
+            FileDataAsset,
+            _PANDAS_FILE_TYPE_READER_METHOD_UNSUPPORTED_LIST,
+            True,
+            _FILE_PATH_ASSET_MODELS,
+            id="file_path",
+        ),
+    ],
+)
+def test_generate_pandas_data_asset_models(
+    run_phase_benchmark,
+    base_model_class: Type[DataAsset],
+    blacklist: tuple,
+    skip_first_param: bool,
+    expected_models: Dict[str, Type[DataAsset]],
+) -> None:
+    def workload(profiler: PhaseProfiler) -> Dict[str, Type[DataAsset]]:
+        with profiler.phase("generate_models"):
+            return _generate_pandas_data_asset_models(
+                base_model_class,
+                blacklist=blacklist,
+                use_docstring_from_method=True,
+                skip_first_param=skip_first_param,
+            )
+
+    models = run_phase_benchmark(workload)
+    assert {type_name: model.schema() for type_name, model in models.items()} == {
+        type_name: model.schema() for type_name, model in expected_models.items()
+    }
+
+
+@pytest.mark.performance
+def test_import_pandas_datasource(request, run_phase_benchmark) -> None:
+    def workload(profiler: PhaseProfiler) -> List[ModuleImportTime]:
+        with profiler.phase("import"):
+            return measure_import_time(module_name=MODEL_MODULES[0])
+
+    import_times = run_phase_benchmark(workload, rounds=5)
+
+    self_ms_by_module: Dict[str, float] = {}
+    for import_time in import_times:
+        # The imported module is reported once more (as already loaded) by the final import.
+        if import_time.module_name in MODEL_MODULES:
+            self_ms_by_module.setdefault(import_time.module_name, import_time.self_us / 1_000)
+    assert sorted(self_ms_by_module) == sorted(MODEL_MODULES)
+    request.getfixturevalue("benchmark").extra_info["self_ms_by_module"] = self_ms_by_module
@@ -0,0 +1,109 @@
+"""Benchmarks for pandas partitioners and samplers, which previously mapped a Python function over every row.
+
+Run with:
+    pytest tests/performance/test_pandas_partitioner_benchmarks.py --performance-tests -p no:warnings
+
+Every benchmark also asserts parity of the partitioned rows with the per-row implementation (i.e., with the
+output of "Series.map" of a Python function, as prior to vectorization).
+"""  # noqa: E501
+
+from __future__ import annotations
+
+import hashlib
+from typing import Callable, Dict, Tuple
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.core.batch_spec import RuntimeDataBatchSpec
+from great_expectations.execution_engine.partition_and_sample.pandas_data_partitioner import (
+    PandasDataPartitioner,
+)
+from great_expectations.execution_engine.partition_and_sample.pandas_data_sampler import (
+    PandasDataSampler,
+)
+
+NUM_ROWS: int = 1_000_000
+
+# Pairs of (vectorized partitioning, per-row partitioning) of a DataFrame.
+PartitionerCase = Tuple[
+    Callable[[pd.DataFrame], pd.DataFrame], Callable[[pd.DataFrame], pd.DataFrame]
+]
+
+
+def _md5_suffix(value) -> str:
+    return hashlib.md5(str(value).encode()).hexdigest()[-1:]
+
+
+@pytest.fixture(scope="module")
+def large_df() -> pd.DataFrame:
+    rng = np.random.default_rng(seed=42)
+    return pd.DataFrame(
+        {
+            "id": np.arange(NUM_ROWS),
+            "user_id": rng.integers(0, 10_000, size=NUM_ROWS),
+            "timestamp": pd.Timestamp("2020-01-01")
+            + pd.to_timedelta(rng.integers(0, 3 * 365 * 24 * 3600, size=NUM_ROWS), unit="s"),
+            "category": rng.choice(["a", "b", "c", "d"], size=NUM_ROWS).astype(object),
+        }
+    )
+
+
+def _cases() -> Dict[str, PartitionerCase]:
+    partitioner = PandasDataPartitioner()
+    sampler = PandasDataSampler()
+    return {
+        "partition_on_hashed_column": (
+            lambda df: partitioner.partition_on_hashed_column(
+                df, column_name="user_id", hash_digits=1, batch_identifiers={"hash_value": "f"}
+            ),
+            lambda df: df[df["user_id"].map(lambda x: _md5_suffix(x) == "f")],
+        ),
+        "sample_using_hash": (
+            lambda df: sampler.sample_using_hash(
+                df,
+                RuntimeDataBatchSpec(batch_data=df, sampling_kwargs={"column_name": "user_id"}),
+            ),
+            lambda df: df[df["user_id"].map(lambda x: _md5_suffix(x) == "f")],
+        ),
+        "partition_on_converted_datetime": (
+            lambda df: partitioner.partition_on_converted_datetime(
+                df, column_name="timestamp", batch_identifiers={"timestamp": "2021-06-15"}
+            ),
+            lambda df: df[df["timestamp"].map(lambda x: x.strftime("%Y-%m-%d")) == "2021-06-15"],
+        ),
+        "partition_on_divided_integer": (
+            lambda df: partitioner.partition_on_divided_integer(
+                df, column_name="id", divisor=1_000, batch_identifiers={"id": 42}
+            ),
+            lambda df: df[df["id"].map(lambda x: int(x / 1_000) == 42)],
+        ),
+        "partition_on_mod_integer": (
+            lambda df: partitioner.partition_on_mod_integer(
+                df, column_name="id", mod=10, batch_identifiers={"id": 3}
+            ),
+            lambda df: df[df["id"].map(lambda x: x % 10 == 3)],
+        ),
+        "partition_on_multi_column_values": (
+            lambda df: partitioner.partition_on_multi_column_values(
+                df,
+                column_names=["category", "user_id"],
+                batch_identifiers={"category": "b", "user_id": 42},
+            ),
+            lambda df: df[(df["category"] == "b") & (df["user_id"] == 42)],
+        ),
+    }
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("case_name", list(_cases()))
+def test_pandas_partitioner(run_phase_benchmark, large_df: pd.DataFrame, case_name: str) -> None:
+    partition, partition_per_row = _cases()[case_name]
+
+    def workload(profiler) -> pd.DataFrame:
+        with profiler.phase("partition"):
+            return partition(large_df)
+
+    result = run_phase_benchmark(workload)
+    pd.testing.assert_frame_equal(result, partition_per_row(large_df))
@@ -0,0 +1,130 @@
+"""Benchmarks for rendering Data Docs pages of many validation results, one at a time and in worker processes.
+
+Run with:
+    pytest tests/performance/test_site_builder_benchmarks.py --performance-tests -p no:warnings --benchmark-json=results.json
+"""  # noqa: E501
+
+from __future__ import annotations
+
+import pathlib
+from typing import TYPE_CHECKING, Callable, Optional
+
+import pytest
+
+from great_expectations.core import ExpectationSuiteValidationResult
+from great_expectations.core.expectation_suite import ExpectationSuite
+from great_expectations.core.expectation_validation_result import (
+    ExpectationValidationResult,
+)
+from great_expectations.core.run_identifier import RunIdentifier
+from great_expectations.data_context import get_context
+from great_expectations.data_context.types.resource_identifiers import (
+    ExpectationSuiteIdentifier,
+    ValidationResultIdentifier,
+)
+from great_expectations.data_context.util import instantiate_class_from_config
+from great_expectations.expectations.expectation_configuration import (
+    ExpectationConfiguration,
+)
+
+if TYPE_CHECKING:
+    from great_expectations.data_context import FileDataContext
+    from tests.performance.conftest import PhaseProfiler
+
+NUM_VALIDATION_RESULTS: int = 5_000
+NUM_EXPECTATION_RESULTS: int = 10
+
+
+@pytest.fixture(scope="module")
+def context_with_validation_results(tmp_path_factory, pytestconfig) -> FileDataContext:
+    """File Data Context with "NUM_VALIDATION_RESULTS" validation results (stored once per module, outside of timed code)."""  # noqa: E501
+    if not pytestconfig.getoption("--performance-tests"):
+        pytest.skip("Requires --performance-tests option.")
+
+    context = get_context(
+        mode="file", project_root_dir=str(tmp_path_factory.mktemp("site_builder"))
+    )
+    context.suites.add(ExpectationSuite(name="suite"))
+    store = context.validation_results_store
+    for idx in range(NUM_VALIDATION_RESULTS):
+        key = ValidationResultIdentifier(
+            expectation_suite_identifier=ExpectationSuiteIdentifier(name="suite"),
+            run_id=RunIdentifier(
+                run_name=f"run_{idx}", run_time=f"2024-01-01T00:00:{idx % 60:02d}.{idx:06d}Z"
+            ),
+            batch_identifier="batch",
+        )
+        store.set(
+            key,
+            ExpectationSuiteValidationResult(
+                success=True,
+                suite_name="suite",
+                results=[
+                    ExpectationValidationResult(
+                        success=True,
+                        expectation_config=ExpectationConfiguration(
+                            type="expect_column_values_to_not_be_null",
+                            kwargs={"column": f"col_{column_idx}"},
+                        ),
+                        result={"element_count": 10_000, "unexpected_count": 0},
+                    )
+                    for column_idx in range(NUM_EXPECTATION_RESULTS)
+                ],
+                statistics={"evaluated_expectations": NUM_EXPECTATION_RESULTS},
+                meta={
+                    "run_id": key.run_id.to_json_dict(),
+                    "validation_time": key.run_id.run_time.strftime("%Y%m%dT%H%M%S.%fZ"),
+                    "active_batch_definition": {"data_asset_name": "asset"},
+                },
+            ),
+        )
+
+    return context
+
+
+def _render_validation_pages(
+    profiler: PhaseProfiler, context: FileDataContext, render_max_workers: Optional[int]
+) -> int:
+    site_builder = instantiate_class_from_config(
+        config={
+            **context.variables.data_docs_sites["local_site"],
+            "render_max_workers": render_max_workers,
+        },
+        runtime_environment={
+            "data_context": context,
+            "root_directory": context.root_directory,
+            "site_name": "local_site",
+        },
+        config_defaults={"module_name": "great_expectations.render.renderer.site_builder"},
+    )
+
+    # Every round renders all pages (i.e., build manifest of previous round is discarded).
+    with profiler.phase("clean_site"):
+        site_builder.clean_site()
+
+    with profiler.phase("render_validations"):
+        site_builder.site_section_builders["validations"].build()
+
+    return len(
+        list(
+            pathlib.Path(
+                context.root_directory, "uncommitted", "data_docs", "local_site", "validations"
+            ).rglob("*.html")
+        )
+    )
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("render_max_workers", [None, 2, 4])
+def test_render_validation_pages(
+    run_phase_benchmark: Callable,
+    context_with_validation_results: FileDataContext,
+    render_max_workers: Optional[int],
+) -> None:
+    num_pages: int = run_phase_benchmark(
+        _render_validation_pages,
+        rounds=1,
+        context=context_with_validation_results,
+        render_max_workers=render_max_workers,
+    )
+    assert num_pages == NUM_VALIDATION_RESULTS
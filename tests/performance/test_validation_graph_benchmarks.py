@@ -0,0 +1,87 @@
+"""Benchmarks for "ValidationGraph.resolve()" on large synthetic metric dependency graphs.
+
+Run with:
+    pytest tests/performance/test_validation_graph_benchmarks.py --performance-tests -p no:warnings
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Tuple, cast
+
+import pytest
+
+from great_expectations.execution_engine import ExecutionEngine
+from great_expectations.validator.computed_metric import MetricValue
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.validation_graph import MetricEdge, ValidationGraph
+
+# Number of metrics feeding into every metric of the next layer.
+FAN_IN: int = 4
+
+
+class _ExecutionEngineStub:
+    """Resolves every requested metric to a constant value, so that benchmarks measure graph scheduling only."""  # noqa: E501
+
+    def __init__(self) -> None:
+        self.num_waves = 0
+
+    # noinspection PyUnusedLocal
+    def resolve_metrics(
+        self,
+        metrics_to_resolve: Iterable[MetricConfiguration],
+        metrics: Optional[Dict[Tuple[str, str, str], MetricValue]] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        self.num_waves += 1
+        return {metric_configuration.id: 0 for metric_configuration in metrics_to_resolve}
+
+
+def _build_layered_graph(num_edges: int, num_layers: int = 10) -> ValidationGraph:
+    """Builds DAG of "num_layers" layers, in which every metric depends on "FAN_IN" metrics of previous layer."""  # noqa: E501
+    layer_width: int = max(FAN_IN, num_edges // (FAN_IN * (num_layers - 1)))
+
+    layers: List[List[MetricConfiguration]] = [
+        [
+            MetricConfiguration(
+                metric_name=f"synthetic.metric_{layer_idx}",
+                metric_domain_kwargs={"column": f"column_{column_idx}"},
+                metric_value_kwargs={"layer": layer_idx, "position": column_idx},
+            )
+            for column_idx in range(layer_width)
+        ]
+        for layer_idx in range(num_layers)
+    ]
+
+    edges: List[MetricEdge] = [MetricEdge(left=metric) for metric in layers[0]]
+    for previous_layer, layer in zip(layers, layers[1:]):
+        for position, metric in enumerate(layer):
+            for offset in range(FAN_IN):
+                edges.append(
+                    MetricEdge(
+                        left=metric,
+                        right=previous_layer[(position + offset) % layer_width],
+                    )
+                )
+
+    return ValidationGraph(
+        execution_engine=cast(ExecutionEngine, _ExecutionEngineStub()), edges=edges
+    )
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("num_edges", [10_000, 50_000, 100_000])
+def test_validation_graph_resolve(benchmark, pytestconfig, num_edges: int) -> None:
+    if not pytestconfig.getoption("--performance-tests"):
+        pytest.skip("Requires --performance-tests option.")
+
+    graph: ValidationGraph = _build_layered_graph(num_edges=num_edges)
+
+    resolved_metrics, aborted_metrics_info = benchmark.pedantic(
+        graph.resolve,
+        kwargs={"show_progress_bars": False},
+        rounds=3,
+        iterations=1,
+    )
+
+    assert len(resolved_metrics) == len({edge.left.id for edge in graph.edges})
+    assert aborted_metrics_info == {}
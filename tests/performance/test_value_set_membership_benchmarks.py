@@ -0,0 +1,80 @@
+"""Benchmarks for membership metrics of large value sets, which are semi-joined rather than inlined as literal lists.
+
+Run with:
+    pytest tests/performance/test_value_set_membership_benchmarks.py --performance-tests -p no:warnings --benchmark-json=results.json
+
+Every benchmark also asserts parity with literal lists (i.e., with "value_set_semi_join_threshold" above size of value set).
+"""  # noqa: E501
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, List
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.self_check.util import build_pandas_engine, build_sa_execution_engine
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.metrics_calculator import MetricsCalculator
+
+if TYPE_CHECKING:
+    from great_expectations.execution_engine import ExecutionEngine
+    from tests.performance.conftest import PhaseProfiler
+
+NUM_ROWS: int = 1_000_000
+NUM_CODES: int = 40_000
+# SQLite binds at most 32,766 parameters per statement, which caps size of literal lists.
+VALUE_SET_SIZE: int = 20_000
+
+
+@pytest.fixture(scope="module")
+def codes_df() -> pd.DataFrame:
+    rng = np.random.default_rng(seed=42)
+    return pd.DataFrame({"code": [f"code_{idx}" for idx in rng.integers(0, NUM_CODES, NUM_ROWS)]})
+
+
+def _compute_unexpected_counts(engine: ExecutionEngine, value_set: List[str]) -> List[Any]:
+    metrics: List[MetricConfiguration] = [
+        MetricConfiguration(
+            metric_name=f"{metric_name_prefix}.unexpected_count",
+            metric_domain_kwargs={"column": "code"},
+            metric_value_kwargs={"value_set": value_set},
+        )
+        for metric_name_prefix in ["column_values.in_set", "column_values.not_in_set"]
+    ]
+    results, aborted_metrics = MetricsCalculator(execution_engine=engine).compute_metrics(
+        metric_configurations=metrics, min_graph_edges_pbar_enable=1_000
+    )
+    engine.release_validation_resources()
+    assert aborted_metrics == {}
+    return [results[metric.id] for metric in metrics]
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("backend", ["pandas", "sqlite"])
+def test_large_value_set_membership(
+    run_phase_benchmark, sa, codes_df: pd.DataFrame, backend: str
+) -> None:
+    value_set: List[str] = [f"code_{idx}" for idx in range(0, 2 * VALUE_SET_SIZE, 2)]
+
+    def _build_engine(value_set_semi_join_threshold: int) -> ExecutionEngine:
+        if backend == "pandas":
+            return build_pandas_engine(
+                codes_df, value_set_semi_join_threshold=value_set_semi_join_threshold
+            )
+
+        return build_sa_execution_engine(
+            codes_df, sa, value_set_semi_join_threshold=value_set_semi_join_threshold
+        )
+
+    engine: ExecutionEngine = _build_engine(value_set_semi_join_threshold=VALUE_SET_SIZE - 1)
+
+    def workload(profiler: PhaseProfiler) -> List[Any]:
+        with profiler.phase("compute_metrics"):
+            return _compute_unexpected_counts(engine, value_set)
+
+    unexpected_counts = run_phase_benchmark(workload)
+    assert unexpected_counts == _compute_unexpected_counts(
+        _build_engine(value_set_semi_join_threshold=VALUE_SET_SIZE), value_set
+    )
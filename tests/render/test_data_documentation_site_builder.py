@@ -1,18 +1,32 @@
 import os
+import pathlib
+import re
 import shutil
-from typing import Dict
+from typing import Dict, Tuple
 
 import pytest
 
+import great_expectations.expectations as gxe
+from great_expectations.core import ExpectationSuite, ExpectationSuiteValidationResult
+from great_expectations.core.run_identifier import RunIdentifier
 from great_expectations.data_context import get_context
 from great_expectations.data_context.data_context.file_data_context import (
     FileDataContext,
 )
 from great_expectations.data_context.store import ExpectationsStore, ValidationResultsStore
+from great_expectations.data_context.types.resource_identifiers import (
+    ExpectationSuiteIdentifier,
+    ValidationResultIdentifier,
+)
 from great_expectations.data_context.util import (
     file_relative_path,
     instantiate_class_from_config,
 )
+from great_expectations.render.renderer import ExpectationSuitePageRenderer
+from great_expectations.render.renderer.site_builder import (
+    DefaultSiteSectionBuilder,
+    _get_many_skipping_failed_keys,
+)
 
 # module level markers
 pytestmark = pytest.mark.filesystem
@@ -125,3 +139,259 @@ def test_site_builder_with_custom_site_section_builders_config(tmp_path_factory)
     profiling_site_section_builder = site_section_builders["profiling"]
     assert isinstance(validations_site_section_builder.source_store, ExpectationsStore)
     assert profiling_site_section_builder.run_name_filter == {"equals": "custom_profiling_filter"}
+
+
+@pytest.fixture
+def context_with_validation_result(tmp_path):
+    context = get_context(mode="file", project_root_dir=str(tmp_path))
+    context.suites.add(ExpectationSuite(name="my_suite"))
+    validation_result_key = ValidationResultIdentifier(
+        expectation_suite_identifier=ExpectationSuiteIdentifier(name="my_suite"),
+        run_id=RunIdentifier(run_name="my_run", run_time="20240101T000000.000000Z"),
+        batch_identifier="my_batch",
+    )
+    context.validation_results_store.set(
+        validation_result_key,
+        ExpectationSuiteValidationResult(
+            success=True,
+            results=[],
+            suite_name="my_suite",
+            meta={
+                "run_id": validation_result_key.run_id.to_json_dict(),
+                "validation_time": "20240101T000000.000000Z",
+                "active_batch_definition": {"data_asset_name": "my_asset"},
+            },
+        ),
+    )
+    return context
+
+
+def _build_local_site(context, mocker, **site_config) -> Tuple[Dict, Dict[str, int]]:
+    """Builds "local_site" (with given config overrides) by new SiteBuilder; returns index links and number of pages rendered per section."""  # noqa: E501
+    site_builder = instantiate_class_from_config(
+        config={**context.variables.data_docs_sites["local_site"], **site_config},
+        runtime_environment={
+            "data_context": context,
+            "root_directory": context.root_directory,
+            "site_name": "local_site",
+        },
+        config_defaults={"module_name": "great_expectations.render.renderer.site_builder"},
+    )
+    render_spies = {
+        section_name: mocker.spy(site_section_builder.renderer_class, "render")
+        for section_name, site_section_builder in site_builder.site_section_builders.items()
+    }
+    _, index_links_dict = site_builder.build()
+    return index_links_dict, {
+        section_name: render_spy.call_count for section_name, render_spy in render_spies.items()
+    }
+
+
+def test_site_builder_build_renders_only_new_or_changed_resources(
+    context_with_validation_result, mocker
+):
+    context = context_with_validation_result
+
+    _, num_rendered_pages = _build_local_site(context, mocker)
+    assert num_rendered_pages == {"expectations": 1, "validations": 1, "profiling": 0}
+
+    deserialize_spy = mocker.spy(ValidationResultsStore, "deserialize")
+    index_links_dict, num_rendered_pages = _build_local_site(context, mocker)
+
+    assert num_rendered_pages == {"expectations": 0, "validations": 0, "profiling": 0}
+    # Index page is built from summaries, recorded in build manifest.
+    assert deserialize_spy.call_count == 0
+    [validation_link] = index_links_dict["validations_links"]
+    assert validation_link["validation_success"] is True
+    assert validation_link["asset_name"] == "my_asset"
+
+    suite = context.suites.get("my_suite")
+    suite.add_expectation(gxe.ExpectColumnToExist(column="a"))
+    _, num_rendered_pages = _build_local_site(context, mocker)
+
+    assert num_rendered_pages == {"expectations": 1, "validations": 0, "profiling": 0}
+
+
+def test_site_builder_build_rerenders_deleted_pages(context_with_validation_result, mocker):
+    context = context_with_validation_result
+    _build_local_site(context, mocker)
+
+    site_directory = pathlib.Path(context.root_directory, "uncommitted", "data_docs", "local_site")
+    [suite_page] = site_directory.joinpath("expectations").rglob("*.html")
+    suite_page.unlink()
+    _, num_rendered_pages = _build_local_site(context, mocker)
+
+    assert num_rendered_pages == {"expectations": 1, "validations": 0, "profiling": 0}
+    assert suite_page.exists()
+
+
+def test_site_builder_build_rerenders_pages_once_custom_styles_change(
+    context_with_validation_result, mocker
+):
+    context = context_with_validation_result
+    styles_directory = pathlib.Path(context.plugins_directory, "custom_data_docs", "styles")
+    styles_directory.mkdir(parents=True, exist_ok=True)
+    styles_directory.joinpath("data_docs_custom_styles.css").write_text("body { color: red; }")
+    _build_local_site(context, mocker)
+
+    _, num_rendered_pages = _build_local_site(context, mocker)
+    assert num_rendered_pages == {"expectations": 0, "validations": 0, "profiling": 0}
+
+    styles_directory.joinpath("data_docs_custom_styles.css").write_text("body { color: blue; }")
+    _, num_rendered_pages = _build_local_site(context, mocker)
+    assert num_rendered_pages == {"expectations": 1, "validations": 1, "profiling": 0}
+
+
+def test_site_builder_build_rerenders_pages_once_section_config_changes(
+    context_with_validation_result, mocker
+):
+    context = context_with_validation_result
+    _build_local_site(context, mocker)
+
+    _, num_rendered_pages = _build_local_site(
+        context,
+        mocker,
+        site_section_builders={
+            "expectations": {
+                "renderer": {
+                    "class_name": "ExpectationSuitePageRenderer",
+                    "column_section_renderer": {
+                        "class_name": "ExpectationSuiteColumnSectionRenderer"
+                    },
+                }
+            }
+        },
+    )
+
+    assert num_rendered_pages == {"expectations": 1, "validations": 0, "profiling": 0}
+
+
+def test_site_builder_clean_site_discards_build_manifest(context_with_validation_result, mocker):
+    context = context_with_validation_result
+    _build_local_site(context, mocker)
+
+    context.clean_data_docs(site_name="local_site")
+    _, num_rendered_pages = _build_local_site(context, mocker)
+
+    assert num_rendered_pages == {"expectations": 1, "validations": 1, "profiling": 0}
+
+
+def _build_local_site_pages(context, **site_config) -> Dict[str, str]:
+    """Builds "local_site" (with given config overrides) from scratch; returns its section pages by path."""  # noqa: E501
+    site_builder = instantiate_class_from_config(
+        config={**context.variables.data_docs_sites["local_site"], **site_config},
+        runtime_environment={
+            "data_context": context,
+            "root_directory": context.root_directory,
+            "site_name": "local_site",
+        },
+        config_defaults={"module_name": "great_expectations.render.renderer.site_builder"},
+    )
+    site_builder.clean_site()
+    site_builder.build()
+    site_directory = pathlib.Path(context.root_directory, "uncommitted", "data_docs", "local_site")
+    return {
+        # Timestamps and generated element ids differ between builds.
+        str(page_path.relative_to(site_directory)): re.sub(
+            r"\?d=\d{8}T\d{6}\.\d{6}Z|-[0-9a-f]{8}(-[0-9a-f]{4}){3}-[0-9a-f]{12}",
+            "",
+            page_path.read_text(),
+        )
+        for section_name in ("expectations", "validations")
+        for page_path in site_directory.joinpath(section_name).rglob("*.html")
+    }
+
+
+def test_site_builder_build_renders_pages_in_worker_processes(context_with_validation_result):
+    context = context_with_validation_result
+    context.suites.add(ExpectationSuite(name="my_other_suite"))
+
+    sequentially_rendered_pages = _build_local_site_pages(context)
+    concurrently_rendered_pages = _build_local_site_pages(context, render_max_workers=2)
+
+    assert len(concurrently_rendered_pages) == 3
+    assert concurrently_rendered_pages == sequentially_rendered_pages
+
+
+def test_site_builder_build_in_worker_processes_honors_validation_results_limit(
+    context_with_validation_result,
+):
+    context = context_with_validation_result
+    [validation_result_key] = context.validation_results_store.list_keys()
+    validation_result = context.validation_results_store.get(validation_result_key)
+    validation_result_keys = [
+        ValidationResultIdentifier(
+            expectation_suite_identifier=validation_result_key.expectation_suite_identifier,
+            run_id=RunIdentifier(run_name="my_run", run_time=f"2024010{day}T000000.000000Z"),
+            batch_identifier="my_batch",
+        )
+        for day in (2, 3)
+    ]
+    for key in validation_result_keys:
+        context.validation_results_store.set(key, validation_result)
+
+    pages = _build_local_site_pages(
+        context,
+        render_max_workers=2,
+        site_index_builder={"class_name": "DefaultSiteIndexBuilder", "validation_results_limit": 2},
+    )
+
+    assert sorted(page_path for page_path in pages if page_path.startswith("validations")) == [
+        os.path.join("validations", *key.to_tuple()) + ".html"  # noqa: PTH118
+        for key in sorted(validation_result_keys, key=lambda key: key.run_id.run_time)
+    ]
+
+
+class CustomExpectationSuitePageRenderer(ExpectationSuitePageRenderer):
+    pass
+
+
+def test_site_builder_renders_custom_renderer_pages_in_this_process(
+    context_with_validation_result, mocker
+):
+    render_in_worker_processes = mocker.spy(
+        DefaultSiteSectionBuilder, "_render_in_worker_processes"
+    )
+
+    pages = _build_local_site_pages(
+        context_with_validation_result,
+        render_max_workers=2,
+        site_section_builders={
+            "expectations": {
+                "renderer": {
+                    "module_name": __name__,
+                    "class_name": "CustomExpectationSuitePageRenderer",
+                }
+            }
+        },
+    )
+
+    # Only sections with built-in renderers are rendered by worker processes.
+    assert sorted(call.args[0].name for call in render_in_worker_processes.call_args_list) == [
+        "profiling",
+        "validations",
+    ]
+    assert any(page_path.startswith("expectations") for page_path in pages)
+
+
+def test_site_builder_with_non_positive_render_max_workers_raises_error(
+    context_with_validation_result,
+):
+    with pytest.raises(ValueError, match="render_max_workers must be positive"):
+        _build_local_site_pages(context_with_validation_result, render_max_workers=0)
+
+
+def test_get_many_skipping_failed_keys_retrieves_remaining_keys_one_by_one(mocker):
+    def _get_many(keys, skip_failed_keys):
+        yield "first", 1
+        raise ValueError("Corrupt value.")
+
+    store = mocker.Mock(spec=ValidationResultsStore)
+    store.get_many.side_effect = _get_many
+    store.get.side_effect = lambda key: {"second": 2}[key]
+
+    assert list(_get_many_skipping_failed_keys(store=store, keys=["first", "second", "third"])) == [
+        ("first", 1),
+        ("second", 2),
+    ]
+    assert store.get.call_args_list == [mocker.call("second"), mocker.call("third")]
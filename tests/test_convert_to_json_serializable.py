@@ -1,6 +1,7 @@
 import re
 
 import numpy as np
+import pandas as pd
 import pytest
 
 from great_expectations.util import convert_to_json_serializable
@@ -63,3 +64,52 @@ def test_serialization_of_pattern():
     pattern_to_test = r"data_(?P<year>\d{4})-(?P<month>\d{2}).csv"
     data = re.compile(pattern_to_test)
     assert convert_to_json_serializable(data) == pattern_to_test
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "data",
+    [
+        pytest.param(np.arange(5), id="int"),
+        pytest.param(np.array([1.5, np.nan, np.inf]), id="float"),
+        pytest.param(np.array([True, False]), id="bool"),
+        pytest.param(np.array(["a", "bc"]), id="str"),
+        pytest.param(np.array(["a", None, np.nan, 1], dtype=object), id="object"),
+        pytest.param(np.array(["2022-12-08", "NaT"], dtype="datetime64[s]"), id="datetime"),
+        pytest.param(np.arange(6).reshape(2, 3), id="2d"),
+        pytest.param(pd.Index(["a", "b"]), id="index"),
+        pytest.param(pd.DatetimeIndex(["2022-12-08", None]), id="datetime_index"),
+    ],
+)
+def test_serialization_of_array_matches_serialization_of_its_elements(data):
+    assert convert_to_json_serializable(data) == [
+        convert_to_json_serializable(value) for value in data.tolist()
+    ]
+
+
+@pytest.mark.unit
+def test_serialization_of_series():
+    data = pd.Series([1.5, np.nan, 3.0], name="value", index=pd.Index(["a", "b", "c"], name="key"))
+    assert convert_to_json_serializable(data) == [
+        {"key": "a", "value": 1.5},
+        {"key": "b", "value": None},
+        {"key": "c", "value": 3.0},
+    ]
+
+
+@pytest.mark.unit
+def test_serialization_of_datetime_series():
+    data = pd.Series(pd.to_datetime(["2022-12-08 12:56:23", None]))
+    assert convert_to_json_serializable(data) == [
+        {"index": 0, "value": "2022-12-08T12:56:23"},
+        {"index": 1, "value": "NaT"},
+    ]
+
+
+@pytest.mark.unit
+def test_serialization_of_unrecognized_type_raises_type_error():
+    class Unrecognized:
+        pass
+
+    with pytest.raises(TypeError, match="Unrecognized which cannot be serialized"):
+        convert_to_json_serializable(Unrecognized())
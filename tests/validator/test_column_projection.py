@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from typing import List, Optional
+
+import pytest
+
+import great_expectations.expectations as gxe
+from great_expectations.expectations.expectation_configuration import (
+    ExpectationConfiguration,
+)
+from great_expectations.validator.column_projection import get_referenced_columns
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "expectations, expected_columns",
+    [
+        pytest.param(
+            [
+                gxe.ExpectColumnValuesToNotBeNull(column="a"),
+                gxe.ExpectColumnPairValuesToBeEqual(column_A="b", column_B="a"),
+                gxe.ExpectCompoundColumnsToBeUnique(column_list=["c", "d"]),
+            ],
+            ["a", "b", "c", "d"],
+            id="domain_columns",
+        ),
+        pytest.param(
+            [
+                gxe.ExpectColumnValuesToBeBetween(
+                    column="a",
+                    min_value=0,
+                    row_condition='col("b")=="x"',
+                    condition_parser="great_expectations",
+                ),
+            ],
+            ["a", "col", "b", "x"],
+            id="row_condition_tokens",
+        ),
+        pytest.param(
+            [
+                gxe.ExpectTableRowCountToEqual(value=3),
+                gxe.ExpectTableColumnsToMatchSet(column_set=["a", "b"]),
+                gxe.ExpectColumnToExist(column="b"),
+            ],
+            [],
+            id="schema_only_table_expectations",
+        ),
+        pytest.param(
+            [
+                gxe.ExpectColumnValuesToNotBeNull(column="a"),
+                gxe.UnexpectedRowsExpectation(unexpected_rows_query="SELECT * FROM {batch}"),
+            ],
+            None,
+            id="table_expectation_reading_rows",
+        ),
+    ],
+)
+def test_get_referenced_columns(
+    expectations: List[gxe.Expectation], expected_columns: Optional[List[str]]
+):
+    assert (
+        get_referenced_columns([expectation.configuration for expectation in expectations])
+        == expected_columns
+    )
+
+
+@pytest.mark.unit
+def test_get_referenced_columns_includes_unexpected_index_columns():
+    configuration = ExpectationConfiguration(
+        type="expect_column_values_to_not_be_null",
+        kwargs={"column": "a", "result_format": {"unexpected_index_column_names": ["c"]}},
+    )
+
+    assert get_referenced_columns(
+        [configuration], result_format={"unexpected_index_column_names": ["id"]}
+    ) == ["id", "a", "c"]
+
+
+@pytest.mark.unit
+def test_get_referenced_columns_with_unexpected_rows_requires_all_columns():
+    configuration = gxe.ExpectColumnValuesToNotBeNull(column="a").configuration
+
+    assert (
+        get_referenced_columns(
+            [configuration],
+            result_format={"result_format": "COMPLETE", "include_unexpected_rows": True},
+        )
+        is None
+    )
+
+
+@pytest.mark.unit
+def test_get_referenced_columns_of_unknown_expectation_requires_all_columns():
+    configuration = ExpectationConfiguration(
+        type="expect_column_values_to_be_unknown", kwargs={"column": "a"}
+    )
+
+    assert get_referenced_columns([configuration]) is None
+
+
+@pytest.mark.unit
+def test_get_referenced_columns_with_parameterized_column_requires_all_columns():
+    configuration = ExpectationConfiguration(
+        type="expect_column_values_to_not_be_null", kwargs={"column": {"$PARAMETER": "name"}}
+    )
+
+    assert get_referenced_columns([configuration]) is None
@@ -1,6 +1,7 @@
 import pytest
 
-from great_expectations.core import Domain
+from great_expectations.core import Domain, IDDict
+from great_expectations.core.batch_spec import PandasBatchSpec
 from great_expectations.core.metric_domain_types import MetricDomainTypes
 from great_expectations.validator.metric_configuration import MetricConfiguration
 
@@ -63,3 +64,66 @@ def test_metric_configuration_get_domain(
             "column": "my_column",
         },
     )
+
+
+@pytest.mark.unit
+def test_metric_configuration_id_is_recomputed_after_kwargs_mutation() -> None:
+    metric_configuration = MetricConfiguration(
+        metric_name="column.quantile_values",
+        metric_domain_kwargs={"column": "a", "batch_id": "abc123"},
+        metric_value_kwargs={"quantiles": [0.25, 0.5]},
+    )
+    original_id = metric_configuration.id
+    assert metric_configuration.id is not None
+    assert metric_configuration.metric_domain_kwargs._cached_id is not None
+
+    metric_configuration.metric_value_kwargs["allow_relative_error"] = False
+    assert metric_configuration.metric_value_kwargs._cached_id is None
+    assert metric_configuration.id != original_id
+
+    metric_configuration.metric_value_kwargs.pop("allow_relative_error")
+    assert metric_configuration.id == original_id
+
+    metric_configuration.metric_domain_kwargs.update({"row_condition": 'col("a")>1'})
+    assert metric_configuration.id[1] != original_id[1]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        pytest.param(lambda d: d.__setitem__("b", 2), id="setitem"),
+        pytest.param(lambda d: d.__delitem__("a"), id="delitem"),
+        pytest.param(lambda d: d.update(b=2), id="update"),
+        pytest.param(lambda d: d.__ior__({"b": 2}), id="ior"),
+        pytest.param(lambda d: d.setdefault("b", 2), id="setdefault"),
+        pytest.param(lambda d: d.pop("a"), id="pop"),
+        pytest.param(lambda d: d.popitem(), id="popitem"),
+        pytest.param(lambda d: d.clear(), id="clear"),
+    ],
+)
+def test_id_dict_mutation_invalidates_memoized_id(mutate) -> None:
+    id_dict = IDDict({"a": 1})
+    assert id_dict.to_id() == "a=1"
+
+    mutate(id_dict)
+
+    assert id_dict.to_id() == IDDict(dict(id_dict)).to_id()
+
+
+@pytest.mark.unit
+def test_id_dict_memoized_id_does_not_leak_into_dot_dict_items() -> None:
+    batch_spec = PandasBatchSpec(reader_method="read_csv")
+    assert batch_spec.to_id() == "reader_method=read_csv"
+    assert dict(batch_spec) == {"reader_method": "read_csv"}
+
+
+@pytest.mark.unit
+def test_id_dict_id_of_large_single_value_is_digest() -> None:
+    value_set = list(range(10_000))
+    id_ = IDDict({"value_set": value_set}).to_id()
+
+    assert id_.startswith("value_set=md5:")
+    assert len(id_) < 100
+    assert id_ == IDDict({"value_set": list(range(10_000))}).to_id()
+    assert id_ != IDDict({"value_set": list(range(10_001))}).to_id()
@@ -4,6 +4,7 @@ from copy import copy
 from pprint import pformat as pf
 from unittest import mock
 
+import pandas as pd
 import pytest
 
 import great_expectations.expectations as gxe
@@ -278,3 +279,62 @@ def test_cloud_validate_renders_results_when_appropriate(
 
     assert len(result.results) == 1
     assert result.results[0].rendered_content
+
+
+@pytest.fixture
+def csv_batch_definition(
+    tmp_path, ephemeral_context_with_defaults: AbstractDataContext
+) -> BatchDefinition:
+    pd.DataFrame(
+        {"a": [1, 2, 3], "b": ["x", "y", "z"], "c": [1.5, None, 3.5], "d": [0, 0, 0]}
+    ).to_csv(tmp_path / "data.csv", index=False)
+    return (
+        ephemeral_context_with_defaults.data_sources.add_pandas_filesystem(
+            name="csv_datasource", base_directory=tmp_path
+        )
+        .add_csv_asset(name="csv_asset")
+        .add_batch_definition_path(name="csv_batch_definition", path="data.csv")
+    )
+
+
+@pytest.mark.filesystem
+def test_validate_expectation_suite_with_column_projection(
+    csv_batch_definition: BatchDefinition,
+):
+    suite = ExpectationSuite(
+        name="test_suite",
+        expectations=[
+            gxe.ExpectColumnValuesToNotBeNull(column="a"),
+            gxe.ExpectColumnValuesToNotBeNull(
+                column="c", row_condition='b=="x"', condition_parser="pandas"
+            ),
+            gxe.ExpectTableColumnsToMatchOrderedList(column_list=["a", "b", "c", "d"]),
+            gxe.ExpectTableRowCountToEqual(value=3),
+        ],
+    )
+    validator = Validator(batch_definition=csv_batch_definition, project_columns=True)
+
+    result = validator.validate_expectation_suite(suite)
+
+    assert result.success
+    assert result.meta["batch_spec"]["columns"] == ["a", "c", "b", "x"]
+    batch_data = validator._wrapped_validator.execution_engine.batch_manager.active_batch_data
+    assert list(batch_data.dataframe.columns) == ["a", "b", "c"]
+    assert batch_data.source_columns == ["a", "b", "c", "d"]
+    unprojected_result = Validator(
+        batch_definition=csv_batch_definition
+    ).validate_expectation_suite(suite)
+    assert [r.result for r in result.results] == [r.result for r in unprojected_result.results]
+
+
+@pytest.mark.filesystem
+def test_validate_expectation_with_column_projection_reloads_batch_for_new_columns(
+    csv_batch_definition: BatchDefinition,
+):
+    validator = Validator(batch_definition=csv_batch_definition, project_columns=True)
+
+    assert validator.validate_expectation(gxe.ExpectColumnValuesToNotBeNull(column="a")).success
+    assert not validator.validate_expectation(gxe.ExpectColumnValuesToNotBeNull(column="c")).success
+
+    batch_data = validator._wrapped_validator.execution_engine.batch_manager.active_batch_data
+    assert list(batch_data.dataframe.columns) == ["a", "c"]
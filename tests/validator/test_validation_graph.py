@@ -19,6 +19,7 @@ from great_expectations.validator.validation_graph import (
     ExpectationValidationGraph,
     MetricEdge,
     ValidationGraph,
+    _MetricResolutionScheduler,
 )
 from great_expectations.validator.validator import ValidationDependencies
 
@@ -291,30 +292,73 @@ def test_ExpectationValidationGraph_get_exception_info(
 
 
 @pytest.mark.unit
-def test_parse_validation_graph(
+def test_resolution_scheduler_ready_and_needed_metrics(
     expect_column_value_z_scores_to_be_less_than_expectation_validation_graph: ValidationGraph,
 ):
+    graph = expect_column_value_z_scores_to_be_less_than_expectation_validation_graph
+
     available_metrics: Dict[Tuple[str, str, str], MetricValue]
 
-    # Parse input "ValidationGraph" object and confirm the numbers of ready and still needed metrics.  # noqa: E501
+    # Index input "ValidationGraph" object and confirm numbers of ready and still needed metrics.
     available_metrics = {}
-    (
-        ready_metrics,
-        needed_metrics,
-    ) = expect_column_value_z_scores_to_be_less_than_expectation_validation_graph._parse(
-        metrics=available_metrics
-    )
-    assert len(ready_metrics) == 2 and len(needed_metrics) == 9
+    scheduler = _MetricResolutionScheduler(edges=graph.edges, metrics=available_metrics)
+    assert len(scheduler.ready_metrics) == 2 and len(scheduler.needed_metrics) == 9
 
     # Show that including "nonexistent" metric in dictionary of resolved metrics does not increase ready_metrics count.  # noqa: E501
     available_metrics = {("nonexistent", "nonexistent", "nonexistent"): "NONE"}
-    (
-        ready_metrics,
-        needed_metrics,
-    ) = expect_column_value_z_scores_to_be_less_than_expectation_validation_graph._parse(
-        metrics=available_metrics
-    )
-    assert len(ready_metrics) == 2 and len(needed_metrics) == 9
+    scheduler = _MetricResolutionScheduler(edges=graph.edges, metrics=available_metrics)
+    assert len(scheduler.ready_metrics) == 2 and len(scheduler.needed_metrics) == 9
+
+
+@pytest.mark.unit
+def test_resolution_scheduler_hands_out_metrics_after_their_dependencies(
+    expect_column_value_z_scores_to_be_less_than_expectation_validation_graph: ValidationGraph,
+):
+    graph = expect_column_value_z_scores_to_be_less_than_expectation_validation_graph
+
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+    scheduler = _MetricResolutionScheduler(edges=graph.edges, metrics=metrics)
+
+    # Resolve graph one wave at a time and confirm that every ready metric has all dependencies resolved.  # noqa: E501
+    num_waves = 0
+    while scheduler.ready_metrics:
+        ready_metrics = scheduler.ready_metrics
+        ready_metric_ids = {metric.id for metric in ready_metrics}
+        for edge in graph.edges:
+            if edge.left.id in ready_metric_ids and edge.right is not None:
+                assert edge.right.id in metrics
+
+        resolved_metrics = {metric.id: "my_value" for metric in ready_metrics}
+        metrics.update(resolved_metrics)
+        scheduler.mark_resolved(metric_ids=resolved_metrics.keys())
+        num_waves += 1
+
+    assert num_waves > 1
+    assert len(scheduler.needed_metrics) == 0
+    assert {edge.left.id for edge in graph.edges} <= set(metrics)
+
+
+@pytest.mark.unit
+def test_resolution_scheduler_treats_already_computed_metrics_as_resolved():
+    metric_a = MetricConfiguration(metric_name="table.row_count", metric_domain_kwargs={})
+    metric_b = MetricConfiguration(metric_name="table.columns", metric_domain_kwargs={})
+    metric_c = MetricConfiguration(metric_name="table.head", metric_domain_kwargs={})
+    edges = [
+        MetricEdge(left=metric_c, right=metric_a),
+        MetricEdge(left=metric_c, right=metric_b),
+        MetricEdge(left=metric_a),
+        MetricEdge(left=metric_b),
+    ]
+
+    scheduler = _MetricResolutionScheduler(edges=edges, metrics={metric_a.id: 7})
+    assert [metric.id for metric in scheduler.ready_metrics] == [metric_b.id]
+    assert [metric.id for metric in scheduler.needed_metrics] == [metric_c.id]
+
+    # Resolving unrelated metrics, or the same metric twice, does not release dependents more than once.  # noqa: E501
+    scheduler.mark_resolved(metric_ids=[("nonexistent", "nonexistent", "nonexistent")])
+    scheduler.mark_resolved(metric_ids=[metric_b.id, metric_b.id])
+    assert [metric.id for metric in scheduler.ready_metrics] == [metric_c.id]
+    assert scheduler.needed_metrics == []
 
 
 @pytest.mark.unit
@@ -326,6 +370,41 @@ def test_populate_dependencies(
     )
 
 
+@pytest.mark.unit
+def test_build_metric_dependency_graph_interns_identical_metric_configurations():
+    class PandasExecutionEngineStub:
+        pass
+
+    PandasExecutionEngineStub.__name__ = "PandasExecutionEngine"
+    execution_engine = cast(ExecutionEngine, PandasExecutionEngineStub())
+
+    interned_metric_configurations: dict = {}
+    graphs = []
+    for _ in range(2):
+        graph = ValidationGraph(
+            execution_engine=execution_engine,
+            interned_metric_configurations=interned_metric_configurations,
+        )
+        graph.build_metric_dependency_graph(
+            metric_configuration=MetricConfiguration(
+                metric_name="column.mean",
+                metric_domain_kwargs={"column": "a"},
+            )
+        )
+        graphs.append(graph)
+
+    # Each graph still holds complete sub-graph, but both share the same "MetricConfiguration" objects.  # noqa: E501
+    assert graphs[0] == graphs[1]
+    vertices = {
+        id(vertex)
+        for graph in graphs
+        for edge in graph.edges
+        for vertex in (edge.left, edge.right)
+        if vertex is not None
+    }
+    assert len(vertices) == len(interned_metric_configurations)
+
+
 @pytest.mark.unit
 def test_populate_dependencies_with_incorrect_metric_name():
     class PandasExecutionEngineStub:
@@ -441,11 +520,8 @@ def test_progress_bar_config(
     # ValidationGraph is a complex object that requires len > 3 to not trigger tqdm
     with (
         mock.patch(
-            "great_expectations.validator.validation_graph.ValidationGraph._parse",
-            return_value=(
-                {},
-                {},
-            ),
+            "great_expectations.validator.validation_graph.ValidationGraph._build_resolution_scheduler",
+            return_value=_MetricResolutionScheduler(edges=[], metrics={}),
         ),
         mock.patch(
             "great_expectations.validator.validation_graph.ValidationGraph.edges",